@@ -1,8 +1,20 @@
 # src/drone/__init__.py
 from .drone_connection import DroneConnection
 from .drone_state import DroneState
+from .state_snapshot import DroneStateSnapshot, StateField
 from .drone_command import DroneCommand
 from .mission_manager import MissionManager
 from .parameter_manager import ParameterManager
+from .parameter_cache import ParameterCache, CachedParameterVehicle
+from .parameter_writer import BulkParameterWriter, ParameterWriteReport
+from .telemetry_history import TelemetryHistory
+from .telemetry_recorder import TelemetryRecorder
+from .telemetry_replay import ReplayVehicle
+from .telemetry_streams import TelemetrySubscriptions, TimedMessage
+from .attribute_watch import AttributeWatch
+from .command_transport import CommandTransport, CommandResult
+from .command_executor import CommandExecutor, CommandTicket
+from .link_monitor import LinkMonitor
+from .async_controller import AsyncDroneController
 
 # This marks the drone module as a Python package
\ No newline at end of file
@@ -0,0 +1,528 @@
+# src/drone/async_controller.py
+import asyncio
+import contextlib
+import logging
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from src.drone import dronekit_wrapper as dronekit
+from dronekit import LocationGlobalRelative
+
+from src.drone.attribute_watch import AttributeWatch, relative_altitude
+from src.drone.drone_command import (
+    WATCH_RECHECK_INTERVAL, Confirmation, confirm_armable, confirm_armed, confirm_mode, confirm_takeoff,
+    confirm_landed, confirm_descent,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDroneController:
+    """asyncio facade over a DroneController
+
+    Flight commands are sent without blocking and their completion is
+    awaited through AttributeWatch listeners, so any number of command flows,
+    across any number of vehicles, can run on one event loop without a
+    thread each. They use the controller's DroneCommand confirmations, so a
+    COMMAND_ACK rejection or DroneCommand.interrupt() ends them just like the
+    blocking commands, and land() / return_to_launch() interrupt the flight
+    commands still in progress before taking over.
+
+    Operations that are blocking in DroneKit itself (connecting, mission and
+    parameter transfers) run in an executor. Their timeout only stops the
+    wait: the call keeps running in its thread, and a connection that comes
+    up after its timeout is closed again.
+
+    Every operation takes a timeout and returns False (or an empty result)
+    when it expires, like the blocking API; cancelling the awaiting task
+    stops the wait and removes its listeners.
+    """
+
+    def __init__(self, controller=None, executor: Optional[Executor] = None):
+        """Initialize the facade
+
+        Args:
+            controller: DroneController to drive (a new one is created if omitted)
+            executor: Executor for blocking DroneKit calls (the loop's default if omitted)
+        """
+        if controller is None:
+            from src.drone.drone_controller import DroneController
+            controller = DroneController()
+        self.controller = controller
+        self.executor = executor
+
+        # Flight command flows in progress, and futures waiting for them to end
+        self._flights = 0
+        self._idle_waiters: List[asyncio.Future] = []
+
+    @property
+    def vehicle(self):
+        """The connected DroneKit vehicle, if any"""
+        return self.controller.connection.vehicle
+
+    @property
+    def command(self):
+        """The controller's DroneCommand"""
+        return self.controller.command
+
+    def _require_vehicle(self, action: str):
+        vehicle = self.vehicle
+        if not vehicle:
+            logger.error(f"No vehicle available for {action}")
+        return vehicle
+
+    async def _run_blocking(self, func: Callable, *args, timeout: Optional[float] = None, default=None,
+                            on_late_result: Optional[Callable[[Any], None]] = None):
+        """Run a blocking call in the executor
+
+        A timeout or cancellation stops the wait, not the call. If the call
+        then finishes, on_late_result is called with its result on the
+        executor thread so the caller can undo it.
+
+        Returns:
+            The call's result, or default on timeout
+        """
+        loop = asyncio.get_running_loop()
+        name = getattr(func, '__name__', 'operation')
+        lock = threading.Lock()
+        finished = []
+        abandoned = []
+
+        def call():
+            result = func(*args)
+            with lock:
+                late = bool(abandoned)
+                if not late:
+                    finished.append(result)
+            if late:
+                logger.warning(f"{name} finished after its caller stopped waiting")
+                if on_late_result is not None:
+                    on_late_result(result)
+            return result
+
+        def abandon() -> bool:
+            with lock:
+                if finished:
+                    return False
+                abandoned.append(True)
+                return True
+
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(self.executor, call), timeout)
+        except asyncio.TimeoutError:
+            if not abandon():
+                # Finished as the timeout expired
+                return finished[0]
+            logger.error(f"Timeout waiting for {name}; it is still running")
+            return default
+        except asyncio.CancelledError:
+            abandon()
+            raise
+
+    async def wait_for(self, attributes: Sequence[str], condition: Callable[[Any], bool],
+                       timeout: Optional[float], description: str = "condition") -> bool:
+        """Wait until a condition on the vehicle holds
+
+        Args:
+            attributes: Attributes whose updates may change the condition
+            condition: Called with the vehicle
+            timeout: Seconds to wait, None for no limit
+            description: Used in the timeout log message
+
+        Returns:
+            bool: True if the condition was met, False on timeout
+        """
+        vehicle = self._require_vehicle(description)
+        if not vehicle:
+            return False
+        with AttributeWatch(vehicle, attributes, condition) as watch:
+            if await watch.wait_async(timeout):
+                return True
+        logger.error(f"Timeout waiting for {description}")
+        return False
+
+    async def _confirm(self, confirmation: Confirmation, timeout: float) -> bool:
+        """Send a command and wait on the loop until DroneCommand confirms it
+
+        Same as DroneCommand.confirm(), but the wait is a coroutine woken by
+        the watch, the COMMAND_ACK and interrupt() through
+        call_soon_threadsafe.
+
+        Returns:
+            bool: True if confirmed, False on rejection, interrupt or timeout
+        """
+        command = self.command
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+
+        def notify():
+            loop.call_soon_threadsafe(wake.set)
+
+        with command.begin(confirmation) as (watch, ack):
+            watch.add_callback(notify)
+            if ack is not None:
+                ack.add_callback(notify)
+            command.add_waiter(notify)
+            try:
+                deadline = loop.time() + timeout
+                while True:
+                    confirmed = command.outcome(watch, ack)
+                    if confirmed is not None:
+                        break
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        confirmed = False
+                        break
+                    try:
+                        await asyncio.wait_for(wake.wait(), min(WATCH_RECHECK_INTERVAL, remaining))
+                    except asyncio.TimeoutError:
+                        pass
+                    wake.clear()
+            finally:
+                watch.remove_callback(notify)
+                command.remove_waiter(notify)
+        return command.finish(confirmation, ack, confirmed)
+
+    @contextlib.contextmanager
+    def _flight(self):
+        """Mark a flight command flow that land() and return_to_launch() may interrupt"""
+        self._flights += 1
+        try:
+            yield
+        finally:
+            self._flights -= 1
+            if not self._flights:
+                waiters, self._idle_waiters = self._idle_waiters, []
+                for future in waiters:
+                    if not future.done():
+                        future.set_result(None)
+
+    async def _preempt(self):
+        """Interrupt the flight commands in progress and wait for them to return"""
+        if not self._flights:
+            return
+        logger.info("Interrupting flight commands in progress")
+        future = asyncio.get_running_loop().create_future()
+        self._idle_waiters.append(future)
+        self.command.interrupt()
+        try:
+            await future
+        finally:
+            self.command.clear_interrupt()
+
+    # Connection
+
+    async def connect(self, connection_string: str, baud: int = 57600, timeout: int = 30,
+                      is_simulation: bool = False, lazy: Optional[bool] = None) -> bool:
+        """Connect to a drone
+
+        If the connection only comes up after the timeout, it is closed again
+        so the controller matches the False that was returned.
+
+        Args:
+            connection_string: Connection string (e.g., 'tcp:127.0.0.1:5760', '/dev/ttyUSB0')
+            baud: Baud rate for serial connections
+            timeout: Connection timeout in seconds
+            is_simulation: Whether this is a simulated connection
+            lazy: Return once core telemetry is live (see DroneController.connect)
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        def close_late_connection(connected):
+            if connected:
+                logger.warning("Closing connection that came up after the timeout")
+                self.controller.disconnect()
+
+        return await self._run_blocking(self.controller.connect, connection_string, baud, timeout,
+                                        is_simulation, lazy, timeout=timeout + 5, default=False,
+                                        on_late_result=close_late_connection)
+
+    async def disconnect(self):
+        """Disconnect from the drone"""
+        await self._run_blocking(self.controller.disconnect)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Get the current drone state
+
+        Returns:
+            dict: Current drone state
+        """
+        return self.controller.get_state()
+
+    # Flight commands
+
+    async def set_mode(self, mode_name: str, timeout: float = 10) -> bool:
+        """Set the flight mode and wait for the vehicle to report it
+
+        Args:
+            mode_name: Name of the flight mode (e.g., 'GUIDED', 'RTL', 'AUTO')
+            timeout: Timeout in seconds
+
+        Returns:
+            bool: True if mode set successfully, False otherwise
+        """
+        vehicle = self._require_vehicle("mode change")
+        if not vehicle:
+            return False
+        if vehicle.mode.name == mode_name:
+            return True
+
+        try:
+            logger.info(f"Setting mode to {mode_name}...")
+            if not await self._confirm(confirm_mode(mode_name), timeout):
+                return False
+        except Exception as e:
+            logger.error(f"Error setting mode to {mode_name}: {str(e)}")
+            return False
+        logger.info(f"Mode changed to {mode_name} successfully")
+        return True
+
+    async def arm(self, timeout: float = 30) -> bool:
+        """Arm the drone
+
+        Args:
+            timeout: Timeout in seconds for each stage (armable, armed)
+
+        Returns:
+            bool: True if successfully armed, False otherwise
+        """
+        vehicle = self._require_vehicle("arming")
+        if not vehicle:
+            return False
+        if vehicle.armed:
+            return True
+
+        with self._flight():
+            if vehicle.mode.name != "GUIDED":
+                await self.set_mode("GUIDED")
+
+            if not vehicle.is_armable and not await self._confirm(confirm_armable(), timeout):
+                return False
+            if self.command.interrupted:
+                logger.warning("Arming interrupted")
+                return False
+
+            logger.info("Arming vehicle...")
+            if not await self._confirm(confirm_armed(True), timeout):
+                return False
+        logger.info("Vehicle armed successfully")
+        return True
+
+    async def disarm(self, timeout: float = 30) -> bool:
+        """Disarm the drone
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            bool: True if successfully disarmed, False otherwise
+        """
+        vehicle = self._require_vehicle("disarming")
+        if not vehicle:
+            return False
+        if not vehicle.armed:
+            return True
+        altitude = relative_altitude(vehicle)
+        if altitude is not None and altitude > 0.1:
+            logger.warning("Vehicle appears to be in air, cannot disarm safely")
+            return False
+
+        logger.info("Disarming vehicle...")
+        if not await self._confirm(confirm_armed(False), timeout):
+            return False
+        logger.info("Vehicle disarmed successfully")
+        return True
+
+    async def takeoff(self, target_altitude: float, timeout: float = 60) -> bool:
+        """Take off and wait until within 5% of the target altitude
+
+        Args:
+            target_altitude: Target altitude in meters (relative)
+            timeout: Timeout in seconds
+
+        Returns:
+            bool: True if takeoff successful, False otherwise
+        """
+        vehicle = self._require_vehicle("takeoff")
+        if not vehicle:
+            return False
+
+        with self._flight():
+            if not vehicle.armed and not await self.arm():
+                logger.error("Failed to arm vehicle for takeoff")
+                return False
+            if vehicle.mode.name != "GUIDED" and not await self.set_mode("GUIDED"):
+                logger.error("Failed to set GUIDED mode for takeoff")
+                return False
+            if self.command.interrupted:
+                logger.warning("Takeoff interrupted")
+                return False
+
+            try:
+                logger.info(f"Taking off to altitude: {target_altitude}m...")
+                if not await self._confirm(confirm_takeoff(target_altitude), timeout):
+                    logger.warning(f"Takeoff stopped at altitude: {relative_altitude(vehicle)}m")
+                    return False
+            except Exception as e:
+                logger.error(f"Takeoff failed: {str(e)}")
+                return False
+        logger.info(f"Reached target altitude: {relative_altitude(vehicle)}m")
+        return True
+
+    async def land(self, timeout: float = 120) -> bool:
+        """Switch to LAND and wait for touchdown
+
+        Flight commands still in progress are interrupted first.
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            bool: True if landing successful, False otherwise
+        """
+        if not self._require_vehicle("landing"):
+            return False
+        await self._preempt()
+        if not await self.set_mode("LAND"):
+            logger.error("Failed to set LAND mode")
+            return False
+
+        if not await self._confirm(confirm_landed(), timeout):
+            logger.warning(f"Landing stopped at altitude: {relative_altitude(self.vehicle)}m")
+            return False
+        logger.info("Vehicle has landed")
+        return True
+
+    async def return_to_launch(self, timeout: float = 120) -> bool:
+        """Switch to RTL and wait until the vehicle starts descending
+
+        Flight commands still in progress are interrupted first.
+
+        Args:
+            timeout: Timeout in seconds
+
+        Returns:
+            bool: True if RTL initiated successfully, False otherwise
+        """
+        if not self._require_vehicle("RTL"):
+            return False
+        await self._preempt()
+        if not await self.set_mode("RTL"):
+            logger.error("Failed to set RTL mode")
+            return False
+
+        initial_altitude = relative_altitude(self.vehicle)
+        if not await self._confirm(confirm_descent(initial_altitude), timeout):
+            logger.warning("Vehicle may still be navigating home")
+            return False
+        logger.info("Vehicle is returning and descending")
+        return True
+
+    async def goto_position(self, lat: float, lon: float, alt: float,
+                            ground_speed: Optional[float] = None) -> bool:
+        """Go to a specific position
+
+        Args:
+            lat: Target latitude
+            lon: Target longitude
+            alt: Target altitude (relative)
+            ground_speed: Optional ground speed in m/s
+
+        Returns:
+            bool: True if command sent successfully, False otherwise
+        """
+        vehicle = self._require_vehicle("position command")
+        if not vehicle:
+            return False
+        with self._flight():
+            if vehicle.mode.name != "GUIDED" and not await self.set_mode("GUIDED"):
+                logger.error("Failed to set GUIDED mode for position command")
+                return False
+            if self.command.interrupted:
+                logger.warning("Position command interrupted")
+                return False
+        try:
+            if ground_speed is not None:
+                vehicle.groundspeed = ground_speed
+            vehicle.simple_goto(LocationGlobalRelative(lat, lon, alt))
+            return True
+        except Exception as e:
+            logger.error(f"Goto position failed: {str(e)}")
+            return False
+
+    # Missions and parameters (blocking in DroneKit, run in the executor)
+
+    async def clear_mission(self, timeout: float = 30) -> bool:
+        """Clear the current mission
+
+        Returns:
+            bool: True if mission cleared successfully, False otherwise
+        """
+        return await self._run_blocking(self.controller.mission.clear_mission, timeout=timeout, default=False)
+
+    async def download_mission(self, timeout: float = 60) -> List[Dict[str, Any]]:
+        """Download the current mission from the vehicle
+
+        Returns:
+            list: List of waypoint dictionaries
+        """
+        return await self._run_blocking(self.controller.mission.download_mission, timeout=timeout, default=[])
+
+    async def upload_mission(self, waypoints: List[Dict[str, Any]], timeout: float = 60) -> bool:
+        """Upload a mission to the vehicle
+
+        Args:
+            waypoints: List of waypoint dictionaries
+            timeout: Timeout in seconds
+
+        Returns:
+            bool: True if mission uploaded successfully, False otherwise
+        """
+        return await self._run_blocking(self.controller.mission.upload_mission, waypoints,
+                                        timeout=timeout, default=False)
+
+    async def start_mission(self, timeout: float = 30) -> bool:
+        """Start the mission
+
+        Returns:
+            bool: True if mission started successfully, False otherwise
+        """
+        return await self._run_blocking(self.controller.mission.start_mission, timeout=timeout, default=False)
+
+    async def get_all_parameters(self, timeout: float = 60) -> Dict[str, Any]:
+        """Get all vehicle parameters
+
+        Returns:
+            dict: Dictionary of parameter names and values
+        """
+        return await self._run_blocking(self.controller.parameters.get_all_parameters,
+                                        timeout=timeout, default={})
+
+    async def get_parameter(self, param_name: str, timeout: float = 10) -> Optional[Any]:
+        """Get a specific parameter value
+
+        Args:
+            param_name: Parameter name
+            timeout: Timeout in seconds
+
+        Returns:
+            Any: Parameter value, or None if not found
+        """
+        return await self._run_blocking(self.controller.parameters.get_parameter, param_name,
+                                        timeout=timeout)
+
+    async def set_parameter(self, param_name: str, value: Any, timeout: float = 10) -> bool:
+        """Set a parameter value
+
+        Args:
+            param_name: Parameter name
+            value: Parameter value
+            timeout: Timeout in seconds
+
+        Returns:
+            bool: True if set successfully, False otherwise
+        """
+        return await self._run_blocking(self.controller.parameters.set_parameter, param_name, value,
+                                        timeout=timeout, default=False)
@@ -0,0 +1,184 @@
+# src/drone/attribute_watch.py
+import asyncio
+import logging
+import threading
+from typing import Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Attributes that DroneKit updates when each condition can change
+ARMED_ATTRIBUTES = ("armed",)
+MODE_ATTRIBUTES = ("mode",)
+ARMABLE_ATTRIBUTES = ("mode", "gps_0", "ekf_ok")
+ALTITUDE_ATTRIBUTES = ("location",)
+
+
+class AttributeWatch:
+    """Signals when a condition on a vehicle's attributes becomes true
+
+    The condition is re-evaluated from DroneKit attribute (and optionally
+    message) listeners, so it is noticed as soon as the message that makes it
+    true is received instead of at the next poll. It is also evaluated once
+    when the watch is created, in case it already holds.
+
+    Wait from a thread with wait(), or from an asyncio event loop with
+    wait_async(); neither needs a thread of its own. Close the watch (or use
+    it as a context manager) to remove its listeners.
+    """
+
+    def __init__(self, vehicle, attributes: Sequence[str], condition: Callable[[object], bool],
+                 messages: Sequence[str] = ()):
+        """Start watching
+
+        Args:
+            vehicle: DroneKit Vehicle (or anything with its listener API)
+            attributes: Attribute names whose updates may change the condition
+            condition: Called with the vehicle; the watch fires once it returns True
+            messages: MAVLink message types that may change the condition
+        """
+        self.vehicle = vehicle
+        self.attributes = tuple(attributes)
+        self.messages = tuple(messages)
+        self.condition = condition
+
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._waiters: List[Callable[[], None]] = []
+        self._closed = False
+
+        for name in self.attributes:
+            vehicle.add_attribute_listener(name, self._on_attribute)
+        for name in self.messages:
+            vehicle.add_message_listener(name, self._on_message)
+
+        self.check()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def is_set(self) -> bool:
+        """Whether the condition has been met"""
+        return self._event.is_set()
+
+    def _on_attribute(self, vehicle, name, value):
+        self.check()
+
+    def _on_message(self, vehicle, name, message):
+        self.check()
+
+    def check(self) -> bool:
+        """Evaluate the condition now
+
+        Returns:
+            bool: True if the condition has been met
+        """
+        if self._event.is_set():
+            return True
+        try:
+            met = bool(self.condition(self.vehicle))
+        except Exception as e:
+            logger.debug(f"Watch condition failed: {str(e)}")
+            met = False
+        if not met:
+            return False
+
+        with self._lock:
+            if self._event.is_set():
+                return True
+            self._event.set()
+            waiters, self._waiters = self._waiters, []
+        for wake in waiters:
+            wake()
+        return True
+
+    def add_callback(self, callback: Callable[[], None]):
+        """Call a function once the condition is met
+
+        The callback runs on the thread that notices the condition (usually
+        DroneKit's), or straight away if it has already been met.
+
+        Args:
+            callback: Function taking no arguments
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._waiters.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]):
+        """Remove a callback added with add_callback, if it hasn't run"""
+        with self._lock:
+            if callback in self._waiters:
+                self._waiters.remove(callback)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the condition is met
+
+        Args:
+            timeout: Seconds to wait, None for no limit
+
+        Returns:
+            bool: True if met, False on timeout
+        """
+        return self._event.wait(timeout)
+
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """Wait on the running event loop until the condition is met
+
+        Listener callbacks arrive on DroneKit's thread and resolve the wait
+        through call_soon_threadsafe. Cancelling the awaiting task cancels
+        only the wait.
+
+        Args:
+            timeout: Seconds to wait, None for no limit
+
+        Returns:
+            bool: True if met, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve():
+            if not future.done():
+                future.set_result(True)
+
+        def wake():
+            loop.call_soon_threadsafe(resolve)
+
+        if self._event.is_set():
+            return True
+        self.add_callback(wake)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.remove_callback(wake)
+
+    def close(self):
+        """Remove the listeners"""
+        if self._closed:
+            return
+        self._closed = True
+        for name in self.attributes:
+            try:
+                self.vehicle.remove_attribute_listener(name, self._on_attribute)
+            except Exception:
+                pass
+        for name in self.messages:
+            try:
+                self.vehicle.remove_message_listener(name, self._on_message)
+            except Exception:
+                pass
+
+
+def relative_altitude(vehicle) -> Optional[float]:
+    """Get the vehicle's altitude above home, if known"""
+    frame = vehicle.location.global_relative_frame
+    return frame.alt if frame is not None else None
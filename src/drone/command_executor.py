@@ -0,0 +1,360 @@
+# src/drone/command_executor.py
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Lower values run first
+PRIORITY_EMERGENCY = 0
+PRIORITY_NORMAL = 10
+
+# Ticket states
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+PREEMPTED = "preempted"
+
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED, PREEMPTED)
+
+
+class CommandTicket:
+    """A command submitted to a CommandExecutor"""
+
+    def __init__(self, ticket_id: int, name: str, func: Callable, args: tuple, kwargs: dict,
+                 priority: int, preemptible: bool, preempts: bool):
+        self.id = ticket_id
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        # Can be cancelled or interrupted by a preempting command
+        self.preemptible = preemptible
+        # Cancels preemptible commands when submitted
+        self.preempts = preempts
+
+        self.state = QUEUED
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """Whether the command has finished, failed or been cancelled"""
+        return self._done.is_set()
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the command ran and returned a true result"""
+        return self.state == SUCCEEDED
+
+    @property
+    def queue_time(self) -> Optional[float]:
+        """Seconds from submission to start"""
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+
+    @property
+    def run_time(self) -> Optional[float]:
+        """Seconds from start to finish"""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the command is done
+
+        Args:
+            timeout: Seconds to wait, None for no limit
+
+        Returns:
+            bool: True if done, False on timeout
+        """
+        return self._done.wait(timeout)
+
+    def _finish(self, state: str, result: Any = None, error: Optional[str] = None):
+        self.state = state
+        self.result = result
+        self.error = error
+        self.finished_at = time.monotonic()
+        self._done.set()
+
+    def __repr__(self) -> str:
+        return f"<CommandTicket({self.id}, {self.name}, {self.state})>"
+
+
+class CommandExecutor:
+    """Runs vehicle commands one at a time on a worker thread
+
+    Commands are queued by priority and then submission order. Submitting a
+    preempting command (RTL, LAND) cancels the queued preemptible commands
+    (GUIDED operations such as takeoff or goto) and interrupts the one that
+    is running, so the emergency command starts as soon as the interrupted
+    one returns.
+
+    Callers never block: submit() returns a CommandTicket straight away and
+    listeners are told when each command is queued, started and finished.
+    Listeners are called on the submitting thread (queued) or the worker
+    thread (everything else).
+    """
+
+    def __init__(self, interrupt: Optional[Callable[[], None]] = None,
+                 resume: Optional[Callable[[], None]] = None, name: str = "command-executor"):
+        """Initialize the executor; the worker starts with the first command
+
+        Args:
+            interrupt: Makes the running command return early, e.g. DroneCommand.interrupt
+            resume: Undoes interrupt once that command has returned, e.g.
+                DroneCommand.clear_interrupt
+            name: Worker thread name
+        """
+        self.interrupt = interrupt
+        self.resume = resume
+        self.name = name
+
+        self._queue: List[tuple] = []
+        self._counter = itertools.count(1)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._interrupt_pending = False
+        self.current: Optional[CommandTicket] = None
+
+        self._listeners: List[Callable[[CommandTicket], None]] = []
+
+        self.stats = {
+            "submitted": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "cancelled": 0,
+            "preempted": 0,
+        }
+        # Command name -> [count, total queue s, max queue s, total run s, max run s]
+        self._latency: Dict[str, List[float]] = {}
+
+    def add_listener(self, listener: Callable[[CommandTicket], None]):
+        """Be told about ticket state changes
+
+        Args:
+            listener: Called with the ticket when it is queued, starts and finishes
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[CommandTicket], None]):
+        """Stop a listener added with add_listener"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, ticket: CommandTicket):
+        for listener in list(self._listeners):
+            try:
+                listener(ticket)
+            except Exception as e:
+                logger.error(f"Error in command listener: {str(e)}")
+
+    def submit(self, name: str, func: Callable, *args, priority: int = PRIORITY_NORMAL,
+               preemptible: bool = True, preempts: bool = False, **kwargs) -> CommandTicket:
+        """Queue a command
+
+        Args:
+            name: Display name, e.g. "Takeoff"
+            func: Blocking function to run; a true return value counts as success
+            *args: Positional arguments for func
+            priority: Queue priority, PRIORITY_EMERGENCY or PRIORITY_NORMAL
+            preemptible: Whether a preempting command may cancel this one
+            preempts: Cancel preemptible commands, queued and running
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            CommandTicket: Handle for the queued command
+        """
+        ticket = CommandTicket(next(self._counter), name, func, args, kwargs,
+                               priority, preemptible, preempts)
+        cancelled = []
+        with self._condition:
+            if self._stopping:
+                ticket._finish(CANCELLED, error="Executor stopped")
+                return ticket
+            if preempts:
+                cancelled = self._preempt_locked()
+            heapq.heappush(self._queue, (priority, ticket.id, ticket))
+            self.stats["submitted"] += 1
+            self._ensure_worker_locked()
+            self._condition.notify()
+
+        for other in cancelled:
+            self._notify(other)
+        self._notify(ticket)
+        return ticket
+
+    def _preempt_locked(self) -> List[CommandTicket]:
+        """Cancel queued preemptible commands and interrupt the running one"""
+        cancelled = []
+        kept = []
+        for entry in self._queue:
+            ticket = entry[2]
+            if ticket.preemptible:
+                ticket._finish(PREEMPTED, error="Preempted")
+                self.stats["preempted"] += 1
+                cancelled.append(ticket)
+            else:
+                kept.append(entry)
+        if cancelled:
+            heapq.heapify(kept)
+            self._queue = kept
+
+        current = self.current
+        if current is not None and current.preemptible and not self._interrupt_pending:
+            logger.info(f"Interrupting {current.name}")
+            self._interrupt_pending = True
+            if self.interrupt is not None:
+                self.interrupt()
+        return cancelled
+
+    def _ensure_worker_locked(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Worker loop"""
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                _, _, ticket = heapq.heappop(self._queue)
+                self.current = ticket
+                ticket.state = RUNNING
+                ticket.started_at = time.monotonic()
+
+            self._notify(ticket)
+            try:
+                result = ticket.func(*ticket.args, **ticket.kwargs)
+                error = None
+            except Exception as e:
+                logger.error(f"Command {ticket.name} failed: {str(e)}")
+                result = None
+                error = str(e)
+
+            with self._condition:
+                self.current = None
+                interrupted = self._interrupt_pending
+                self._interrupt_pending = False
+
+            if interrupted:
+                state = PREEMPTED
+                if self.resume is not None:
+                    self.resume()
+            elif error is None and result:
+                state = SUCCEEDED
+            else:
+                state = FAILED
+            ticket._finish(state, result, error)
+            self._record(ticket)
+            self._notify(ticket)
+
+    def _record(self, ticket: CommandTicket):
+        """Update counters and per-command latency"""
+        self.stats[ticket.state] += 1
+        latency = self._latency.setdefault(ticket.name, [0, 0.0, 0.0, 0.0, 0.0])
+        latency[0] += 1
+        latency[1] += ticket.queue_time
+        latency[2] = max(latency[2], ticket.queue_time)
+        latency[3] += ticket.run_time
+        latency[4] = max(latency[4], ticket.run_time)
+
+    def cancel(self, ticket: CommandTicket) -> bool:
+        """Cancel a command that hasn't started
+
+        Args:
+            ticket: Ticket returned by submit()
+
+        Returns:
+            bool: True if the command was removed from the queue
+        """
+        with self._condition:
+            for index, entry in enumerate(self._queue):
+                if entry[2] is ticket:
+                    self._queue.pop(index)
+                    heapq.heapify(self._queue)
+                    break
+            else:
+                return False
+            ticket._finish(CANCELLED, error="Cancelled")
+            self.stats["cancelled"] += 1
+        self._notify(ticket)
+        return True
+
+    def cancel_all(self) -> int:
+        """Cancel every command that hasn't started
+
+        Returns:
+            int: Number of commands cancelled
+        """
+        with self._condition:
+            tickets = [entry[2] for entry in self._queue]
+            self._queue = []
+            for ticket in tickets:
+                ticket._finish(CANCELLED, error="Cancelled")
+            self.stats["cancelled"] += len(tickets)
+        for ticket in tickets:
+            self._notify(ticket)
+        return len(tickets)
+
+    def pending(self) -> List[CommandTicket]:
+        """Get the queued commands in the order they will run"""
+        with self._condition:
+            return [entry[2] for entry in sorted(self._queue)]
+
+    def stop(self, timeout: float = 5.0):
+        """Cancel queued commands and stop the worker
+
+        Args:
+            timeout: Seconds to wait for the running command to return
+        """
+        self.cancel_all()
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        with self._condition:
+            self._thread = None
+            self._stopping = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get counters and per-command latency
+
+        Returns:
+            dict: Outcome counters, queue length and, per command name, the
+            count with mean and max queue and run times in ms
+        """
+        stats = dict(self.stats)
+        with self._condition:
+            stats["queued"] = len(self._queue)
+            stats["running"] = self.current.name if self.current is not None else None
+        stats["latency"] = {
+            name: {
+                "count": count,
+                "mean_queue_ms": total_queue / count * 1000,
+                "max_queue_ms": max_queue * 1000,
+                "mean_run_ms": total_run / count * 1000,
+                "max_run_ms": max_run * 1000,
+            }
+            for name, (count, total_queue, max_queue, total_run, max_run) in self._latency.items()
+        }
+        return stats
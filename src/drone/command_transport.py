@@ -0,0 +1,436 @@
+# src/drone/command_transport.py
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from pymavlink import mavutil
+
+logger = logging.getLogger(__name__)
+
+MAV_RESULT_ACCEPTED = mavutil.mavlink.MAV_RESULT_ACCEPTED
+MAV_RESULT_IN_PROGRESS = mavutil.mavlink.MAV_RESULT_IN_PROGRESS
+
+
+def result_name(result: Optional[int]) -> str:
+    """Get the name of a MAV_RESULT code, e.g. 4 -> 'MAV_RESULT_FAILED'"""
+    if result is None:
+        return "NO_ACK"
+    entry = mavutil.mavlink.enums["MAV_RESULT"].get(result)
+    return entry.name if entry is not None else str(result)
+
+
+def command_name(command: int) -> str:
+    """Get the name of a MAV_CMD id, e.g. 400 -> 'MAV_CMD_COMPONENT_ARM_DISARM'"""
+    entry = mavutil.mavlink.enums["MAV_CMD"].get(command)
+    return entry.name if entry is not None else str(command)
+
+
+class CommandResult:
+    """Outcome of a command sent through CommandTransport"""
+
+    __slots__ = ("command", "result", "progress", "attempts", "rtt")
+
+    def __init__(self, command: int, result: Optional[int], progress: Optional[int],
+                 attempts: int, rtt: Optional[float]):
+        self.command = command
+        # MAV_RESULT code from COMMAND_ACK, None if no ACK arrived
+        self.result = result
+        # Percent complete reported with MAV_RESULT_IN_PROGRESS
+        self.progress = progress
+        # Number of times the command was sent
+        self.attempts = attempts
+        # Seconds from the last send to its ACK
+        self.rtt = rtt
+
+    @property
+    def accepted(self) -> bool:
+        """Whether the autopilot accepted the command"""
+        return self.result == MAV_RESULT_ACCEPTED
+
+    @property
+    def timed_out(self) -> bool:
+        """Whether no ACK arrived after all retries"""
+        return self.result is None
+
+    @property
+    def result_name(self) -> str:
+        """Name of the result code"""
+        return result_name(self.result)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the result as a plain dictionary"""
+        return {
+            "command": command_name(self.command),
+            "result": self.result_name,
+            "accepted": self.accepted,
+            "progress": self.progress,
+            "attempts": self.attempts,
+            "rtt_ms": round(self.rtt * 1000, 1) if self.rtt is not None else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"<CommandResult({command_name(self.command)}, {self.result_name}, attempts={self.attempts})>"
+
+
+class PendingAck:
+    """Waits for the COMMAND_ACK of one command id
+
+    Created by CommandTransport.expect_ack(). Works for commands sent by the
+    transport and for ones DroneKit sends itself, such as arming and mode
+    changes.
+    """
+
+    def __init__(self, command: int):
+        """Initialize the pending ACK
+
+        Args:
+            command: MAV_CMD id the ACK will carry
+        """
+        self.command = command
+        self.result: Optional[int] = None
+        self.progress: Optional[int] = None
+        self.sent_at: Optional[float] = None
+        self.acked_at: Optional[float] = None
+        self.acks = 0
+        self._condition = threading.Condition()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def done(self) -> bool:
+        """Whether a final (not in-progress) result has arrived"""
+        return self.result is not None and self.result != MAV_RESULT_IN_PROGRESS
+
+    @property
+    def rejected(self) -> bool:
+        """Whether the autopilot refused the command"""
+        return self.done and self.result != MAV_RESULT_ACCEPTED
+
+    @property
+    def rtt(self) -> Optional[float]:
+        """Seconds from the last send to the latest ACK"""
+        if self.sent_at is None or self.acked_at is None:
+            return None
+        return max(self.acked_at - self.sent_at, 0.0)
+
+    def add_callback(self, callback: Callable[[], None]):
+        """Call a function on every ACK (on DroneKit's receive thread)"""
+        with self._condition:
+            self._callbacks.append(callback)
+
+    def mark_sent(self):
+        """Record that the command was (re)sent now"""
+        self.sent_at = time.monotonic()
+
+    def resolve(self, message):
+        """Record a COMMAND_ACK for this command"""
+        with self._condition:
+            self.result = message.result
+            self.progress = getattr(message, "progress", None)
+            self.acked_at = time.monotonic()
+            self.acks += 1
+            self._condition.notify_all()
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback()
+
+    def wait(self, timeout: Optional[float], final: bool = False) -> bool:
+        """Wait for an ACK
+
+        Args:
+            timeout: Seconds to wait
+            final: Keep waiting through MAV_RESULT_IN_PROGRESS ACKs
+
+        Returns:
+            bool: True if a (final) ACK arrived
+        """
+        with self._condition:
+            if final:
+                return self._condition.wait_for(lambda: self.done, timeout)
+            return self._condition.wait_for(lambda: self.result is not None, timeout)
+
+
+class CommandTransport:
+    """Sends MAVLink commands and matches them to their COMMAND_ACK
+
+    COMMAND_ACK carries only the command id, so commands with the same id
+    are sent one at a time. A command that is not acknowledged within
+    ack_timeout is resent, with the timeout growing by backoff each time,
+    up to retries resends. A COMMAND_LONG resend has its confirmation field
+    incremented, as the protocol expects.
+
+    The result code and round-trip time are returned in a CommandResult,
+    so a rejection is reported as soon as the ACK arrives.
+    """
+
+    def __init__(self, vehicle=None, ack_timeout: float = 1.0, retries: int = 2,
+                 backoff: float = 2.0, max_ack_timeout: float = 5.0,
+                 in_progress_timeout: float = 30.0):
+        """Initialize the transport
+
+        Args:
+            vehicle: DroneKit Vehicle to attach to
+            ack_timeout: Seconds to wait for the first ACK
+            retries: Resends after the first attempt
+            backoff: Multiplier applied to the ACK timeout on each resend
+            max_ack_timeout: Longest per-attempt ACK timeout
+            in_progress_timeout: Seconds to wait for a final result once the
+                autopilot reports MAV_RESULT_IN_PROGRESS
+        """
+        self.vehicle = None
+        self.ack_timeout = ack_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_ack_timeout = max_ack_timeout
+        self.in_progress_timeout = in_progress_timeout
+
+        self._lock = threading.Lock()
+        # Command id -> PendingAck objects waiting for it
+        self._pending: Dict[int, List[PendingAck]] = {}
+        # Command id -> lock serializing sends of that id
+        self._send_locks: Dict[int, threading.Lock] = {}
+
+        self.stats = {
+            "sent": 0,
+            "resent": 0,
+            "acks": 0,
+            "unmatched_acks": 0,
+            "accepted": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "last_rtt_ms": None,
+            "max_rtt_ms": 0.0,
+            "total_rtt_ms": 0.0,
+            "rtt_samples": 0,
+        }
+        self.results: Dict[str, int] = {}
+
+        if vehicle is not None:
+            self.attach(vehicle)
+
+    def attach(self, vehicle):
+        """Start receiving COMMAND_ACKs from a vehicle
+
+        Args:
+            vehicle: DroneKit Vehicle (or anything with its listener API)
+        """
+        self.detach()
+        self.vehicle = vehicle
+        try:
+            vehicle.add_message_listener("COMMAND_ACK", self._on_ack)
+        except Exception as e:
+            logger.debug(f"Vehicle doesn't report COMMAND_ACK: {str(e)}")
+
+    def detach(self):
+        """Stop receiving ACKs; pending waits run to their timeouts"""
+        if self.vehicle is None:
+            return
+        try:
+            self.vehicle.remove_message_listener("COMMAND_ACK", self._on_ack)
+        except Exception:
+            pass
+        self.vehicle = None
+
+    def _on_ack(self, vehicle, name, message):
+        """COMMAND_ACK listener (DroneKit receive thread)"""
+        self.stats["acks"] += 1
+        with self._lock:
+            waiting = list(self._pending.get(message.command, ()))
+        if not waiting:
+            self.stats["unmatched_acks"] += 1
+            return
+        for pending in waiting:
+            pending.resolve(message)
+
+    def expect_ack(self, command: int) -> "_Expectation":
+        """Start waiting for the ACK of a command
+
+        Call this before the command is sent, e.g. before setting
+        vehicle.armed, and use it as a context manager so it is removed
+        afterwards.
+
+        Args:
+            command: MAV_CMD id
+
+        Returns:
+            Context manager yielding a PendingAck
+        """
+        return _Expectation(self, command)
+
+    def _register(self, pending: PendingAck):
+        with self._lock:
+            self._pending.setdefault(pending.command, []).append(pending)
+
+    def _unregister(self, pending: PendingAck):
+        with self._lock:
+            waiting = self._pending.get(pending.command)
+            if waiting and pending in waiting:
+                waiting.remove(pending)
+                if not waiting:
+                    del self._pending[pending.command]
+
+    def _send_lock(self, command: int) -> threading.Lock:
+        with self._lock:
+            lock = self._send_locks.get(command)
+            if lock is None:
+                lock = self._send_locks[command] = threading.Lock()
+            return lock
+
+    def send_command_long(self, command: int, params: Sequence[float] = (),
+                          target_system: int = 0, target_component: int = 0,
+                          ack_timeout: Optional[float] = None,
+                          retries: Optional[int] = None) -> CommandResult:
+        """Send a COMMAND_LONG and wait for its ACK
+
+        Args:
+            command: MAV_CMD id
+            params: Up to seven parameters; missing ones are sent as 0
+            target_system: Target system id (0 for any)
+            target_component: Target component id (0 for any)
+            ack_timeout: Seconds to wait for the first ACK (default ack_timeout)
+            retries: Resends after the first attempt (default retries)
+
+        Returns:
+            CommandResult: Result code, attempts and round-trip time
+        """
+        values = self._pad(params, 7)
+
+        def encode(factory, attempt):
+            return factory.command_long_encode(
+                target_system, target_component, command,
+                min(attempt, 255),  # confirmation
+                *values)
+
+        return self._send(command, encode, ack_timeout, retries)
+
+    def send_command_int(self, command: int, frame: int, params: Sequence[float] = (),
+                         x: int = 0, y: int = 0, z: float = 0,
+                         target_system: int = 0, target_component: int = 0,
+                         ack_timeout: Optional[float] = None,
+                         retries: Optional[int] = None) -> CommandResult:
+        """Send a COMMAND_INT and wait for its ACK
+
+        Args:
+            command: MAV_CMD id
+            frame: MAV_FRAME of the position
+            params: Up to four parameters; missing ones are sent as 0
+            x: Latitude * 1e7 (or local x)
+            y: Longitude * 1e7 (or local y)
+            z: Altitude
+            target_system: Target system id (0 for any)
+            target_component: Target component id (0 for any)
+            ack_timeout: Seconds to wait for the first ACK (default ack_timeout)
+            retries: Resends after the first attempt (default retries)
+
+        Returns:
+            CommandResult: Result code, attempts and round-trip time
+        """
+        values = self._pad(params, 4)
+
+        def encode(factory, attempt):
+            return factory.command_int_encode(
+                target_system, target_component, frame, command,
+                0, 0,  # current, autocontinue
+                *values, int(x), int(y), z)
+
+        return self._send(command, encode, ack_timeout, retries)
+
+    @staticmethod
+    def _pad(params: Sequence[float], count: int) -> List[float]:
+        values = [float(p) if p is not None else 0.0 for p in params]
+        if len(values) > count:
+            raise ValueError(f"At most {count} parameters, got {len(values)}")
+        return values + [0.0] * (count - len(values))
+
+    def _send(self, command: int, encode, ack_timeout: Optional[float],
+              retries: Optional[int]) -> CommandResult:
+        """Send with retries and wait for the final result"""
+        vehicle = self.vehicle
+        if vehicle is None:
+            logger.error(f"No vehicle available for {command_name(command)}")
+            return CommandResult(command, None, None, 0, None)
+
+        timeout = self.ack_timeout if ack_timeout is None else ack_timeout
+        retries = self.retries if retries is None else retries
+        attempts = 0
+
+        with self._send_lock(command), self.expect_ack(command) as pending:
+            for attempt in range(retries + 1):
+                try:
+                    msg = encode(vehicle.message_factory, attempt)
+                    pending.mark_sent()
+                    vehicle.send_mavlink(msg)
+                except Exception as e:
+                    logger.error(f"Failed to send {command_name(command)}: {str(e)}")
+                    break
+                attempts += 1
+                self.stats["sent"] += 1
+                if attempt:
+                    self.stats["resent"] += 1
+                    logger.debug(f"Resending {command_name(command)} (attempt {attempt + 1})")
+
+                if pending.wait(timeout):
+                    break
+                timeout = min(timeout * self.backoff, self.max_ack_timeout)
+
+            # Long-running commands report progress before their result
+            if pending.result == MAV_RESULT_IN_PROGRESS:
+                pending.wait(self.in_progress_timeout, final=True)
+
+        result = CommandResult(command, pending.result, pending.progress, attempts, pending.rtt)
+        self._record(result)
+        return result
+
+    def _record(self, result: CommandResult):
+        """Update statistics and log the outcome"""
+        name = command_name(result.command)
+        if result.timed_out:
+            self.stats["timeouts"] += 1
+            logger.warning(f"No COMMAND_ACK for {name} after {result.attempts} attempts")
+            return
+
+        self.results[result.result_name] = self.results.get(result.result_name, 0) + 1
+        if result.rtt is not None:
+            rtt_ms = result.rtt * 1000
+            self.stats["last_rtt_ms"] = rtt_ms
+            self.stats["max_rtt_ms"] = max(self.stats["max_rtt_ms"], rtt_ms)
+            self.stats["total_rtt_ms"] += rtt_ms
+            self.stats["rtt_samples"] += 1
+
+        if result.accepted:
+            self.stats["accepted"] += 1
+            logger.debug(f"{name} accepted in {result.as_dict()['rtt_ms']} ms")
+        else:
+            self.stats["rejected"] += 1
+            logger.warning(f"{name} rejected: {result.result_name}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get command statistics
+
+        Returns:
+            dict: Send/ACK counters, round-trip times in ms and result-code counts
+        """
+        stats = dict(self.stats)
+        samples = stats.pop("rtt_samples")
+        total = stats.pop("total_rtt_ms")
+        stats["mean_rtt_ms"] = total / samples if samples else None
+        stats["results"] = dict(self.results)
+        with self._lock:
+            stats["pending"] = sum(len(waiting) for waiting in self._pending.values())
+        return stats
+
+
+class _Expectation:
+    """Context manager registering a PendingAck with a transport"""
+
+    def __init__(self, transport: CommandTransport, command: int):
+        self.transport = transport
+        self.pending = PendingAck(command)
+
+    def __enter__(self) -> PendingAck:
+        self.pending.mark_sent()
+        self.transport._register(self.pending)
+        return self.pending
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.transport._unregister(self.pending)
@@ -1,14 +1,98 @@
 # src/drone/drone_command.py
+import contextlib
 import logging
 import time
-from typing import Dict, Any, Optional, Tuple, List, Union
+import threading
+from typing import Dict, Any, Callable, Iterator, Optional, Tuple, List, Union
 import math
 from src.drone import dronekit_wrapper as dronekit
 from dronekit import Vehicle, VehicleMode, LocationGlobal, LocationGlobalRelative
 from pymavlink import mavutil
+from src.drone.attribute_watch import (
+    AttributeWatch, ARMED_ATTRIBUTES, MODE_ATTRIBUTES, ARMABLE_ATTRIBUTES, ALTITUDE_ATTRIBUTES,
+    relative_altitude,
+)
+from src.drone.command_transport import CommandTransport, CommandResult, PendingAck, command_name, result_name
 
 logger = logging.getLogger(__name__)
 
+# Longest gap between condition checks when no listener callback arrives
+WATCH_RECHECK_INTERVAL = 1.0
+
+class Confirmation:
+    """A flight command and the vehicle state that confirms it
+    
+    DroneCommand waits for these from a thread and AsyncDroneController
+    awaits the same ones on an event loop, so a command is sent, acknowledged
+    and confirmed the same way through either API.
+    """
+    
+    def __init__(self, description: str, attributes, condition: Callable[[Any], bool],
+                 send: Optional[Callable[[Any], None]] = None, ack_command: Optional[int] = None):
+        """Initialize the confirmation
+        
+        Args:
+            description: What is awaited, used in log messages (e.g. 'vehicle to arm')
+            attributes: Vehicle attributes whose updates can change the condition
+            condition: Called with the vehicle; True once the command has taken effect
+            send: Called with the vehicle to send the command, None to only wait
+            ack_command: MAV_CMD id whose COMMAND_ACK may reject the command
+        """
+        self.description = description
+        self.attributes = attributes
+        self.condition = condition
+        self.send = send
+        self.ack_command = ack_command
+
+def confirm_armable() -> Confirmation:
+    """Wait for the pre-arm checks (GPS lock, EKF) to pass"""
+    return Confirmation("vehicle to become armable", ARMABLE_ATTRIBUTES, lambda v: v.is_armable)
+
+def confirm_armed(armed: bool) -> Confirmation:
+    """Arm or disarm the vehicle"""
+    def send(vehicle):
+        vehicle.armed = armed
+    
+    return Confirmation("vehicle to arm" if armed else "vehicle to disarm", ARMED_ATTRIBUTES,
+                        lambda v: v.armed == armed, send, mavutil.mavlink.MAV_CMD_COMPONENT_ARM_DISARM)
+
+def confirm_mode(mode_name: str) -> Confirmation:
+    """Change the flight mode (DroneKit sends it as MAV_CMD_DO_SET_MODE)"""
+    def send(vehicle):
+        vehicle.mode = VehicleMode(mode_name)
+    
+    return Confirmation(f"mode change to {mode_name}", MODE_ATTRIBUTES,
+                        lambda v: v.mode.name == mode_name, send, mavutil.mavlink.MAV_CMD_DO_SET_MODE)
+
+def confirm_takeoff(target_altitude: float) -> Confirmation:
+    """Take off and climb to within 5% of the target altitude"""
+    def reached(vehicle):
+        current_altitude = relative_altitude(vehicle)
+        return current_altitude is not None and current_altitude >= target_altitude * 0.95
+    
+    def send(vehicle):
+        vehicle.simple_takeoff(target_altitude)
+    
+    return Confirmation(f"takeoff to {target_altitude}m", ALTITUDE_ATTRIBUTES, reached, send,
+                        mavutil.mavlink.MAV_CMD_NAV_TAKEOFF)
+
+def confirm_landed() -> Confirmation:
+    """Wait for the altitude to drop to near zero"""
+    def landed(vehicle):
+        current_altitude = relative_altitude(vehicle)
+        return current_altitude is not None and current_altitude <= 0.2
+    
+    return Confirmation("landing", ALTITUDE_ATTRIBUTES, landed)
+
+def confirm_descent(initial_altitude: Optional[float]) -> Confirmation:
+    """Wait for a 10% drop from the initial altitude (RTL at the home location)"""
+    def descending(vehicle):
+        current_altitude = relative_altitude(vehicle)
+        return (current_altitude is not None and initial_altitude is not None
+                and current_altitude < initial_altitude * 0.9)
+    
+    return Confirmation("RTL descent", ALTITUDE_ATTRIBUTES, descending)
+
 class DroneCommand:
     """Handles sending commands to a drone via MAVLink"""
     
@@ -19,6 +103,14 @@ class DroneCommand:
             vehicle: DroneKit Vehicle object
         """
         self.vehicle = vehicle
+        
+        # Sends commands and matches COMMAND_ACK results to them
+        self.transport = CommandTransport(vehicle)
+        
+        # Wake functions of the waits in progress, called by interrupt()
+        self._waits_lock = threading.Lock()
+        self._active_waits: List[Callable[[], None]] = []
+        self.interrupted = False
     
     def set_vehicle(self, vehicle: Vehicle):
         """Set the vehicle to command
@@ -27,6 +119,213 @@ class DroneCommand:
             vehicle: DroneKit Vehicle object
         """
         self.vehicle = vehicle
+        if vehicle is not None:
+            self.transport.attach(vehicle)
+        else:
+            self.transport.detach()
+    
+    def _watch(self, attributes, condition) -> AttributeWatch:
+        """Watch a condition on the vehicle
+        
+        Create the watch before sending the command it confirms, so a reply
+        that arrives straight away isn't missed.
+        
+        Args:
+            attributes: Vehicle attributes whose updates can change the condition
+            condition: Called with the vehicle; True once the command has taken effect
+            
+        Returns:
+            AttributeWatch: Watch to pass to _wait_for and close afterwards
+        """
+        return AttributeWatch(self.vehicle, attributes, condition)
+    
+    @contextlib.contextmanager
+    def begin(self, confirmation: Confirmation) -> Iterator[Tuple[AttributeWatch, Optional[PendingAck]]]:
+        """Send a command with its watch and ACK wait already in place
+        
+        Args:
+            confirmation: Command to send and the condition confirming it
+            
+        Yields:
+            tuple: (watch, pending ACK or None) to pass to outcome()
+        """
+        with contextlib.ExitStack() as stack:
+            watch = stack.enter_context(self._watch(confirmation.attributes, confirmation.condition))
+            ack = None
+            if confirmation.ack_command is not None:
+                ack = stack.enter_context(self.transport.expect_ack(confirmation.ack_command))
+            if confirmation.send is not None:
+                confirmation.send(self.vehicle)
+            yield watch, ack
+    
+    def outcome(self, watch: AttributeWatch, ack: Optional[PendingAck] = None) -> Optional[bool]:
+        """Check whether a wait is over
+        
+        Args:
+            watch: Watch for the completion condition
+            ack: Pending COMMAND_ACK of the command
+            
+        Returns:
+            True if the condition was met, False if the command was rejected
+            or interrupted, None to keep waiting
+        """
+        if watch.check():
+            return True
+        if self.interrupted:
+            logger.warning("Command interrupted before it completed")
+            return False
+        if ack is not None and ack.rejected:
+            logger.error(f"{command_name(ack.command)} rejected by vehicle: "
+                         f"{result_name(ack.result)}")
+            return False
+        return None
+    
+    def finish(self, confirmation: Confirmation, ack: Optional[PendingAck], confirmed: bool) -> bool:
+        """Log a wait that ran out of time
+        
+        Rejections and interrupts were already logged by outcome().
+        
+        Returns:
+            bool: confirmed, unchanged
+        """
+        if not confirmed and not self.interrupted and not (ack is not None and ack.rejected):
+            logger.error(f"Timeout waiting for {confirmation.description}")
+        return confirmed
+    
+    def add_waiter(self, wake: Callable[[], None]):
+        """Register a wait so interrupt() wakes it
+        
+        Args:
+            wake: Function taking no arguments, called from the interrupting thread
+        """
+        with self._waits_lock:
+            self._active_waits.append(wake)
+    
+    def remove_waiter(self, wake: Callable[[], None]):
+        """Unregister a wait added with add_waiter"""
+        with self._waits_lock:
+            if wake in self._active_waits:
+                self._active_waits.remove(wake)
+    
+    def confirm(self, confirmation: Confirmation, timeout: float) -> bool:
+        """Send a command and block until it is confirmed
+        
+        Args:
+            confirmation: Command to send and the condition confirming it
+            timeout: Timeout in seconds
+            
+        Returns:
+            bool: True if confirmed, False on rejection, interrupt or timeout
+        """
+        with self.begin(confirmation) as (watch, ack):
+            confirmed = self._wait_for(watch, timeout, ack)
+        return self.finish(confirmation, ack, confirmed)
+    
+    def _wait_for(self, watch: AttributeWatch, timeout: float, ack: Optional[PendingAck] = None) -> bool:
+        """Block until a watch fires, the command is rejected or the timeout passes
+        
+        The watch is signalled from DroneKit's listener callbacks as soon as
+        the confirming message is received. The condition is also re-checked
+        every WATCH_RECHECK_INTERVAL in case a callback never arrives.
+        
+        Args:
+            watch: Watch for the completion condition
+            timeout: Timeout in seconds
+            ack: Pending COMMAND_ACK of the command; a rejection ends the wait
+            
+        Returns:
+            bool: True if the condition was met, False on rejection, interrupt
+            or timeout
+        """
+        wake = threading.Event()
+        watch.add_callback(wake.set)
+        if ack is not None:
+            ack.add_callback(wake.set)
+        self.add_waiter(wake.set)
+        
+        try:
+            start_time = time.time()
+            while True:
+                outcome = self.outcome(watch, ack)
+                if outcome is not None:
+                    return outcome
+                elapsed = time.time() - start_time
+                if elapsed > timeout:
+                    return False
+                wake.wait(min(WATCH_RECHECK_INTERVAL, max(timeout - elapsed, 0)))
+                wake.clear()
+        finally:
+            watch.remove_callback(wake.set)
+            self.remove_waiter(wake.set)
+    
+    def interrupt(self):
+        """Abandon the command in progress
+        
+        Waits for confirmation return False straight away, and keep doing so
+        until clear_interrupt() is called, so a multi-step command such as
+        takeoff stops at the step it had reached. Nothing is sent to the
+        vehicle; the caller should follow up with the command that replaces
+        it (e.g. RTL or LAND).
+        """
+        with self._waits_lock:
+            self.interrupted = True
+            waits = list(self._active_waits)
+        for wake in waits:
+            wake()
+    
+    def clear_interrupt(self):
+        """Allow commands to run again after interrupt()"""
+        self.interrupted = False
+    
+    def send_command(self, command: int, *params: float, ack_timeout: Optional[float] = None,
+                     retries: Optional[int] = None) -> CommandResult:
+        """Send a MAVLink COMMAND_LONG and wait for its COMMAND_ACK
+        
+        Args:
+            command: MAV_CMD id, e.g. mavutil.mavlink.MAV_CMD_DO_SET_SERVO
+            *params: Up to seven command parameters
+            ack_timeout: Seconds to wait for the first ACK
+            retries: Resends if no ACK arrives
+            
+        Returns:
+            CommandResult: Result code, attempts and round-trip time
+        """
+        if not self.vehicle:
+            logger.error(f"No vehicle available for {command_name(command)}")
+            return CommandResult(command, None, None, 0, None)
+        return self.transport.send_command_long(command, params, ack_timeout=ack_timeout, retries=retries)
+    
+    def send_command_int(self, command: int, frame: int, lat: float, lon: float, alt: float,
+                         *params: float, ack_timeout: Optional[float] = None,
+                         retries: Optional[int] = None) -> CommandResult:
+        """Send a MAVLink COMMAND_INT with a position and wait for its COMMAND_ACK
+        
+        Args:
+            command: MAV_CMD id, e.g. mavutil.mavlink.MAV_CMD_DO_REPOSITION
+            frame: MAV_FRAME of the position
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+            alt: Altitude in meters
+            *params: Up to four command parameters
+            ack_timeout: Seconds to wait for the first ACK
+            retries: Resends if no ACK arrives
+            
+        Returns:
+            CommandResult: Result code, attempts and round-trip time
+        """
+        if not self.vehicle:
+            logger.error(f"No vehicle available for {command_name(command)}")
+            return CommandResult(command, None, None, 0, None)
+        return self.transport.send_command_int(command, frame, params, int(lat * 1e7), int(lon * 1e7), alt,
+                                               ack_timeout=ack_timeout, retries=retries)
+    
+    def get_command_stats(self) -> Dict[str, Any]:
+        """Get command ACK statistics
+        
+        Returns:
+            dict: Commands sent, results and round-trip times
+        """
+        return self.transport.get_stats()
     
     def arm(self, timeout: int = 30) -> bool:
         """Arm the drone
@@ -50,30 +349,22 @@ class DroneCommand:
         if self.vehicle.mode.name != "GUIDED":
             logger.info("Setting vehicle mode to GUIDED for arming")
             self.set_mode("GUIDED")
-            time.sleep(1)  # Wait a bit for mode change
         
         # Check if vehicle is armable
         if not self.vehicle.is_armable:
             logger.warning("Vehicle is not armable, waiting...")
             # Wait for GPS lock and other checks
-            start_time = time.time()
-            while not self.vehicle.is_armable:
-                if time.time() - start_time > timeout:
-                    logger.error("Timeout waiting for vehicle to become armable")
-                    return False
-                time.sleep(1)
+            if not self.confirm(confirm_armable(), timeout):
+                return False
+        
+        if self.interrupted:
+            logger.warning("Arming interrupted")
+            return False
         
         # Arm the vehicle
         logger.info("Arming vehicle...")
-        self.vehicle.armed = True
-        
-        # Wait for arming
-        start_time = time.time()
-        while not self.vehicle.armed:
-            if time.time() - start_time > timeout:
-                logger.error("Timeout waiting for vehicle to arm")
-                return False
-            time.sleep(1)
+        if not self.confirm(confirm_armed(True), timeout):
+            return False
         
         logger.info("Vehicle armed successfully")
         return True
@@ -103,15 +394,8 @@ class DroneCommand:
         
         # Disarm the vehicle
         logger.info("Disarming vehicle...")
-        self.vehicle.armed = False
-        
-        # Wait for disarming
-        start_time = time.time()
-        while self.vehicle.armed:
-            if time.time() - start_time > timeout:
-                logger.error("Timeout waiting for vehicle to disarm")
-                return False
-            time.sleep(1)
+        if not self.confirm(confirm_armed(False), timeout):
+            return False
         
         logger.info("Vehicle disarmed successfully")
         return True
@@ -138,15 +422,8 @@ class DroneCommand:
         try:
             # Set the flight mode
             logger.info(f"Setting mode to {mode_name}...")
-            self.vehicle.mode = VehicleMode(mode_name)
-            
-            # Wait for mode change
-            start_time = time.time()
-            while self.vehicle.mode.name != mode_name:
-                if time.time() - start_time > timeout:
-                    logger.error(f"Timeout waiting for mode change to {mode_name}")
-                    return False
-                time.sleep(0.5)
+            if not self.confirm(confirm_mode(mode_name), timeout):
+                return False
             
             logger.info(f"Mode changed to {mode_name} successfully")
             return True
@@ -182,31 +459,20 @@ class DroneCommand:
                 logger.error("Failed to set GUIDED mode for takeoff")
                 return False
         
+        if self.interrupted:
+            logger.warning("Takeoff interrupted")
+            return False
+        
         # Initiate takeoff command
         try:
             logger.info(f"Taking off to altitude: {target_altitude}m...")
-            self.vehicle.simple_takeoff(target_altitude)
             
             # Wait for the drone to reach the target altitude
-            start_time = time.time()
-            
-            while True:
-                current_altitude = self.vehicle.location.global_relative_frame.alt
-                logger.debug(f"Current altitude: {current_altitude}m, Target: {target_altitude}m")
-                
-                # Check if we're close enough to the target altitude
-                if current_altitude >= target_altitude * 0.95:  # Within 5% of target
-                    logger.info(f"Reached target altitude: {current_altitude}m")
-                    break
-                
-                # Check for timeout
-                if time.time() - start_time > timeout:
-                    logger.warning(f"Takeoff timeout! Reached altitude: {current_altitude}m")
-                    return False
-                
-                # Wait a bit
-                time.sleep(1)
+            if not self.confirm(confirm_takeoff(target_altitude), timeout):
+                logger.warning(f"Takeoff stopped at altitude: {relative_altitude(self.vehicle)}m")
+                return False
             
+            logger.info(f"Reached target altitude: {relative_altitude(self.vehicle)}m")
             return True
             
         except Exception as e:
@@ -235,25 +501,11 @@ class DroneCommand:
                 return False
             
             # Wait for the drone to land
-            start_time = time.time()
-            
-            while True:
-                current_altitude = self.vehicle.location.global_relative_frame.alt
-                logger.debug(f"Current altitude during landing: {current_altitude}m")
-                
-                # Check if we've landed (altitude near zero)
-                if current_altitude <= 0.2:
-                    logger.info("Vehicle has landed")
-                    break
-                
-                # Check for timeout
-                if time.time() - start_time > timeout:
-                    logger.warning(f"Landing timeout! Current altitude: {current_altitude}m")
-                    return False
-                
-                # Wait a bit
-                time.sleep(1)
+            if not self.confirm(confirm_landed(), timeout):
+                logger.warning(f"Landing stopped at altitude: {relative_altitude(self.vehicle)}m")
+                return False
             
+            logger.info("Vehicle has landed")
             return True
             
         except Exception as e:
@@ -282,26 +534,12 @@ class DroneCommand:
                 return False
             
             # Wait for the vehicle to start descending
-            start_time = time.time()
-            initial_altitude = self.vehicle.location.global_relative_frame.alt
-            
-            while True:
-                current_altitude = self.vehicle.location.global_relative_frame.alt
-                logger.debug(f"Current altitude during RTL: {current_altitude}m")
-                
-                # Check if we're descending (at home location)
-                if current_altitude < initial_altitude * 0.9:  # 10% decrease indicates descent
-                    logger.info("Vehicle is returning and descending")
-                    break
-                
-                # Check for timeout
-                if time.time() - start_time > timeout:
-                    logger.warning("RTL timeout! Vehicle may still be navigating home")
-                    return False
-                
-                # Wait a bit
-                time.sleep(1)
+            initial_altitude = relative_altitude(self.vehicle)
+            if not self.confirm(confirm_descent(initial_altitude), timeout):
+                logger.warning("Vehicle may still be navigating home")
+                return False
             
+            logger.info("Vehicle is returning and descending")
             return True
             
         except Exception as e:
@@ -1,4 +1,5 @@
 # src/drone/drone_connection.py
+import functools
 import logging
 import time
 import threading
@@ -6,27 +7,87 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 from src.drone import dronekit_wrapper as dronekit
 import dronekit
 from pymavlink import mavutil
+from src.drone.telemetry_recorder import TelemetryRecorder, DEFAULT_TELEMETRY_DIR
+from src.drone.telemetry_replay import ReplayVehicle
+from src.drone.telemetry_streams import TelemetrySubscriptions
+from src.drone.link_monitor import LinkMonitor, LINK_LOST, LINK_RESTORED
+from src.drone.attribute_watch import AttributeWatch
+from src.drone.parameter_cache import CachedParameterVehicle
+from src.utils.config import config_value
 
 logger = logging.getLogger(__name__)
 
+# Attributes DroneKit updates as the core telemetry arrives
+CORE_TELEMETRY_ATTRIBUTES = ("attitude", "location", "mode")
+
+
+def core_telemetry_ready(vehicle) -> bool:
+    """Whether a vehicle has reported its mode, attitude and position"""
+    return (vehicle.mode is not None and vehicle.mode.name is not None
+            and vehicle.attitude.pitch is not None
+            and vehicle.location.global_frame.lat is not None)
+
+
 class DroneConnection:
     """Handles communication with a drone via MAVLink protocol"""
     
-    def __init__(self):
-        """Initialize the drone connection manager"""
+    def __init__(self, config=None):
+        """Initialize the drone connection manager
+        
+        Args:
+            config: Application Config (defaults to DEFAULT_CONFIG values)
+        """
+        self.config = config
         self.vehicle = None
         self.connection_string = ""
         self.is_connected = False
         self.is_simulation = False
-        self.heartbeat_thread = None
-        self.stop_heartbeat = threading.Event()
+        self.recorder = None
+        
+        # Per-message MAVLink subscriptions and stream rates
+        self.subscriptions = TelemetrySubscriptions()
+        
+        # Heartbeat, packet loss, latency and radio statistics
+        self.link_monitor = LinkMonitor(
+            heartbeat_timeout=config_value(self.config, "drone.link.heartbeat_timeout", 3.0),
+            silence_timeout=config_value(self.config, "drone.link.silence_timeout", 1.0),
+            max_loss_percent=config_value(self.config, "drone.link.max_loss_percent", 10.0),
+            max_latency_ms=config_value(self.config, "drone.link.max_latency_ms", 500.0),
+            min_rssi=config_value(self.config, "drone.link.min_rssi", None),
+        )
+        self.link_monitor.register_on_link_event(self._on_link_event)
+        
+        # Connection options, reused when reconnecting
+        self.baud = 57600
+        self.timeout = 30
+        self.lazy = False
+        
+        # Background parameter and mission loading (lazy connections)
+        self.parameters_ready = threading.Event()
+        self.mission_ready = threading.Event()
+        self.loader_thread = None
+        
+        # Automatic reconnection after the heartbeat is lost
+        self.auto_reconnect = config_value(self.config, "drone.reconnect.enabled", True)
+        self.reconnect_initial_delay = config_value(self.config, "drone.reconnect.initial_delay", 0.5)
+        self.reconnect_max_delay = config_value(self.config, "drone.reconnect.max_delay", 30.0)
+        self.reconnect_thread = None
+        self.stop_reconnect = threading.Event()
+        
+        # Parameter table cache (a ParameterCache), None to always download
+        self.parameter_cache = None
+        
+        # Connection timings in seconds from the start of connect()
+        self.connect_metrics: Dict[str, Optional[float]] = {}
+        self.reconnects = 0
         
         # Callback handlers
         self.on_connection_callbacks = []
         self.on_disconnection_callbacks = []
         self.on_status_changed_callbacks = []
         
-    def connect(self, connection_string: str, baud: int = 57600, timeout: int = 30, is_simulation: bool = False) -> bool:
+    def connect(self, connection_string: str, baud: int = 57600, timeout: int = 30, is_simulation: bool = False,
+                lazy: bool = False) -> bool:
         """Connect to a drone
         
         Args:
@@ -34,27 +95,76 @@ class DroneConnection:
             baud: Baud rate for serial connections
             timeout: Connection timeout in seconds
             is_simulation: Whether this is a simulated connection
+            lazy: Return once the heartbeat and core telemetry (mode, attitude,
+                position) are live, and load parameters and the mission in the
+                background, instead of waiting for every attribute and the
+                full parameter set
             
         Returns:
             bool: True if connection successful, False otherwise
         """
         self.connection_string = connection_string
         self.is_simulation = is_simulation
+        self.baud = baud
+        self.timeout = timeout
+        self.lazy = lazy
+        self.stop_reconnect.clear()
+        
+        return self._open()
+    
+    def _open(self) -> bool:
+        """Open the connection with the stored options
+        
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        connection_string = self.connection_string
+        started = time.monotonic()
+        self.connect_metrics = {
+            "time_to_heartbeat": None,
+            "time_to_first_telemetry": None,
+            "time_to_parameters": None,
+            "time_to_mission": None,
+        }
+        self.parameters_ready.clear()
+        self.mission_ready.clear()
         
         try:
             logger.info(f"Connecting to drone on {connection_string}...")
             
-            # Connect to the vehicle
+            # Connect to the vehicle; lazily, this returns at the first heartbeat
+            options = {"heartbeat_timeout": self.timeout} if self.lazy else {"wait_ready": True}
+            if self.parameter_cache is not None:
+                options["vehicle_class"] = functools.partial(CachedParameterVehicle, cache=self.parameter_cache)
             if "tcp:" in connection_string or "udp:" in connection_string:
-                self.vehicle = dronekit.connect(connection_string, wait_ready=True, timeout=timeout)
+                self.vehicle = dronekit.connect(connection_string, timeout=self.timeout, **options)
             else:
-                self.vehicle = dronekit.connect(connection_string, baud=baud, wait_ready=True, timeout=timeout)
+                self.vehicle = dronekit.connect(connection_string, baud=self.baud, timeout=self.timeout, **options)
+            self.connect_metrics["time_to_heartbeat"] = time.monotonic() - started
             
             self.is_connected = True
             logger.info(f"Connected to drone on {connection_string}")
             
-            # Start heartbeat monitoring
-            self._start_heartbeat_monitoring()
+            # Subscribe to the raw message stream and request stream rates
+            self.subscriptions.attach(self.vehicle)
+            self.apply_stream_rates()
+            
+            if config_value(self.config, "drone.record_telemetry", False):
+                self.start_recording()
+            
+            if self.lazy:
+                self._wait_for_core_telemetry(started)
+                self._start_background_loading(self.vehicle, started)
+            else:
+                # wait_ready covered telemetry, parameters and (by default) the mission
+                elapsed = time.monotonic() - started
+                for key in self.connect_metrics:
+                    self.connect_metrics[key] = elapsed
+                self.parameters_ready.set()
+                self.mission_ready.set()
+            
+            # Start link monitoring
+            self._start_link_monitoring()
             
             # Trigger connection callbacks
             self._trigger_connection_callbacks()
@@ -66,12 +176,131 @@ class DroneConnection:
             self.is_connected = False
             return False
     
+    def _wait_for_core_telemetry(self, started: float):
+        """Wait until mode, attitude and position have been reported
+        
+        Args:
+            started: time.monotonic() when connecting started
+        """
+        with AttributeWatch(self.vehicle, CORE_TELEMETRY_ATTRIBUTES, core_telemetry_ready) as watch:
+            if watch.wait(self.timeout):
+                elapsed = time.monotonic() - started
+                self.connect_metrics["time_to_first_telemetry"] = elapsed
+                logger.info(f"Core telemetry live {elapsed:.2f} s after connecting")
+            else:
+                logger.warning(f"No core telemetry within {self.timeout} s, continuing without it")
+    
+    def _start_background_loading(self, vehicle, started: float):
+        """Load parameters and the mission without blocking connect()
+        
+        Args:
+            vehicle: Vehicle that was just connected
+            started: time.monotonic() when connecting started
+        """
+        self.loader_thread = threading.Thread(
+            target=self._load_in_background, args=(vehicle, started), name="drone-loader", daemon=True
+        )
+        self.loader_thread.start()
+    
+    def _load_in_background(self, vehicle, started: float):
+        """Wait for the parameter download DroneKit started, then download the mission
+        
+        Args:
+            vehicle: Vehicle to load from
+            started: time.monotonic() when connecting started
+        """
+        try:
+            if vehicle.wait_ready('parameters', timeout=self.timeout, raise_exception=False):
+                if vehicle is not self.vehicle:
+                    return
+                elapsed = time.monotonic() - started
+                self.connect_metrics["time_to_parameters"] = elapsed
+                self.parameters_ready.set()
+                logger.info(f"Parameters loaded {elapsed:.2f} s after connecting")
+            else:
+                logger.warning("Timed out loading parameters in the background")
+            
+            commands = vehicle.commands
+            commands.download()
+            if commands.wait_ready(timeout=self.timeout, raise_exception=False):
+                if vehicle is not self.vehicle:
+                    return
+                elapsed = time.monotonic() - started
+                self.connect_metrics["time_to_mission"] = elapsed
+                self.mission_ready.set()
+                logger.info(f"Mission loaded {elapsed:.2f} s after connecting")
+            else:
+                logger.warning("Timed out loading the mission in the background")
+            
+            self._trigger_status_changed_callbacks()
+            
+        except Exception as e:
+            logger.error(f"Error loading vehicle state in the background: {str(e)}")
+    
+    def get_connect_metrics(self) -> Dict:
+        """Get how long the last connection took to become usable
+        
+        Returns:
+            dict: Connection mode, seconds from the start of connecting to the
+            first heartbeat, first core telemetry, parameters and mission (None
+            until reached), where the parameters came from ('cache' or
+            'download') and the number of automatic reconnects
+        """
+        metrics = dict(self.connect_metrics)
+        metrics["mode"] = "lazy" if self.lazy else "full"
+        metrics["parameter_source"] = (self.vehicle.parameter_source
+                                       if isinstance(self.vehicle, CachedParameterVehicle) else None)
+        metrics["reconnects"] = self.reconnects
+        return metrics
+    
+    def connect_replay(self, log_path: str, speed: Optional[float] = 1.0, loop: bool = False) -> bool:
+        """Connect to a recorded telemetry log instead of a live drone
+        
+        Args:
+            log_path: Path to a .tlog file
+            speed: Playback speed multiple, or None for as fast as possible
+            loop: Start over when the end of the log is reached
+            
+        Returns:
+            bool: True if the log was loaded, False otherwise
+        """
+        self.connection_string = f"replay:{log_path}"
+        self.is_simulation = True
+        
+        try:
+            self.vehicle = ReplayVehicle(log_path, speed=speed, loop=loop)
+            self.subscriptions.attach(self.vehicle)
+            self.is_connected = True
+            logger.info(f"Replaying telemetry from {log_path}")
+            
+            # A replay has no link to monitor
+            self._trigger_connection_callbacks()
+            self.vehicle.start()
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to open telemetry log: {str(e)}")
+            self.vehicle = None
+            self.is_connected = False
+            return False
+    
+    @property
+    def is_replay(self) -> bool:
+        """Whether the current vehicle is a telemetry replay"""
+        return isinstance(self.vehicle, ReplayVehicle)
+    
     def disconnect(self):
         """Disconnect from the drone"""
+        self.stop_reconnect.set()
         if self.vehicle:
             try:
-                # Stop heartbeat monitoring
-                self._stop_heartbeat_monitoring()
+                # Stop link monitoring
+                self._stop_link_monitoring()
+                
+                # Finish writing the telemetry log
+                self.stop_recording()
+                self.subscriptions.detach()
                 
                 # Close the connection
                 self.vehicle.close()
@@ -84,55 +313,173 @@ class DroneConnection:
             except Exception as e:
                 logger.error(f"Error disconnecting from drone: {str(e)}")
     
-    def _start_heartbeat_monitoring(self):
-        """Start a thread to monitor the drone heartbeat"""
-        if self.heartbeat_thread and self.heartbeat_thread.is_alive():
+    def _start_link_monitoring(self):
+        """Start monitoring heartbeats and link quality"""
+        if self.link_monitor.is_running:
+            return
+        self.link_monitor.start(self.vehicle, self.subscriptions)
+    
+    def _stop_link_monitoring(self):
+        """Stop link monitoring"""
+        self.link_monitor.stop()
+    
+    def _on_link_event(self, event: str, reasons: List[str]):
+        """Handle a link monitor event
+        
+        Args:
+            event: LINK_LOST, LINK_RESTORED, LINK_DEGRADED or LINK_RECOVERED
+            reasons: Current link degradation reasons
+        """
+        if event == LINK_LOST:
+            self.is_connected = False
+            self._trigger_disconnection_callbacks()
+            if self.auto_reconnect and not self.is_replay:
+                self._start_reconnect()
+        elif event == LINK_RESTORED:
+            logger.info("Reconnected to drone, heartbeat restored")
+            self.is_connected = True
+            self._trigger_connection_callbacks()
+        else:
+            self._trigger_status_changed_callbacks()
+    
+    def _start_reconnect(self):
+        """Start reconnecting in the background unless already doing so"""
+        if self.reconnect_thread is not None and self.reconnect_thread.is_alive():
             return
+        self.reconnect_thread = threading.Thread(target=self._reconnect_loop, name="drone-reconnect", daemon=True)
+        self.reconnect_thread.start()
+    
+    def _reconnect_loop(self):
+        """Reopen the connection with exponential backoff until it is back or disconnect() is called"""
+        delay = self.reconnect_initial_delay
+        attempt = 0
+        # The first attempt stops the recorder; resume it on whichever attempt succeeds
+        recording = self.recorder is not None and self.recorder.is_recording
+        while not self.stop_reconnect.wait(delay):
+            # The heartbeat came back on the existing connection
+            if self.is_connected:
+                return
+            
+            attempt += 1
+            logger.info(f"Reconnecting to drone on {self.connection_string} (attempt {attempt})...")
+            self._close_vehicle()
+            
+            if self._open():
+                # disconnect() was called while this attempt was connecting
+                if self.stop_reconnect.is_set():
+                    logger.info("Disconnect requested during reconnect, closing the new connection")
+                    self.disconnect()
+                    return
+                self.reconnects += 1
+                if recording:
+                    self.recorder.start(self.vehicle)
+                return
+            
+            delay = min(delay * 2, self.reconnect_max_delay)
+            logger.warning(f"Reconnect attempt {attempt} failed, retrying in {delay:.1f} s")
+    
+    def _close_vehicle(self):
+        """Close the current vehicle without triggering disconnection callbacks"""
+        self._stop_link_monitoring()
+        self.stop_recording()
+        self.subscriptions.detach()
+        if self.vehicle:
+            try:
+                self.vehicle.close()
+            except Exception as e:
+                logger.error(f"Error closing vehicle: {str(e)}")
+        self.vehicle = None
+    
+    def get_link_stats(self) -> Dict:
+        """Get rolling link-quality statistics
+        
+        Returns:
+            dict: Packet loss, message rates, TIMESYNC latency and radio status
+        """
+        return self.link_monitor.get_stats()
+    
+    def apply_stream_rates(self) -> Dict[str, float]:
+        """Request telemetry stream rates from drone.telemetry_frequency and drone.message_rates
+        
+        Returns:
+            dict: Message rates that were requested
+        """
+        return self.subscriptions.apply_stream_rates(
+            config_value(self.config, "drone.telemetry_frequency", 2.0),
+            config_value(self.config, "drone.message_rates", {}),
+        )
+    
+    def subscribe_message(self, message_type: str, callback: Callable):
+        """Register a callback for one MAVLink message type
         
-        self.stop_heartbeat.clear()
-        self.heartbeat_thread = threading.Thread(target=self._heartbeat_loop)
-        self.heartbeat_thread.daemon = True
-        self.heartbeat_thread.start()
-        logger.debug("Heartbeat monitoring started")
-    
-    def _stop_heartbeat_monitoring(self):
-        """Stop the heartbeat monitoring thread"""
-        if self.heartbeat_thread and self.heartbeat_thread.is_alive():
-            self.stop_heartbeat.set()
-            self.heartbeat_thread.join(timeout=2.0)
-            logger.debug("Heartbeat monitoring stopped")
-    
-    def _heartbeat_loop(self):
-        """Heartbeat monitoring loop"""
-        last_heartbeat_time = time.time()
-        was_connected = True
-        
-        while not self.stop_heartbeat.is_set():
-            # Check if we're still connected
-            if self.vehicle:
-                # Get last heartbeat time
-                try:
-                    current_time = time.time()
-                    time_since_last_heartbeat = current_time - self.vehicle.last_heartbeat
-                    
-                    # If we haven't received a heartbeat in 3 seconds, consider the connection lost
-                    if time_since_last_heartbeat > 3.0:
-                        if was_connected:
-                            logger.warning(f"Lost heartbeat from drone, last heartbeat {time_since_last_heartbeat:.1f}s ago")
-                            was_connected = False
-                            self.is_connected = False
-                            self._trigger_disconnection_callbacks()
-                    else:
-                        if not was_connected:
-                            logger.info("Reconnected to drone, heartbeat restored")
-                            was_connected = True
-                            self.is_connected = True
-                            self._trigger_connection_callbacks()
-                except:
-                    pass
-                    
-            # Sleep for a bit
-            time.sleep(1.0)
+        Args:
+            message_type: Message name (e.g., 'ATTITUDE'), or '*' for all
+            callback: Function to call with a TimedMessage
+        """
+        self.subscriptions.subscribe(message_type, callback)
+    
+    def unsubscribe_message(self, message_type: str, callback: Callable):
+        """Unregister a message callback
+        
+        Args:
+            message_type: Message name the callback was registered for
+            callback: Function to unregister
+        """
+        self.subscriptions.unsubscribe(message_type, callback)
+    
+    def set_message_rate(self, message_type: str, rate_hz: float) -> bool:
+        """Change the stream rate of one MAVLink message type
+        
+        Args:
+            message_type: Message name (e.g., 'ATTITUDE')
+            rate_hz: Messages per second, 0 to stop the stream
+            
+        Returns:
+            bool: True if the request was sent, False otherwise
+        """
+        if not self.vehicle:
+            logger.error("No vehicle available to set message rate")
+            return False
+        return self.subscriptions.set_message_interval(message_type, rate_hz)
+    
+    def start_recording(self, directory: Optional[str] = None, **options) -> bool:
+        """Start recording raw MAVLink telemetry to .tlog files
+        
+        Args:
+            directory: Directory for the log files (defaults to 'paths.telemetry')
+            **options: Further TelemetryRecorder options (max_file_bytes, queue_size, ...)
+            
+        Returns:
+            bool: True if recording started, False otherwise
+        """
+        if not self.vehicle:
+            logger.error("No vehicle available for telemetry recording")
+            return False
+        if self.recorder and self.recorder.is_recording:
+            return True
+        
+        if directory is None:
+            directory = config_value(self.config, "paths.telemetry", DEFAULT_TELEMETRY_DIR)
+        
+        try:
+            self.recorder = TelemetryRecorder(directory, **options)
+            return self.recorder.start(self.vehicle)
+        except Exception as e:
+            logger.error(f"Failed to start telemetry recording: {str(e)}")
+            return False
+    
+    def stop_recording(self):
+        """Stop recording telemetry"""
+        if self.recorder:
+            self.recorder.stop()
+    
+    def get_recording_stats(self) -> Optional[Dict]:
+        """Get telemetry recorder counters
+        
+        Returns:
+            dict: Recorder statistics, or None if nothing has been recorded
+        """
+        return self.recorder.get_stats() if self.recorder else None
     
     def register_on_connection(self, callback: Callable):
         """Register a callback for when the drone connects
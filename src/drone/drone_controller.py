@@ -9,19 +9,41 @@ from .drone_state import DroneState
 from .drone_command import DroneCommand
 from .mission_manager import MissionManager
 from .parameter_manager import ParameterManager
+from .parameter_cache import ParameterCache, DEFAULT_PARAMETER_CACHE_DIR
+from .telemetry_history import TelemetryHistory
+from .command_executor import CommandExecutor, CommandTicket, PRIORITY_EMERGENCY, PRIORITY_NORMAL
+from src.utils.config import config_value
 
 logger = logging.getLogger(__name__)
 
+# Operations (and flight modes) that take over from GUIDED commands
+EMERGENCY_OPERATIONS = ("return_to_launch", "land")
+EMERGENCY_MODES = ("RTL", "LAND")
+
 class DroneController:
     """Main controller for drone operations"""
     
-    def __init__(self):
-        """Initialize the drone controller"""
-        self.connection = DroneConnection()
+    def __init__(self, config=None):
+        """Initialize the drone controller
+        
+        Args:
+            config: Application Config (defaults to DEFAULT_CONFIG values)
+        """
+        self.config = config
+        self.connection = DroneConnection(config)
         self.state = DroneState()
         self.command = DroneCommand()
         self.mission = MissionManager()
-        self.parameters = ParameterManager()
+        self.parameters = ParameterManager(cache=self._create_parameter_cache())
+        self.connection.parameter_cache = self.parameters.cache
+        
+        # Runs commands off the caller's thread; RTL and LAND preempt
+        self.executor = CommandExecutor(interrupt=self.command.interrupt,
+                                        resume=self.command.clear_interrupt)
+        
+        # Shared telemetry history for charts and trends
+        self.history = TelemetryHistory()
+        self.history.attach(self.state)
         
         # Register callbacks
         self.connection.register_on_connection(self._on_connect)
@@ -33,7 +55,21 @@ class DroneController:
         # Callback handlers
         self.state_change_callbacks = []
     
-    def connect(self, connection_string: str, baud: int = 57600, timeout: int = 30, is_simulation: bool = False) -> bool:
+    def _create_parameter_cache(self) -> Optional[ParameterCache]:
+        """Create the parameter cache from the drone.parameter_cache settings
+        
+        Returns:
+            ParameterCache: The cache, or None if disabled
+        """
+        if not config_value(self.config, "drone.parameter_cache.enabled", True):
+            return None
+        return ParameterCache(
+            config_value(self.config, "drone.parameter_cache.directory", DEFAULT_PARAMETER_CACHE_DIR),
+            spot_checks=config_value(self.config, "drone.parameter_cache.spot_checks", 8),
+        )
+    
+    def connect(self, connection_string: str, baud: int = 57600, timeout: int = 30, is_simulation: bool = False,
+                lazy: Optional[bool] = None) -> bool:
         """Connect to a drone
         
         Args:
@@ -41,12 +77,17 @@ class DroneController:
             baud: Baud rate for serial connections
             timeout: Connection timeout in seconds
             is_simulation: Whether this is a simulated connection
+            lazy: Return once core telemetry is live and load parameters and the
+                mission in the background; None uses drone.connect_lazily
             
         Returns:
             bool: True if connection successful, False otherwise
         """
+        if lazy is None:
+            lazy = bool(config_value(self.config, "drone.connect_lazily", False))
+        
         # Connect to the drone
-        if self.connection.connect(connection_string, baud, timeout, is_simulation):
+        if self.connection.connect(connection_string, baud, timeout, is_simulation, lazy=lazy):
             # Wait for the _on_connect callback to handle integration
             start_time = time.time()
             while not self.is_connected and time.time() - start_time < timeout:
@@ -56,10 +97,27 @@ class DroneController:
         
         return False
     
+    def connect_replay(self, log_path: str, speed: Optional[float] = 1.0, loop: bool = False) -> bool:
+        """Drive the controller from a recorded telemetry log
+        
+        Args:
+            log_path: Path to a .tlog file
+            speed: Playback speed multiple, or None for as fast as possible
+            loop: Start over when the end of the log is reached
+            
+        Returns:
+            bool: True if the replay started, False otherwise
+        """
+        if self.connection.connect_replay(log_path, speed, loop):
+            return self.is_connected
+        
+        return False
+    
     def disconnect(self):
-        """Disconnect from the drone"""
-        if self.is_connected:
-            self.connection.disconnect()
+        """Disconnect from the drone, also stopping any automatic reconnection"""
+        # Always pass this on: while reconnecting, neither side is connected
+        # but the reconnect loop still has to be stopped
+        self.connection.disconnect()
     
     def _on_connect(self):
         """Handle connection established"""
@@ -83,6 +141,9 @@ class DroneController:
         """Handle disconnection"""
         logger.info("Drone disconnected, cleaning up...")
         
+        # Drop commands that can no longer be sent
+        self.executor.cancel_all()
+        
         # Clear the vehicle from all components
         self.state.clear_vehicle()
         
@@ -198,6 +259,39 @@ class DroneController:
         """
         return self.command.set_mode(mode_name)
     
+    def submit(self, operation: str, *args, **kwargs) -> CommandTicket:
+        """Run a controller operation on the command executor without waiting
+        
+        return_to_launch, land and set_mode("RTL"/"LAND") are queued ahead
+        of other commands and cancel the GUIDED operations queued or running.
+        
+        Args:
+            operation: Name of a DroneController method, e.g. "takeoff"
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+            
+        Returns:
+            CommandTicket: Handle reporting the command's progress and result
+        """
+        func = getattr(self, operation)
+        emergency = operation in EMERGENCY_OPERATIONS or \
+            (operation == "set_mode" and bool(args) and str(args[0]).upper() in EMERGENCY_MODES)
+        name = operation.replace("_", " ").capitalize()
+        if emergency:
+            return self.executor.submit(name, func, *args, priority=PRIORITY_EMERGENCY,
+                                        preemptible=False, preempts=True, **kwargs)
+        return self.executor.submit(name, func, *args, priority=PRIORITY_NORMAL, **kwargs)
+    
+    def get_command_stats(self) -> Dict[str, Any]:
+        """Get command executor and COMMAND_ACK statistics
+        
+        Returns:
+            dict: Executor outcome counters and per-command latency, plus ACK results
+        """
+        stats = self.executor.get_stats()
+        stats["acks"] = self.command.get_command_stats()
+        return stats
+    
     def clear_mission(self) -> bool:
         """Clear the current mission
         
@@ -5,6 +5,8 @@ import threading
 from typing import Dict, Any, Optional, Callable, List
 from src.drone import dronekit_wrapper as dronekit
 from dronekit import Vehicle, LocationGlobal, LocationGlobalRelative, VehicleMode
+from src.drone.state_snapshot import DroneStateSnapshot, StateField, STATE_FIELDS, FIELD_INDEX, changed_fields
+from src.drone.state_notifier import StateNotifier, DEFAULT_MAX_RATE_HZ
 
 logger = logging.getLogger(__name__)
 
@@ -19,32 +21,42 @@ class DroneState:
         """
         self.vehicle = vehicle
         
-        # State attributes
-        self.latitude = 0.0
-        self.longitude = 0.0
-        self.altitude = 0.0
-        self.relative_altitude = 0.0
-        self.heading = 0
-        self.airspeed = 0.0
-        self.groundspeed = 0.0
-        self.roll = 0.0
-        self.pitch = 0.0
-        self.yaw = 0.0
-        self.mode = ""
-        self.armed = False
-        self.battery_voltage = 0.0
-        self.battery_level = 0.0
-        self.battery_current = 0.0
-        self.gps_fix = 0
-        self.gps_satellites = 0
-        self.last_update_time = 0.0
+        # State attributes, written into a back buffer in STATE_FIELDS order.
+        # Readers get the published snapshot instead, which is swapped in
+        # whole so it never mixes values from two updates.
+        self._values = [
+            0.0,    # latitude
+            0.0,    # longitude
+            0.0,    # altitude
+            0.0,    # relative_altitude
+            0,      # heading
+            0.0,    # airspeed
+            0.0,    # groundspeed
+            0.0,    # roll
+            0.0,    # pitch
+            0.0,    # yaw
+            "",     # mode
+            False,  # armed
+            0.0,    # battery_voltage
+            0.0,    # battery_level
+            0.0,    # battery_current
+            0,      # gps_fix
+            0,      # gps_satellites
+            0.0,    # last_update_time
+        ]
+        # Set when attributes were assigned directly and not yet published
+        self._dirty = False
+        
+        # Last published snapshot; serializes writers, never taken by readers
+        self._snapshot_lock = threading.Lock()
+        self._snapshot = DroneStateSnapshot(tuple(self._values))
+        
+        # State change callbacks, delivered at a bounded rate per subscriber
+        self.notifier = StateNotifier()
         
         # Attribute listeners
         self._setup_attribute_listeners()
         
-        # State change callbacks
-        self.state_change_callbacks = []
-        
         # Update thread
         self.update_thread = None
         self.stop_update = threading.Event()
@@ -62,6 +74,7 @@ class DroneState:
     def clear_vehicle(self):
         """Clear the vehicle reference"""
         self._stop_update_thread()
+        self.notifier.stop()
         self.vehicle = None
     
     def _setup_attribute_listeners(self):
@@ -104,16 +117,16 @@ class DroneState:
             attribute_name: Attribute name
             value: New value
         """
+        fields = {}
         if value and value.global_frame:
-            self.latitude = value.global_frame.lat
-            self.longitude = value.global_frame.lon
-            self.altitude = value.global_frame.alt
+            fields.update(latitude=value.global_frame.lat,
+                          longitude=value.global_frame.lon,
+                          altitude=value.global_frame.alt)
             
         if value and value.global_relative_frame:
-            self.relative_altitude = value.global_relative_frame.alt
+            fields["relative_altitude"] = value.global_relative_frame.alt
         
-        self.last_update_time = time.time()
-        self._notify_state_change()
+        self._write(last_update_time=time.time(), **fields)
     
     def _update_attitude(self, vehicle, attribute_name, value):
         """Update attitude information
@@ -123,13 +136,11 @@ class DroneState:
             attribute_name: Attribute name
             value: New value
         """
+        fields = {}
         if value:
-            self.roll = value.roll
-            self.pitch = value.pitch
-            self.yaw = value.yaw
+            fields.update(roll=value.roll, pitch=value.pitch, yaw=value.yaw)
             
-        self.last_update_time = time.time()
-        self._notify_state_change()
+        self._write(last_update_time=time.time(), **fields)
     
     def _update_velocity(self, vehicle, attribute_name, value):
         """Update velocity information
@@ -140,8 +151,7 @@ class DroneState:
             value: New value
         """
         # TODO: Implement velocity updates
-        self.last_update_time = time.time()
-        self._notify_state_change()
+        self._write(last_update_time=time.time())
     
     def _update_armed(self, vehicle, attribute_name, value):
         """Update armed status
@@ -151,9 +161,7 @@ class DroneState:
             attribute_name: Attribute name
             value: New value
         """
-        self.armed = value
-        self.last_update_time = time.time()
-        self._notify_state_change()
+        self._write(armed=value, last_update_time=time.time())
     
     def _update_mode(self, vehicle, attribute_name, value):
         """Update flight mode
@@ -163,11 +171,11 @@ class DroneState:
             attribute_name: Attribute name
             value: New value
         """
+        fields = {}
         if value:
-            self.mode = value.name
+            fields["mode"] = value.name
         
-        self.last_update_time = time.time()
-        self._notify_state_change()
+        self._write(last_update_time=time.time(), **fields)
     
     def _update_battery(self, vehicle, attribute_name, value):
         """Update battery information
@@ -177,13 +185,13 @@ class DroneState:
             attribute_name: Attribute name
             value: New value
         """
+        fields = {}
         if value:
-            self.battery_voltage = value.voltage
-            self.battery_level = value.level
-            self.battery_current = value.current
+            fields.update(battery_voltage=value.voltage,
+                          battery_level=value.level,
+                          battery_current=value.current)
         
-        self.last_update_time = time.time()
-        self._notify_state_change()
+        self._write(last_update_time=time.time(), **fields)
     
     def _update_gps(self, vehicle, attribute_name, value):
         """Update GPS information
@@ -193,12 +201,11 @@ class DroneState:
             attribute_name: Attribute name
             value: New value
         """
+        fields = {}
         if value:
-            self.gps_fix = value.fix_type
-            self.gps_satellites = value.satellites_visible
+            fields.update(gps_fix=value.fix_type, gps_satellites=value.satellites_visible)
         
-        self.last_update_time = time.time()
-        self._notify_state_change()
+        self._write(last_update_time=time.time(), **fields)
     
     def _start_update_thread(self):
         """Start the update thread"""
@@ -223,15 +230,17 @@ class DroneState:
         while not self.stop_update.is_set() and self.vehicle:
             try:
                 # Update airspeed and groundspeed
-                self.airspeed = self.vehicle.airspeed
-                self.groundspeed = self.vehicle.groundspeed
+                fields = {
+                    "airspeed": self.vehicle.airspeed,
+                    "groundspeed": self.vehicle.groundspeed,
+                }
                 
                 # Update heading
                 if hasattr(self.vehicle, 'heading'):
-                    self.heading = self.vehicle.heading
+                    fields["heading"] = self.vehicle.heading
                 
-                # Only notify if something changed
-                self._notify_state_change()
+                # Only notifies if something changed
+                self._write(**fields)
                 
             except Exception as e:
                 logger.error(f"Error in state update loop: {str(e)}")
@@ -239,14 +248,26 @@ class DroneState:
             # Sleep for a bit
             time.sleep(0.5)
     
-    def register_state_change_callback(self, callback: Callable):
+    @property
+    def state_change_callbacks(self) -> List[Callable]:
+        """Registered state change callbacks"""
+        return self.notifier.callbacks
+    
+    def register_state_change_callback(self, callback: Callable,
+                                       max_rate_hz: Optional[float] = DEFAULT_MAX_RATE_HZ,
+                                       fields: int = StateField.ALL):
         """Register a callback for state changes
         
+        The first change is delivered right away; further changes within
+        1/max_rate_hz are coalesced into one call with the latest snapshot.
+        Arming and mode changes are always delivered immediately.
+        
         Args:
-            callback: Function to call on state changes
+            callback: Function to call with a DroneStateSnapshot
+            max_rate_hz: Maximum calls per second, or None for every change
+            fields: StateField flags the callback cares about
         """
-        if callback not in self.state_change_callbacks:
-            self.state_change_callbacks.append(callback)
+        self.notifier.subscribe(callback, max_rate_hz, fields)
     
     def unregister_state_change_callback(self, callback: Callable):
         """Unregister a state change callback
@@ -254,40 +275,96 @@ class DroneState:
         Args:
             callback: Function to unregister
         """
-        if callback in self.state_change_callbacks:
-            self.state_change_callbacks.remove(callback)
+        self.notifier.unsubscribe(callback)
+    
+    def get_notification_stats(self) -> Dict[str, Any]:
+        """Get state callback counts and latency
+        
+        Returns:
+            dict: See StateNotifier.get_stats()
+        """
+        return self.notifier.get_stats()
     
     def _notify_state_change(self):
-        """Notify all registered callbacks of state change"""
-        for callback in self.state_change_callbacks:
-            try:
-                callback(self.get_state())
-            except Exception as e:
-                logger.error(f"Error in state change callback: {str(e)}")
+        """Notify registered callbacks of a state change
+        
+        Publishes attributes assigned directly since the last snapshot.
+        One snapshot is built per change and shared by all callbacks.
+        Nothing is sent if no field changed since the last snapshot.
+        """
+        with self._snapshot_lock:
+            snapshot, is_new = self._publish()
+            immediate = self.notifier.mark(snapshot) if is_new else ()
+        self.notifier.deliver(immediate)
+    
+    def _write(self, **fields):
+        """Update several fields as one change and notify callbacks
+        
+        The fields are published together in a single snapshot, so no
+        reader sees some of them updated and others not.
+        
+        Args:
+            **fields: New field values by name
+        """
+        with self._snapshot_lock:
+            values = self._values
+            for name, value in fields.items():
+                values[FIELD_INDEX[name]] = value
+            snapshot, is_new = self._publish()
+            # Marked under the lock so subscribers see versions in order
+            immediate = self.notifier.mark(snapshot) if is_new else ()
+        # Callbacks run outside the lock
+        self.notifier.deliver(immediate)
+    
+    def _publish(self):
+        """Swap in a new snapshot if any field changed (called with the lock held)
+        
+        Returns:
+            tuple: (latest snapshot, whether it was just built)
+        """
+        self._dirty = False
+        values = tuple(self._values)
+        previous = self._snapshot
+        if values == previous.values_tuple:
+            return previous, False
+        self._snapshot = DroneStateSnapshot(
+            values, previous.version + 1, changed_fields(previous.values_tuple, values)
+        )
+        return self._snapshot, True
+    
+    def get_snapshot(self) -> DroneStateSnapshot:
+        """Get an immutable snapshot of the current state
+        
+        Lock-free unless attributes were assigned directly since the last
+        update, in which case they are published first.
+        
+        Returns:
+            DroneStateSnapshot: Latest snapshot, shared while nothing changes
+        """
+        if self._dirty:
+            with self._snapshot_lock:
+                self._publish()
+        return self._snapshot
     
     def get_state(self) -> Dict[str, Any]:
         """Get the current drone state
         
         Returns:
-            dict: Current state as a dictionary
+            dict: Current state as a dictionary, from one consistent snapshot
         """
-        return {
-            "latitude": self.latitude,
-            "longitude": self.longitude,
-            "altitude": self.altitude,
-            "relative_altitude": self.relative_altitude,
-            "heading": self.heading,
-            "airspeed": self.airspeed,
-            "groundspeed": self.groundspeed,
-            "roll": self.roll,
-            "pitch": self.pitch,
-            "yaw": self.yaw,
-            "mode": self.mode,
-            "armed": self.armed,
-            "battery_voltage": self.battery_voltage,
-            "battery_level": self.battery_level,
-            "battery_current": self.battery_current,
-            "gps_fix": self.gps_fix,
-            "gps_satellites": self.gps_satellites,
-            "last_update_time": self.last_update_time
-        }
\ No newline at end of file
+        return self.get_snapshot().as_dict()
+
+
+def _state_property(index: int, name: str) -> property:
+    def get_value(self):
+        return self._values[index]
+    
+    def set_value(self, value):
+        self._values[index] = value
+        self._dirty = True
+    
+    return property(get_value, set_value, doc=f"Latest written {name}")
+
+
+for _index, _name in enumerate(STATE_FIELDS):
+    setattr(DroneState, _name, _state_property(_index, _name))
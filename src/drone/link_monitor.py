@@ -0,0 +1,401 @@
+# src/drone/link_monitor.py
+import time
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from pymavlink import mavutil
+
+from src.drone.telemetry_streams import ALL_MESSAGES
+
+logger = logging.getLogger(__name__)
+
+# Link events passed to callbacks
+LINK_LOST = "lost"
+LINK_RESTORED = "restored"
+LINK_DEGRADED = "degraded"
+LINK_RECOVERED = "recovered"
+
+# Reasons a link counts as degraded
+REASON_LOSS = "packet_loss"
+REASON_LATENCY = "latency"
+REASON_RSSI = "rssi"
+REASON_SILENT = "silent"
+
+# Width of the rolling-window buckets, seconds
+BUCKET_SECONDS = 0.1
+
+# TIMESYNC requests remembered for matching replies
+TIMESYNC_OUTSTANDING = 8
+
+
+class LinkMonitor:
+    """Rolling link-quality statistics for a MAVLink connection
+
+    Every received message updates the statistics on the receive thread:
+    sequence-number gaps per sending component give packet loss, message
+    counts give per-type rates, TIMESYNC replies give round-trip latency
+    and RADIO_STATUS gives RSSI. Counts are kept in BUCKET_SECONDS buckets
+    over a sliding window.
+
+    A watchdog thread ticks every watchdog_interval (50 ms by default) to
+    catch what no message can report: a missing heartbeat or a silent link.
+    It also sends the TIMESYNC requests. Degradation is therefore reported
+    within one bucket or tick of happening, rather than at the next poll.
+
+    Callbacks registered with register_on_link_event() are called with the
+    event name and the list of degradation reasons.
+    """
+
+    def __init__(self, window: float = 10.0, heartbeat_timeout: float = 3.0,
+                 silence_timeout: float = 1.0, max_loss_percent: float = 10.0,
+                 max_latency_ms: float = 500.0, min_rssi: Optional[float] = None,
+                 timesync_interval: Optional[float] = 1.0, watchdog_interval: float = 0.05):
+        """Initialize the monitor
+
+        Args:
+            window: Seconds covered by the rolling statistics
+            heartbeat_timeout: Seconds without a vehicle heartbeat before the link is lost
+            silence_timeout: Seconds without any message before the link is degraded
+            max_loss_percent: Packet loss over the window above which the link is degraded
+            max_latency_ms: TIMESYNC round trip above which the link is degraded
+            min_rssi: Radio RSSI below which the link is degraded (None to ignore)
+            timesync_interval: Seconds between TIMESYNC requests (None to disable)
+            watchdog_interval: Seconds between watchdog ticks
+        """
+        self.window = window
+        self.heartbeat_timeout = heartbeat_timeout
+        self.silence_timeout = silence_timeout
+        self.max_loss_percent = max_loss_percent
+        self.max_latency_ms = max_latency_ms
+        self.min_rssi = min_rssi
+        self.timesync_interval = timesync_interval
+        self.watchdog_interval = watchdog_interval
+
+        self.vehicle = None
+        self.subscriptions = None
+        self._lock = threading.RLock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._callbacks: List[Callable[[str, List[str]], None]] = []
+        self.reset()
+
+    def reset(self):
+        """Clear all statistics"""
+        with self._lock:
+            now = time.monotonic()
+            # Buckets of [start, received, lost, {type: count}]
+            self._buckets: Deque[list] = deque()
+            self._window_received = 0
+            self._window_lost = 0
+            self._window_counts: Dict[str, int] = {}
+            self._last_seq: Dict[Tuple[int, int], int] = {}
+            self.total_received = 0
+            self.total_lost = 0
+
+            self._timesync_sent: Deque[int] = deque(maxlen=TIMESYNC_OUTSTANDING)
+            self._next_timesync = now
+            self._latencies: Deque[float] = deque(maxlen=50)
+            self.radio: Optional[Dict[str, int]] = None
+
+            self.started_at = now
+            self.last_message = now
+            self.last_heartbeat = now
+
+            self.link_up = True
+            self.degraded_reasons: List[str] = []
+            self.events = 0
+
+    # Lifecycle
+
+    def start(self, vehicle, subscriptions=None):
+        """Start monitoring a vehicle
+
+        Args:
+            vehicle: DroneKit Vehicle, used to send TIMESYNC requests
+            subscriptions: TelemetrySubscriptions delivering the raw stream;
+                without one, a '*' message listener on the vehicle is used
+        """
+        self.stop()
+        self.reset()
+        self.vehicle = vehicle
+        self.subscriptions = subscriptions
+        if subscriptions is not None:
+            subscriptions.subscribe(ALL_MESSAGES, self._on_timed_message)
+        else:
+            vehicle.add_message_listener(ALL_MESSAGES, self._on_vehicle_message)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watchdog, name="link-monitor", daemon=True)
+        self._thread.start()
+        logger.debug("Link monitoring started")
+
+    def stop(self):
+        """Stop monitoring"""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+        if self.subscriptions is not None:
+            self.subscriptions.unsubscribe(ALL_MESSAGES, self._on_timed_message)
+        elif self.vehicle is not None:
+            try:
+                self.vehicle.remove_message_listener(ALL_MESSAGES, self._on_vehicle_message)
+            except Exception:
+                pass
+        self.subscriptions = None
+        self.vehicle = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the watchdog is running"""
+        return self._thread is not None and self._thread.is_alive()
+
+    # Events
+
+    def register_on_link_event(self, callback: Callable[[str, List[str]], None]):
+        """Register a callback for link events
+
+        Args:
+            callback: Called with the event (LINK_LOST, LINK_RESTORED,
+                LINK_DEGRADED or LINK_RECOVERED) and the degradation reasons
+        """
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def unregister_on_link_event(self, callback: Callable[[str, List[str]], None]):
+        """Unregister a link event callback"""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def _fire(self, event: str, reasons: List[str]):
+        self.events += 1
+        for callback in list(self._callbacks):
+            try:
+                callback(event, reasons)
+            except Exception as e:
+                logger.error(f"Error in link event callback: {str(e)}")
+
+    # Message path (receive thread)
+
+    def _on_timed_message(self, timed):
+        self.process(timed.message)
+
+    def _on_vehicle_message(self, vehicle, name, message):
+        self.process(message)
+
+    def process(self, message, now: Optional[float] = None):
+        """Account for one received message
+
+        Args:
+            message: pymavlink message
+            now: Monotonic receive time (defaults to now)
+        """
+        name = message.get_type()
+        if name == "BAD_DATA":
+            return
+        if now is None:
+            now = time.monotonic()
+
+        events = []
+        with self._lock:
+            bucket = self._bucket(now)
+            lost = self._sequence_gap(message)
+            bucket[1] += 1
+            bucket[2] += lost
+            bucket[3][name] = bucket[3].get(name, 0) + 1
+            self._window_received += 1
+            self._window_lost += lost
+            self._window_counts[name] = self._window_counts.get(name, 0) + 1
+            self.total_received += 1
+            self.total_lost += lost
+            self.last_message = now
+
+            if name == "HEARTBEAT":
+                if message.type != mavutil.mavlink.MAV_TYPE_GCS:
+                    self.last_heartbeat = now
+                    if not self.link_up:
+                        self.link_up = True
+                        logger.info("Heartbeat restored")
+                        events.append(LINK_RESTORED)
+            elif name == "TIMESYNC":
+                self._on_timesync(message)
+            elif name == "RADIO_STATUS":
+                self.radio = {
+                    "rssi": message.rssi,
+                    "remrssi": message.remrssi,
+                    "noise": message.noise,
+                    "remnoise": message.remnoise,
+                    "txbuf": message.txbuf,
+                    "rxerrors": message.rxerrors,
+                    "fixed": message.fixed,
+                }
+
+            events.extend(self._evaluate(now))
+            reasons = list(self.degraded_reasons)
+
+        for event in events:
+            self._fire(event, reasons)
+
+    def _sequence_gap(self, message) -> int:
+        """Packets missed since the sender's previous message"""
+        key = (message.get_srcSystem(), message.get_srcComponent())
+        seq = message.get_seq()
+        previous = self._last_seq.get(key)
+        self._last_seq[key] = seq
+        if previous is None or seq == previous:
+            return 0
+        return (seq - previous - 1) & 0xFF
+
+    def _bucket(self, now: float) -> list:
+        """Current bucket, expiring ones older than the window"""
+        buckets = self._buckets
+        if not buckets or now - buckets[-1][0] >= BUCKET_SECONDS:
+            buckets.append([now, 0, 0, {}])
+        self._expire(now)
+        return buckets[-1]
+
+    def _expire(self, now: float):
+        buckets = self._buckets
+        while buckets and now - buckets[0][0] > self.window:
+            _, received, lost, counts = buckets.popleft()
+            self._window_received -= received
+            self._window_lost -= lost
+            window_counts = self._window_counts
+            for name, count in counts.items():
+                remaining = window_counts[name] - count
+                if remaining:
+                    window_counts[name] = remaining
+                else:
+                    del window_counts[name]
+
+    def _on_timesync(self, message):
+        """Match a TIMESYNC reply to one of our requests"""
+        if message.tc1 == 0 or message.ts1 not in self._timesync_sent:
+            return
+        self._timesync_sent.remove(message.ts1)
+        rtt_ms = (time.monotonic_ns() - message.ts1) / 1e6
+        if rtt_ms >= 0:
+            self._latencies.append(rtt_ms)
+
+    # Quality
+
+    def loss_percent(self) -> float:
+        """Packet loss over the window, in percent"""
+        expected = self._window_received + self._window_lost
+        return 100.0 * self._window_lost / expected if expected else 0.0
+
+    def _evaluate(self, now: float) -> List[str]:
+        """Update the link state; returns the events to fire (caller holds the lock)"""
+        events = []
+        if self.link_up and now - self.last_heartbeat > self.heartbeat_timeout:
+            self.link_up = False
+            logger.warning(f"Lost heartbeat from drone, last heartbeat {now - self.last_heartbeat:.1f}s ago")
+            events.append(LINK_LOST)
+
+        reasons = []
+        if self.max_loss_percent is not None and self._window_lost and \
+                self.loss_percent() > self.max_loss_percent:
+            reasons.append(REASON_LOSS)
+        if self.max_latency_ms is not None and self._latencies and \
+                self._latencies[-1] > self.max_latency_ms:
+            reasons.append(REASON_LATENCY)
+        if self.min_rssi is not None and self.radio is not None and \
+                self.radio["rssi"] < self.min_rssi:
+            reasons.append(REASON_RSSI)
+        if self.silence_timeout is not None and now - self.last_message > self.silence_timeout:
+            reasons.append(REASON_SILENT)
+
+        if reasons != self.degraded_reasons:
+            was_degraded = bool(self.degraded_reasons)
+            self.degraded_reasons = reasons
+            if reasons:
+                logger.warning(f"Link degraded: {', '.join(reasons)}")
+                events.append(LINK_DEGRADED)
+            elif was_degraded:
+                logger.info("Link quality recovered")
+                events.append(LINK_RECOVERED)
+        return events
+
+    def check(self, now: Optional[float] = None):
+        """Evaluate timeouts and window expiry without a new message
+
+        Args:
+            now: Monotonic time (defaults to now)
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            events = self._evaluate(now)
+            reasons = list(self.degraded_reasons)
+        for event in events:
+            self._fire(event, reasons)
+
+    def _watchdog(self):
+        """Watchdog loop"""
+        while not self._stop.wait(self.watchdog_interval):
+            now = time.monotonic()
+            try:
+                self.check(now)
+                if self.timesync_interval and now >= self._next_timesync:
+                    self._next_timesync = now + self.timesync_interval
+                    self.send_timesync()
+            except Exception as e:
+                logger.error(f"Link watchdog error: {str(e)}")
+
+    def send_timesync(self) -> bool:
+        """Send a TIMESYNC request to measure the round trip
+
+        Returns:
+            bool: True if the request was sent
+        """
+        vehicle = self.vehicle
+        factory = getattr(vehicle, "message_factory", None)
+        if factory is None:
+            return False
+        ts1 = time.monotonic_ns()
+        with self._lock:
+            self._timesync_sent.append(ts1)
+        vehicle.send_mavlink(factory.timesync_encode(0, ts1))
+        return True
+
+    # Statistics
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the rolling link statistics
+
+        Returns:
+            dict: Link state, loss, per-type rates (Hz), TIMESYNC latency (ms)
+            and the latest RADIO_STATUS
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            span = min(self.window, max(now - self.started_at, BUCKET_SECONDS))
+            latencies = list(self._latencies)
+            return {
+                "link_up": self.link_up,
+                "degraded": bool(self.degraded_reasons),
+                "degraded_reasons": list(self.degraded_reasons),
+                "window": self.window,
+                "received": self._window_received,
+                "lost": self._window_lost,
+                "loss_percent": self.loss_percent(),
+                "total_received": self.total_received,
+                "total_lost": self.total_lost,
+                "message_rates": {name: count / span for name, count in self._window_counts.items()},
+                "latency_ms": {
+                    "last": latencies[-1] if latencies else None,
+                    "mean": sum(latencies) / len(latencies) if latencies else None,
+                    "min": min(latencies) if latencies else None,
+                    "max": max(latencies) if latencies else None,
+                    "samples": len(latencies),
+                },
+                "radio": dict(self.radio) if self.radio else None,
+                "seconds_since_heartbeat": now - self.last_heartbeat,
+                "seconds_since_message": now - self.last_message,
+                "events": self.events,
+            }
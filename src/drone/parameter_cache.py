@@ -0,0 +1,426 @@
+# src/drone/parameter_cache.py
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from dronekit import Vehicle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARAMETER_CACHE_DIR = os.path.join("data", "parameters")
+
+# Bumped when the file layout changes; older files are ignored
+CACHE_FORMAT = 1
+
+# Where a vehicle's parameter table came from
+SOURCE_CACHE = "cache"
+SOURCE_DOWNLOAD = "download"
+
+# A cached table entry: (name, value, MAV_PARAM_TYPE)
+ParameterEntry = Tuple[str, float, int]
+
+
+def table_hash(entries: Sequence[ParameterEntry]) -> str:
+    """Hash a parameter table in index order"""
+    digest = hashlib.sha1()
+    for name, value, param_type in entries:
+        digest.update(f"{name}={value!r}:{param_type};".encode())
+    return digest.hexdigest()
+
+
+def vehicle_identity(message) -> Optional[Tuple[str, str]]:
+    """Get the cache key parts from an AUTOPILOT_VERSION message
+
+    Args:
+        message: AUTOPILOT_VERSION message
+
+    Returns:
+        tuple: (uid, firmware) as strings, or None if the board reports no UID
+    """
+    if message.uid:
+        uid = f"{message.uid:016x}"
+    elif any(getattr(message, "uid2", ()) or ()):
+        uid = bytes(bytearray(message.uid2)).hex()
+    else:
+        return None
+
+    version = message.flight_sw_version
+    git_hash = bytes(bytearray(message.flight_custom_version)).hex()
+    firmware = f"{(version >> 24) & 0xff}.{(version >> 16) & 0xff}.{(version >> 8) & 0xff}.{version & 0xff}-{git_hash}"
+    return uid, firmware
+
+
+class CachedParameter:
+    """Stands in for a PARAM_VALUE message in DroneKit's parameter table"""
+
+    __slots__ = ("param_id", "param_value", "param_type", "param_index", "param_count")
+
+    def __init__(self, name: str, value: float, param_type: int, index: int, count: int):
+        self.param_id = name
+        self.param_value = value
+        self.param_type = param_type
+        self.param_index = index
+        self.param_count = count
+
+
+class ParameterCache:
+    """Parameter tables on disk, one JSON file per autopilot UID and firmware version
+
+    A table is only offered back for the same board running the same
+    firmware build; CachedParameterVehicle then probes a few entries against
+    the autopilot before trusting it.
+    """
+
+    def __init__(self, directory: str = DEFAULT_PARAMETER_CACHE_DIR, spot_checks: int = 8,
+                 probe_timeout: float = 2.0, identity_timeout: float = 3.0):
+        """Initialize the cache
+
+        Args:
+            directory: Directory holding the cached tables
+            spot_checks: Number of parameters read back to validate a table
+            probe_timeout: Seconds to wait for the spot-check replies
+            identity_timeout: Seconds to wait for AUTOPILOT_VERSION on connect
+        """
+        self.directory = directory
+        self.spot_checks = spot_checks
+        self.probe_timeout = probe_timeout
+        self.identity_timeout = identity_timeout
+        self._lock = threading.Lock()
+
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "invalidated": 0,
+            "saved": 0,
+        }
+        self.last_probe: Optional[Dict[str, Any]] = None
+
+    def path_for(self, uid: str, firmware: str) -> str:
+        """Get the file path for a vehicle's table"""
+        safe_firmware = "".join(c if c.isalnum() or c in ".-" else "_" for c in firmware)
+        return os.path.join(self.directory, f"{uid}_{safe_firmware}.json")
+
+    def load(self, uid: str, firmware: str) -> Optional[List[ParameterEntry]]:
+        """Read a cached table
+
+        Args:
+            uid: Autopilot UID
+            firmware: Firmware version string
+
+        Returns:
+            list: (name, value, type) entries in parameter index order, or None
+            if there is no usable table
+        """
+        path = self.path_for(uid, firmware)
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable parameter cache {path}: {str(e)}")
+            return None
+
+        if data.get("format") != CACHE_FORMAT:
+            return None
+        entries = [(name, value, param_type) for name, value, param_type in data.get("parameters", [])]
+        if len(entries) != data.get("count") or table_hash(entries) != data.get("hash"):
+            logger.warning(f"Ignoring corrupt parameter cache {path}")
+            return None
+        return entries
+
+    def save(self, uid: str, firmware: str, entries: Sequence[ParameterEntry]) -> bool:
+        """Store a table, replacing any previous one
+
+        Args:
+            uid: Autopilot UID
+            firmware: Firmware version string
+            entries: (name, value, type) entries in parameter index order
+
+        Returns:
+            bool: True if the table was written
+        """
+        path = self.path_for(uid, firmware)
+        data = {
+            "format": CACHE_FORMAT,
+            "uid": uid,
+            "firmware": firmware,
+            "saved_at": time.time(),
+            "count": len(entries),
+            "hash": table_hash(entries),
+            "parameters": [list(entry) for entry in entries],
+        }
+        tmp_path = f"{path}.{threading.get_ident()}.part"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"Failed to save parameter cache: {str(e)}")
+            return False
+
+        with self._lock:
+            self.stats["saved"] += 1
+        logger.info(f"Saved {len(entries)} parameters to {path}")
+        return True
+
+    def invalidate(self, uid: str, firmware: str):
+        """Delete a vehicle's cached table"""
+        try:
+            os.remove(self.path_for(uid, firmware))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to remove parameter cache: {str(e)}")
+
+    def choose_spot_checks(self, count: int) -> List[int]:
+        """Pick the parameter indices to read back
+
+        The first and last index are always included, so a table that grew,
+        shrank or shifted is caught; the rest are random.
+        """
+        if count <= 0:
+            return []
+        indices = {0, count - 1}
+        remaining = [i for i in range(1, count - 1)]
+        extra = max(0, min(self.spot_checks - len(indices), len(remaining)))
+        indices.update(random.sample(remaining, extra))
+        return sorted(indices)
+
+    def record_probe(self, hit: bool, **details):
+        """Count a validation attempt and keep its details for get_stats()"""
+        with self._lock:
+            self.stats["hits" if hit else "invalidated"] += 1
+            self.last_probe = dict(details, hit=hit)
+
+    def record_miss(self, reason: str):
+        """Count a connection that found no cached table"""
+        with self._lock:
+            self.stats["misses"] += 1
+            self.last_probe = {"hit": False, "reason": reason}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters
+
+        Returns:
+            dict: Hits, misses, invalidated and saved tables, and the details
+            of the last validation probe
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["last_probe"] = dict(self.last_probe) if self.last_probe else None
+        stats["directory"] = self.directory
+        return stats
+
+
+class CachedParameterVehicle(Vehicle):
+    """DroneKit Vehicle that loads its parameter table from a ParameterCache
+
+    DroneKit starts a full PARAM_REQUEST_LIST download from initialize().
+    This class takes over that step: once the autopilot has identified itself
+    with AUTOPILOT_VERSION, a cached table for the same UID and firmware is
+    put in place and a few entries are read back by index. Each reply carries
+    the parameter count, the name at that index and its current value, so a
+    table that no longer matches is caught and the normal download runs
+    instead. Downloaded tables are saved once complete and again on close,
+    picking up any parameters set during the session.
+
+    Pass it to dronekit.connect() with functools.partial(CachedParameterVehicle, cache=...).
+    """
+
+    def __init__(self, handler, cache: Optional[ParameterCache] = None):
+        """Initialize the vehicle
+
+        Args:
+            handler: DroneKit MAVConnection
+            cache: Parameter cache, None to always download
+        """
+        super().__init__(handler)
+        self.parameter_cache = cache
+        self.identity: Optional[Tuple[str, str]] = None
+        self.parameter_source: Optional[str] = None
+
+        self._identity_ready = threading.Event()
+        self._probe_lock = threading.Lock()
+        self._probe_indices: set = set()
+        self._probe_replies: Dict[int, Any] = {}
+        self._probe_done = threading.Event()
+        self._parameter_load_started = False
+
+        self.add_message_listener('AUTOPILOT_VERSION', self._on_autopilot_version)
+        self.add_message_listener('PARAM_VALUE', self._on_param_value)
+        self.add_attribute_listener('parameters', self._on_parameters_loaded)
+
+    def initialize(self, rate=4, heartbeat_timeout=30):
+        """Connect as DroneKit does, using the cached parameter table when it is still valid"""
+        master = self._master
+        fetch_all = master.param_fetch_all
+
+        def start_parameter_load():
+            if not self._parameter_load_started:
+                self._parameter_load_started = True
+                if self.parameter_cache is not None and self._load_cached_parameters():
+                    return
+                self.parameter_source = SOURCE_DOWNLOAD
+            fetch_all()
+
+        # Vehicle.initialize() calls this once the first heartbeat is in
+        master.param_fetch_all = start_parameter_load
+        try:
+            super().initialize(rate=rate, heartbeat_timeout=heartbeat_timeout)
+        finally:
+            del master.param_fetch_all
+
+    def _on_autopilot_version(self, vehicle, name, message):
+        if self.identity is None:
+            self.identity = vehicle_identity(message)
+        self._identity_ready.set()
+
+    def _on_param_value(self, vehicle, name, message):
+        with self._probe_lock:
+            if message.param_index in self._probe_indices:
+                self._probe_replies[message.param_index] = message
+                if len(self._probe_replies) == len(self._probe_indices):
+                    self._probe_done.set()
+
+    def _on_parameters_loaded(self, vehicle, name, value):
+        if self.parameter_source == SOURCE_DOWNLOAD:
+            self.save_parameter_cache()
+
+    def _load_cached_parameters(self) -> bool:
+        """Seed DroneKit's parameter table from the cache and validate it
+
+        Returns:
+            bool: True if the cached table was accepted
+        """
+        cache = self.parameter_cache
+        started = time.monotonic()
+
+        # DroneKit asks on every heartbeat; ask now as well
+        self.send_capabilities_request(self, 'HEARTBEAT', None)
+        if not self._identity_ready.wait(cache.identity_timeout) or self.identity is None:
+            logger.info("Autopilot did not report a UID, downloading parameters")
+            cache.record_miss("no identity")
+            return False
+
+        uid, firmware = self.identity
+        entries = cache.load(uid, firmware)
+        if entries is None:
+            logger.info(f"No cached parameters for autopilot {uid} firmware {firmware}")
+            cache.record_miss("not cached")
+            return False
+
+        # The count is set last so DroneKit keeps the table when probe replies arrive
+        count = len(entries)
+        self._params_set = [CachedParameter(name, value, param_type, index, count)
+                            for index, (name, value, param_type) in enumerate(entries)]
+        self._params_map = {name: value for name, value, _ in entries}
+        self._params_count = count
+
+        indices = cache.choose_spot_checks(count)
+        mismatches = self._probe(indices, entries, cache.probe_timeout)
+        probe_ms = (time.monotonic() - started) * 1000
+        if mismatches:
+            logger.info(f"Cached parameters out of date ({', '.join(mismatches[:5])}), downloading")
+            cache.record_probe(False, uid=uid, firmware=firmware, count=count, checked=len(indices),
+                               mismatches=mismatches, probe_ms=probe_ms)
+            # A reply with a different count has already restarted DroneKit's
+            # download state; stop its loop first, or it sees the emptied
+            # table as complete and announces 'parameters' with nothing in it
+            self._params_start = False
+            self._params_loaded = False
+            self._params_count = -1
+            self._params_set = []
+            self._params_map = {}
+            return False
+
+        cache.record_probe(True, uid=uid, firmware=firmware, count=count, checked=len(indices),
+                           mismatches=[], probe_ms=probe_ms)
+        logger.info(f"Loaded {count} parameters from cache ({len(indices)} checked in {probe_ms:.0f} ms)")
+        self.parameter_source = SOURCE_CACHE
+        # DroneKit marks the table loaded and notifies 'parameters' on its next loop
+        self._params_start = True
+        return True
+
+    def _probe(self, indices: List[int], entries: Sequence[ParameterEntry], timeout: float) -> List[str]:
+        """Read back parameters by index and compare them with the cached table
+
+        Returns:
+            list: Descriptions of the entries that did not match, empty if all did
+        """
+        with self._probe_lock:
+            self._probe_indices = set(indices)
+            self._probe_replies = {}
+            self._probe_done.clear()
+
+        def request_missing():
+            with self._probe_lock:
+                missing = [i for i in indices if i not in self._probe_replies]
+            for index in missing:
+                self._master.mav.param_request_read_send(0, 0, b'', index)
+
+        # Ask twice, in case a request or reply is lost on the radio
+        request_missing()
+        if not self._probe_done.wait(timeout / 2):
+            request_missing()
+            self._probe_done.wait(timeout / 2)
+
+        with self._probe_lock:
+            replies = dict(self._probe_replies)
+            self._probe_indices = set()
+
+        count = len(entries)
+        mismatches = []
+        for index in indices:
+            reply = replies.get(index)
+            name, value, _ = entries[index]
+            if reply is None:
+                mismatches.append(f"#{index} no reply")
+            elif reply.param_count != count:
+                mismatches.append(f"count {reply.param_count} != {count}")
+            elif reply.param_id != name:
+                mismatches.append(f"#{index} {reply.param_id} != {name}")
+            elif reply.param_value != value:
+                mismatches.append(f"{name} {reply.param_value} != {value}")
+        return mismatches
+
+    def parameter_entries(self) -> Optional[List[ParameterEntry]]:
+        """Get the current parameter table in index order
+
+        Returns:
+            list: (name, value, type) entries, or None until the table is complete
+        """
+        table = list(self._params_set)
+        if not table or any(entry is None for entry in table):
+            return None
+        # Values set during the session are in the map before any echo lands in the table
+        return [(entry.param_id, self._params_map.get(entry.param_id, entry.param_value), entry.param_type)
+                for entry in table]
+
+    def save_parameter_cache(self) -> bool:
+        """Write the current table to the cache
+
+        Returns:
+            bool: True if the table was written
+        """
+        if self.parameter_cache is None or self.identity is None:
+            return False
+        entries = self.parameter_entries()
+        if entries is None:
+            return False
+        uid, firmware = self.identity
+        return self.parameter_cache.save(uid, firmware, entries)
+
+    def close(self):
+        """Save the parameter table, then close the connection"""
+        try:
+            self.save_parameter_cache()
+        except Exception as e:
+            logger.error(f"Error saving parameter cache: {str(e)}")
+        return super().close()
@@ -4,19 +4,27 @@ import time
 from typing import Dict, Any, Optional, Tuple, List, Union
 from src.drone import dronekit_wrapper as dronekit
 from dronekit import Vehicle
+from .parameter_cache import ParameterCache
+from .parameter_writer import BulkParameterWriter, ParameterWriteReport, CONFIRMED
 
 logger = logging.getLogger(__name__)
 
 class ParameterManager:
     """Manages vehicle parameters"""
     
-    def __init__(self, vehicle: Optional[Vehicle] = None):
+    def __init__(self, vehicle: Optional[Vehicle] = None, cache: Optional[ParameterCache] = None):
         """Initialize with optional vehicle
         
         Args:
             vehicle: DroneKit Vehicle object
+            cache: Persistent parameter table cache, used by connections made
+                with a CachedParameterVehicle
         """
         self.vehicle = vehicle
+        self.cache = cache
+        
+        # Outcome of the last apply_parameters() call
+        self.last_write_report: Optional[ParameterWriteReport] = None
     
     def set_vehicle(self, vehicle: Vehicle):
         """Set the vehicle to manage
@@ -131,6 +139,74 @@ class ParameterManager:
             logger.error(f"Set parameter {param_name} failed: {str(e)}")
             return False
     
+    def apply_parameters(self, parameters: Dict[str, Any], window: int = 10, timeout: float = 1.0,
+                         retries: int = 3) -> Optional[ParameterWriteReport]:
+        """Set many parameters at once
+        
+        Only parameters that differ from the vehicle's values are sent, with
+        up to `window` PARAM_SETs awaiting their PARAM_VALUE echo at a time.
+        
+        Args:
+            parameters: Parameter names and values
+            window: Maximum PARAM_SETs in flight
+            timeout: Seconds to wait for each echo before resending
+            retries: Resends per parameter
+            
+        Returns:
+            ParameterWriteReport: Per-parameter outcomes, or None on error
+        """
+        if not self.vehicle:
+            logger.error("No vehicle available for parameter setting")
+            return None
+        
+        try:
+            current = self.get_all_parameters()
+            logger.info(f"Applying {len(parameters)} parameters to vehicle")
+            writer = BulkParameterWriter(self.vehicle, window=window, timeout=timeout, retries=retries)
+            report = writer.write(parameters, current)
+            
+            logger.info(f"Parameter outcomes:\n{report.format_table()}")
+            self.last_write_report = report
+            
+            # Keep the cached table in step with what was written
+            if report.counts.get(CONFIRMED):
+                self.save_cache()
+            
+            return report
+            
+        except Exception as e:
+            logger.error(f"Apply parameters failed: {str(e)}")
+            return None
+    
+    def save_cache(self) -> bool:
+        """Write the vehicle's current parameter table to the cache
+        
+        Returns:
+            bool: True if the table was written, False otherwise
+        """
+        if not self.vehicle or not hasattr(self.vehicle, "save_parameter_cache"):
+            logger.debug("Vehicle does not use the parameter cache")
+            return False
+        
+        try:
+            return self.vehicle.save_parameter_cache()
+        except Exception as e:
+            logger.error(f"Save parameter cache failed: {str(e)}")
+            return False
+    
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get parameter cache counters
+        
+        Returns:
+            dict: Cache hits, misses and the last validation probe, plus where
+            the current vehicle's parameters came from, or None without a cache
+        """
+        if self.cache is None:
+            return None
+        stats = self.cache.get_stats()
+        stats["source"] = getattr(self.vehicle, "parameter_source", None) if self.vehicle else None
+        return stats
+    
     def get_parameter_groups(self) -> Dict[str, List[str]]:
         """Group parameters by prefix for easier management
         
@@ -245,13 +321,7 @@ class ParameterManager:
             
             # Apply parameters if requested
             if apply and self.vehicle:
-                logger.info(f"Applying {len(parameters)} parameters to vehicle")
-                success_count = 0
-                for key, value in parameters.items():
-                    if self.set_parameter(key, value):
-                        success_count += 1
-                
-                logger.info(f"Applied {success_count} out of {len(parameters)} parameters")
+                self.apply_parameters(parameters)
             
             return parameters
             
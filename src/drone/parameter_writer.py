@@ -0,0 +1,263 @@
+# src/drone/parameter_writer.py
+import collections
+import logging
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from pymavlink import mavutil
+
+logger = logging.getLogger(__name__)
+
+# Per-parameter outcomes
+UNCHANGED = "unchanged"   # Already had the requested value, not sent
+CONFIRMED = "confirmed"   # Echoed back with the requested value
+REJECTED = "rejected"     # Echoed back with a different value on every attempt
+TIMEOUT = "timeout"       # No echo after every attempt
+UNKNOWN = "unknown"       # Not a parameter of this vehicle, not sent
+
+FAILED_STATUSES = (REJECTED, TIMEOUT, UNKNOWN)
+
+
+def as_float32(value: float) -> float:
+    """Round a value the way it travels in PARAM_SET / PARAM_VALUE"""
+    return struct.unpack("<f", struct.pack("<f", float(value)))[0]
+
+
+class ParameterWriteResult:
+    """Outcome of writing one parameter"""
+
+    def __init__(self, name: str, value: Any, previous: Optional[float] = None):
+        self.name = name
+        self.value = value
+        self.previous = previous
+        self.final: Optional[float] = previous
+        self.status: Optional[str] = None
+        self.attempts = 0
+        self.sent_at: Optional[float] = None
+        self.first_sent_at: Optional[float] = None
+        self.rtt: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the result as a table row"""
+        return {
+            "name": self.name,
+            "value": self.value,
+            "previous": self.previous,
+            "final": self.final,
+            "status": self.status,
+            "attempts": self.attempts,
+            "rtt_ms": self.rtt * 1000 if self.rtt is not None else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"<ParameterWriteResult({self.name}={self.value}, {self.status})>"
+
+
+class ParameterWriteReport:
+    """Per-parameter outcomes of a bulk write, in the order they were requested"""
+
+    def __init__(self, results: List[ParameterWriteResult], elapsed: float):
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of parameters with each outcome"""
+        return dict(collections.Counter(result.status for result in self.results))
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether every parameter now has the requested value"""
+        return all(result.status not in FAILED_STATUSES for result in self.results)
+
+    @property
+    def failed(self) -> List[ParameterWriteResult]:
+        """Parameters that were rejected, timed out or are unknown"""
+        return [result for result in self.results if result.status in FAILED_STATUSES]
+
+    def as_rows(self) -> List[Dict[str, Any]]:
+        """Get the outcome table as one dict per parameter"""
+        return [result.as_dict() for result in self.results]
+
+    def format_table(self, include_unchanged: bool = False) -> str:
+        """Format the outcome table for logs or a dialog
+
+        Args:
+            include_unchanged: Also list parameters that were already set
+
+        Returns:
+            str: One line per parameter followed by a summary line
+        """
+        lines = [f"{'Parameter':<16} {'Requested':>12} {'Previous':>12} {'Final':>12}  {'Status':<9} Tries"]
+        for result in self.results:
+            if result.status == UNCHANGED and not include_unchanged:
+                continue
+            lines.append(f"{result.name:<16} {_format_value(result.value):>12} {_format_value(result.previous):>12} "
+                         f"{_format_value(result.final):>12}  {result.status:<9} {result.attempts}")
+        counts = ", ".join(f"{count} {status}" for status, count in sorted(self.counts.items()))
+        lines.append(f"{len(self.results)} parameters in {self.elapsed:.2f} s: {counts}")
+        return "\n".join(lines)
+
+
+def _format_value(value) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:g}"
+    return str(value)
+
+
+class BulkParameterWriter:
+    """Writes many parameters with PARAM_SET, several at a time
+
+    Only parameters whose value differs from the vehicle's current table are
+    sent. Up to `window` PARAM_SETs are in flight at once; each is confirmed
+    by the PARAM_VALUE the autopilot sends back for that name. A parameter
+    with no echo within `timeout`, or echoed with a different value, is sent
+    again up to `retries` more times.
+    """
+
+    def __init__(self, vehicle, window: int = 10, timeout: float = 1.0, retries: int = 3):
+        """Initialize the writer
+
+        Args:
+            vehicle: DroneKit Vehicle
+            window: Maximum PARAM_SETs awaiting their echo
+            timeout: Seconds to wait for an echo before resending
+            retries: Resends per parameter after the first attempt
+        """
+        self.vehicle = vehicle
+        self.window = max(1, window)
+        self.timeout = timeout
+        self.retries = retries
+
+        self._condition = threading.Condition()
+        self._echoes: Dict[str, Any] = {}
+        self._waiting: set = set()
+
+    def diff(self, parameters: Dict[str, Any], current: Dict[str, float]) -> List[ParameterWriteResult]:
+        """Compare requested values with the vehicle's
+
+        Args:
+            parameters: Parameter names and requested values
+            current: The vehicle's current parameter values
+
+        Returns:
+            list: One result per requested parameter; UNCHANGED and UNKNOWN
+            are already decided, the rest still have to be sent
+        """
+        results = []
+        for name, value in parameters.items():
+            key = name.upper()
+            result = ParameterWriteResult(key, value, current.get(key))
+            if key not in current:
+                result.status = UNKNOWN
+            elif as_float32(value) == as_float32(current[key]):
+                result.status = UNCHANGED
+            results.append(result)
+        return results
+
+    def write(self, parameters: Dict[str, Any], current: Optional[Dict[str, float]] = None) -> ParameterWriteReport:
+        """Apply parameters to the vehicle
+
+        Args:
+            parameters: Parameter names and requested values
+            current: The vehicle's current values (defaults to vehicle.parameters)
+
+        Returns:
+            ParameterWriteReport: Outcome of every requested parameter
+        """
+        started = time.monotonic()
+        if current is None:
+            current = {key.upper(): value for key, value in self.vehicle.parameters.items()}
+        results = self.diff(parameters, current)
+        pending = collections.deque(result for result in results if result.status is None)
+
+        if pending:
+            logger.info(f"Writing {len(pending)} changed parameters "
+                        f"({len(results) - len(pending)} unchanged or unknown)")
+            types = self._parameter_types()
+            self.vehicle.add_message_listener('PARAM_VALUE', self._on_param_value)
+            try:
+                self._run(pending, types)
+            finally:
+                self.vehicle.remove_message_listener('PARAM_VALUE', self._on_param_value)
+
+        report = ParameterWriteReport(results, time.monotonic() - started)
+        logger.info(f"Parameter write finished in {report.elapsed:.2f} s: {report.counts}")
+        return report
+
+    def _parameter_types(self) -> Dict[str, int]:
+        """Get each parameter's MAV_PARAM_TYPE from DroneKit's table, where known"""
+        types = {}
+        for entry in list(getattr(self.vehicle, "_params_set", None) or ()):
+            if entry is not None:
+                types[entry.param_id] = entry.param_type
+        return types
+
+    def _on_param_value(self, vehicle, name, message):
+        """PARAM_VALUE listener (receive thread)"""
+        with self._condition:
+            if message.param_id in self._waiting:
+                self._echoes[message.param_id] = message
+                self._condition.notify()
+
+    def _send(self, result: ParameterWriteResult, types: Dict[str, int]):
+        param_type = types.get(result.name, mavutil.mavlink.MAV_PARAM_TYPE_REAL32)
+        msg = self.vehicle.message_factory.param_set_encode(
+            0, 0,  # target system, target component: broadcast
+            result.name.encode(), float(result.value), param_type)
+        now = time.monotonic()
+        result.attempts += 1
+        result.sent_at = now
+        if result.first_sent_at is None:
+            result.first_sent_at = now
+        self.vehicle.send_mavlink(msg)
+
+    def _run(self, pending: collections.deque, types: Dict[str, int]):
+        """Keep the window full until every parameter is decided"""
+        in_flight: Dict[str, ParameterWriteResult] = {}
+        with self._condition:
+            while pending or in_flight:
+                while pending and len(in_flight) < self.window:
+                    result = pending.popleft()
+                    in_flight[result.name] = result
+                    self._waiting.add(result.name)
+                    self._send(result, types)
+
+                now = time.monotonic()
+                echoes, self._echoes = self._echoes, {}
+                for name, message in echoes.items():
+                    result = in_flight.get(name)
+                    if result is None:
+                        continue
+                    result.final = message.param_value
+                    if message.param_value == as_float32(result.value):
+                        result.status = CONFIRMED
+                        result.rtt = now - result.sent_at
+                    elif result.attempts > self.retries:
+                        result.status = REJECTED
+                        logger.warning(f"Parameter {name} stayed {message.param_value}, not {result.value}")
+                    else:
+                        self._send(result, types)
+                        continue
+                    self._waiting.discard(name)
+                    del in_flight[name]
+
+                for name, result in list(in_flight.items()):
+                    if now - result.sent_at < self.timeout:
+                        continue
+                    if result.attempts > self.retries:
+                        result.status = TIMEOUT
+                        logger.warning(f"No PARAM_VALUE for {name} after {result.attempts} attempts")
+                        self._waiting.discard(name)
+                        del in_flight[name]
+                    else:
+                        self._send(result, types)
+
+                if in_flight and not self._echoes and not (pending and len(in_flight) < self.window):
+                    next_deadline = min(result.sent_at for result in in_flight.values()) + self.timeout
+                    self._condition.wait(max(0.0, next_deadline - time.monotonic()))
+            self._waiting.clear()
@@ -0,0 +1,240 @@
+# src/drone/state_notifier.py
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from src.drone.state_snapshot import DroneStateSnapshot, StateField
+
+logger = logging.getLogger(__name__)
+
+# Default maximum callback rate per subscriber
+DEFAULT_MAX_RATE_HZ = 10.0
+
+# Changes to these fields are delivered immediately, whatever the subscriber's rate
+BYPASS_FIELDS = StateField.ARMED | StateField.MODE
+
+
+class _Subscriber:
+    """Delivery state of one state change callback"""
+
+    def __init__(self, callback: Callable, max_rate_hz: Optional[float], fields: int):
+        self.callback = callback
+        self.name = getattr(callback, "__qualname__", repr(callback))
+        self.interval = 1.0 / max_rate_hz if max_rate_hz else 0.0
+        self.max_rate_hz = max_rate_hz
+        self.fields = int(fields)
+
+        # Latest undelivered snapshot and the fields changed since the last delivery
+        self.pending: Optional[DroneStateSnapshot] = None
+        self.pending_mask = 0
+        self.marked_at = 0.0
+        self.due_at = 0.0
+        self.last_sent = float("-inf")
+        # Serializes deliveries from the telemetry and flush threads
+        self.delivery_lock = threading.Lock()
+
+        self.stats = {
+            "delivered": 0,
+            "coalesced": 0,
+            "bypassed": 0,
+            "errors": 0,
+            "latency_ms_total": 0.0,
+            "latency_ms_max": 0.0,
+        }
+
+
+class StateNotifier:
+    """Delivers state snapshots to subscribers at a bounded rate
+
+    Each new snapshot marks its changed fields dirty for every subscriber
+    interested in them. A subscriber is called right away if it hasn't been
+    called within its minimum interval (leading edge); otherwise the change
+    waits and a flush thread delivers the latest snapshot, with the changed
+    masks of everything it replaced merged, once the interval has passed
+    (trailing edge). Changes to BYPASS_FIELDS are always delivered
+    immediately.
+    """
+
+    def __init__(self):
+        """Initialize the notifier"""
+        self._subscribers: List[_Subscriber] = []
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._flush_thread = None
+        self._stopped = False
+
+        self.stats = {
+            "notifications": 0,
+            "delivered": 0,
+            "coalesced": 0,
+            "bypassed": 0,
+        }
+
+    @property
+    def callbacks(self) -> List[Callable]:
+        """Registered callbacks"""
+        with self._lock:
+            return [subscriber.callback for subscriber in self._subscribers]
+
+    def subscribe(self, callback: Callable, max_rate_hz: Optional[float] = DEFAULT_MAX_RATE_HZ,
+                  fields: int = StateField.ALL):
+        """Register a callback
+
+        Args:
+            callback: Called with a DroneStateSnapshot
+            max_rate_hz: Maximum calls per second, or None for every change
+            fields: StateField flags the callback cares about
+        """
+        with self._lock:
+            if any(subscriber.callback == callback for subscriber in self._subscribers):
+                return
+            self._subscribers.append(_Subscriber(callback, max_rate_hz, fields))
+
+    def unsubscribe(self, callback: Callable):
+        """Unregister a callback"""
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s.callback != callback]
+
+    def notify(self, snapshot: DroneStateSnapshot):
+        """Hand a new snapshot to the subscribers (safe from any thread)"""
+        self.deliver(self.mark(snapshot))
+
+    def mark(self, snapshot: DroneStateSnapshot) -> List[_Subscriber]:
+        """Record a new snapshot as pending for interested subscribers
+
+        Calls no callbacks, so a publisher can mark snapshots in version
+        order while holding its own lock and deliver after releasing it.
+
+        Returns:
+            list: Subscribers due for an immediate call; pass to deliver()
+        """
+        now = time.perf_counter()
+        immediate = []
+        schedule = False
+        with self._lock:
+            self.stats["notifications"] += 1
+            for subscriber in self._subscribers:
+                if not snapshot.changed & subscriber.fields:
+                    continue
+
+                if subscriber.pending is not None:
+                    subscriber.stats["coalesced"] += 1
+                    self.stats["coalesced"] += 1
+                else:
+                    subscriber.marked_at = now
+                subscriber.pending = snapshot
+                subscriber.pending_mask |= snapshot.changed
+
+                if snapshot.changed & BYPASS_FIELDS:
+                    subscriber.stats["bypassed"] += 1
+                    self.stats["bypassed"] += 1
+                    immediate.append(subscriber)
+                elif now - subscriber.last_sent >= subscriber.interval:
+                    immediate.append(subscriber)
+                else:
+                    subscriber.due_at = subscriber.last_sent + subscriber.interval
+                    schedule = True
+
+            if schedule:
+                self._ensure_flush_thread()
+                self._condition.notify()
+        return immediate
+
+    def deliver(self, subscribers):
+        """Call the subscribers returned by mark() with their pending snapshots"""
+        for subscriber in subscribers:
+            self._deliver(subscriber)
+
+    def _deliver(self, subscriber: _Subscriber):
+        """Call a subscriber with its pending snapshot, if any"""
+        with subscriber.delivery_lock:
+            with self._lock:
+                snapshot = subscriber.pending
+                if snapshot is None:
+                    return
+                mask = subscriber.pending_mask
+                marked_at = subscriber.marked_at
+                subscriber.pending = None
+                subscriber.pending_mask = 0
+                subscriber.last_sent = time.perf_counter()
+
+            if mask != snapshot.changed:
+                # Report everything that changed since the subscriber's last call
+                snapshot = DroneStateSnapshot(snapshot.values_tuple, snapshot.version, mask)
+
+            try:
+                subscriber.callback(snapshot)
+            except Exception as e:
+                subscriber.stats["errors"] += 1
+                logger.error(f"Error in state change callback: {str(e)}")
+
+            latency_ms = (time.perf_counter() - marked_at) * 1000
+            with self._lock:
+                subscriber.stats["delivered"] += 1
+                subscriber.stats["latency_ms_total"] += latency_ms
+                subscriber.stats["latency_ms_max"] = max(subscriber.stats["latency_ms_max"], latency_ms)
+                self.stats["delivered"] += 1
+
+    def _ensure_flush_thread(self):
+        """Start the flush thread if needed (called with the lock held)"""
+        if self._flush_thread and self._flush_thread.is_alive():
+            return
+        self._stopped = False
+        self._flush_thread = threading.Thread(target=self._flush_loop, name="StateNotifierFlush")
+        self._flush_thread.daemon = True
+        self._flush_thread.start()
+
+    def _flush_loop(self):
+        """Deliver coalesced changes when their subscriber's interval has passed"""
+        while True:
+            with self._lock:
+                while True:
+                    if self._stopped:
+                        return
+                    now = time.perf_counter()
+                    waiting = [s for s in self._subscribers if s.pending is not None]
+                    due = [s for s in waiting if s.due_at <= now]
+                    if due:
+                        break
+                    next_due = min((s.due_at for s in waiting), default=None)
+                    self._condition.wait(None if next_due is None else next_due - now)
+
+            for subscriber in due:
+                self._deliver(subscriber)
+
+    def stop(self):
+        """Stop the flush thread; pending changes are dropped"""
+        with self._lock:
+            self._stopped = True
+            for subscriber in self._subscribers:
+                subscriber.pending = None
+                subscriber.pending_mask = 0
+            self._condition.notify_all()
+        if self._flush_thread and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=1.0)
+        self._flush_thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get callback counts and delivery latency
+
+        Returns:
+            dict: Totals plus a "subscribers" list with per-callback figures
+        """
+        with self._lock:
+            subscribers = []
+            for subscriber in self._subscribers:
+                delivered = subscriber.stats["delivered"]
+                subscribers.append({
+                    "callback": subscriber.name,
+                    "max_rate_hz": subscriber.max_rate_hz,
+                    "delivered": delivered,
+                    "coalesced": subscriber.stats["coalesced"],
+                    "bypassed": subscriber.stats["bypassed"],
+                    "errors": subscriber.stats["errors"],
+                    "latency_ms_avg": subscriber.stats["latency_ms_total"] / delivered if delivered else 0.0,
+                    "latency_ms_max": subscriber.stats["latency_ms_max"],
+                })
+            stats = dict(self.stats)
+            stats["subscribers"] = subscribers
+            return stats
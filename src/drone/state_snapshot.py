@@ -0,0 +1,145 @@
+# src/drone/state_snapshot.py
+import enum
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple
+
+# Order of the fields in a snapshot, matching DroneState.get_state()
+STATE_FIELDS = (
+    "latitude",
+    "longitude",
+    "altitude",
+    "relative_altitude",
+    "heading",
+    "airspeed",
+    "groundspeed",
+    "roll",
+    "pitch",
+    "yaw",
+    "mode",
+    "armed",
+    "battery_voltage",
+    "battery_level",
+    "battery_current",
+    "gps_fix",
+    "gps_satellites",
+    "last_update_time",
+)
+
+FIELD_INDEX = {name: index for index, name in enumerate(STATE_FIELDS)}
+
+
+class StateField(enum.IntFlag):
+    """Bit flags for the fields of a snapshot, used in changed-field masks"""
+    NONE = 0
+    LATITUDE = 1 << 0
+    LONGITUDE = 1 << 1
+    ALTITUDE = 1 << 2
+    RELATIVE_ALTITUDE = 1 << 3
+    HEADING = 1 << 4
+    AIRSPEED = 1 << 5
+    GROUNDSPEED = 1 << 6
+    ROLL = 1 << 7
+    PITCH = 1 << 8
+    YAW = 1 << 9
+    MODE = 1 << 10
+    ARMED = 1 << 11
+    BATTERY_VOLTAGE = 1 << 12
+    BATTERY_LEVEL = 1 << 13
+    BATTERY_CURRENT = 1 << 14
+    GPS_FIX = 1 << 15
+    GPS_SATELLITES = 1 << 16
+    LAST_UPDATE_TIME = 1 << 17
+
+    # Groups
+    POSITION = LATITUDE | LONGITUDE | ALTITUDE | RELATIVE_ALTITUDE
+    ATTITUDE = ROLL | PITCH | YAW
+    SPEED = AIRSPEED | GROUNDSPEED
+    BATTERY = BATTERY_VOLTAGE | BATTERY_LEVEL | BATTERY_CURRENT
+    GPS = GPS_FIX | GPS_SATELLITES
+    STATUS = MODE | ARMED
+    ALL = (1 << 18) - 1
+
+
+# Flag value of each field, in STATE_FIELDS order (plain ints: combining
+# IntFlag members is much slower than combining ints)
+FIELD_FLAGS = tuple(int(StateField[name.upper()]) for name in STATE_FIELDS)
+
+
+def changed_fields(previous: Tuple, current: Tuple) -> int:
+    """Get the mask of StateField flags of the fields that differ between two value tuples"""
+    mask = 0
+    for flag, old, new in zip(FIELD_FLAGS, previous, current):
+        if old != new:
+            mask |= flag
+    return mask
+
+
+class DroneStateSnapshot(Mapping):
+    """Immutable record of the drone state at one point in time
+
+    One snapshot is built per state notification and the same object is
+    handed to every subscriber. It behaves like the dict returned by
+    DroneState.get_state() (state["latitude"], .get(), .items(), ...) and
+    also exposes the fields as attributes. version increases with every
+    change, and changed is an int mask of the StateField flags of the fields
+    that differ from the previous snapshot, so subscribers can skip updates
+    they don't care about:
+
+        if snapshot.changed & StateField.POSITION:
+            ...
+    """
+
+    __slots__ = ("_values", "version", "changed")
+
+    def __init__(self, values: Tuple, version: int = 0, changed: int = StateField.ALL):
+        """Initialize the snapshot
+
+        Args:
+            values: Field values in STATE_FIELDS order
+            version: Snapshot version
+            changed: Fields that changed since the previous version
+        """
+        if len(values) != len(STATE_FIELDS):
+            raise ValueError(f"Expected {len(STATE_FIELDS)} values, got {len(values)}")
+        object.__setattr__(self, "_values", tuple(values))
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "changed", changed)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DroneStateSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("DroneStateSnapshot is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[FIELD_INDEX[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(STATE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(STATE_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"<DroneStateSnapshot(version={self.version}, changed={StateField(self.changed)!r})>"
+
+    @property
+    def values_tuple(self) -> Tuple:
+        """Field values in STATE_FIELDS order"""
+        return self._values
+
+    def has_changed(self, fields: StateField) -> bool:
+        """Check whether any of the given fields changed in this version"""
+        return bool(self.changed & fields)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get a mutable dict copy of the fields"""
+        return dict(zip(STATE_FIELDS, self._values))
+
+
+def _field_property(index: int, name: str) -> property:
+    return property(lambda self: self._values[index], doc=f"Snapshot value of {name}")
+
+
+for _index, _name in enumerate(STATE_FIELDS):
+    setattr(DroneStateSnapshot, _name, _field_property(_index, _name))
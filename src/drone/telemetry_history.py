@@ -0,0 +1,195 @@
+# src/drone/telemetry_history.py
+import time
+import logging
+from typing import Any, Mapping, Optional, Tuple
+
+import numpy as np
+
+from src.drone.state_snapshot import StateField
+
+logger = logging.getLogger(__name__)
+
+# Columns kept for every sample. Mode is a string and is left out; "time" is
+# the sample timestamp in seconds since the epoch.
+HISTORY_DTYPE = np.dtype([
+    ("time", np.float64),
+    ("latitude", np.float64),
+    ("longitude", np.float64),
+    ("altitude", np.float32),
+    ("relative_altitude", np.float32),
+    ("heading", np.float32),
+    ("airspeed", np.float32),
+    ("groundspeed", np.float32),
+    ("roll", np.float32),
+    ("pitch", np.float32),
+    ("yaw", np.float32),
+    ("armed", np.uint8),
+    ("battery_voltage", np.float32),
+    ("battery_level", np.float32),
+    ("battery_current", np.float32),
+    ("gps_fix", np.int16),
+    ("gps_satellites", np.int16),
+])
+
+HISTORY_FIELDS = HISTORY_DTYPE.names[1:]
+
+# Fields whose changes are worth a sample; last_update_time alone is not
+SAMPLED_FIELDS = StateField.ALL & ~StateField.LAST_UPDATE_TIME
+
+
+class TelemetryHistory:
+    """Fixed-size time series of drone telemetry
+
+    Samples go into a preallocated NumPy structured array used as a ring
+    buffer. Every sample is written twice, at i and i + capacity, so the most
+    recent n samples are always one contiguous slice and windowed reads are
+    views rather than copies.
+
+    There must be a single writer at a time; readers take no lock. The
+    writer fills both copies of a row before publishing the new count, so a
+    reader never sees a half-written sample. A view stays valid until
+    capacity - len(view) further samples have been appended; copy it if it
+    must outlive that.
+
+    Window queries need increasing timestamps. When a sample is older than
+    the newest one, e.g. after a replay seek or loop, the history starts a
+    new segment and the samples before it are dropped.
+    """
+
+    def __init__(self, retention_s: float = 600.0, sample_rate_hz: float = 10.0,
+                 capacity: Optional[int] = None):
+        """Initialize the history
+
+        Args:
+            retention_s: How far back the history reaches at sample_rate_hz
+            sample_rate_hz: Expected sample rate, used to size the buffer
+            capacity: Number of samples to keep (overrides retention_s)
+        """
+        self.sample_rate_hz = sample_rate_hz
+        self.capacity = capacity or max(1, int(retention_s * sample_rate_hz))
+        self._buffer = np.zeros(2 * self.capacity, dtype=HISTORY_DTYPE)
+        self._count = 0
+        # Count at which the current run of increasing timestamps began
+        self._segment_start = 0
+        self.segments = 1
+        self.drone_state = None
+
+    def __len__(self) -> int:
+        return min(self._count - self._segment_start, self.capacity)
+
+    @property
+    def total_samples(self) -> int:
+        """Number of samples appended since creation or the last clear()"""
+        return self._count
+
+    def append(self, state: Mapping[str, Any], timestamp: Optional[float] = None):
+        """Add a sample (single writer)
+
+        Args:
+            state: DroneStateSnapshot or get_state() dict
+            timestamp: Sample time; defaults to the state's last_update_time
+        """
+        if timestamp is None:
+            timestamp = state.get("last_update_time") or time.time()
+        row = (timestamp,) + tuple(
+            0 if state.get(name) is None else state.get(name) for name in HISTORY_FIELDS
+        )
+
+        total = self._count
+        if total > self._segment_start:
+            newest = self._buffer["time"][(total - 1) % self.capacity]
+            if timestamp < newest:
+                logger.info(f"Telemetry time went back {newest - timestamp:.1f} s, "
+                            f"starting a new history segment")
+                # Readers see an empty history until the count is published
+                self._segment_start = total
+                self.segments += 1
+
+        index = total % self.capacity
+        self._buffer[index] = row
+        self._buffer[index + self.capacity] = row
+        # Publish only after both copies are written
+        self._count = total + 1
+
+    def _recent(self, count: int, total: int) -> np.ndarray:
+        """View of the last count samples as of total appended samples"""
+        end = (total - 1) % self.capacity + self.capacity + 1
+        return self._buffer[end - count:end]
+
+    def window(self, seconds: Optional[float] = None, now: Optional[float] = None) -> np.ndarray:
+        """Get recent samples as a structured array view
+
+        Args:
+            seconds: Only samples from the last seconds (None for the whole history)
+            now: Reference time (defaults to the newest sample's time)
+
+        Returns:
+            np.ndarray: Oldest-first view of HISTORY_DTYPE rows
+        """
+        total = self._count
+        count = max(0, min(total - self._segment_start, self.capacity))
+        if count == 0:
+            return self._buffer[:0]
+
+        samples = self._recent(count, total)
+        if seconds is None:
+            return samples
+        if now is None:
+            now = samples["time"][-1]
+        start = np.searchsorted(samples["time"], now - seconds, side="left")
+        return samples[start:]
+
+    def series(self, field: str, seconds: Optional[float] = None,
+               now: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (times, values) of one field, e.g. the last 60 s of altitude
+
+        Both arrays are views into the history.
+        """
+        if field not in HISTORY_FIELDS:
+            raise KeyError(f"Unknown telemetry field: {field}")
+        samples = self.window(seconds, now)
+        return samples["time"], samples[field]
+
+    def latest(self) -> Optional[np.void]:
+        """Get the newest sample, if any"""
+        total = self._count
+        if total <= self._segment_start:
+            return None
+        return self._recent(1, total)[0]
+
+    def rate_of_change(self, field: str, seconds: float) -> float:
+        """Least-squares slope of a field over the last seconds, per second
+
+        Returns:
+            float: Trend, e.g. m/s for altitude or %/s for battery_level
+        """
+        times, values = self.series(field, seconds)
+        if len(times) < 2 or times[-1] == times[0]:
+            return 0.0
+        return float(np.polyfit(times - times[0], values.astype(np.float64), 1)[0])
+
+    def clear(self):
+        """Drop all samples"""
+        self._count = 0
+        self._segment_start = 0
+        self.segments = 1
+
+    def attach(self, drone_state, max_rate_hz: Optional[float] = None):
+        """Record samples from a DroneState
+
+        Args:
+            drone_state: DroneState to follow
+            max_rate_hz: Sample rate limit (defaults to sample_rate_hz)
+        """
+        self.detach()
+        self.drone_state = drone_state
+        # The notifier serializes calls to one callback, keeping a single writer
+        drone_state.register_state_change_callback(
+            self.append, max_rate_hz=max_rate_hz or self.sample_rate_hz, fields=SAMPLED_FIELDS
+        )
+
+    def detach(self):
+        """Stop recording samples"""
+        if self.drone_state is not None:
+            self.drone_state.unregister_state_change_callback(self.append)
+            self.drone_state = None
@@ -0,0 +1,266 @@
+# src/drone/telemetry_recorder.py
+import os
+import time
+import queue
+import struct
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TELEMETRY_DIR = "data/telemetry"
+
+# Each record is a big-endian uint64 of microseconds since the epoch followed
+# by the raw MAVLink packet, the .tlog layout read by pymavlink, MAVProxy and
+# Mission Planner.
+TLOG_TIMESTAMP = struct.Struct(">Q")
+
+# Sentinel queued by stop() to wake the writer thread
+_STOP = object()
+
+
+class TelemetryRecorder:
+    """Records raw MAVLink traffic to rotating .tlog files
+
+    The receive path only timestamps the packet and puts it on a bounded
+    queue; a dedicated thread writes the files. When the disk falls behind
+    and the queue is full, packets are dropped and counted rather than
+    blocking the vehicle's receive thread.
+    """
+
+    def __init__(self, directory: str = DEFAULT_TELEMETRY_DIR, max_file_bytes: int = 64 * 1024 * 1024,
+                 max_file_seconds: float = 3600.0, queue_size: int = 10000, flush_interval: float = 1.0):
+        """Initialize the recorder
+
+        Args:
+            directory: Directory for the log files
+            max_file_bytes: Start a new file once the current one reaches this size
+            max_file_seconds: Start a new file once the current one is this old
+            queue_size: Maximum packets waiting to be written
+            flush_interval: Seconds between flushes of the current file
+        """
+        self.directory = directory
+        self.max_file_bytes = max_file_bytes
+        self.max_file_seconds = max_file_seconds
+        self.flush_interval = flush_interval
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        # Set when stop() couldn't queue the sentinel; the writer gives up draining
+        self._stopping = threading.Event()
+        self._file = None
+        self._file_opened_at = 0.0
+        self._file_bytes = 0
+        self.vehicle = None
+        self.files: List[str] = []
+
+        self.stats = {
+            "received": 0,
+            "written": 0,
+            "dropped": 0,
+            "bytes_written": 0,
+            "write_errors": 0,
+            "queue_high_water": 0,
+        }
+
+    @property
+    def is_recording(self) -> bool:
+        """Whether the writer thread is running and has not been told to stop"""
+        return self._thread is not None and self._thread.is_alive() and not self._stopping.is_set()
+
+    @property
+    def current_file(self) -> Optional[str]:
+        """Path of the file being written, if any"""
+        return self.files[-1] if self._file else None
+
+    def start(self, vehicle=None) -> bool:
+        """Start recording
+
+        Args:
+            vehicle: DroneKit vehicle whose messages are recorded; packets can
+                also be passed to record() directly
+
+        Returns:
+            bool: True if recording, False if the writer of a timed-out stop()
+            is still running
+        """
+        if self.is_recording:
+            return True
+        if self._thread is not None and self._thread.is_alive():
+            logger.error("Telemetry writer from the previous recording is still running, not starting")
+            return False
+
+        if self._stopping.is_set():
+            # Packets (and possibly the sentinel) left behind by a stop() that gave up
+            self._discard_queue()
+            self._stopping.clear()
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._writer_loop, name="TelemetryRecorder")
+        self._thread.daemon = True
+        self._thread.start()
+
+        if vehicle is not None:
+            self.vehicle = vehicle
+            vehicle.add_message_listener('*', self._on_message)
+        logger.info(f"Telemetry recording started in {self.directory}")
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        """Stop recording, writing out what is already queued
+
+        If the queue is still full after timeout, or the writer hasn't
+        finished by then, the writer is told to stop after its current write
+        and the rest of the queue is discarded.
+
+        Args:
+            timeout: Seconds to wait for the writer thread
+        """
+        if self.vehicle is not None:
+            try:
+                self.vehicle.remove_message_listener('*', self._on_message)
+            except Exception as e:
+                logger.error(f"Error removing telemetry listener: {str(e)}")
+            self.vehicle = None
+
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        if not self._stopping.is_set():
+            try:
+                # Wait for room rather than drop the sentinel; the writer is draining the queue
+                self._queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                logger.warning(f"Telemetry queue still full after {timeout} s, "
+                               f"discarding {self._queue.qsize()} unwritten messages")
+                self._stopping.set()
+
+        self._thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        if self._thread.is_alive():
+            # Stalled on the disk; keep the thread so start() doesn't add a second writer
+            self._stopping.set()
+            logger.warning(f"Telemetry writer did not finish within {timeout} s")
+            return
+        self._thread = None
+        logger.info(f"Telemetry recording stopped ({self.stats['written']} messages, "
+                    f"{self.stats['dropped']} dropped)")
+
+    def _discard_queue(self):
+        """Drop everything still queued"""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    def _on_message(self, vehicle, name, message):
+        """DroneKit message listener (runs on the receive thread)"""
+        try:
+            packet = message.get_msgbuf()
+        except Exception:
+            return
+        if packet:
+            self.record(bytes(packet))
+
+    def record(self, packet: bytes, timestamp: Optional[float] = None) -> bool:
+        """Queue a raw MAVLink packet for writing without blocking
+
+        Args:
+            packet: Packet bytes as received
+            timestamp: Receive time in seconds (defaults to now)
+
+        Returns:
+            bool: False if the packet was dropped because the queue is full
+        """
+        self.stats["received"] += 1
+        try:
+            self._queue.put_nowait((timestamp or time.time(), packet))
+        except queue.Full:
+            self.stats["dropped"] += 1
+            return False
+
+        depth = self._queue.qsize()
+        if depth > self.stats["queue_high_water"]:
+            self.stats["queue_high_water"] = depth
+        return True
+
+    def _writer_loop(self):
+        """Write queued packets to disk until stopped"""
+        last_flush = time.time()
+        try:
+            while not self._stopping.is_set():
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP:
+                    break
+                if item is not None:
+                    self._write(*item)
+                    # Write whatever else is already waiting before flushing
+                    while not self._stopping.is_set():
+                        try:
+                            item = self._queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if item is _STOP:
+                            return
+                        self._write(*item)
+
+                if self._file and time.time() - last_flush >= self.flush_interval:
+                    self._file.flush()
+                    last_flush = time.time()
+        finally:
+            self._close_file()
+
+    def _write(self, timestamp: float, packet: bytes):
+        """Append one record, rotating the file if needed"""
+        try:
+            if self._file is None or self._should_rotate(timestamp):
+                self._open_file(timestamp)
+            record = TLOG_TIMESTAMP.pack(int(timestamp * 1e6)) + packet
+            self._file.write(record)
+            self._file_bytes += len(record)
+            self.stats["written"] += 1
+            self.stats["bytes_written"] += len(record)
+        except Exception as e:
+            self.stats["write_errors"] += 1
+            logger.error(f"Error writing telemetry log: {str(e)}")
+
+    def _should_rotate(self, timestamp: float) -> bool:
+        return (self._file_bytes >= self.max_file_bytes or
+                timestamp - self._file_opened_at >= self.max_file_seconds)
+
+    def _open_file(self, timestamp: float):
+        """Close the current file and start a new one"""
+        self._close_file()
+        stamp = datetime.fromtimestamp(timestamp).strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.directory, f"flight_{stamp}_{len(self.files):03d}.tlog")
+        self._file = open(path, "ab")
+        self._file_opened_at = timestamp
+        self._file_bytes = 0
+        self.files.append(path)
+        logger.debug(f"Recording telemetry to {path}")
+
+    def _close_file(self):
+        if self._file:
+            try:
+                self._file.close()
+            except Exception as e:
+                logger.error(f"Error closing telemetry log: {str(e)}")
+            self._file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get recording counters
+
+        Returns:
+            dict: Message, byte and drop counts plus the current file
+        """
+        stats = dict(self.stats)
+        stats["recording"] = self.is_recording
+        stats["queue_depth"] = self._queue.qsize()
+        stats["current_file"] = self.current_file
+        stats["files"] = len(self.files)
+        return stats
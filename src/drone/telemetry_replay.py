@@ -0,0 +1,450 @@
+# src/drone/telemetry_replay.py
+import time
+import bisect
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.drone import dronekit_wrapper as dronekit
+from dronekit import Attitude, Battery, GPSInfo, LocationGlobal, LocationGlobalRelative, VehicleMode
+from pymavlink import mavutil
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+from src.drone.telemetry_recorder import TLOG_TIMESTAMP
+
+logger = logging.getLogger(__name__)
+
+MAVLINK1_MAGIC = 0xFE
+MAVLINK2_MAGIC = 0xFD
+MAVLINK2_SIGNED = 0x01
+
+# Messages that update vehicle attributes, applied when priming after a seek
+STATE_MESSAGES = ("HEARTBEAT", "GLOBAL_POSITION_INT", "ATTITUDE", "VFR_HUD", "SYS_STATUS", "GPS_RAW_INT")
+
+
+def _packet_length(data: bytes, start: int) -> int:
+    """Length of the MAVLink packet at start, or 0 if there isn't one"""
+    if start + 3 > len(data):
+        return 0
+    magic = data[start]
+    if magic == MAVLINK1_MAGIC:
+        return data[start + 1] + 8
+    if magic == MAVLINK2_MAGIC:
+        signed = data[start + 2] & MAVLINK2_SIGNED
+        return data[start + 1] + 12 + (13 if signed else 0)
+    return 0
+
+
+def index_tlog(data: bytes) -> Tuple[List[float], List[int], List[int]]:
+    """Find the records of a .tlog file without decoding them
+
+    Args:
+        data: File contents
+
+    Returns:
+        tuple: (timestamps in seconds, packet offsets, packet lengths)
+    """
+    times, offsets, lengths = [], [], []
+    position = 0
+    skipped = 0
+    end = len(data)
+    while position + TLOG_TIMESTAMP.size < end:
+        start = position + TLOG_TIMESTAMP.size
+        length = _packet_length(data, start)
+        if length == 0 or start + length > end:
+            # Not a record boundary; resynchronize one byte further on
+            position += 1
+            skipped += 1
+            continue
+        times.append(TLOG_TIMESTAMP.unpack_from(data, position)[0] / 1e6)
+        offsets.append(start)
+        lengths.append(length)
+        position = start + length
+
+    if skipped:
+        logger.warning(f"Skipped {skipped} unreadable bytes while indexing telemetry log")
+    return times, offsets, lengths
+
+
+class _ReplayLocations:
+    """Location frames, shaped like DroneKit's vehicle.location"""
+
+    def __init__(self):
+        self.global_frame = LocationGlobal(None, None, None)
+        self.global_relative_frame = LocationGlobalRelative(None, None, None)
+        self.local_frame = None
+
+
+class ReplayVehicle:
+    """Plays a recorded .tlog back through a DroneKit-like vehicle interface
+
+    Decoded messages update the same attributes a DroneKit Vehicle keeps
+    (location, attitude, battery, gps_0, mode, armed, airspeed, ...) and fire
+    the same attribute and message listeners, so a DroneState or any other
+    listener can be pointed at a recording instead of a live link.
+
+    Playback runs on its own thread at a multiple of the recorded speed, or
+    as fast as possible with speed=None, and can be paused, resumed and
+    seeked. Commands are not supported; the vehicle only reports.
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0, loop: bool = False):
+        """Load and index a telemetry log
+
+        Args:
+            path: .tlog file, e.g. one written by TelemetryRecorder
+            speed: Playback speed multiple, or None for as fast as possible
+            loop: Start over when the end of the log is reached
+        """
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+
+        with open(path, "rb") as f:
+            self._data = f.read()
+        self._times, self._offsets, self._lengths = index_tlog(self._data)
+        self._mav = mavlink.MAVLink(None)
+
+        # Vehicle attributes, as DroneKit names them
+        self.location = _ReplayLocations()
+        self.attitude = Attitude(None, None, None)
+        self.velocity = [None, None, None]
+        self.battery = None
+        self.gps_0 = GPSInfo(None, None, None, None)
+        self.mode = VehicleMode("UNKNOWN")
+        self.armed = False
+        self.airspeed = None
+        self.groundspeed = None
+        self.heading = None
+        self.system_status = None
+        self.parameters: Dict[str, float] = {}
+        self.version = None
+        self._last_heartbeat = None
+
+        self._attribute_listeners: Dict[str, List[Callable]] = {}
+        self._message_listeners: Dict[str, List[Callable]] = {}
+        self._listener_lock = threading.Lock()
+
+        # Playback state
+        self._position = 0
+        self._anchor_wall = 0.0
+        self._anchor_log = self.start_time
+        # Reentrant so listeners may pause or seek from the playback thread
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._running = threading.Event()
+        self._stopped = threading.Event()
+        self.finished = threading.Event()
+        self._thread = None
+
+        self.stats = {
+            "messages": 0,
+            "decode_errors": 0,
+            "seeks": 0,
+            "busy_seconds": 0.0,
+        }
+        logger.info(f"Loaded telemetry log {path}: {len(self._times)} messages, {self.duration:.1f}s")
+
+    # Log information
+
+    @property
+    def message_count(self) -> int:
+        """Number of messages in the log"""
+        return len(self._times)
+
+    @property
+    def start_time(self) -> float:
+        """Timestamp of the first message"""
+        return self._times[0] if self._times else 0.0
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the first to the last message"""
+        return self._times[-1] - self._times[0] if self._times else 0.0
+
+    @property
+    def position(self) -> float:
+        """Playback position in seconds from the start of the log"""
+        index = min(self._position, len(self._times) - 1)
+        return self._times[index] - self.start_time if index >= 0 else 0.0
+
+    @property
+    def last_heartbeat(self) -> Optional[float]:
+        """Seconds since the last replayed HEARTBEAT, as in DroneKit"""
+        if self._last_heartbeat is None:
+            return None
+        return time.monotonic() - self._last_heartbeat
+
+    @property
+    def is_playing(self) -> bool:
+        """Whether playback is running and not paused"""
+        return self._thread is not None and self._thread.is_alive() and self._running.is_set()
+
+    # Listener API
+
+    def add_attribute_listener(self, attr_name: str, observer: Callable):
+        """Call observer(vehicle, attr_name, value) when the attribute is updated"""
+        with self._listener_lock:
+            listeners = self._attribute_listeners.setdefault(attr_name, [])
+            if observer not in listeners:
+                listeners.append(observer)
+
+    def remove_attribute_listener(self, attr_name: str, observer: Callable):
+        """Remove an attribute listener"""
+        with self._listener_lock:
+            listeners = self._attribute_listeners.get(attr_name, [])
+            if observer in listeners:
+                listeners.remove(observer)
+
+    def add_message_listener(self, name: str, fn: Callable):
+        """Call fn(vehicle, name, message) for each replayed message of a type ('*' for all)"""
+        with self._listener_lock:
+            listeners = self._message_listeners.setdefault(name, [])
+            if fn not in listeners:
+                listeners.append(fn)
+
+    def remove_message_listener(self, name: str, fn: Callable):
+        """Remove a message listener"""
+        with self._listener_lock:
+            listeners = self._message_listeners.get(name, [])
+            if fn in listeners:
+                listeners.remove(fn)
+
+    def notify_attribute_listeners(self, attr_name: str, value: Any):
+        with self._listener_lock:
+            listeners = list(self._attribute_listeners.get(attr_name, ()))
+        for fn in listeners:
+            try:
+                fn(self, attr_name, value)
+            except Exception as e:
+                logger.error(f"Error in replay attribute listener for {attr_name}: {str(e)}")
+
+    def notify_message_listeners(self, name: str, message):
+        with self._listener_lock:
+            listeners = list(self._message_listeners.get(name, ())) + list(self._message_listeners.get('*', ()))
+        for fn in listeners:
+            try:
+                fn(self, name, message)
+            except Exception as e:
+                logger.error(f"Error in replay message listener for {name}: {str(e)}")
+
+    # Playback control
+
+    def start(self):
+        """Start or resume playback"""
+        with self._lock:
+            self._reanchor()
+        self._running.set()
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self.finished.clear()
+        self._thread = threading.Thread(target=self._playback_loop, name="TelemetryReplay")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def pause(self):
+        """Pause playback at the current message"""
+        self._running.clear()
+        self._wake.set()
+
+    def resume(self):
+        """Resume paused playback"""
+        self.start()
+
+    def stop(self):
+        """Stop playback and the playback thread"""
+        self._stopped.set()
+        self._running.set()
+        self._wake.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def close(self):
+        """Stop playback (DroneKit Vehicle.close() equivalent)"""
+        self.stop()
+
+    def set_speed(self, speed: Optional[float]):
+        """Change the playback speed
+
+        Args:
+            speed: Speed multiple, or None for as fast as possible
+        """
+        with self._lock:
+            self.speed = speed
+            self._reanchor()
+        self._wake.set()
+
+    def seek(self, seconds: float):
+        """Jump to a position in the log
+
+        The most recent message of each state message type before the new
+        position is applied straight away, so attributes are correct as soon
+        as the seek returns.
+
+        Args:
+            seconds: Position in seconds from the start of the log
+        """
+        target = self.start_time + max(0.0, min(seconds, self.duration))
+        index = bisect.bisect_left(self._times, target)
+        with self._lock:
+            self._position = index
+            self._prime(index)
+            self._reanchor()
+            self.stats["seeks"] += 1
+        self.finished.clear()
+        self._wake.set()
+
+    def run_to_end(self):
+        """Replay the rest of the log synchronously, as fast as possible"""
+        with self._lock:
+            while self._position < len(self._times):
+                self._dispatch(self._position)
+                self._position += 1
+        self.finished.set()
+
+    def _reanchor(self):
+        """Tie the current log position to now (called with the lock held)"""
+        self._anchor_wall = time.monotonic()
+        index = min(self._position, len(self._times) - 1)
+        self._anchor_log = self._times[index] if index >= 0 else 0.0
+
+    def _prime(self, index: int, limit: int = 5000):
+        """Apply the latest state messages before index without delays"""
+        latest = {}
+        for i in range(index - 1, max(-1, index - 1 - limit), -1):
+            message = self._decode(i)
+            if message is None:
+                continue
+            name = message.get_type()
+            if name in STATE_MESSAGES and name not in latest:
+                latest[name] = message
+                if len(latest) == len(STATE_MESSAGES):
+                    break
+        for message in latest.values():
+            self._apply(message)
+
+    def _playback_loop(self):
+        """Dispatch messages at their recorded times"""
+        while not self._stopped.is_set():
+            self._running.wait()
+            if self._stopped.is_set():
+                break
+
+            with self._lock:
+                index = self._position
+                if index >= len(self._times):
+                    if self.loop and self._times:
+                        self._position = 0
+                        self._reanchor()
+                        continue
+                    self.finished.set()
+                    self._running.clear()
+                    logger.info("Telemetry replay finished")
+                    continue
+                delay = 0.0
+                if self.speed:
+                    due = self._anchor_wall + (self._times[index] - self._anchor_log) / self.speed
+                    delay = due - time.monotonic()
+
+            if delay > 0:
+                self._wake.clear()
+                # Woken early by pause, seek, speed changes or stop
+                if self._wake.wait(delay):
+                    continue
+
+            with self._lock:
+                if not self._running.is_set() or self._position != index:
+                    continue
+                started = time.perf_counter()
+                self._dispatch(index)
+                self._position = index + 1
+                self.stats["busy_seconds"] += time.perf_counter() - started
+
+    def _decode(self, index: int):
+        """Decode the message at index, or None if it is corrupt"""
+        start = self._offsets[index]
+        packet = self._data[start:start + self._lengths[index]]
+        try:
+            message = self._mav.decode(bytearray(packet))
+        except Exception:
+            self.stats["decode_errors"] += 1
+            return None
+        message._timestamp = self._times[index]
+        return message
+
+    def _dispatch(self, index: int):
+        """Apply one message and notify listeners"""
+        message = self._decode(index)
+        if message is None:
+            return
+        self.stats["messages"] += 1
+        name = message.get_type()
+        self._apply(message)
+        self.notify_message_listeners(name, message)
+
+    def _apply(self, m):
+        """Update attributes from a message, as DroneKit's handlers do"""
+        name = m.get_type()
+        if name == "GLOBAL_POSITION_INT":
+            self.location.global_frame = LocationGlobal(m.lat / 1.0e7, m.lon / 1.0e7, m.alt / 1000.0)
+            self.location.global_relative_frame = LocationGlobalRelative(
+                m.lat / 1.0e7, m.lon / 1.0e7, m.relative_alt / 1000.0)
+            self.velocity = [m.vx / 100.0, m.vy / 100.0, m.vz / 100.0]
+            self.notify_attribute_listeners('location', self.location)
+            self.notify_attribute_listeners('velocity', self.velocity)
+        elif name == "ATTITUDE":
+            self.attitude = Attitude(m.pitch, m.yaw, m.roll)
+            self.notify_attribute_listeners('attitude', self.attitude)
+        elif name == "VFR_HUD":
+            self.airspeed = m.airspeed
+            self.groundspeed = m.groundspeed
+            self.heading = m.heading
+            self.notify_attribute_listeners('airspeed', self.airspeed)
+            self.notify_attribute_listeners('groundspeed', self.groundspeed)
+            self.notify_attribute_listeners('heading', self.heading)
+        elif name == "SYS_STATUS":
+            self.battery = Battery(m.voltage_battery, m.current_battery, m.battery_remaining)
+            self.notify_attribute_listeners('battery', self.battery)
+        elif name == "GPS_RAW_INT":
+            self.gps_0 = GPSInfo(m.eph, m.epv, m.fix_type, m.satellites_visible)
+            self.notify_attribute_listeners('gps_0', self.gps_0)
+        elif name == "HEARTBEAT":
+            # Ignore ground stations, including the one that recorded the log
+            if m.type == mavutil.mavlink.MAV_TYPE_GCS:
+                return
+            self._last_heartbeat = time.monotonic()
+            # Like DroneKit, armed and mode listeners only hear about changes
+            armed = (m.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED) != 0
+            if armed != self.armed:
+                self.armed = armed
+                self.notify_attribute_listeners('armed', self.armed)
+            mode = mavutil.mode_string_v10(m)
+            if mode != self.mode.name:
+                self.mode = VehicleMode(mode)
+                self.notify_attribute_listeners('mode', self.mode)
+            self.system_status = m.system_status
+        elif name == "PARAM_VALUE":
+            self.parameters[m.param_id] = m.param_value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get playback counters
+
+        Returns:
+            dict: Messages replayed, position, duration and replay throughput
+        """
+        stats = dict(self.stats)
+        stats.update({
+            "path": self.path,
+            "speed": self.speed,
+            "position_s": self.position,
+            "duration_s": self.duration,
+            "total_messages": self.message_count,
+            "playing": self.is_playing,
+            "finished": self.finished.is_set(),
+            "messages_per_second": (stats["messages"] / stats["busy_seconds"]
+                                    if stats["busy_seconds"] else 0.0),
+        })
+        return stats
@@ -0,0 +1,263 @@
+# src/drone/telemetry_streams.py
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from pymavlink import mavutil
+
+logger = logging.getLogger(__name__)
+
+# Messages requested at drone.telemetry_frequency unless drone.message_rates
+# says otherwise: the ones DroneState is built from
+DEFAULT_STREAM_MESSAGES = (
+    "GLOBAL_POSITION_INT",
+    "ATTITUDE",
+    "VFR_HUD",
+    "SYS_STATUS",
+    "GPS_RAW_INT",
+)
+
+# Wildcard subscription key
+ALL_MESSAGES = "*"
+
+
+def message_id(message_type: str) -> int:
+    """Get the MAVLink message id of a message name, e.g. 'ATTITUDE' -> 30"""
+    try:
+        return getattr(mavutil.mavlink, f"MAVLINK_MSG_ID_{message_type.upper()}")
+    except AttributeError:
+        raise ValueError(f"Unknown MAVLink message: {message_type}")
+
+
+class TimedMessage:
+    """A received MAVLink message with its timestamps"""
+
+    __slots__ = ("message", "type", "received_at", "boot_time_ms", "system_id")
+
+    def __init__(self, message, received_at: float):
+        self.message = message
+        self.type = message.get_type()
+        # Time the ground station received the message (seconds since the epoch)
+        self.received_at = received_at
+        # Autopilot time since boot, when the message carries one
+        boot_ms = getattr(message, "time_boot_ms", None)
+        if boot_ms is None:
+            usec = getattr(message, "time_usec", None)
+            boot_ms = usec // 1000 if usec is not None else None
+        self.boot_time_ms = boot_ms
+        self.system_id = message.get_srcSystem()
+
+    def __getattr__(self, name: str) -> Any:
+        # Message fields, e.g. timed.roll
+        return getattr(self.message, name)
+
+    def __repr__(self) -> str:
+        return f"<TimedMessage({self.type}, received_at={self.received_at:.3f}, boot_time_ms={self.boot_time_ms})>"
+
+
+class TelemetrySubscriptions:
+    """Per-message-type callbacks on the raw MAVLink stream
+
+    Callbacks are registered as message listeners on the vehicle's MAVLink
+    connection handler, after DroneKit's own listener has updated the vehicle
+    attributes, and receive a TimedMessage carrying the receive time and the
+    autopilot boot time. Only message types with a
+    subscriber cost more than a dict lookup on the receive thread.
+
+    Stream rates are requested per message type with
+    MAV_CMD_SET_MESSAGE_INTERVAL.
+    """
+
+    def __init__(self):
+        """Initialize the subscriptions"""
+        self.vehicle = None
+        self._handler = None
+        # Replaced on every change so the receive thread reads it without a lock
+        self._callbacks: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.requested_rates: Dict[str, float] = {}
+
+        self.counts: Dict[str, int] = {}
+        self.last_received: Dict[str, float] = {}
+        self.stats = {
+            "received": 0,
+            "dispatched": 0,
+            "errors": 0,
+            "interval_requests": 0,
+        }
+
+    def attach(self, vehicle):
+        """Start receiving messages from a vehicle
+
+        Args:
+            vehicle: DroneKit Vehicle (or ReplayVehicle)
+        """
+        self.detach()
+        self.vehicle = vehicle
+        handler = getattr(vehicle, "_handler", None)
+        if handler is not None and hasattr(handler, "message_listeners"):
+            # Straight from the MAVLink receive loop, before DroneKit decodes attributes
+            self._handler = handler
+            handler.forward_message(self._on_raw_message)
+        else:
+            vehicle.add_message_listener(ALL_MESSAGES, self._on_vehicle_message)
+
+    def detach(self):
+        """Stop receiving messages"""
+        if self._handler is not None:
+            try:
+                self._handler.message_listeners.remove(self._on_raw_message)
+            except ValueError:
+                pass
+        elif self.vehicle is not None:
+            try:
+                self.vehicle.remove_message_listener(ALL_MESSAGES, self._on_vehicle_message)
+            except Exception as e:
+                logger.error(f"Error removing message listener: {str(e)}")
+        self._handler = None
+        self.vehicle = None
+
+    def subscribe(self, message_type: str, callback: Callable):
+        """Call callback(TimedMessage) for every message of a type
+
+        Args:
+            message_type: MAVLink message name, e.g. 'ATTITUDE', or '*' for all
+            callback: Function to call on the receive thread; keep it short
+        """
+        message_type = message_type.upper()
+        if message_type != ALL_MESSAGES:
+            message_id(message_type)
+        with self._lock:
+            callbacks = dict(self._callbacks)
+            current = callbacks.get(message_type, ())
+            if callback not in current:
+                callbacks[message_type] = current + (callback,)
+            self._callbacks = callbacks
+
+    def unsubscribe(self, message_type: str, callback: Callable):
+        """Remove a callback
+
+        Args:
+            message_type: Message name it was subscribed with
+            callback: Function to remove
+        """
+        message_type = message_type.upper()
+        with self._lock:
+            callbacks = dict(self._callbacks)
+            remaining = tuple(fn for fn in callbacks.get(message_type, ()) if fn != callback)
+            if remaining:
+                callbacks[message_type] = remaining
+            else:
+                callbacks.pop(message_type, None)
+            self._callbacks = callbacks
+
+    def _on_raw_message(self, handler, message):
+        """MAVConnection message listener"""
+        self.dispatch(message)
+
+    def _on_vehicle_message(self, vehicle, name, message):
+        """Vehicle '*' message listener"""
+        self.dispatch(message)
+
+    def dispatch(self, message, received_at: Optional[float] = None):
+        """Hand a message to its subscribers
+
+        Args:
+            message: pymavlink message
+            received_at: Receive time (defaults to the message's own timestamp)
+        """
+        name = message.get_type()
+        if name == "BAD_DATA":
+            return
+
+        now = received_at or getattr(message, "_timestamp", None) or time.time()
+        self.stats["received"] += 1
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.last_received[name] = now
+
+        callbacks = self._callbacks
+        targets = callbacks.get(name, ()) + callbacks.get(ALL_MESSAGES, ())
+        if not targets:
+            return
+
+        timed = TimedMessage(message, now)
+        for callback in targets:
+            try:
+                callback(timed)
+                self.stats["dispatched"] += 1
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.error(f"Error in {name} subscriber: {str(e)}")
+
+    def set_message_interval(self, message_type: str, rate_hz: Optional[float]) -> bool:
+        """Ask the autopilot to stream a message at a given rate
+
+        Args:
+            message_type: MAVLink message name
+            rate_hz: Messages per second; 0 or None stops the stream
+
+        Returns:
+            bool: True if the request was sent, False otherwise
+        """
+        vehicle = self.vehicle
+        factory = getattr(vehicle, "message_factory", None)
+        if factory is None:
+            logger.debug(f"Cannot set {message_type} interval: vehicle has no MAVLink link")
+            return False
+
+        interval_us = int(1e6 / rate_hz) if rate_hz and rate_hz > 0 else -1
+        try:
+            msg = factory.command_long_encode(
+                0, 0,  # target system, target component: broadcast
+                mavutil.mavlink.MAV_CMD_SET_MESSAGE_INTERVAL,
+                0,  # confirmation
+                message_id(message_type), interval_us,
+                0, 0, 0, 0, 0)
+            vehicle.send_mavlink(msg)
+        except Exception as e:
+            logger.error(f"Failed to set {message_type} interval: {str(e)}")
+            return False
+
+        self.requested_rates[message_type.upper()] = rate_hz or 0.0
+        self.stats["interval_requests"] += 1
+        return True
+
+    def apply_stream_rates(self, default_hz: float, overrides: Optional[Dict[str, float]] = None,
+                           messages: Iterable[str] = DEFAULT_STREAM_MESSAGES) -> Dict[str, float]:
+        """Request rates for the standard telemetry messages plus any overrides
+
+        Args:
+            default_hz: Rate for messages without an override
+            overrides: Per-message rates, e.g. {"ATTITUDE": 50.0}
+            messages: Messages streamed at default_hz
+
+        Returns:
+            dict: Rates that were requested successfully
+        """
+        rates = {name.upper(): default_hz for name in messages}
+        for name, rate in (overrides or {}).items():
+            rates[name.upper()] = rate
+
+        applied = {}
+        for name, rate in rates.items():
+            try:
+                if self.set_message_interval(name, rate):
+                    applied[name] = rate
+            except ValueError as e:
+                logger.error(str(e))
+        if applied:
+            logger.info(f"Requested telemetry rates: {applied}")
+        return applied
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get receive counters
+
+        Returns:
+            dict: Totals, per-type counts and the requested rates
+        """
+        stats = dict(self.stats)
+        stats["counts"] = dict(self.counts)
+        stats["requested_rates"] = dict(self.requested_rates)
+        stats["subscriptions"] = {name: len(fns) for name, fns in self._callbacks.items()}
+        return stats
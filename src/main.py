@@ -53,6 +53,10 @@ def main():
     backup_manager = BackupManager(db)
     backup_manager.start_scheduled_backups()
     
+    # Custom URL schemes must be registered before the application exists
+    from src.mapping.map_scheme_handler import register_map_scheme
+    register_map_scheme()
+
     # Create the application
     app = QApplication(sys.argv)
     app.setApplicationName("Drone Search & Recovery")
@@ -0,0 +1,125 @@
+# src/mapping/live_track.py
+import json
+import time
+import logging
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+from src.drone.state_snapshot import StateField
+from src.mapping.track_buffer import TrackBuffer, TrackPoint
+
+logger = logging.getLogger(__name__)
+
+
+class LiveTrackPublisher(QObject):
+    """Streams the vehicle's track to the map page over QWebChannel
+
+    DroneState callbacks only append to a TrackBuffer, which is cheap and
+    safe from the telemetry thread. A timer on the GUI thread sends the points
+    added since the last push, so the page is updated at most max_rate_hz
+    times per second regardless of the telemetry rate. If the GUI thread fell
+    so far behind that unsent points already left the buffer's ring, the
+    whole track is sent again instead of leaving a gap.
+
+    Register an instance on the page's QWebChannel as "trackBridge".
+    """
+
+    # JSON list of [lat, lon, alt] points added since the previous push
+    points_appended = pyqtSignal(str)
+    # JSON list of [lat, lon, alt] points replacing the whole track
+    track_reset = pyqtSignal(str)
+
+    def __init__(self, buffer: Optional[TrackBuffer] = None, max_rate_hz: float = 4.0,
+                 parent: Optional[QObject] = None):
+        """Initialize the publisher
+
+        Args:
+            buffer: Track buffer to publish (a new one is created if omitted)
+            max_rate_hz: Maximum number of pushes to the page per second
+            parent: Optional Qt parent
+        """
+        super().__init__(parent)
+        self.buffer = buffer if buffer is not None else TrackBuffer()
+        self.drone_state = None
+        self._last_sequence = 0
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(int(1000 / max_rate_hz))
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
+        self.stats = {
+            "pushes": 0,
+            "points_pushed": 0,
+            "resets": 0,
+            "resyncs": 0,
+        }
+
+    def attach(self, drone_state):
+        """Start recording positions from a DroneState
+
+        Args:
+            drone_state: DroneState instance to follow
+        """
+        self.detach()
+        self.drone_state = drone_state
+        drone_state.register_state_change_callback(self._on_state_change, max_rate_hz=10.0,
+                                                   fields=StateField.POSITION)
+
+    def detach(self):
+        """Stop recording positions"""
+        if self.drone_state is not None:
+            self.drone_state.unregister_state_change_callback(self._on_state_change)
+            self.drone_state = None
+
+    def _on_state_change(self, state: Dict[str, Any]):
+        """Record a position (runs on the telemetry thread)"""
+        changed = getattr(state, "changed", StateField.ALL)
+        if not changed & StateField.POSITION:
+            return
+        lat = state.get("latitude")
+        lon = state.get("longitude")
+        # 0, 0 is what DroneState reports before the first GPS fix
+        if lat is None or lon is None or (lat == 0.0 and lon == 0.0):
+            return
+        self.buffer.append(lat, lon, state.get("relative_altitude") or 0.0,
+                           state.get("last_update_time") or time.time())
+
+    @pyqtSlot()
+    def flush(self):
+        """Push points added since the previous push (GUI thread)"""
+        points = self.buffer.points_since(self._last_sequence)
+        if points is None:
+            logger.warning(f"Track points after #{self._last_sequence} were evicted before "
+                           f"they were sent, resending the whole track")
+            self.stats["resyncs"] += 1
+            self.request_snapshot()
+            return
+        if not points:
+            return
+        self._last_sequence = points[-1][0]
+        self.stats["pushes"] += 1
+        self.stats["points_pushed"] += len(points)
+        self.points_appended.emit(_encode(points))
+
+    @pyqtSlot()
+    def request_snapshot(self):
+        """Send the whole track, e.g. after the page has been reloaded"""
+        points = self.buffer.snapshot()
+        if points:
+            self._last_sequence = points[-1][0]
+        self.stats["resets"] += 1
+        self.track_reset.emit(_encode(points))
+
+    @pyqtSlot()
+    def clear(self):
+        """Forget the recorded track and clear it from the page"""
+        self.buffer.clear()
+        self.track_reset.emit("[]")
+
+
+def _encode(points: List[TrackPoint]) -> str:
+    """Serialize points compactly for the page"""
+    return json.dumps([[round(lat, 7), round(lon, 7), round(alt, 1)]
+                       for _, lat, lon, alt, _ in points], separators=(",", ":"))
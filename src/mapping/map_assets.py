@@ -0,0 +1,149 @@
+# src/mapping/map_assets.py
+import os
+import re
+import logging
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin, urlparse
+
+import requests
+
+from src.mapping.url_scheme import ASSETS_ROUTE, scheme_url
+
+logger = logging.getLogger(__name__)
+
+# Vendored copies of the Leaflet/folium JS and CSS, mirrored as <host>/<path>
+# so relative references inside the stylesheets (fonts, sprites) keep working.
+ASSET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "resources", "map_assets")
+
+ASSET_URL_PREFIX = scheme_url(ASSETS_ROUTE, "")
+
+_TAG_URL_RE = re.compile(r'(?:src|href)="(https?://[^"]+\.(?:js|css))"')
+_CSS_URL_RE = re.compile(r'url\(\s*[\'"]?([^\'")]+)[\'"]?\s*\)')
+
+
+def local_asset_path(url: str, asset_dir: str = ASSET_DIR) -> str:
+    """Get the vendored file path for a remote asset URL"""
+    parsed = urlparse(url)
+    return os.path.join(asset_dir, parsed.netloc, *parsed.path.lstrip("/").split("/"))
+
+
+def local_asset_url(url: str) -> str:
+    """Get the mapview:// URL that serves the vendored copy of a remote asset"""
+    parsed = urlparse(url)
+    return f"{ASSET_URL_PREFIX}{parsed.netloc}{parsed.path}"
+
+
+def find_remote_assets(html: str) -> List[str]:
+    """Find the remote scripts and stylesheets referenced by a map page
+
+    Args:
+        html: Rendered map HTML
+
+    Returns:
+        list: Asset URLs in document order, without duplicates
+    """
+    urls = []
+    for url in _TAG_URL_RE.findall(html):
+        if url not in urls:
+            urls.append(url)
+    return urls
+
+
+def rewrite_asset_urls(html: str, asset_dir: str = ASSET_DIR) -> str:
+    """Point a map page at the vendored assets instead of the CDNs
+
+    Assets without a vendored copy keep their CDN URL, so a missing file
+    degrades to the old behaviour instead of breaking the map.
+
+    Args:
+        html: Rendered map HTML
+        asset_dir: Directory holding the vendored assets
+
+    Returns:
+        str: HTML with asset URLs rewritten to mapview://assets/
+    """
+    missing = []
+
+    def replace(match):
+        url = match.group(1)
+        if os.path.exists(local_asset_path(url, asset_dir)):
+            return match.group(0).replace(url, local_asset_url(url))
+        missing.append(url)
+        return match.group(0)
+
+    html = _TAG_URL_RE.sub(replace, html)
+    if missing:
+        logger.warning(f"{len(missing)} map assets not vendored, loading from CDN: {missing}")
+    return html
+
+
+def vendor_assets(urls: Iterable[str], asset_dir: str = ASSET_DIR,
+                  session: Optional[requests.Session] = None) -> Dict[str, int]:
+    """Download map assets, and the files their stylesheets reference
+
+    Args:
+        urls: Asset URLs to vendor
+        asset_dir: Directory to mirror the assets into
+        session: Optional HTTP session
+
+    Returns:
+        dict: Counts of downloaded, existing and failed files
+    """
+    session = session or requests.Session()
+    stats = {"downloaded": 0, "existing": 0, "failed": 0}
+    queue = list(urls)
+    seen = set()
+
+    while queue:
+        url = queue.pop(0).split("#")[0].split("?")[0]
+        if url in seen:
+            continue
+        seen.add(url)
+
+        path = local_asset_path(url, asset_dir)
+        if os.path.exists(path):
+            stats["existing"] += 1
+            with open(path, "rb") as f:
+                content = f.read()
+        else:
+            try:
+                response = session.get(url, timeout=30)
+                response.raise_for_status()
+                content = response.content
+            except Exception as e:
+                logger.error(f"Failed to vendor {url}: {str(e)}")
+                stats["failed"] += 1
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(content)
+            stats["downloaded"] += 1
+            logger.info(f"Vendored {url}")
+
+        # Stylesheets pull in fonts and images by relative URL
+        if url.endswith(".css"):
+            for ref in _CSS_URL_RE.findall(content.decode("utf-8", errors="ignore")):
+                if not ref.startswith("data:"):
+                    queue.append(urljoin(url, ref))
+
+    return stats
+
+
+def main():
+    """Vendor every asset used by the planning map
+
+    Run from the project root: python -m src.mapping.map_assets
+    """
+    logging.basicConfig(level=logging.INFO)
+    from src.mapping.map_generator import render_folium_map
+
+    # Render a map with a flight path so optional plugins are included too
+    sample_path = [(34.0734, -118.4449), (34.0740, -118.4440), (34.0746, -118.4449)]
+    html = render_folium_map(sample_path, local_assets=False)
+    stats = vendor_assets(find_remote_assets(html))
+    logger.info(f"Map assets: {stats}")
+
+
+if __name__ == "__main__":
+    main()
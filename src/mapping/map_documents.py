@@ -0,0 +1,124 @@
+# src/mapping/map_documents.py
+import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+from src.mapping.map_generator import render_folium_map
+from src.mapping.url_scheme import scheme_url, MAPS_ROUTE
+
+logger = logging.getLogger(__name__)
+
+HTML_MIME_TYPE = "text/html"
+
+
+def plan_hash(waypoints: Optional[Sequence] = None, speed_mps: float = 5.0,
+              altitude: float = 50, local_assets: bool = True,
+              overlays: Optional[List[Dict]] = None) -> str:
+    """Get the content address of the map page for a plan
+
+    Everything that changes the rendered page goes into the hash, so equal
+    plans share one document and a changed plan never reuses a stale one.
+
+    Returns:
+        str: Hex digest used as the document name
+    """
+    speed = speed_mps if isinstance(speed_mps, (int, float)) else 0
+    key = {
+        "waypoints": [[round(float(lat), 8), round(float(lon), 8)]
+                      for lat, lon in (waypoint[:2] for waypoint in waypoints or [])],
+        "speed": float(speed),
+        "altitude": float(altitude),
+        "local_assets": local_assets,
+        "overlays": overlays or [],
+    }
+    encoded = json.dumps(key, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+def map_document_url(key: str) -> str:
+    """Get the mapview:// URL of a stored map document"""
+    return scheme_url(MAPS_ROUTE, f"{key}.html")
+
+
+class MapDocumentStore:
+    """In-memory, content-addressed store of rendered map pages
+
+    Pages are rendered into memory and served through the mapview://maps/
+    route instead of being written to a shared file on disk. Documents are
+    named by their plan hash, so re-planning to an unchanged result is a
+    cache hit that skips the render entirely. The least recently used
+    documents are dropped once max_documents is exceeded.
+    """
+
+    def __init__(self, max_documents: int = 16):
+        """Initialize the store
+
+        Args:
+            max_documents: Number of rendered pages to keep
+        """
+        self.max_documents = max_documents
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a stored document, marking it as recently used"""
+        with self._lock:
+            html = self._documents.get(key)
+            if html is not None:
+                self._documents.move_to_end(key)
+            return html
+
+    def put(self, key: str, html: str):
+        """Store a rendered document"""
+        with self._lock:
+            self._documents[key] = html.encode("utf-8")
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._documents
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._documents)
+
+    def render(self, waypoints: Optional[Sequence] = None, speed_mps: float = 5.0,
+               altitude: float = 50, local_assets: bool = True,
+               overlays: Optional[List[Dict]] = None) -> str:
+        """Render the map page for a plan unless it's already stored
+
+        Safe to call from a worker thread.
+
+        Returns:
+            str: Key of the document, see map_document_url()
+        """
+        key = plan_hash(waypoints, speed_mps, altitude, local_assets, overlays)
+        if self.get(key) is not None:
+            self.stats["hits"] += 1
+            return key
+
+        self.stats["misses"] += 1
+        html = render_folium_map(waypoints, speed_mps=speed_mps, altitude=altitude,
+                                 local_assets=local_assets, overlays=overlays)
+        self.put(key, html)
+        logger.debug(f"Rendered map document {key} ({len(html)} bytes)")
+        return key
+
+    def resolve(self, path: str):
+        """Route resolver for mapview://maps/<key>.html"""
+        key = path[:-len(".html")] if path.endswith(".html") else path
+        html = self.get(key)
+        if html is None:
+            return None
+        return html, HTML_MIME_TYPE
@@ -0,0 +1,102 @@
+# src/mapping/map_events.py
+import json
+import logging
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Event types sent by the map page
+HOVER_EVENT = "hover"
+CLICK_EVENT = "click"
+SHAPE_EVENT = "shape"
+VIEWPORT_EVENT = "viewport"
+
+# Event types where only the newest event in a batch matters
+COALESCED_EVENTS = {HOVER_EVENT, VIEWPORT_EVENT}
+
+
+class MapEventDispatcher:
+    """Unpacks batched map page events and hands them to handlers
+
+    The page collects its events and flushes them at most once per animation
+    frame as a single JSON message:
+
+        {"events": [{"type": "hover", "lat": .., "lon": ..}, ...],
+         "raw": {"mousemove": 14}}
+
+    "raw" counts the DOM events the page saw since the last flush, so the
+    IPC saving can be measured from the Python side.
+    """
+
+    def __init__(self):
+        """Initialize the dispatcher"""
+        self.handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self.stats = {
+            "messages": 0,
+            "events": 0,
+            "coalesced": 0,
+            "raw_events": 0,
+            "errors": 0,
+        }
+
+    def register_handler(self, event_type: str, handler: Callable[[Dict[str, Any]], None]):
+        """Register a handler for an event type
+
+        Args:
+            event_type: Event type, e.g. "hover"
+            handler: Function called with the event dict
+        """
+        handlers = self.handlers.setdefault(event_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def unregister_handler(self, event_type: str, handler: Callable[[Dict[str, Any]], None]):
+        """Unregister an event handler"""
+        if handler in self.handlers.get(event_type, []):
+            self.handlers[event_type].remove(handler)
+
+    def dispatch_batch(self, batch_json: str) -> int:
+        """Dispatch one batch message from the page
+
+        Args:
+            batch_json: JSON message as described in the class docstring
+
+        Returns:
+            int: Number of events handed to handlers
+        """
+        self.stats["messages"] += 1
+        try:
+            batch = json.loads(batch_json)
+        except (TypeError, ValueError) as e:
+            self.stats["errors"] += 1
+            logger.error(f"Malformed map event batch: {str(e)}")
+            return 0
+
+        self.stats["raw_events"] += sum(batch.get("raw", {}).values())
+        events = batch.get("events", [])
+
+        # Only the last event of a coalesced type is worth delivering
+        last_index = {}
+        for index, event in enumerate(events):
+            if event.get("type") in COALESCED_EVENTS:
+                last_index[event["type"]] = index
+
+        dispatched = 0
+        for index, event in enumerate(events):
+            event_type = event.get("type")
+            if event_type in last_index and last_index[event_type] != index:
+                self.stats["coalesced"] += 1
+                continue
+
+            for handler in self.handlers.get(event_type, []):
+                try:
+                    handler(event)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.error(f"Error in map {event_type} event handler: {str(e)}")
+            dispatched += 1
+
+        self.stats["events"] += dispatched
+        if self.stats["messages"] % 500 == 0:
+            logger.debug(f"Map event IPC: {self.stats}")
+        return dispatched
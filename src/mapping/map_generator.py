@@ -9,10 +9,43 @@ from geopy.distance import geodesic
 from bs4 import BeautifulSoup
 from folium import PolyLine, Marker
 from folium.features import CustomIcon
+from src.mapping.tiles import TILE_SOURCES
+from src.mapping.map_assets import rewrite_asset_urls
+from src.mapping.url_scheme import basemap_url, overlay_url
 
-def generate_folium_map(waypoints=None, speed_mps=5.0, altitude=50):
+# Points the live track line may hold in the page before older points are thinned
+LIVE_TRACK_MAX_POINTS = 4000
+
+def generate_folium_map(waypoints=None, speed_mps=5.0, altitude=50, local_assets=True):
+    html = render_folium_map(waypoints, speed_mps=speed_mps, altitude=altitude,
+                             local_assets=local_assets)
+
+    # Save the HTML
+    map_dir = os.path.join("data", "maps")
+    os.makedirs(map_dir, exist_ok=True)
+    map_path = os.path.join(map_dir, "latest_map.html")
+    with open(map_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    print(f"[DEBUG] Map saved to: {map_path}")
+
+    return map_path
+
+def render_folium_map(waypoints=None, speed_mps=5.0, altitude=50, local_assets=True,
+                      overlays=None):
+    """Build the planning map page in memory
+
+    With local_assets the page loads Leaflet and its plugins from the vendored
+    copies and base map tiles through the tile cache, both via the mapview://
+    scheme, so it renders without internet access.
+
+    overlays lists generated raster layers ({"name", "bounds", "version"}, see
+    RasterTileRenderer.overlay_layers()) whose tiles come from mapview://overlays/.
+    """
     if waypoints and len(waypoints) > 0:
         map_center = waypoints[0]
+    elif overlays:
+        south, west, north, east = overlays[0]["bounds"]
+        map_center = [(south + north) / 2, (west + east) / 2]
     else:
         map_center = [34.0734, -118.4449]  # Default center
 
@@ -76,21 +109,27 @@ def generate_folium_map(waypoints=None, speed_mps=5.0, altitude=50):
     minutes, seconds = divmod(int(estimated_time_sec), 60)
 
     # Add measurement + tile layers
-    folium.TileLayer(
-        tiles='https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}',
-        attr='Esri',
-        name='Satellite',
-        overlay=False,
-        control=True
-    ).add_to(base_map)
-    folium.TileLayer(
-        tiles="https://{s}.tile.opentopomap.org/{z}/{x}/{y}.png",
-        attr="Map data: © OpenTopoMap contributors",
-        name="Topographic",
-        overlay=False,
-        control=True
-    ).add_to(base_map)
-    folium.TileLayer('CartoDB positron', name='Light').add_to(base_map)
+    for name, source in TILE_SOURCES.items():
+        folium.TileLayer(
+            tiles=basemap_url(name) if local_assets else source["url"],
+            attr=source["attr"],
+            name=name,
+            subdomains=source["subdomains"] or "abc",
+            overlay=False,
+            control=True
+        ).add_to(base_map)
+    for overlay in overlays or []:
+        south, west, north, east = overlay["bounds"]
+        folium.TileLayer(
+            tiles=overlay_url(overlay["name"], overlay.get("version", 0)),
+            attr=overlay["name"],
+            name=overlay["name"],
+            overlay=True,
+            control=True,
+            opacity=0.7,
+            # Leaflet only requests tiles inside the raster's bounds
+            bounds=[[south, west], [north, east]]
+        ).add_to(base_map)
     folium.LayerControl(collapsed=False).add_to(base_map)
     base_map.add_child(MeasureControl(primary_length_unit='meters'))
     base_map.add_child(Draw(export=True))
@@ -107,16 +146,8 @@ def generate_folium_map(waypoints=None, speed_mps=5.0, altitude=50):
     """
     base_map.get_root().html.add_child(folium.Element(distance_time_display))
 
-    # Save the base HTML
-    map_dir = os.path.join("data", "maps")
-    os.makedirs(map_dir, exist_ok=True)
-    map_path = os.path.join(map_dir, "latest_map.html")
-    base_map.save(map_path)
-    print(f"[DEBUG] Map saved to: {map_path}")
-
-        # Inject WebChannel and JS draw + hover handling
-    with open(map_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "html.parser")
+    # Inject WebChannel and JS draw + hover handling
+    soup = BeautifulSoup(base_map.get_root().render(), "html.parser")
 
     # Add qwebchannel.js once
     head = soup.find("head")
@@ -133,7 +164,6 @@ def generate_folium_map(waypoints=None, speed_mps=5.0, altitude=50):
     <script>
         window.onload = function() {{
             new QWebChannel(qt.webChannelTransport, function(channel) {{
-                const mapBridge = channel.objects.mapBridge;
                 const coordinateBridge = channel.objects.coordinateBridge;
                 const map = typeof {map_var} !== 'undefined' ? {map_var} : null;
 
@@ -142,16 +172,53 @@ def generate_folium_map(waypoints=None, speed_mps=5.0, altitude=50):
                     return;
                 }}
 
+                // Batched event channel: events are queued and flushed to
+                // Python at most once per animation frame in one message.
+                // Hover only keeps the latest position between frames.
+                let queue = [];
+                let pendingHover = null;
+                let rawCounts = {{}};
+                let flushScheduled = false;
+
+                function countRaw(name) {{
+                    rawCounts[name] = (rawCounts[name] || 0) + 1;
+                }}
+
+                function flushEvents() {{
+                    flushScheduled = false;
+                    if (pendingHover) {{
+                        queue.push(pendingHover);
+                        pendingHover = null;
+                    }}
+                    if (!queue.length || !coordinateBridge) {{
+                        return;
+                    }}
+                    coordinateBridge.send_events(JSON.stringify({{ events: queue, raw: rawCounts }}));
+                    queue = [];
+                    rawCounts = {{}};
+                }}
+
+                function scheduleFlush() {{
+                    if (!flushScheduled) {{
+                        flushScheduled = true;
+                        window.requestAnimationFrame(flushEvents);
+                    }}
+                }}
+
+                window.queueMapEvent = function(event) {{
+                    queue.push(event);
+                    scheduleFlush();
+                }};
+
                 // Hover & Click
                 map.on('click', function(e) {{
-                    if (coordinateBridge) {{
-                        coordinateBridge.send_coordinates(e.latlng.lat, e.latlng.lng);
-                    }}
+                    countRaw('click');
+                    queueMapEvent({{ type: 'click', lat: e.latlng.lat, lon: e.latlng.lng }});
                 }});
                 map.on('mousemove', function(e) {{
-                    if (coordinateBridge) {{
-                        coordinateBridge.send_hover_coordinates(e.latlng.lat, e.latlng.lng);
-                    }}
+                    countRaw('mousemove');
+                    pendingHover = {{ type: 'hover', lat: e.latlng.lat, lon: e.latlng.lng }};
+                    scheduleFlush();
                 }});
 
                 // Shape Drawing
@@ -168,15 +235,116 @@ def generate_folium_map(waypoints=None, speed_mps=5.0, altitude=50):
                         latlngs = [[center.lat, center.lng, radius]];
                     }}
 
-                    if (mapBridge) {{
-                        mapBridge.receiveShape(JSON.stringify(latlngs));
-                    }}
+                    queueMapEvent({{ type: 'shape', coordinates: latlngs }});
                 }}
 
                 map.on('draw:created', onShapeDrawn);
                 map.on('draw:edited', function(e) {{
                     e.layers.eachLayer(layer => onShapeDrawn({{ layer: layer, layerType: 'polygon' }}));
                 }});
+
+                // Live vehicle track. Python pushes only new points; once the
+                // line gets too long, the older half is thinned out so the
+                // page's memory stays bounded on long flights.
+                const trackBridge = channel.objects.trackBridge;
+                if (trackBridge) {{
+                    const maxTrackPoints = {LIVE_TRACK_MAX_POINTS};
+                    let trackPoints = [];
+                    const trackLine = L.polyline([], {{ color: '#F97316', weight: 3 }}).addTo(map);
+                    const vehicleMarker = L.circleMarker([0, 0], {{
+                        radius: 6, color: '#FFFFFF', weight: 2, fillColor: '#F97316', fillOpacity: 1
+                    }});
+
+                    function decimateTrack() {{
+                        const half = Math.floor(trackPoints.length / 2);
+                        const older = trackPoints.slice(0, half).filter((p, i) => i % 2 === 0);
+                        trackPoints = older.concat(trackPoints.slice(half));
+                    }}
+
+                    function drawTrack() {{
+                        while (trackPoints.length > maxTrackPoints) {{
+                            decimateTrack();
+                        }}
+                        trackLine.setLatLngs(trackPoints.map(p => [p[0], p[1]]));
+                        if (trackPoints.length) {{
+                            const last = trackPoints[trackPoints.length - 1];
+                            vehicleMarker.setLatLng([last[0], last[1]]);
+                            if (!map.hasLayer(vehicleMarker)) {{
+                                vehicleMarker.addTo(map);
+                            }}
+                        }} else if (map.hasLayer(vehicleMarker)) {{
+                            map.removeLayer(vehicleMarker);
+                        }}
+                    }}
+
+                    trackBridge.points_appended.connect(function(pointsJson) {{
+                        trackPoints = trackPoints.concat(JSON.parse(pointsJson));
+                        drawTrack();
+                    }});
+                    trackBridge.track_reset.connect(function(pointsJson) {{
+                        trackPoints = JSON.parse(pointsJson);
+                        drawTrack();
+                    }});
+                    trackBridge.request_snapshot();
+                }}
+
+                // Mission overview. Python pages in the geometries around the
+                // current viewport, simplified for the zoom level, and removes
+                // the ones that scrolled out of range.
+                const overviewBridge = channel.objects.overviewBridge;
+                if (overviewBridge) {{
+                    const overviewLayer = L.featureGroup().addTo(map);
+                    let overviewFeatures = {{}};
+                    const statusColors = {{
+                        new: '#6366F1', planning: '#0EA5E9', ready: '#22C55E',
+                        in_progress: '#F59E0B', completed: '#64748B', archived: '#94A3B8'
+                    }};
+
+                    function removeOverviewFeature(id) {{
+                        if (overviewFeatures[id]) {{
+                            overviewLayer.removeLayer(overviewFeatures[id]);
+                            delete overviewFeatures[id];
+                        }}
+                    }}
+
+                    overviewBridge.features_added.connect(function(featuresJson) {{
+                        JSON.parse(featuresJson).forEach(function(f) {{
+                            removeOverviewFeature(f.id);
+                            const color = statusColors[f.status] || '#6366F1';
+                            let layer;
+                            if (f.kind === 'point') {{
+                                layer = L.circleMarker(f.coords[0], {{ radius: 4, color: color, weight: 1, fillOpacity: 0.8 }});
+                            }} else if (f.kind === 'polygon') {{
+                                layer = L.polygon(f.coords, {{ color: color, weight: 2, fillOpacity: 0.1 }});
+                            }} else {{
+                                layer = L.polyline(f.coords, {{ color: color, weight: 2 }});
+                            }}
+                            if (f.mission) {{
+                                layer.bindTooltip(f.mission);
+                            }}
+                            overviewFeatures[f.id] = layer.addTo(overviewLayer);
+                        }});
+                    }});
+                    overviewBridge.features_removed.connect(function(idsJson) {{
+                        JSON.parse(idsJson).forEach(removeOverviewFeature);
+                    }});
+                    overviewBridge.overview_cleared.connect(function() {{
+                        overviewLayer.clearLayers();
+                        overviewFeatures = {{}};
+                    }});
+                    overviewBridge.page_loaded();
+                }}
+
+                // Viewport changes go through the batched channel too
+                function queueViewport() {{
+                    const b = map.getBounds();
+                    queueMapEvent({{
+                        type: 'viewport', south: b.getSouth(), west: b.getWest(),
+                        north: b.getNorth(), east: b.getEast(), zoom: map.getZoom()
+                    }});
+                }}
+                map.on('moveend', queueViewport);
+                queueViewport();
             }});
         }};
     </script>
@@ -184,7 +352,7 @@ def generate_folium_map(waypoints=None, speed_mps=5.0, altitude=50):
 
     soup.body.append(BeautifulSoup(combined_js, "html.parser"))
 
-    with open(map_path, "w", encoding="utf-8") as f:
-        f.write(str(soup))
-
-    return map_path
\ No newline at end of file
+    html = str(soup)
+    if local_assets:
+        html = rewrite_asset_urls(html)
+    return html
\ No newline at end of file
@@ -0,0 +1,194 @@
+# src/mapping/map_scheme_handler.py
+import os
+import itertools
+import logging
+import mimetypes
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple, Union
+from urllib.parse import unquote
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QUrl, pyqtSignal
+from PyQt6.QtWebEngineCore import (
+    QWebEngineProfile, QWebEngineUrlRequestJob, QWebEngineUrlScheme, QWebEngineUrlSchemeHandler
+)
+
+from src.mapping.map_assets import ASSET_DIR
+from src.mapping.tile_prefetch import TileCache, TilePrefetcher
+from src.mapping.tiles import TILE_SOURCES
+from src.mapping.url_scheme import ASSETS_ROUTE, BASEMAP_ROUTE, SCHEME_NAME
+
+logger = logging.getLogger(__name__)
+
+# A route resolver gets the URL path (without the route) and returns either
+# (data, mime_type), a QUrl to redirect to, or None for "not found". Slow
+# routes return a Future of one of those and are answered when it completes.
+RouteResult = Union[Tuple[bytes, str], QUrl, Future, None]
+RouteResolver = Callable[[str], RouteResult]
+
+
+def register_map_scheme():
+    """Register the mapview:// scheme with Qt WebEngine
+
+    Must be called before the QApplication is created.
+    """
+    scheme = QWebEngineUrlScheme(SCHEME_NAME.encode())
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(
+        QWebEngineUrlScheme.Flag.SecureScheme
+        | QWebEngineUrlScheme.Flag.LocalScheme
+        | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+        | QWebEngineUrlScheme.Flag.CorsEnabled
+    )
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+class MapSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Serves mapview:// requests from in-process routes"""
+
+    # Completed Future results, delivered to the thread the jobs live on
+    _deferred_done = pyqtSignal(int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.routes: Dict[str, RouteResolver] = {}
+        self.request_count = 0
+
+        # Jobs waiting for a Future, dropped if the page goes away first
+        self._deferred: Dict[int, QWebEngineUrlRequestJob] = {}
+        self._tokens = itertools.count()
+        self._deferred_done.connect(self._finish_deferred)
+
+    def add_route(self, route: str, resolver: RouteResolver):
+        """Register a resolver for mapview://<route>/..."""
+        self.routes[route] = resolver
+
+    def remove_route(self, route: str):
+        """Unregister a route"""
+        self.routes.pop(route, None)
+
+    def requestStarted(self, job: QWebEngineUrlRequestJob):
+        """Answer a request from the web page"""
+        self.request_count += 1
+        url = job.requestUrl()
+        resolver = self.routes.get(url.host())
+        if resolver is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+
+        try:
+            result = resolver(unquote(url.path().lstrip("/")))
+        except Exception as e:
+            logger.error(f"Error serving {url.toString()}: {str(e)}")
+            job.fail(QWebEngineUrlRequestJob.Error.RequestFailed)
+            return
+
+        if isinstance(result, Future):
+            token = next(self._tokens)
+            self._deferred[token] = job
+            job.destroyed.connect(lambda *args, token=token: self._deferred.pop(token, None))
+            result.add_done_callback(lambda future, token=token: self._deferred_done.emit(token, future))
+            return
+        self._reply(job, result)
+
+    def _finish_deferred(self, token: int, future: Future):
+        """Answer a job whose route returned a Future"""
+        job = self._deferred.pop(token, None)
+        if job is None:
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Error serving {job.requestUrl().toString()}: {str(e)}")
+            job.fail(QWebEngineUrlRequestJob.Error.RequestFailed)
+            return
+        self._reply(job, result)
+
+    def _reply(self, job: QWebEngineUrlRequestJob, result: RouteResult):
+        if result is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+        elif isinstance(result, QUrl):
+            job.redirect(result)
+        else:
+            data, mime_type = result
+            # The buffer must outlive this call, so parent it to the job
+            buffer = QBuffer(job)
+            buffer.setData(QByteArray(data))
+            buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            job.reply(mime_type.encode(), buffer)
+
+
+def serve_directory(root: str) -> RouteResolver:
+    """Build a resolver serving files below a directory"""
+    root = os.path.abspath(root)
+
+    def resolve(path: str) -> RouteResult:
+        full_path = os.path.abspath(os.path.join(root, path))
+        if not full_path.startswith(root + os.sep) or not os.path.isfile(full_path):
+            return None
+        with open(full_path, "rb") as f:
+            data = f.read()
+        mime_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        return data, mime_type
+
+    return resolve
+
+
+def serve_basemap(cache: TileCache, executor: Optional[Executor] = None) -> RouteResolver:
+    """Build a resolver serving base map tiles from the tile cache
+
+    Tiles missing from the cache are downloaded into it in the background and
+    served once they arrive, so the page itself never loads a remote URL.
+
+    Args:
+        cache: Tile cache to serve from and fill
+        executor: Runs the downloads (a small thread pool by default)
+    """
+    fetcher = TilePrefetcher(cache)
+    executor = executor or ThreadPoolExecutor(max_workers=4, thread_name_prefix="basemap")
+
+    def fetch(layer: str, zoom: int, x: int, y: int) -> RouteResult:
+        data = fetcher.fetch_tile(layer, zoom, x, y)
+        return (data, "image/png") if data is not None else None
+
+    def resolve(path: str) -> RouteResult:
+        parts = path.split("/")
+        if len(parts) != 4 or parts[0] not in TILE_SOURCES:
+            return None
+        layer = parts[0]
+        try:
+            zoom, x, y = int(parts[1]), int(parts[2]), int(parts[3].split(".")[0])
+        except ValueError:
+            return None
+
+        data = cache.read(layer, zoom, x, y)
+        if data is not None:
+            return data, "image/png"
+        return executor.submit(fetch, layer, zoom, x, y)
+
+    return resolve
+
+
+def install_map_scheme_handler(profile: QWebEngineProfile,
+                               tile_cache: Optional[TileCache] = None,
+                               config=None) -> MapSchemeHandler:
+    """Install the mapview:// handler on a web engine profile
+
+    Installing twice on the same profile returns the existing handler.
+
+    Args:
+        profile: Profile used by the map web view
+        tile_cache: Tile cache for base map tiles (defaults to the 'paths.tiles' directory)
+        config: Application Config used for the default tile cache
+
+    Returns:
+        MapSchemeHandler: The handler, so callers can add routes
+    """
+    existing = profile.urlSchemeHandler(SCHEME_NAME.encode())
+    if isinstance(existing, MapSchemeHandler):
+        return existing
+
+    handler = MapSchemeHandler(profile)
+    handler.add_route(ASSETS_ROUTE, serve_directory(ASSET_DIR))
+    handler.add_route(BASEMAP_ROUTE, serve_basemap(tile_cache or TileCache(config=config)))
+    profile.installUrlSchemeHandler(SCHEME_NAME.encode(), handler)
+    return handler
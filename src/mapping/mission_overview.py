@@ -0,0 +1,240 @@
+# src/mapping/mission_overview.py
+import math
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from shapely.geometry import LineString, Polygon
+
+from src.mapping.tiles import METERS_PER_DEGREE_LAT, boundary_bounds, expand_bounds
+
+logger = logging.getLogger(__name__)
+
+# Ground resolution of a 256 px Web Mercator tile at zoom 0, in m/px at the equator
+METERS_PER_PIXEL_Z0 = 156543.03
+# Simplification tolerance and smallest drawn size, in screen pixels
+SIMPLIFY_PIXELS = 1.5
+POINT_PIXELS = 6
+# Zoom from which geometries are sent at full resolution
+FULL_DETAIL_ZOOM = 17
+CIRCLE_SEGMENTS = 48
+
+Bounds = Tuple[float, float, float, float]
+
+
+def meters_per_pixel(zoom: int, lat: float) -> float:
+    """Ground resolution of the map at a zoom level and latitude"""
+    return METERS_PER_PIXEL_Z0 * math.cos(math.radians(lat)) / (2 ** zoom)
+
+
+def circle_ring(lat: float, lon: float, radius_m: float,
+                segments: int = CIRCLE_SEGMENTS) -> List[List[float]]:
+    """Approximate a circle boundary as a ring of [lat, lon] points"""
+    dlat = radius_m / METERS_PER_DEGREE_LAT
+    dlon = radius_m / (METERS_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 1e-6))
+    return [[lat + dlat * math.sin(2 * math.pi * i / segments),
+             lon + dlon * math.cos(2 * math.pi * i / segments)] for i in range(segments)]
+
+
+class OverviewGeometry:
+    """A mission boundary or flown track shown on the overview map"""
+
+    def __init__(self, feature_id: str, coordinates: List, kind: str = "polygon",
+                 properties: Optional[Dict[str, Any]] = None):
+        """Initialize the geometry
+
+        Args:
+            feature_id: Unique id, e.g. "boundary-12"
+            coordinates: [lat, lon] points, or a single [lat, lon, radius_m] circle
+            kind: "polygon" for boundaries, "line" for tracks
+            properties: Extra fields for the page (mission name, status, ...)
+        """
+        if len(coordinates) == 1 and len(coordinates[0]) == 3:
+            coordinates = circle_ring(*coordinates[0])
+        if len(coordinates) < 2:
+            raise ValueError(f"Geometry {feature_id} needs at least two points")
+
+        self.feature_id = feature_id
+        self.kind = kind
+        self.properties = properties or {}
+        self.coordinates = [[float(point[0]), float(point[1])] for point in coordinates]
+        self.bounds = boundary_bounds(self.coordinates)
+        # Shapely works in x/y, i.e. lon/lat
+        xy = [(lon, lat) for lat, lon in self.coordinates]
+        self.shape = Polygon(xy) if kind == "polygon" and len(xy) >= 3 else LineString(xy)
+        self._lod_cache: Dict[int, Dict[str, Any]] = {}
+
+    def feature(self, zoom: int) -> Dict[str, Any]:
+        """Get the feature sent to the page for a zoom level
+
+        Geometries are simplified to what is visible at the zoom level, and
+        geometries smaller than a few pixels are sent as a single point.
+        """
+        zoom = min(int(zoom), FULL_DETAIL_ZOOM)
+        cached = self._lod_cache.get(zoom)
+        if cached is not None:
+            return cached
+
+        south, west, north, east = self.bounds
+        resolution = meters_per_pixel(zoom, (south + north) / 2)
+        size_m = max((north - south) * METERS_PER_DEGREE_LAT,
+                     (east - west) * METERS_PER_DEGREE_LAT * math.cos(math.radians((south + north) / 2)))
+
+        if size_m < resolution * POINT_PIXELS:
+            kind = "point"
+            coords = [[(south + north) / 2, (west + east) / 2]]
+        elif zoom >= FULL_DETAIL_ZOOM:
+            kind = self.kind
+            coords = self.coordinates
+        else:
+            kind = self.kind
+            simplified = self.shape.simplify(resolution * SIMPLIFY_PIXELS / METERS_PER_DEGREE_LAT,
+                                             preserve_topology=True)
+            xy = simplified.exterior.coords if isinstance(simplified, Polygon) else simplified.coords
+            coords = [[round(lat, 7), round(lon, 7)] for lon, lat in xy]
+
+        feature = {"id": self.feature_id, "kind": kind, "coords": coords, "lod": zoom}
+        feature.update(self.properties)
+        self._lod_cache[zoom] = feature
+        return feature
+
+
+class MissionOverviewIndex:
+    """Spatial index of overview geometries
+
+    Geometries are bucketed into a uniform grid of cell_deg sized cells, so a
+    viewport query only looks at geometries near the viewport instead of
+    every mission.
+    """
+
+    def __init__(self, cell_deg: float = 0.05):
+        """Initialize the index
+
+        Args:
+            cell_deg: Grid cell size in degrees
+        """
+        self.cell_deg = cell_deg
+        self.geometries: Dict[str, OverviewGeometry] = {}
+        self._cells: Dict[Tuple[int, int], Set[str]] = defaultdict(set)
+
+    def _cells_for(self, bounds: Bounds) -> Iterable[Tuple[int, int]]:
+        south, west, north, east = bounds
+        for row in range(math.floor(south / self.cell_deg), math.floor(north / self.cell_deg) + 1):
+            for col in range(math.floor(west / self.cell_deg), math.floor(east / self.cell_deg) + 1):
+                yield row, col
+
+    def add(self, geometry: OverviewGeometry):
+        """Add or replace a geometry"""
+        self.remove(geometry.feature_id)
+        self.geometries[geometry.feature_id] = geometry
+        for cell in self._cells_for(geometry.bounds):
+            self._cells[cell].add(geometry.feature_id)
+
+    def remove(self, feature_id: str):
+        """Remove a geometry"""
+        geometry = self.geometries.pop(feature_id, None)
+        if geometry is None:
+            return
+        for cell in self._cells_for(geometry.bounds):
+            self._cells[cell].discard(feature_id)
+
+    def add_mission_boundaries(self, boundaries: Iterable) -> int:
+        """Index MissionBoundary rows
+
+        Args:
+            boundaries: MissionBoundary objects (with their mission relationship)
+
+        Returns:
+            int: Number of boundaries indexed
+        """
+        count = 0
+        for boundary in boundaries:
+            mission = boundary.mission
+            try:
+                self.add(OverviewGeometry(
+                    f"boundary-{boundary.id}",
+                    boundary.get_coordinates(),
+                    properties={
+                        "mission_id": boundary.mission_id,
+                        "mission": mission.name if mission else "",
+                        "status": mission.status if mission else "",
+                    },
+                ))
+                count += 1
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Skipping boundary {boundary.id} in overview: {str(e)}")
+        return count
+
+    def query(self, bounds: Bounds) -> List[OverviewGeometry]:
+        """Get the geometries overlapping a (south, west, north, east) box"""
+        # A viewport spanning a large part of the world is cheaper to scan directly
+        south, west, north, east = bounds
+        cell_count = ((north - south) / self.cell_deg + 1) * ((east - west) / self.cell_deg + 1)
+        if cell_count > len(self.geometries):
+            candidates = self.geometries.keys()
+        else:
+            candidates = set()
+            for cell in self._cells_for(bounds):
+                candidates.update(self._cells.get(cell, ()))
+
+        results = []
+        for feature_id in candidates:
+            geometry = self.geometries[feature_id]
+            g_south, g_west, g_north, g_east = geometry.bounds
+            if g_south <= north and g_north >= south and g_west <= east and g_east >= west:
+                results.append(geometry)
+        return results
+
+    def __len__(self) -> int:
+        return len(self.geometries)
+
+
+class OverviewSession:
+    """Tracks which features a map page holds and works out what to send
+
+    The viewport is padded before querying so small pans don't require new
+    geometries, and a feature is only re-sent when its level of detail changes.
+    """
+
+    def __init__(self, index: MissionOverviewIndex, padding: float = 0.5):
+        """Initialize the session
+
+        Args:
+            index: Geometries to serve
+            padding: Fraction of the viewport size added on each side
+        """
+        self.index = index
+        self.padding = padding
+        self.sent: Dict[str, int] = {}
+
+    def update(self, bounds: Bounds, zoom: int) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Work out the changes for a new viewport
+
+        Args:
+            bounds: Visible (south, west, north, east)
+            zoom: Map zoom level
+
+        Returns:
+            tuple: (features to add or replace, ids of features to remove)
+        """
+        south, west, north, east = bounds
+        pad_m = max(north - south, east - west) * self.padding * METERS_PER_DEGREE_LAT
+        visible = self.index.query(expand_bounds(bounds, pad_m))
+
+        added = []
+        visible_ids = set()
+        for geometry in visible:
+            feature = geometry.feature(zoom)
+            visible_ids.add(geometry.feature_id)
+            if self.sent.get(geometry.feature_id) != feature["lod"]:
+                added.append(feature)
+                self.sent[geometry.feature_id] = feature["lod"]
+
+        removed = [feature_id for feature_id in self.sent if feature_id not in visible_ids]
+        for feature_id in removed:
+            del self.sent[feature_id]
+        return added, removed
+
+    def reset(self):
+        """Forget what the page holds, e.g. after it was reloaded"""
+        self.sent.clear()
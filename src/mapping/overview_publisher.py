@@ -0,0 +1,123 @@
+# src/mapping/overview_publisher.py
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+from src.mapping.mission_overview import MissionOverviewIndex, OverviewSession
+
+logger = logging.getLogger(__name__)
+
+
+class MissionOverviewPublisher(QObject):
+    """Pages mission geometries into the map page as the user pans
+
+    Viewport events arrive through the batched map event channel. For each
+    one the publisher works out which geometries became visible or changed
+    level of detail and sends them in pages of page_size features, one page
+    per event loop pass, so the page stays responsive with hundreds of
+    missions. Pages still queued for an outdated viewport are dropped.
+
+    Register an instance on the page's QWebChannel as "overviewBridge".
+    """
+
+    # JSON list of features to add or replace
+    features_added = pyqtSignal(str)
+    # JSON list of feature ids to remove
+    features_removed = pyqtSignal(str)
+    overview_cleared = pyqtSignal()
+
+    def __init__(self, index: Optional[MissionOverviewIndex] = None, page_size: int = 100,
+                 parent: Optional[QObject] = None):
+        """Initialize the publisher
+
+        Args:
+            index: Geometries to show (an empty index is created if omitted)
+            page_size: Features sent per message
+            parent: Optional Qt parent
+        """
+        super().__init__(parent)
+        self.page_size = page_size
+        self.enabled = False
+        self.last_viewport = None
+        self._pages: List[List[Dict[str, Any]]] = []
+        self._send_scheduled = False
+        self.stats = {
+            "viewports": 0,
+            "pages": 0,
+            "features_sent": 0,
+            "features_removed": 0,
+            "pages_dropped": 0,
+        }
+        self.set_index(index or MissionOverviewIndex())
+
+    def set_index(self, index: MissionOverviewIndex):
+        """Replace the geometries shown, e.g. after missions were loaded"""
+        self.index = index
+        self.session = OverviewSession(index)
+        self._pages = []
+        self.overview_cleared.emit()
+        self._refresh()
+
+    def set_enabled(self, enabled: bool):
+        """Show or hide the overview"""
+        self.enabled = enabled
+        self.session.reset()
+        self._pages = []
+        self.overview_cleared.emit()
+        self._refresh()
+
+    @pyqtSlot()
+    def page_loaded(self):
+        """Called by the page when its channel connects; it starts out empty"""
+        self.session.reset()
+        self._pages = []
+        self._refresh()
+
+    def on_viewport(self, event: Dict[str, Any]):
+        """Handle a viewport event from the map page"""
+        self.last_viewport = event
+        self._refresh()
+
+    def _refresh(self):
+        """Queue the changes for the last known viewport"""
+        if not self.enabled or self.last_viewport is None:
+            return
+
+        # Pages queued for an older viewport never reached the page, so the
+        # session must not count their features as sent
+        for page in self._pages:
+            self.stats["pages_dropped"] += 1
+            for feature in page:
+                self.session.sent.pop(feature["id"], None)
+
+        event = self.last_viewport
+        bounds = (event["south"], event["west"], event["north"], event["east"])
+        added, removed = self.session.update(bounds, event["zoom"])
+        self.stats["viewports"] += 1
+
+        if removed:
+            self.stats["features_removed"] += len(removed)
+            self.features_removed.emit(json.dumps(removed))
+
+        self._pages = [added[i:i + self.page_size] for i in range(0, len(added), self.page_size)]
+        self._schedule_send()
+
+    def _schedule_send(self):
+        """Send the next page on the next event loop pass"""
+        if self._pages and not self._send_scheduled:
+            self._send_scheduled = True
+            QTimer.singleShot(0, self._send_next_page)
+
+    @pyqtSlot()
+    def _send_next_page(self):
+        """Send one page of features"""
+        self._send_scheduled = False
+        if not self._pages:
+            return
+        page = self._pages.pop(0)
+        self.stats["pages"] += 1
+        self.stats["features_sent"] += len(page)
+        self.features_added.emit(json.dumps(page, separators=(",", ":")))
+        self._schedule_send()
@@ -0,0 +1,258 @@
+# src/mapping/raster_tiles.py
+import io
+import math
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from src.mapping.tiles import tile_bounds
+
+logger = logging.getLogger(__name__)
+
+TILE_SIZE = 256
+
+# Colour ramps as (position, (r, g, b, a)) stops, expanded into 256-entry
+# lookup tables so colourising a tile is a single array index.
+COLORMAPS = {
+    "probability": [
+        (0.0, (49, 54, 149, 0)),
+        (0.1, (69, 117, 180, 120)),
+        (0.4, (254, 224, 144, 170)),
+        (0.7, (244, 109, 67, 200)),
+        (1.0, (165, 0, 38, 220)),
+    ],
+    "coverage": [
+        (0.0, (255, 255, 255, 0)),
+        (0.01, (199, 233, 192, 110)),
+        (0.5, (65, 171, 93, 160)),
+        (1.0, (0, 90, 50, 200)),
+    ],
+}
+
+
+def build_lut(stops: Sequence[Tuple[float, Tuple[int, int, int, int]]]) -> np.ndarray:
+    """Expand colour stops into a (256, 4) uint8 lookup table"""
+    positions = np.array([stop[0] for stop in stops])
+    colors = np.array([stop[1] for stop in stops], dtype=float)
+    samples = np.linspace(0.0, 1.0, 256)
+    lut = np.stack([np.interp(samples, positions, colors[:, channel]) for channel in range(4)], axis=1)
+    return np.round(lut).astype(np.uint8)
+
+
+def _encode_png(rgba: np.ndarray) -> bytes:
+    """Encode an RGBA array as PNG, favouring speed over size"""
+    output = io.BytesIO()
+    Image.fromarray(rgba, "RGBA").save(output, format="PNG", compress_level=1)
+    return output.getvalue()
+
+
+TRANSPARENT_TILE = _encode_png(np.zeros((TILE_SIZE, TILE_SIZE, 4), dtype=np.uint8))
+
+
+class RasterLayer:
+    """A georeferenced raster shown as a map overlay
+
+    The raster is a regular lat/lon grid: row 0 is the northern edge and
+    column 0 the western edge of the bounds. NaN cells are left transparent.
+    """
+
+    def __init__(self, name: str, data: np.ndarray, bounds: Tuple[float, float, float, float],
+                 colormap: str = "probability", value_range: Optional[Tuple[float, float]] = None,
+                 version: int = 0):
+        """Initialize the layer
+
+        Args:
+            name: Layer name, used in tile URLs and the layer control
+            data: 2D array of values
+            bounds: (south, west, north, east) covered by the raster
+            colormap: Key into COLORMAPS
+            value_range: (min, max) mapped onto the colour ramp (defaults to the data range)
+            version: Bumped whenever the layer is replaced
+        """
+        data = np.asarray(data, dtype=np.float32)
+        if data.ndim != 2:
+            raise ValueError("Raster data must be two-dimensional")
+        if colormap not in COLORMAPS:
+            raise ValueError(f"Unknown colormap: {colormap}")
+
+        self.name = name
+        self.data = data
+        self.bounds = bounds
+        self.colormap = colormap
+        self.lut = build_lut(COLORMAPS[colormap])
+        self.version = version
+
+        if value_range is None:
+            finite = self.data[np.isfinite(self.data)]
+            value_range = (float(finite.min()), float(finite.max())) if finite.size else (0.0, 1.0)
+        self.value_range = value_range
+
+    def intersects(self, bounds: Tuple[float, float, float, float]) -> bool:
+        """Check whether a (south, west, north, east) box overlaps the raster"""
+        south, west, north, east = bounds
+        r_south, r_west, r_north, r_east = self.bounds
+        return south < r_north and north > r_south and west < r_east and east > r_west
+
+    def render(self, zoom: int, x: int, y: int) -> bytes:
+        """Render one slippy-map tile as PNG (nearest-neighbour sampling)"""
+        south, west, north, east = tile_bounds(x, y, zoom)
+        if not self.intersects((south, west, north, east)):
+            return TRANSPARENT_TILE
+
+        n = 2 ** zoom
+        pixel = (np.arange(TILE_SIZE) + 0.5) / TILE_SIZE
+        lons = west + pixel * (east - west)
+        # Rows are evenly spaced in Web Mercator, not in latitude
+        lats = np.degrees(np.arctan(np.sinh(math.pi * (1 - 2 * (y + pixel) / n))))
+
+        r_south, r_west, r_north, r_east = self.bounds
+        rows, cols = self.data.shape
+        row_index = np.floor((r_north - lats) / (r_north - r_south) * rows).astype(int)
+        col_index = np.floor((lons - r_west) / (r_east - r_west) * cols).astype(int)
+        row_valid = (row_index >= 0) & (row_index < rows)
+        col_valid = (col_index >= 0) & (col_index < cols)
+
+        values = self.data[np.clip(row_index, 0, rows - 1)[:, None],
+                           np.clip(col_index, 0, cols - 1)[None, :]]
+        inside = row_valid[:, None] & col_valid[None, :] & np.isfinite(values)
+
+        low, high = self.value_range
+        scale = 255.0 / (high - low) if high > low else 0.0
+        levels = np.clip((np.nan_to_num(values, nan=low) - low) * scale, 0, 255).astype(np.uint8)
+        rgba = self.lut[levels]
+        rgba[~inside] = 0
+        return _encode_png(rgba)
+
+
+class RasterTileRenderer:
+    """Renders raster overlays into map tiles on demand
+
+    Tiles are only computed when the map page requests them, i.e. when they
+    are visible, and the most recently used ones are kept in an LRU cache.
+    Replacing a layer bumps its version, which invalidates its cached tiles.
+    Tiles outside a raster are answered with a shared transparent tile.
+
+    The mapview:// route answers cached tiles at once and renders the rest
+    on a thread pool, so the GUI thread running the scheme handler never
+    waits for a render.
+    """
+
+    def __init__(self, cache_size: int = 512, executor: Optional[Executor] = None):
+        """Initialize the renderer
+
+        Args:
+            cache_size: Number of rendered tiles to keep
+            executor: Renders tiles requested through resolve() (a small thread pool by default)
+        """
+        self.cache_size = cache_size
+        self.layers: Dict[str, RasterLayer] = {}
+        self.executor = executor or ThreadPoolExecutor(max_workers=4, thread_name_prefix="overlay")
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "rendered": 0,
+            "hits": 0,
+            "empty": 0,
+        }
+
+    def set_layer(self, name: str, data: np.ndarray, bounds: Tuple[float, float, float, float],
+                  colormap: str = "probability",
+                  value_range: Optional[Tuple[float, float]] = None) -> RasterLayer:
+        """Add or replace an overlay layer
+
+        Args:
+            name: Layer name
+            data: 2D array of values, row 0 at the northern edge
+            bounds: (south, west, north, east) covered by the raster
+            colormap: Key into COLORMAPS
+            value_range: (min, max) mapped onto the colour ramp
+
+        Returns:
+            RasterLayer: The new layer
+        """
+        with self._lock:
+            previous = self.layers.get(name)
+            version = previous.version + 1 if previous else 0
+            layer = RasterLayer(name, data, bounds, colormap, value_range, version)
+            self.layers[name] = layer
+        return layer
+
+    def remove_layer(self, name: str):
+        """Remove an overlay layer"""
+        with self._lock:
+            self.layers.pop(name, None)
+
+    def overlay_layers(self) -> List[Dict]:
+        """Describe the current layers for the map page"""
+        with self._lock:
+            return [{"name": layer.name, "bounds": list(layer.bounds), "version": layer.version}
+                    for layer in self.layers.values()]
+
+    def render_tile(self, name: str, zoom: int, x: int, y: int) -> Optional[bytes]:
+        """Get a tile of a layer as PNG
+
+        Returns:
+            bytes: PNG data, or None if the layer doesn't exist
+        """
+        layer, key, data = self._lookup(name, zoom, x, y)
+        if layer is None or data is not None:
+            return data
+        return self._render(layer, key, zoom, x, y)
+
+    def _lookup(self, name: str, zoom: int, x: int, y: int):
+        """Find a layer and its cached tile
+
+        Returns:
+            tuple: (layer, cache key, PNG data); the layer is None if it doesn't
+            exist and the data is None if the tile isn't cached
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+            layer = self.layers.get(name)
+            if layer is None:
+                return None, None, None
+            key = (name, layer.version, zoom, x, y)
+            data = self._cache.get(key)
+            if data is not None:
+                self._cache.move_to_end(key)
+                self.stats["hits"] += 1
+            return layer, key, data
+
+    def _render(self, layer: RasterLayer, key: Tuple, zoom: int, x: int, y: int) -> bytes:
+        """Render a tile that wasn't cached and cache it (any thread)"""
+        data = layer.render(zoom, x, y)
+        with self._lock:
+            if data is TRANSPARENT_TILE:
+                self.stats["empty"] += 1
+                return data
+            self._cache[key] = data
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            self.stats["rendered"] += 1
+        return data
+
+    def resolve(self, path: str):
+        """Route resolver for mapview://overlays/<layer>/<z>/<x>/<y>.png
+
+        Cached tiles are returned directly; others as a Future of the rendered tile.
+        """
+        parts = path.split("/")
+        if len(parts) != 4:
+            return None
+        try:
+            zoom, x, y = int(parts[1]), int(parts[2]), int(parts[3].split(".")[0])
+        except ValueError:
+            return None
+
+        layer, key, data = self._lookup(parts[0], zoom, x, y)
+        if layer is None:
+            return None
+        if data is not None:
+            return data, "image/png"
+        return self.executor.submit(lambda: (self._render(layer, key, zoom, x, y), "image/png"))
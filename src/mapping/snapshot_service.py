@@ -0,0 +1,331 @@
+# src/mapping/snapshot_service.py
+import os
+import json
+import time
+import logging
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, QUrl, Qt, pyqtSignal
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile
+from PyQt6.QtWebEngineWidgets import QWebEngineView
+
+from src.mapping.map_documents import MapDocumentStore, map_document_url
+from src.mapping.map_scheme_handler import install_map_scheme_handler
+from src.mapping.tiles import boundary_bounds
+from src.mapping.url_scheme import MAPS_ROUTE, OVERLAYS_ROUTE
+from src.utils.config import config_value
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_DIR = os.path.join("data", "snapshots")
+
+# Number of tile layers still loading on the folium map, or -1 while the
+# map doesn't exist yet. Leaflet clears GridLayer._loading when it fires
+# 'load', i.e. once every visible tile has loaded or failed.
+PENDING_TILES_JS = """
+(function() {
+    if (typeof L === 'undefined' || document.readyState !== 'complete') { return -1; }
+    var pending = 0, found = false;
+    Object.keys(window).forEach(function(name) {
+        var map = window[name];
+        if (name.indexOf('map_') === 0 && map instanceof L.Map) {
+            found = true;
+            map.eachLayer(function(layer) {
+                if (layer instanceof L.GridLayer && layer._loading) { pending++; }
+            });
+        }
+    });
+    return found ? pending : -1;
+})();
+"""
+
+FIT_BOUNDS_JS = """
+(function() {
+    Object.keys(window).forEach(function(name) {
+        var map = window[name];
+        if (name.indexOf('map_') === 0 && map instanceof L.Map) {
+            map.fitBounds(%s, {animate: false, padding: [20, 20]});
+        }
+    });
+})();
+"""
+
+
+class SnapshotJob:
+    """A map state to capture as PNG"""
+
+    def __init__(self, job_id: int, output_path: str, waypoints: Optional[Sequence] = None,
+                 speed_mps: float = 5.0, altitude: float = 50,
+                 bounds: Optional[Tuple[float, float, float, float]] = None,
+                 overlays: Optional[List[Dict]] = None, size: Optional[Tuple[int, int]] = None):
+        """Initialize the job
+
+        Args:
+            job_id: Id reported back in snapshot_ready/snapshot_failed
+            output_path: Where to write the PNG
+            waypoints: Flight path to draw
+            speed_mps: Flight speed for the distance/time box
+            altitude: Flight altitude
+            bounds: (south, west, north, east) to frame; defaults to the waypoints
+            overlays: Raster overlay layers, see RasterTileRenderer.overlay_layers()
+            size: (width, height) in pixels; defaults to the service size
+        """
+        self.job_id = job_id
+        self.output_path = output_path
+        self.waypoints = waypoints
+        self.speed_mps = speed_mps
+        self.altitude = altitude
+        self.bounds = bounds
+        self.overlays = overlays
+        self.size = size
+        self.started_at = None
+
+
+class MapSnapshotService(QObject):
+    """Captures map snapshots with one warm offscreen web view
+
+    Creating a QWebEngineView starts a renderer process and costs seconds, so
+    the service creates one hidden view up front and reuses it for every
+    job. Jobs are queued and run one after another: the map page is rendered
+    into a private document store, loaded, framed, and captured as soon as
+    Leaflet reports that all visible tiles have loaded rather than after a
+    fixed delay.
+
+    The view has its own off-the-record profile, so its mapview:// routes
+    don't interfere with the interactive map view.
+
+    PNGs without an explicit path go to the 'paths.snapshots' directory of
+    the configuration.
+    """
+
+    snapshot_ready = pyqtSignal(int, str)
+    snapshot_failed = pyqtSignal(int, str)
+    queue_drained = pyqtSignal()
+
+    def __init__(self, size: Tuple[int, int] = (1280, 800), tile_timeout_ms: int = 15000,
+                 poll_interval_ms: int = 50, settle_ms: int = 100,
+                 raster_tiles=None, config=None, view=None, parent: Optional[QObject] = None):
+        """Initialize the service and warm up its web view
+
+        Args:
+            size: Default (width, height) of snapshots
+            tile_timeout_ms: Capture anyway if tiles are still loading after this long
+            poll_interval_ms: How often tile loading is checked
+            settle_ms: Delay between the last tile loading and the capture, for painting
+            raster_tiles: Optional RasterTileRenderer serving overlay tiles
+            config: Application Config (defaults to DEFAULT_CONFIG values)
+            view: Web view to render into; by default a hidden QWebEngineView
+                with its own profile is created
+            parent: Optional Qt parent
+        """
+        super().__init__(parent)
+        self.size = size
+        self.tile_timeout_ms = tile_timeout_ms
+        self.settle_ms = settle_ms
+        self.snapshot_dir = config_value(config, "paths.snapshots", DEFAULT_SNAPSHOT_DIR)
+        self.documents = MapDocumentStore(max_documents=4)
+
+        self.profile = None
+        self.scheme_handler = None
+        if view is None:
+            view = self._create_view(raster_tiles, config)
+        self.view = view
+        self.view.resize(*size)
+        self.view.loadFinished.connect(self._on_load_finished)
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval_ms)
+        self._poll_timer.timeout.connect(self._poll_tiles)
+
+        self._jobs = deque()
+        self._current: Optional[SnapshotJob] = None
+        self._next_job_id = 0
+        self._ready = False
+        self._busy_since = None
+
+        self.stats = {
+            "completed": 0,
+            "failed": 0,
+            "tile_timeouts": 0,
+            "busy_seconds": 0.0,
+            "last_snapshot_ms": 0.0,
+        }
+
+        # Warm up: start the renderer process with an empty map
+        self.view.setUrl(QUrl(map_document_url(self.documents.render(None))))
+
+    def _create_view(self, raster_tiles=None, config=None) -> QWebEngineView:
+        """Create the hidden web view and the profile serving its mapview:// routes"""
+        self.profile = QWebEngineProfile(self)
+        self.scheme_handler = install_map_scheme_handler(self.profile, config=config)
+        self.scheme_handler.add_route(MAPS_ROUTE, self.documents.resolve)
+        if raster_tiles is not None:
+            self.scheme_handler.add_route(OVERLAYS_ROUTE, raster_tiles.resolve)
+
+        view = QWebEngineView()
+        view.setPage(QWebEnginePage(self.profile, view))
+        view.setAttribute(Qt.WidgetAttribute.WA_DontShowOnScreen, True)
+        view.show()
+        return view
+
+    def submit(self, output_path: Optional[str] = None, **job_options) -> int:
+        """Queue a snapshot
+
+        Args:
+            output_path: Where to write the PNG (defaults to <snapshot_dir>/snapshot_<id>.png)
+            **job_options: Map state, see SnapshotJob
+
+        Returns:
+            int: Job id
+        """
+        self._next_job_id += 1
+        job_id = self._next_job_id
+        if output_path is None:
+            output_path = os.path.join(self.snapshot_dir, f"snapshot_{job_id}.png")
+        self._jobs.append(SnapshotJob(job_id, output_path, **job_options))
+        if self._busy_since is None:
+            self._busy_since = time.perf_counter()
+        self._start_next()
+        return job_id
+
+    def pending(self) -> int:
+        """Number of jobs queued or running"""
+        return len(self._jobs) + (1 if self._current else 0)
+
+    def snapshots_per_second(self) -> float:
+        """Throughput over the time the service has been busy"""
+        busy = self.stats["busy_seconds"]
+        if self._busy_since is not None:
+            busy += time.perf_counter() - self._busy_since
+        return self.stats["completed"] / busy if busy > 0 else 0.0
+
+    def get_stats(self) -> Dict:
+        """Get snapshot statistics
+
+        Returns:
+            dict: Completed/failed counts, tile timeouts, busy time, the last
+            snapshot's duration, throughput and the number of pending jobs
+        """
+        stats = dict(self.stats)
+        stats["snapshots_per_second"] = self.snapshots_per_second()
+        stats["pending"] = self.pending()
+        return stats
+
+    def shutdown(self):
+        """Drop queued jobs and release the web view"""
+        self._jobs.clear()
+        self._current = None
+        self._poll_timer.stop()
+        self.view.close()
+        self.view.deleteLater()
+
+    def _start_next(self):
+        """Load the next queued job into the view"""
+        if not self._ready or self._current is not None:
+            return
+        if not self._jobs:
+            if self._busy_since is not None:
+                self.stats["busy_seconds"] += time.perf_counter() - self._busy_since
+                self._busy_since = None
+                logger.info(f"Snapshot queue drained: {self.stats['completed']} snapshots, "
+                            f"{self.snapshots_per_second():.2f} snapshots/s")
+                self.queue_drained.emit()
+            return
+
+        job = self._jobs.popleft()
+        self._current = job
+        job.started_at = time.perf_counter()
+        try:
+            key = self.documents.render(job.waypoints, speed_mps=job.speed_mps,
+                                        altitude=job.altitude, overlays=job.overlays)
+        except Exception as e:
+            self._finish_failed(f"Error rendering map: {str(e)}")
+            return
+
+        self.view.resize(*(job.size or self.size))
+        url = QUrl(map_document_url(key))
+        if self.view.url() == url:
+            # Same document as the previous job; no need to load it again
+            self._on_load_finished(True)
+        else:
+            self.view.setUrl(url)
+
+    def _on_load_finished(self, ok: bool):
+        """Frame the map and start waiting for tiles"""
+        if not self._ready:
+            self._ready = True
+            logger.debug("Snapshot view warmed up")
+            self._start_next()
+            return
+
+        job = self._current
+        if job is None:
+            return
+        if not ok:
+            self._finish_failed("Map page failed to load")
+            return
+
+        bounds = job.bounds
+        if bounds is None and job.waypoints:
+            bounds = boundary_bounds([list(point[:2]) for point in job.waypoints])
+        if bounds is not None:
+            south, west, north, east = bounds
+            self.view.page().runJavaScript(FIT_BOUNDS_JS % json.dumps([[south, west], [north, east]]))
+        self._poll_timer.start()
+
+    def _poll_tiles(self):
+        """Check whether the visible tiles have finished loading"""
+        job = self._current
+        if job is None:
+            self._poll_timer.stop()
+            return
+        self.view.page().runJavaScript(PENDING_TILES_JS, lambda pending: self._on_tiles_polled(job, pending))
+
+    def _on_tiles_polled(self, job: SnapshotJob, pending):
+        """Capture once no tile layer is loading, or when the timeout expires"""
+        if job is not self._current or not self._poll_timer.isActive():
+            return
+
+        waited_ms = (time.perf_counter() - job.started_at) * 1000
+        if pending == 0:
+            self._poll_timer.stop()
+            QTimer.singleShot(self.settle_ms, lambda: self._capture(job))
+        elif waited_ms > self.tile_timeout_ms:
+            self._poll_timer.stop()
+            self.stats["tile_timeouts"] += 1
+            logger.warning(f"Snapshot {job.job_id}: tiles still loading after "
+                           f"{self.tile_timeout_ms} ms, capturing anyway")
+            self._capture(job)
+
+    def _capture(self, job: SnapshotJob):
+        """Grab the view into a PNG"""
+        if job is not self._current:
+            return
+        try:
+            directory = os.path.dirname(job.output_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if not self.view.grab().save(job.output_path, "PNG"):
+                raise IOError(f"Could not write {job.output_path}")
+        except Exception as e:
+            self._finish_failed(f"Error capturing snapshot: {str(e)}")
+            return
+
+        elapsed_ms = (time.perf_counter() - job.started_at) * 1000
+        self.stats["completed"] += 1
+        self.stats["last_snapshot_ms"] = elapsed_ms
+        logger.debug(f"Snapshot {job.job_id} captured in {elapsed_ms:.0f} ms")
+        self._current = None
+        self.snapshot_ready.emit(job.job_id, job.output_path)
+        self._start_next()
+
+    def _finish_failed(self, error: str):
+        """Report the current job as failed and move on"""
+        job = self._current
+        self._current = None
+        self._poll_timer.stop()
+        self.stats["failed"] += 1
+        logger.error(f"Snapshot {job.job_id} failed: {error}")
+        self.snapshot_failed.emit(job.job_id, error)
+        self._start_next()
@@ -0,0 +1,297 @@
+# src/mapping/tile_prefetch.py
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from src.mapping.tiles import (
+    TILE_SOURCES, boundary_bounds, expand_bounds, tiles_for_bounds, tile_url
+)
+from src.utils.config import config_value
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TILE_CACHE_DIR = os.path.join("data", "tiles")
+
+
+class TileCache:
+    """Disk cache of base map tiles laid out as <root>/<layer>/<z>/<x>/<y>"""
+
+    def __init__(self, root: Optional[str] = None, config=None):
+        """Initialize the cache
+
+        Args:
+            root: Directory holding the cached tiles (defaults to 'paths.tiles')
+            config: Application Config (defaults to DEFAULT_CONFIG values)
+        """
+        self.root = root or config_value(config, "paths.tiles", DEFAULT_TILE_CACHE_DIR)
+
+    def path_for(self, layer: str, zoom: int, x: int, y: int) -> str:
+        """Get the file path for a tile"""
+        return os.path.join(self.root, layer, str(zoom), str(x), f"{y}.png")
+
+    def contains(self, layer: str, zoom: int, x: int, y: int) -> bool:
+        """Check whether a tile is already cached"""
+        return os.path.exists(self.path_for(layer, zoom, x, y))
+
+    def read(self, layer: str, zoom: int, x: int, y: int) -> Optional[bytes]:
+        """Read a cached tile
+
+        Returns:
+            bytes: Tile image data, or None if not cached
+        """
+        try:
+            with open(self.path_for(layer, zoom, x, y), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def write(self, layer: str, zoom: int, x: int, y: int, data: bytes):
+        """Store a tile
+
+        The tile is written to a temporary file and renamed into place so an
+        interrupted prefetch never leaves a truncated tile behind.
+        """
+        path = self.path_for(layer, zoom, x, y)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.part"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+class TilePrefetcher:
+    """Downloads the base map tiles covering a mission area ahead of time
+
+    Tiles already present in the cache are skipped, so an interrupted or
+    cancelled prefetch can simply be started again to resume it.
+    """
+
+    def __init__(self, cache: Optional[TileCache] = None, max_workers: int = 8,
+                 per_host_limit: int = 2, timeout: float = 10.0, max_tiles: int = 50000,
+                 sources: Optional[Dict[str, Dict[str, str]]] = None, config=None):
+        """Initialize the prefetcher
+
+        Args:
+            cache: Tile cache to fill (defaults to the 'paths.tiles' directory)
+            max_workers: Size of the download thread pool
+            per_host_limit: Maximum concurrent requests against one tile server host
+            timeout: Per-request timeout in seconds
+            max_tiles: Refuse jobs larger than this many tiles
+            sources: Tile sources by layer name (defaults to TILE_SOURCES)
+            config: Application Config used for the default cache
+        """
+        self.cache = cache or TileCache(config=config)
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.max_tiles = max_tiles
+        self.sources = sources or TILE_SOURCES
+
+        self._host_semaphores = {}
+        self._host_lock = threading.Lock()
+        self._local = threading.local()
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def plan(self, boundary: Any, zoom_levels: Iterable[int], layers: Optional[List[str]] = None,
+             buffer_m: float = 200.0) -> List[Tuple[str, int, int, int]]:
+        """Enumerate the tiles needed for a mission area
+
+        Args:
+            boundary: MissionBoundary, or its coordinate list
+            zoom_levels: Zoom levels to cover
+            layers: Base layer names (defaults to every configured layer)
+            buffer_m: Extra margin around the boundary in meters
+
+        Returns:
+            list: (layer, zoom, x, y) tuples
+        """
+        coordinates = boundary.get_coordinates() if hasattr(boundary, "get_coordinates") else boundary
+        bounds = expand_bounds(boundary_bounds(coordinates), buffer_m)
+        layers = layers or list(self.sources.keys())
+
+        for layer in layers:
+            if layer not in self.sources:
+                raise ValueError(f"Unknown tile layer: {layer}")
+
+        tiles = []
+        for zoom in sorted(set(zoom_levels)):
+            zoom_tiles = list(tiles_for_bounds(bounds, zoom))
+            for layer in layers:
+                tiles.extend((layer, z, x, y) for z, x, y in zoom_tiles)
+
+        if len(tiles) > self.max_tiles:
+            raise ValueError(f"Prefetch needs {len(tiles)} tiles, limit is {self.max_tiles}")
+
+        return tiles
+
+    def prefetch(self, boundary: Any, zoom_levels: Iterable[int], layers: Optional[List[str]] = None,
+                 buffer_m: float = 200.0,
+                 progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Download every missing tile for a mission area (blocking)
+
+        Args:
+            boundary: MissionBoundary, or its coordinate list
+            zoom_levels: Zoom levels to cover
+            layers: Base layer names (defaults to every configured layer)
+            buffer_m: Extra margin around the boundary in meters
+            progress_callback: Called with the progress dict after each tile
+
+        Returns:
+            dict: Final progress (total, completed, downloaded, skipped, failed, bytes, cancelled)
+        """
+        self._cancel.clear()
+        return self._prefetch(boundary, zoom_levels, layers, buffer_m, progress_callback)
+
+    def _prefetch(self, boundary: Any, zoom_levels: Iterable[int], layers: Optional[List[str]],
+                  buffer_m: float,
+                  progress_callback: Optional[Callable[[Dict[str, Any]], None]]) -> Dict[str, Any]:
+        """Run a prefetch without resetting the cancel flag, see prefetch()"""
+        tiles = self.plan(boundary, zoom_levels, layers, buffer_m)
+        progress = {
+            "total": len(tiles),
+            "completed": 0,
+            "downloaded": 0,
+            "skipped": 0,
+            "failed": 0,
+            "bytes": 0,
+            "cancelled": False,
+        }
+        progress_lock = threading.Lock()
+
+        def record(outcome: str, size: int = 0):
+            with progress_lock:
+                progress["completed"] += 1
+                progress[outcome] += 1
+                progress["bytes"] += size
+                snapshot = dict(progress)
+            if progress_callback:
+                try:
+                    progress_callback(snapshot)
+                except Exception as e:
+                    logger.error(f"Error in prefetch progress callback: {str(e)}")
+
+        pending = []
+        for tile in tiles:
+            if self.cache.contains(*tile):
+                record("skipped")
+            else:
+                pending.append(tile)
+
+        logger.info(f"Prefetching {len(pending)} of {len(tiles)} tiles "
+                    f"({len(tiles) - len(pending)} already cached)")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._fetch_tile, *tile) for tile in pending]
+            for future in as_completed(futures):
+                size = future.result()
+                if size is None:
+                    if not self._cancel.is_set():
+                        record("failed")
+                else:
+                    record("downloaded", size)
+
+        progress["cancelled"] = self._cancel.is_set()
+        logger.info(f"Tile prefetch finished: {progress['downloaded']} downloaded, "
+                    f"{progress['skipped']} cached, {progress['failed']} failed, "
+                    f"{progress['bytes'] / 1024:.1f} KiB")
+        return progress
+
+    def start(self, boundary: Any, zoom_levels: Iterable[int], layers: Optional[List[str]] = None,
+              buffer_m: float = 200.0,
+              progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+              finished_callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> bool:
+        """Run a prefetch in a background thread
+
+        Returns:
+            bool: True if started, False if a prefetch is already running
+        """
+        if self.is_running():
+            logger.warning("Tile prefetch already running")
+            return False
+
+        # Cleared here rather than in the thread, so a cancel() right after
+        # start() returns is not lost
+        self._cancel.clear()
+
+        def run():
+            try:
+                result = self._prefetch(boundary, zoom_levels, layers, buffer_m, progress_callback)
+            except Exception as e:
+                logger.error(f"Tile prefetch failed: {str(e)}")
+                return
+            if finished_callback:
+                finished_callback(result)
+
+        self._thread = threading.Thread(target=run)
+        self._thread.daemon = True
+        self._thread.start()
+        return True
+
+    def cancel(self):
+        """Stop a running prefetch; it can be resumed later"""
+        self._cancel.set()
+
+    def is_running(self) -> bool:
+        """Check whether a background prefetch is in progress"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None):
+        """Wait for a background prefetch to finish"""
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _host_semaphore(self, host: str) -> threading.Semaphore:
+        """Get the concurrency limiter for a tile server host"""
+        with self._host_lock:
+            if host not in self._host_semaphores:
+                self._host_semaphores[host] = threading.Semaphore(self.per_host_limit)
+            return self._host_semaphores[host]
+
+    def _session(self) -> requests.Session:
+        """Get this worker thread's HTTP session (keeps connections alive)"""
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def fetch_tile(self, layer: str, zoom: int, x: int, y: int) -> Optional[bytes]:
+        """Download one tile into the cache now, outside any prefetch
+
+        Used for tiles the map asks for that were not prefetched. Not
+        affected by cancel().
+
+        Returns:
+            bytes: Tile image data, or None on failure
+        """
+        return self._download(layer, zoom, x, y, cancellable=False)
+
+    def _fetch_tile(self, layer: str, zoom: int, x: int, y: int) -> Optional[int]:
+        """Download one tile into the cache
+
+        Returns:
+            int: Number of bytes stored, or None on failure/cancellation
+        """
+        data = self._download(layer, zoom, x, y, cancellable=True)
+        return len(data) if data is not None else None
+
+    def _download(self, layer: str, zoom: int, x: int, y: int, cancellable: bool) -> Optional[bytes]:
+        if cancellable and self._cancel.is_set():
+            return None
+
+        url = tile_url(self.sources[layer], zoom, x, y)
+        try:
+            with self._host_semaphore(urlparse(url).netloc):
+                if cancellable and self._cancel.is_set():
+                    return None
+                response = self._session().get(url, timeout=self.timeout)
+            response.raise_for_status()
+            self.cache.write(layer, zoom, x, y, response.content)
+            return response.content
+        except Exception as e:
+            logger.warning(f"Failed to fetch tile {layer} {zoom}/{x}/{y}: {str(e)}")
+            return None
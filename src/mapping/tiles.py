@@ -0,0 +1,125 @@
+# src/mapping/tiles.py
+import math
+from typing import Dict, Iterator, List, Tuple
+
+# Base layers shown on the planning map. Shared by the map generator and the
+# tile prefetcher so both always agree on where tiles come from.
+TILE_SOURCES = {
+    "Satellite": {
+        "url": "https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+        "attr": "Esri",
+        "subdomains": "",
+    },
+    "Topographic": {
+        "url": "https://{s}.tile.opentopomap.org/{z}/{x}/{y}.png",
+        "attr": "Map data: © OpenTopoMap contributors",
+        "subdomains": "abc",
+    },
+    "Light": {
+        "url": "https://{s}.basemaps.cartocdn.com/light_all/{z}/{x}/{y}.png",
+        "attr": "© OpenStreetMap contributors © CARTO",
+        "subdomains": "abcd",
+    },
+}
+
+MAX_LATITUDE = 85.0511287798
+METERS_PER_DEGREE_LAT = 111320.0
+
+
+def lat_lon_to_tile(lat: float, lon: float, zoom: int) -> Tuple[int, int]:
+    """Convert a WGS84 coordinate to slippy-map tile indices
+
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+        zoom: Zoom level
+
+    Returns:
+        tuple: (x, y) tile indices
+    """
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    n = 2 ** zoom
+    x = int((lon + 180.0) / 360.0 * n)
+    lat_rad = math.radians(lat)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_bounds(x: int, y: int, zoom: int) -> Tuple[float, float, float, float]:
+    """Get the geographic bounds of a tile
+
+    Args:
+        x: Tile column
+        y: Tile row
+        zoom: Zoom level
+
+    Returns:
+        tuple: (south, west, north, east) in degrees
+    """
+    n = 2 ** zoom
+    west = x / n * 360.0 - 180.0
+    east = (x + 1) / n * 360.0 - 180.0
+    north = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / n))))
+    south = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) / n))))
+    return south, west, north, east
+
+
+def expand_bounds(bounds: Tuple[float, float, float, float],
+                  buffer_m: float) -> Tuple[float, float, float, float]:
+    """Grow a (south, west, north, east) box by a buffer in meters"""
+    south, west, north, east = bounds
+    dlat = buffer_m / METERS_PER_DEGREE_LAT
+    mid_lat = math.radians((south + north) / 2)
+    dlon = buffer_m / (METERS_PER_DEGREE_LAT * max(math.cos(mid_lat), 1e-6))
+    return (max(south - dlat, -MAX_LATITUDE), max(west - dlon, -180.0),
+            min(north + dlat, MAX_LATITUDE), min(east + dlon, 180.0))
+
+
+def boundary_bounds(coordinates: List) -> Tuple[float, float, float, float]:
+    """Get the bounding box of stored boundary coordinates
+
+    Accepts the formats produced by the map drawing tools: a list of
+    [lat, lon] points, or a single [lat, lon, radius_m] entry for circles.
+
+    Args:
+        coordinates: Boundary coordinates (e.g. MissionBoundary.get_coordinates())
+
+    Returns:
+        tuple: (south, west, north, east) in degrees
+    """
+    if not coordinates:
+        raise ValueError("Boundary has no coordinates")
+
+    if len(coordinates) == 1 and len(coordinates[0]) == 3:
+        lat, lon, radius = coordinates[0]
+        return expand_bounds((lat, lon, lat, lon), radius)
+
+    lats = [float(point[0]) for point in coordinates]
+    lons = [float(point[1]) for point in coordinates]
+    return min(lats), min(lons), max(lats), max(lons)
+
+
+def tiles_for_bounds(bounds: Tuple[float, float, float, float],
+                     zoom: int) -> Iterator[Tuple[int, int, int]]:
+    """Enumerate the tiles covering a bounding box at one zoom level
+
+    Args:
+        bounds: (south, west, north, east) in degrees
+        zoom: Zoom level
+
+    Yields:
+        tuple: (zoom, x, y)
+    """
+    south, west, north, east = bounds
+    min_x, min_y = lat_lon_to_tile(north, west, zoom)
+    max_x, max_y = lat_lon_to_tile(south, east, zoom)
+    for x in range(min_x, max_x + 1):
+        for y in range(min_y, max_y + 1):
+            yield zoom, x, y
+
+
+def tile_url(source: Dict[str, str], zoom: int, x: int, y: int) -> str:
+    """Build the download URL for a tile, spreading requests over subdomains"""
+    subdomains = source.get("subdomains") or ""
+    subdomain = subdomains[(x + y) % len(subdomains)] if subdomains else ""
+    return source["url"].format(s=subdomain, z=zoom, x=x, y=y)
@@ -0,0 +1,111 @@
+# src/mapping/track_buffer.py
+import math
+import threading
+from collections import deque
+from typing import List, Optional, Tuple
+
+# (sequence, latitude, longitude, relative altitude, timestamp)
+TrackPoint = Tuple[int, float, float, float, float]
+
+
+class TrackBuffer:
+    """Bounded, thread-safe store of a vehicle's flown track
+
+    Recent points are kept at full resolution in a ring buffer. Points that
+    fall out of the ring move to a decimated history: only every n-th point is
+    kept, and whenever the history fills up every other point is dropped and
+    n doubles. Memory therefore stays bounded however long the flight is,
+    while the whole track remains drawable.
+    """
+
+    def __init__(self, recent_capacity: int = 2000, history_capacity: int = 2000,
+                 min_distance_m: float = 0.5):
+        """Initialize the buffer
+
+        Args:
+            recent_capacity: Full-resolution points to keep
+            history_capacity: Decimated points to keep for older parts of the track
+            min_distance_m: Ignore fixes closer than this to the previous point
+        """
+        self.recent_capacity = recent_capacity
+        self.history_capacity = history_capacity
+        self.min_distance_m = min_distance_m
+
+        self._recent = deque()
+        self._history = []
+        self._history_stride = 1
+        self._evicted = 0
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def append(self, lat: float, lon: float, alt: float, timestamp: float) -> bool:
+        """Add a position fix (safe to call from the telemetry thread)
+
+        Returns:
+            bool: True if the point was stored, False if it was filtered out
+        """
+        with self._lock:
+            if self._recent:
+                _, last_lat, last_lon, _, _ = self._recent[-1]
+                if _distance_m(last_lat, last_lon, lat, lon) < self.min_distance_m:
+                    return False
+
+            self._sequence += 1
+            self._recent.append((self._sequence, lat, lon, alt, timestamp))
+            if len(self._recent) > self.recent_capacity:
+                self._evict(self._recent.popleft())
+            return True
+
+    def _evict(self, point: TrackPoint):
+        """Move a point from the ring buffer into the decimated history"""
+        if self._evicted % self._history_stride == 0:
+            self._history.append(point)
+            if len(self._history) > self.history_capacity:
+                self._history = self._history[::2]
+                self._history_stride *= 2
+        self._evicted += 1
+
+    def points_since(self, sequence: int) -> Optional[List[TrackPoint]]:
+        """Get the full-resolution points newer than a sequence number
+
+        Returns:
+            list: Points after sequence, oldest first, or None if some of
+            them have already left the ring buffer; the reader then has to
+            resynchronize from snapshot()
+        """
+        with self._lock:
+            if not self._recent or self._recent[-1][0] <= sequence:
+                return []
+            first = self._recent[0][0]
+            if first > sequence + 1:
+                return None
+            return list(self._recent)[sequence - first + 1:]
+
+    def snapshot(self) -> List[TrackPoint]:
+        """Get the whole track: decimated history followed by recent points"""
+        with self._lock:
+            return self._history + list(self._recent)
+
+    def latest(self) -> Optional[TrackPoint]:
+        """Get the most recent point, if any"""
+        with self._lock:
+            return self._recent[-1] if self._recent else None
+
+    def clear(self):
+        """Forget the track"""
+        with self._lock:
+            self._recent.clear()
+            self._history = []
+            self._history_stride = 1
+            self._evicted = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._history) + len(self._recent)
+
+
+def _distance_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Equirectangular distance, accurate enough for consecutive fixes"""
+    x = math.radians(lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2))
+    y = math.radians(lat2 - lat1)
+    return math.hypot(x, y) * 6371000.0
@@ -0,0 +1,29 @@
+# src/mapping/url_scheme.py
+from urllib.parse import quote
+
+# Custom URL scheme through which the map page loads everything it needs from
+# inside the application. Hosts act as routes: mapview://<route>/<path>
+SCHEME_NAME = "mapview"
+
+ASSETS_ROUTE = "assets"
+BASEMAP_ROUTE = "basemap"
+MAPS_ROUTE = "maps"
+OVERLAYS_ROUTE = "overlays"
+
+
+def scheme_url(route: str, path: str) -> str:
+    """Build a mapview:// URL for a route and path"""
+    return f"{SCHEME_NAME}://{route}/{path.lstrip('/')}"
+
+
+def basemap_url(layer: str) -> str:
+    """Get the Leaflet tile URL template serving a base layer via the tile cache"""
+    return scheme_url(BASEMAP_ROUTE, f"{quote(layer)}/{{z}}/{{x}}/{{y}}.png")
+
+
+def overlay_url(layer: str, version: int = 0) -> str:
+    """Get the Leaflet tile URL template of a generated raster overlay
+
+    The version query makes the page fetch fresh tiles after the layer changes.
+    """
+    return scheme_url(OVERLAYS_ROUTE, f"{quote(layer)}/{{z}}/{{x}}/{{y}}.png?v={version}")
@@ -0,0 +1,170 @@
+# src/planning/plan_scheduler.py
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+
+logger = logging.getLogger(__name__)
+
+# A plan function receives the request payload and an is_cancelled() check it
+# should consult between expensive stages. It runs on a worker thread.
+PlanFunction = Callable[[Dict[str, Any], Callable[[], bool]], Any]
+
+
+class _PlanJob(QRunnable):
+    """Runs one plan request on the thread pool"""
+
+    def __init__(self, scheduler: "PlanScheduler", generation: int, payload: Dict[str, Any]):
+        super().__init__()
+        self.scheduler = scheduler
+        self.generation = generation
+        self.payload = payload
+
+    def run(self):
+        """Plan, unless a newer request has superseded this one"""
+        is_cancelled = lambda: self.scheduler.is_stale(self.generation)
+        if is_cancelled():
+            self.scheduler._job_finished.emit(self.generation, None, None, 0.0)
+            return
+
+        start_time = time.perf_counter()
+        try:
+            result = self.scheduler.plan_function(self.payload, is_cancelled)
+            error = None
+        except Exception as e:
+            logger.error(f"Plan request {self.generation} failed: {str(e)}")
+            result, error = None, str(e)
+        elapsed = time.perf_counter() - start_time
+        self.scheduler._job_finished.emit(self.generation, result, error, elapsed)
+
+
+class PlanScheduler(QObject):
+    """Coalesces bursts of plan requests and runs them off the GUI thread
+
+    Every request gets a new generation number. Requests arriving within the
+    debounce interval replace each other, so a burst of spinbox changes
+    results in one planning run. Results from runs that were superseded while
+    in flight are discarded, and the running plan function can stop early by
+    checking is_cancelled().
+    """
+
+    # Emitted on the scheduler's thread with (generation, result)
+    plan_ready = pyqtSignal(int, object)
+    plan_failed = pyqtSignal(int, str)
+
+    # Internal: worker -> scheduler thread hand-off
+    _job_finished = pyqtSignal(int, object, object, float)
+
+    def __init__(self, plan_function: PlanFunction, debounce_ms: int = 150,
+                 max_wait_ms: int = 500, max_workers: int = 2, parent: Optional[QObject] = None):
+        """Initialize the scheduler
+
+        Args:
+            plan_function: Called on a worker thread with (payload, is_cancelled)
+            debounce_ms: Quiet period that ends a burst of requests
+            max_wait_ms: Longest a request waits while a burst keeps going
+            max_workers: Size of the planning thread pool
+            parent: Optional Qt parent
+        """
+        super().__init__(parent)
+        self.plan_function = plan_function
+        self.debounce_ms = debounce_ms
+        self.max_wait_ms = max_wait_ms
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_workers)
+
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self._pending_payload = None
+        self._burst_started_at = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._dispatch)
+        self._job_finished.connect(self._on_job_finished)
+
+        self.stats = {
+            "requested": 0,
+            "dispatched": 0,
+            "completed": 0,
+            "discarded": 0,
+            "failed": 0,
+            "last_plan_ms": 0.0,
+        }
+
+    @property
+    def generation(self) -> int:
+        """Generation number of the most recent request"""
+        return self._generation
+
+    def is_stale(self, generation: int) -> bool:
+        """Check whether a newer request has replaced a generation (thread-safe)"""
+        with self._generation_lock:
+            return generation != self._generation
+
+    def request(self, payload: Dict[str, Any]) -> int:
+        """Queue a plan request, replacing any request not yet dispatched
+
+        Args:
+            payload: Snapshot of everything the plan function needs. It is
+                handed to a worker thread, so it must not contain widgets.
+
+        Returns:
+            int: Generation number assigned to the request
+        """
+        with self._generation_lock:
+            self._generation += 1
+            generation = self._generation
+        self._pending_payload = payload
+        self.stats["requested"] += 1
+
+        now = time.perf_counter()
+        if self._burst_started_at is None:
+            self._burst_started_at = now
+        waited_ms = (now - self._burst_started_at) * 1000
+        self._timer.start(int(max(0, min(self.debounce_ms, self.max_wait_ms - waited_ms))))
+        return generation
+
+    def cancel(self):
+        """Drop the pending request and discard results of running ones"""
+        with self._generation_lock:
+            self._generation += 1
+        self._timer.stop()
+        self._pending_payload = None
+        self._burst_started_at = None
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """Block until the thread pool is idle (for shutdown and tests)"""
+        return self.thread_pool.waitForDone(timeout_ms)
+
+    @pyqtSlot()
+    def _dispatch(self):
+        """Start the pending request on the thread pool"""
+        payload = self._pending_payload
+        self._pending_payload = None
+        self._burst_started_at = None
+        if payload is None:
+            return
+
+        self.stats["dispatched"] += 1
+        self.thread_pool.start(_PlanJob(self, self._generation, payload))
+
+    @pyqtSlot(int, object, object, float)
+    def _on_job_finished(self, generation: int, result: Any, error: Optional[str], elapsed: float):
+        """Deliver a finished job, unless it was superseded"""
+        if self.is_stale(generation):
+            self.stats["discarded"] += 1
+            logger.debug(f"Discarded stale plan result {generation} (current {self._generation})")
+            return
+
+        self.stats["last_plan_ms"] = elapsed * 1000
+        if error is not None:
+            self.stats["failed"] += 1
+            self.plan_failed.emit(generation, error)
+            return
+
+        self.stats["completed"] += 1
+        self.plan_ready.emit(generation, result)
@@ -73,6 +73,13 @@ class MissionRepository(BaseRepository):
         
         return boundary
     
+    def get_boundaries(self, user_id=None):
+        """Get mission boundaries, optionally only those of a user's missions"""
+        query = self.session.query(MissionBoundary).join(Mission)
+        if user_id is not None:
+            query = query.filter(Mission.user_id == user_id)
+        return query.all()
+    
     def add_chat_message(self, mission_id, message, sender_type="user", user_id=None):
         """Add a chat message to a mission"""
         chat_message = ChatMessage(
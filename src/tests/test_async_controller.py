@@ -0,0 +1,317 @@
+# src/tests/test_async_controller.py
+import unittest
+from unittest.mock import patch
+import asyncio
+import heapq
+import threading
+import time
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from dronekit import VehicleMode, LocationGlobalRelative
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+# Import the modules to test
+from src.drone.async_controller import AsyncDroneController
+from src.drone.attribute_watch import AttributeWatch
+from src.drone.drone_command import DroneCommand
+
+
+class FakeAutopilot:
+    """One thread delivering delayed vehicle updates, like DroneKit's receive thread"""
+
+    def __init__(self):
+        self._queue = []
+        self._condition = threading.Condition()
+        self._counter = 0
+        self._stopped = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def later(self, delay, fn):
+        with self._condition:
+            self._counter += 1
+            heapq.heappush(self._queue, (time.monotonic() + delay, self._counter, fn))
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and (not self._queue or self._queue[0][0] > time.monotonic()):
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._condition.wait(timeout)
+                if self._stopped:
+                    return
+                _, _, fn = heapq.heappop(self._queue)
+            fn()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+
+class FakeVehicle:
+    """Vehicle that reacts to commands a few milliseconds later"""
+
+    def __init__(self, autopilot, responsive=True, delay=0.01, reject=(), climbs=True):
+        self.autopilot = autopilot
+        self.responsive = responsive
+        self.delay = delay
+        # Attributes whose change is refused with a COMMAND_ACK
+        self.reject = set(reject)
+        self.climbs = climbs
+        self.listeners = {}
+        self.message_listeners = {}
+        self._armed = False
+        self._mode = VehicleMode("STABILIZE")
+        self.is_armable = True
+        self.location = SimpleNamespace(global_relative_frame=LocationGlobalRelative(0, 0, 0.0))
+
+    def add_attribute_listener(self, name, fn):
+        self.listeners.setdefault(name, []).append(fn)
+
+    def remove_attribute_listener(self, name, fn):
+        self.listeners[name].remove(fn)
+
+    def add_message_listener(self, name, fn):
+        self.message_listeners.setdefault(name, []).append(fn)
+
+    def remove_message_listener(self, name, fn):
+        self.message_listeners[name].remove(fn)
+
+    def listener_count(self):
+        return sum(len(fns) for fns in self.listeners.values())
+
+    def _notify(self, name, value):
+        for fn in list(self.listeners.get(name, ())):
+            fn(self, name, value)
+
+    def _respond(self, name, apply):
+        if not self.responsive:
+            return
+        if name in self.reject:
+            command = {"armed": mavlink.MAV_CMD_COMPONENT_ARM_DISARM, "mode": mavlink.MAV_CMD_DO_SET_MODE}[name]
+            ack = mavlink.MAVLink_command_ack_message(command, mavlink.MAV_RESULT_DENIED, 0, 0, 0, 0)
+
+            def deny():
+                for fn in list(self.message_listeners.get("COMMAND_ACK", ())):
+                    fn(self, "COMMAND_ACK", ack)
+            self.autopilot.later(self.delay, deny)
+            return
+
+        def update():
+            apply()
+            self._notify(name, getattr(self, name))
+        self.autopilot.later(self.delay, update)
+
+    @property
+    def armed(self):
+        return self._armed
+
+    @armed.setter
+    def armed(self, value):
+        self._respond("armed", lambda: setattr(self, "_armed", value))
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @mode.setter
+    def mode(self, value):
+        self._respond("mode", lambda: setattr(self, "_mode", value))
+
+    def simple_takeoff(self, altitude):
+        if not self.climbs:
+            return
+        # Climb in five steps
+        for step in range(1, 6):
+            def climb(alt=altitude * step / 5):
+                self.location.global_relative_frame = LocationGlobalRelative(0, 0, alt)
+                self._notify("location", self.location)
+            self.autopilot.later(self.delay * step, climb)
+
+
+def make_controller(vehicle):
+    controller = SimpleNamespace(connection=SimpleNamespace(vehicle=vehicle), command=DroneCommand(vehicle))
+    return AsyncDroneController(controller)
+
+
+class TestAsyncDroneController(unittest.TestCase):
+    """Tests for the asyncio drone controller facade"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.autopilot = FakeAutopilot()
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.autopilot.stop()
+
+    def test_arm_confirms_from_listener(self):
+        """Test arming completes as soon as the vehicle reports it"""
+        vehicle = FakeVehicle(self.autopilot)
+        drone = make_controller(vehicle)
+
+        started = time.monotonic()
+        self.assertTrue(asyncio.run(drone.arm(timeout=2)))
+        elapsed = time.monotonic() - started
+
+        self.assertTrue(vehicle.armed)
+        self.assertEqual(vehicle.mode.name, "GUIDED")
+        # Two round trips of 10 ms, not a one-second poll
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(vehicle.listener_count(), 0)
+
+    def test_timeout(self):
+        """Test an unanswered mode change times out and returns False"""
+        vehicle = FakeVehicle(self.autopilot, responsive=False)
+        drone = make_controller(vehicle)
+
+        self.assertFalse(asyncio.run(drone.set_mode("RTL", timeout=0.1)))
+        self.assertEqual(vehicle.listener_count(), 0)
+
+    def test_cancellation_removes_listeners(self):
+        """Test cancelling an operation stops waiting and cleans up"""
+        vehicle = FakeVehicle(self.autopilot, responsive=False)
+        drone = make_controller(vehicle)
+
+        async def run():
+            task = asyncio.ensure_future(drone.set_mode("LAND", timeout=30))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        self.assertEqual(vehicle.listener_count(), 0)
+
+    def test_many_vehicles_on_one_loop(self):
+        """Test hundreds of takeoff flows run concurrently without extra threads"""
+        vehicles = [FakeVehicle(self.autopilot) for _ in range(200)]
+        drones = [make_controller(vehicle) for vehicle in vehicles]
+        threads_before = threading.active_count()
+        peak_threads = []
+
+        async def run():
+            async def sample_threads():
+                while True:
+                    peak_threads.append(threading.active_count())
+                    await asyncio.sleep(0.01)
+
+            sampler = asyncio.ensure_future(sample_threads())
+            results = await asyncio.gather(*(drone.takeoff(10.0, timeout=5) for drone in drones))
+            sampler.cancel()
+            return results
+
+        started = time.monotonic()
+        results = asyncio.run(run())
+
+        self.assertTrue(all(results))
+        self.assertLess(time.monotonic() - started, 3.0)
+        self.assertLessEqual(max(peak_threads), threads_before)
+        self.assertTrue(all(vehicle.location.global_relative_frame.alt >= 9.5 for vehicle in vehicles))
+
+    def test_watch_blocking_wait(self):
+        """Test a watch can also be waited on from a plain thread"""
+        vehicle = FakeVehicle(self.autopilot)
+        with AttributeWatch(vehicle, ("armed",), lambda v: v.armed) as watch:
+            self.assertFalse(watch.is_set)
+            vehicle.armed = True
+            self.assertTrue(watch.wait(1.0))
+        self.assertEqual(vehicle.listener_count(), 0)
+
+    def test_rejection_ends_wait(self):
+        """Test a COMMAND_ACK rejection fails the command without waiting for the timeout"""
+        vehicle = FakeVehicle(self.autopilot, reject=["armed"])
+        vehicle._mode = VehicleMode("GUIDED")
+        drone = make_controller(vehicle)
+
+        started = time.monotonic()
+        self.assertFalse(asyncio.run(drone.arm(timeout=5)))
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertFalse(vehicle.armed)
+        self.assertEqual(vehicle.listener_count(), 0)
+
+    def test_land_interrupts_takeoff(self):
+        """Test land() ends a takeoff in progress, then lands and allows new commands"""
+        vehicle = FakeVehicle(self.autopilot, climbs=False)
+        drone = make_controller(vehicle)
+
+        async def run():
+            takeoff = asyncio.ensure_future(drone.takeoff(10.0, timeout=30))
+            await asyncio.sleep(0.1)
+            started = time.monotonic()
+            landed = await drone.land(timeout=2)
+            return await takeoff, landed, time.monotonic() - started
+
+        took_off, landed, elapsed = asyncio.run(run())
+
+        self.assertFalse(took_off)
+        self.assertTrue(landed)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(vehicle.mode.name, "LAND")
+        self.assertFalse(drone.command.interrupted)
+        self.assertEqual(vehicle.listener_count(), 0)
+
+    def test_interrupt_ends_async_wait(self):
+        """Test DroneCommand.interrupt() from another thread ends an awaited command"""
+        vehicle = FakeVehicle(self.autopilot, responsive=False)
+        drone = make_controller(vehicle)
+        threading.Timer(0.05, drone.command.interrupt).start()
+
+        started = time.monotonic()
+        self.assertFalse(asyncio.run(drone.set_mode("RTL", timeout=10)))
+        self.assertLess(time.monotonic() - started, 0.5)
+
+    def test_late_blocking_result_is_reconciled(self):
+        """Test a blocking call that finishes after its timeout reaches on_late_result"""
+        drone = make_controller(FakeVehicle(self.autopilot))
+        late = threading.Event()
+        results = []
+
+        def slow_connect():
+            time.sleep(0.2)
+            return True
+
+        def on_late_result(result):
+            results.append(result)
+            late.set()
+
+        async def run():
+            return await drone._run_blocking(slow_connect, timeout=0.05, default=False,
+                                             on_late_result=on_late_result)
+
+        self.assertFalse(asyncio.run(run()))
+        self.assertTrue(late.wait(2))
+        self.assertEqual(results, [True])
+
+    def test_late_connect_is_closed(self):
+        """Test a connection that comes up after connect() timed out is closed again"""
+        disconnected = threading.Event()
+
+        def connect(*args):
+            time.sleep(0.2)
+            return True
+
+        controller = SimpleNamespace(connection=SimpleNamespace(vehicle=None), connect=connect,
+                                     disconnect=disconnected.set)
+        drone = AsyncDroneController(controller)
+
+        async def run():
+            # connect() waits 5 s beyond the connection timeout
+            with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError):
+                return await drone.connect("tcp:127.0.0.1:5760", timeout=0)
+
+        self.assertFalse(asyncio.run(run()))
+        self.assertTrue(disconnected.wait(2))
@@ -0,0 +1,177 @@
+# src/tests/test_command_executor.py
+import unittest
+import threading
+import time
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from dronekit import VehicleMode, LocationGlobalRelative
+from PyQt6.QtCore import QCoreApplication
+
+# Import the modules to test
+from src.drone.command_executor import (
+    CommandExecutor, PRIORITY_EMERGENCY, SUCCEEDED, FAILED, CANCELLED, PREEMPTED,
+)
+from src.drone.drone_command import DroneCommand
+from src.views.command_signals import CommandExecutorSignals
+
+app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+
+class ClimbingVehicle:
+    """Armed GUIDED vehicle that never climbs and changes mode on request"""
+
+    def __init__(self):
+        self.listeners = {}
+        self.armed = True
+        self.is_armable = True
+        self._mode = VehicleMode("GUIDED")
+        self.location = SimpleNamespace(global_relative_frame=LocationGlobalRelative(0, 0, 0.0))
+        self.takeoffs = []
+
+    def add_attribute_listener(self, name, fn):
+        self.listeners.setdefault(name, []).append(fn)
+
+    def remove_attribute_listener(self, name, fn):
+        self.listeners[name].remove(fn)
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @mode.setter
+    def mode(self, value):
+        def apply():
+            self._mode = value
+            for fn in list(self.listeners.get("mode", ())):
+                fn(self, "mode", value)
+        threading.Timer(0.01, apply).start()
+
+    def simple_takeoff(self, altitude):
+        # Never reaches the target; the takeoff wait runs until interrupted
+        self.takeoffs.append(altitude)
+
+
+class TestCommandExecutor(unittest.TestCase):
+    """Tests for the prioritized command executor"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.executor = CommandExecutor()
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.executor.stop()
+
+    def test_runs_off_caller_thread(self):
+        """Test submit returns at once and the command reports its result and latency"""
+        release = threading.Event()
+        threads = []
+
+        def command():
+            threads.append(threading.current_thread())
+            return release.wait(5)
+
+        start = time.monotonic()
+        ticket = self.executor.submit("Slow", command)
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.assertFalse(ticket.done)
+
+        release.set()
+        self.assertTrue(ticket.wait(5))
+        self.assertEqual(ticket.state, SUCCEEDED)
+        self.assertIsNot(threads[0], threading.current_thread())
+
+        latency = self.executor.get_stats()["latency"]["Slow"]
+        self.assertEqual(latency["count"], 1)
+        self.assertGreaterEqual(latency["max_run_ms"], 0)
+
+    def test_priority_order_and_failures(self):
+        """Test emergency commands jump the queue and failures are reported"""
+        gate = threading.Event()
+        order = []
+
+        self.executor.submit("Blocker", gate.wait, 5)
+        first = self.executor.submit("First", lambda: order.append("first") or True)
+        failing = self.executor.submit("Failing", lambda: False)
+        raising = self.executor.submit("Raising", lambda: 1 / 0)
+        urgent = self.executor.submit("Urgent", lambda: order.append("urgent") or True,
+                                      priority=PRIORITY_EMERGENCY)
+        gate.set()
+
+        for ticket in (first, failing, raising, urgent):
+            self.assertTrue(ticket.wait(5))
+        self.assertEqual(order, ["urgent", "first"])
+        self.assertEqual(failing.state, FAILED)
+        self.assertEqual(raising.state, FAILED)
+        self.assertIn("division", raising.error)
+
+    def test_cancel_queued(self):
+        """Test queued commands can be cancelled"""
+        gate = threading.Event()
+        blocker = self.executor.submit("Blocker", gate.wait, 5)
+        queued = self.executor.submit("Queued", lambda: True)
+        later = self.executor.submit("Later", lambda: True)
+
+        self.assertTrue(self.executor.cancel(queued))
+        self.assertEqual(queued.state, CANCELLED)
+        self.assertFalse(self.executor.cancel(queued))
+        self.assertGreaterEqual(self.executor.cancel_all(), 1)
+        self.assertEqual(later.state, CANCELLED)
+        gate.set()
+        self.assertFalse(self.executor.cancel(blocker))
+
+    def test_rtl_preempts_takeoff(self):
+        """Test RTL interrupts a running takeoff and cancels queued GUIDED commands"""
+        vehicle = ClimbingVehicle()
+        command = DroneCommand(vehicle)
+        executor = CommandExecutor(interrupt=command.interrupt, resume=command.clear_interrupt)
+        try:
+            takeoff = executor.submit("Takeoff", command.takeoff, 20.0, timeout=60)
+            goto = executor.submit("Goto", command.goto_position, 1.0, 2.0, 20.0)
+            deadline = time.monotonic() + 2
+            while not vehicle.takeoffs and time.monotonic() < deadline:
+                time.sleep(0.005)
+
+            start = time.monotonic()
+            rtl = executor.submit("Return to launch", command.set_mode, "RTL",
+                                  priority=PRIORITY_EMERGENCY, preemptible=False, preempts=True)
+            self.assertTrue(rtl.wait(5))
+            elapsed = time.monotonic() - start
+
+            self.assertEqual(takeoff.state, PREEMPTED)
+            self.assertEqual(goto.state, PREEMPTED)
+            self.assertEqual(rtl.state, SUCCEEDED)
+            self.assertEqual(vehicle.mode.name, "RTL")
+            # The takeoff wait ends at once instead of running out its 60 s timeout
+            self.assertLess(elapsed, 0.5)
+            self.assertFalse(command.interrupted)
+            self.assertEqual(executor.get_stats()["preempted"], 2)
+        finally:
+            executor.stop()
+
+    def test_qt_signals(self):
+        """Test progress reaches Qt slots through queued signals"""
+        signals = CommandExecutorSignals(self.executor)
+        states = []
+        finished = []
+        signals.command_progress.connect(lambda ticket, state: states.append(state))
+        signals.command_finished.connect(finished.append)
+
+        ticket = self.executor.submit("Quick", lambda: True)
+        deadline = time.monotonic() + 2
+        while not finished and time.monotonic() < deadline:
+            app.processEvents()
+
+        self.assertEqual(finished, [ticket])
+        self.assertEqual(states, ["queued", "running", "succeeded"])
+        signals.detach()
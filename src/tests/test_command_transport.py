@@ -0,0 +1,192 @@
+# src/tests/test_command_transport.py
+import unittest
+import threading
+import time
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from dronekit import VehicleMode, LocationGlobalRelative
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+# Import the modules to test
+from src.drone.command_transport import CommandTransport
+from src.drone.drone_command import DroneCommand
+
+
+class AckingVehicle:
+    """Vehicle that answers commands with COMMAND_ACK after a delay
+
+    Args:
+        replies: List of (result, progress) per ACK to send for each command;
+            None in place of a reply drops that send
+    """
+
+    def __init__(self, replies=None, delay=0.01):
+        self.message_factory = mavlink.MAVLink(None)
+        self.replies = list(replies or [(mavlink.MAV_RESULT_ACCEPTED, 0)])
+        self.delay = delay
+        self.sent = []
+        self.message_listeners = {}
+        self.attribute_listeners = {}
+        self._armed = False
+        self.mode = VehicleMode("GUIDED")
+        self.is_armable = True
+        self.location = SimpleNamespace(global_relative_frame=LocationGlobalRelative(0, 0, 0.0))
+
+    def add_message_listener(self, name, fn):
+        self.message_listeners.setdefault(name, []).append(fn)
+
+    def remove_message_listener(self, name, fn):
+        self.message_listeners[name].remove(fn)
+
+    def add_attribute_listener(self, name, fn):
+        self.attribute_listeners.setdefault(name, []).append(fn)
+
+    def remove_attribute_listener(self, name, fn):
+        self.attribute_listeners[name].remove(fn)
+
+    def ack(self, command, result, progress=0):
+        message = mavlink.MAVLink_command_ack_message(command, result, progress)
+        for fn in list(self.message_listeners.get("COMMAND_ACK", ())):
+            fn(self, "COMMAND_ACK", message)
+
+    def send_mavlink(self, message):
+        self.sent.append(message)
+        reply = self.replies.pop(0) if self.replies else None
+        if reply is None:
+            return
+        for step, (result, progress) in enumerate(reply if isinstance(reply, list) else [reply]):
+            timer = threading.Timer(self.delay * (step + 1), self.ack, (message.command, result, progress))
+            timer.daemon = True
+            timer.start()
+
+    @property
+    def armed(self):
+        return self._armed
+
+    @armed.setter
+    def armed(self, value):
+        # Like arducopter_arm(): a COMMAND_LONG the autopilot ACKs
+        self.send_mavlink(self.message_factory.command_long_encode(
+            0, 0, mavlink.MAV_CMD_COMPONENT_ARM_DISARM, 0, 1 if value else 0, 0, 0, 0, 0, 0, 0))
+
+
+class TestCommandTransport(unittest.TestCase):
+    """Tests for COMMAND_ACK correlation and retries"""
+
+    def make_transport(self, vehicle, **options):
+        options.setdefault("ack_timeout", 0.1)
+        return CommandTransport(vehicle, **options)
+
+    def test_accepted(self):
+        """Test an acknowledged command reports its result and round trip"""
+        vehicle = AckingVehicle(delay=0.02)
+        transport = self.make_transport(vehicle)
+
+        result = transport.send_command_long(mavlink.MAV_CMD_DO_SET_SERVO, (9, 1500))
+
+        self.assertTrue(result.accepted)
+        self.assertEqual(result.attempts, 1)
+        self.assertGreaterEqual(result.rtt, 0.015)
+        self.assertLess(result.rtt, 0.1)
+        self.assertEqual(vehicle.sent[0].param1, 9)
+        self.assertEqual(vehicle.sent[0].param2, 1500)
+        self.assertEqual(result.as_dict()["command"], "MAV_CMD_DO_SET_SERVO")
+
+        stats = transport.get_stats()
+        self.assertEqual(stats["accepted"], 1)
+        self.assertEqual(stats["pending"], 0)
+        self.assertIsNotNone(stats["mean_rtt_ms"])
+
+    def test_rejection_is_immediate(self):
+        """Test a refused command returns as soon as the ACK arrives"""
+        vehicle = AckingVehicle(replies=[(mavlink.MAV_RESULT_DENIED, 0)])
+        transport = self.make_transport(vehicle, ack_timeout=5.0)
+
+        start = time.monotonic()
+        result = transport.send_command_long(mavlink.MAV_CMD_DO_SET_SERVO, (9, 1500))
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertFalse(result.accepted)
+        self.assertEqual(result.result_name, "MAV_RESULT_DENIED")
+        self.assertEqual(transport.get_stats()["results"], {"MAV_RESULT_DENIED": 1})
+
+    def test_retries_lost_sends(self):
+        """Test lost sends are retried with the confirmation field incremented"""
+        vehicle = AckingVehicle(replies=[None, None, (mavlink.MAV_RESULT_ACCEPTED, 0)])
+        transport = self.make_transport(vehicle, ack_timeout=0.05, backoff=2.0)
+
+        result = transport.send_command_long(mavlink.MAV_CMD_DO_SET_SERVO, (9, 1500))
+
+        self.assertTrue(result.accepted)
+        self.assertEqual(result.attempts, 3)
+        self.assertEqual([m.confirmation for m in vehicle.sent], [0, 1, 2])
+        # Round trip is measured from the send that was answered
+        self.assertLess(result.rtt, 0.05)
+        self.assertEqual(transport.get_stats()["resent"], 2)
+
+    def test_no_ack(self):
+        """Test a command with no ACK times out after its retries"""
+        vehicle = AckingVehicle(replies=[None, None, None])
+        transport = self.make_transport(vehicle, ack_timeout=0.05, retries=2, backoff=2.0)
+
+        start = time.monotonic()
+        result = transport.send_command_long(mavlink.MAV_CMD_DO_SET_SERVO, (9, 1500))
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(result.timed_out)
+        self.assertEqual(result.attempts, 3)
+        # 0.05 + 0.1 + 0.2 seconds of ACK timeouts
+        self.assertGreaterEqual(elapsed, 0.34)
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(transport.get_stats()["timeouts"], 1)
+
+    def test_in_progress(self):
+        """Test an in-progress ACK is followed through to the final result"""
+        vehicle = AckingVehicle(replies=[[(mavlink.MAV_RESULT_IN_PROGRESS, 50),
+                                          (mavlink.MAV_RESULT_ACCEPTED, 100)]], delay=0.08)
+        transport = self.make_transport(vehicle, ack_timeout=0.1)
+
+        result = transport.send_command_long(mavlink.MAV_CMD_PREFLIGHT_CALIBRATION, (1,))
+
+        self.assertTrue(result.accepted)
+        self.assertEqual(result.progress, 100)
+        # The in-progress reply stopped the resends
+        self.assertEqual(result.attempts, 1)
+
+    def test_command_int(self):
+        """Test COMMAND_INT carries the scaled position"""
+        vehicle = AckingVehicle()
+        command = DroneCommand(vehicle)
+        command.transport.ack_timeout = 0.1
+
+        result = command.send_command_int(mavlink.MAV_CMD_DO_REPOSITION,
+                                          mavlink.MAV_FRAME_GLOBAL_RELATIVE_ALT_INT,
+                                          40.1234567, -105.5, 30.0, -1)
+
+        self.assertTrue(result.accepted)
+        sent = vehicle.sent[0]
+        self.assertEqual(sent.x, 401234567)
+        self.assertEqual(sent.y, -1055000000)
+        self.assertEqual(sent.z, 30.0)
+        self.assertEqual(sent.param1, -1)
+
+    def test_arm_rejection_surfaces_quickly(self):
+        """Test DroneCommand.arm fails on a refusal instead of waiting out its timeout"""
+        vehicle = AckingVehicle(replies=[(mavlink.MAV_RESULT_FAILED, 0)])
+        command = DroneCommand(vehicle)
+
+        start = time.monotonic()
+        self.assertFalse(command.arm(timeout=30))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(command.get_command_stats()["pending"], 0)
+        self.assertEqual(sum(len(fns) for fns in vehicle.attribute_listeners.values()), 0)
@@ -0,0 +1,145 @@
+# src/tests/test_drone_command_events.py
+import unittest
+import threading
+import time
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from dronekit import VehicleMode, LocationGlobalRelative
+
+# Import the module to test
+from src.drone.drone_command import DroneCommand
+
+
+class ListenerVehicle:
+    """Vehicle that applies commands after a delay and notifies listeners, like DroneKit"""
+
+    def __init__(self, delay=0.02, responsive=True):
+        self.delay = delay
+        self.responsive = responsive
+        self.listeners = {}
+        self._armed = False
+        self._mode = VehicleMode("STABILIZE")
+        self.is_armable = True
+        self.location = SimpleNamespace(global_relative_frame=LocationGlobalRelative(0, 0, 0.0))
+
+    def add_attribute_listener(self, name, fn):
+        self.listeners.setdefault(name, []).append(fn)
+
+    def remove_attribute_listener(self, name, fn):
+        self.listeners[name].remove(fn)
+
+    def listener_count(self):
+        return sum(len(fns) for fns in self.listeners.values())
+
+    def _later(self, name, apply, delay=None):
+        if not self.responsive:
+            return
+
+        def update():
+            apply()
+            for fn in list(self.listeners.get(name, ())):
+                fn(self, name, getattr(self, name))
+        timer = threading.Timer(self.delay if delay is None else delay, update)
+        timer.daemon = True
+        timer.start()
+
+    @property
+    def armed(self):
+        return self._armed
+
+    @armed.setter
+    def armed(self, value):
+        self._later("armed", lambda: setattr(self, "_armed", value))
+
+    @property
+    def mode(self):
+        return self._mode
+
+    @mode.setter
+    def mode(self, value):
+        self._later("mode", lambda: setattr(self, "_mode", value))
+
+    def set_altitude(self, altitude, delay):
+        def apply():
+            self.location.global_relative_frame = LocationGlobalRelative(0, 0, altitude)
+        self._later("location", apply, delay)
+
+    def simple_takeoff(self, altitude):
+        self.set_altitude(altitude, self.delay)
+
+
+class TestDroneCommandEvents(unittest.TestCase):
+    """Tests for listener-driven command confirmation"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.vehicle = ListenerVehicle()
+        self.command = DroneCommand(self.vehicle)
+
+    def timed(self, func, *args, **kwargs):
+        start = time.monotonic()
+        result = func(*args, **kwargs)
+        return result, time.monotonic() - start
+
+    def test_mode_change_confirmed_by_listener(self):
+        """Test a mode change completes as soon as the vehicle reports it"""
+        result, elapsed = self.timed(self.command.set_mode, "GUIDED")
+
+        self.assertTrue(result)
+        self.assertEqual(self.vehicle.mode.name, "GUIDED")
+        # One 20 ms reply rather than a 0.5 s poll
+        self.assertLess(elapsed, 0.3)
+        self.assertEqual(self.vehicle.listener_count(), 0)
+
+    def test_arm_and_takeoff(self):
+        """Test arming (with its mode change) and takeoff avoid fixed sleeps"""
+        result, elapsed = self.timed(self.command.arm)
+        self.assertTrue(result)
+        self.assertTrue(self.vehicle.armed)
+        self.assertLess(elapsed, 0.5)
+
+        result, elapsed = self.timed(self.command.takeoff, 10.0)
+        self.assertTrue(result)
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(self.vehicle.listener_count(), 0)
+
+    def test_land(self):
+        """Test landing completes on the altitude update"""
+        self.vehicle.location.global_relative_frame = LocationGlobalRelative(0, 0, 10.0)
+        self.vehicle.set_altitude(0.0, 0.1)
+
+        result, elapsed = self.timed(self.command.land, timeout=5)
+
+        self.assertTrue(result)
+        self.assertEqual(self.vehicle.mode.name, "LAND")
+        self.assertLess(elapsed, 0.6)
+
+    def test_timeout_kept(self):
+        """Test an unanswered command still times out"""
+        self.vehicle.responsive = False
+
+        result, elapsed = self.timed(self.command.set_mode, "RTL", timeout=0.3)
+
+        self.assertFalse(result)
+        self.assertGreaterEqual(elapsed, 0.3)
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(self.vehicle.listener_count(), 0)
+
+    def test_recheck_without_callbacks(self):
+        """Test a change that no listener reports is still noticed by the periodic check"""
+        self.vehicle.responsive = False
+        timer = threading.Timer(0.05, lambda: setattr(self.vehicle, "_mode", VehicleMode("AUTO")))
+        timer.start()
+
+        self.assertTrue(self.command.set_mode("AUTO", timeout=3))
+        timer.join()
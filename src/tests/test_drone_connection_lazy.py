@@ -0,0 +1,317 @@
+# src/tests/test_drone_connection_lazy.py
+import unittest
+from unittest.mock import patch
+import threading
+import tempfile
+import shutil
+import time
+import sys
+import os
+from types import SimpleNamespace
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from dronekit import VehicleMode, LocationGlobal, LocationGlobalRelative, Attitude
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+# Import the modules to test
+from src.drone.drone_connection import DroneConnection
+from src.drone.drone_controller import DroneController
+from src.drone.link_monitor import LINK_LOST
+
+
+class FakeCommands:
+    """Mission download that completes at once"""
+
+    def __init__(self):
+        self.downloads = 0
+
+    def download(self):
+        self.downloads += 1
+
+    def wait_ready(self, **kwargs):
+        return True
+
+
+class SlowVehicle:
+    """Vehicle whose telemetry arrives shortly after the heartbeat and parameters much later"""
+
+    def __init__(self, telemetry_delay=0.05, parameter_delay=0.5):
+        self.attribute_listeners = {}
+        self.message_listeners = {}
+        self.message_factory = mavlink.MAVLink(None)
+        self.sent = []
+        self.closed = False
+        self.mode = VehicleMode("STABILIZE")
+        self.attitude = Attitude(None, None, None)
+        self.location = SimpleNamespace(global_frame=LocationGlobal(None, None, None),
+                                        global_relative_frame=LocationGlobalRelative(None, None, None))
+        self.commands = FakeCommands()
+        self.parameter_waits = []
+        self._parameters = threading.Event()
+
+        threading.Timer(telemetry_delay, self._telemetry).start()
+        threading.Timer(parameter_delay, self._parameters.set).start()
+
+    def _telemetry(self):
+        self.attitude = Attitude(0.01, 0.02, 1.5)
+        self.notify("attitude", self.attitude)
+        self.location.global_frame = LocationGlobal(47.6, -122.3, 10.0)
+        self.notify("location", self.location)
+
+    def notify(self, name, value):
+        for fn in list(self.attribute_listeners.get(name, ())):
+            fn(self, name, value)
+
+    def add_attribute_listener(self, name, fn):
+        self.attribute_listeners.setdefault(name, []).append(fn)
+
+    def remove_attribute_listener(self, name, fn):
+        self.attribute_listeners[name].remove(fn)
+
+    def add_message_listener(self, name, fn):
+        self.message_listeners.setdefault(name, []).append(fn)
+
+    def remove_message_listener(self, name, fn):
+        self.message_listeners[name].remove(fn)
+
+    def send_mavlink(self, message):
+        self.sent.append(message)
+
+    def wait_ready(self, *types, timeout=None, raise_exception=True):
+        self.parameter_waits.append(types)
+        return self._parameters.wait(timeout)
+
+    def close(self):
+        self.closed = True
+
+
+class StubRecorder:
+    """Recorder that only tracks whether it is running"""
+
+    def __init__(self):
+        self.is_recording = True
+        self.vehicles = []
+
+    def start(self, vehicle=None):
+        self.is_recording = True
+        self.vehicles.append(vehicle)
+
+    def stop(self):
+        self.is_recording = False
+
+
+class StubConfig:
+    """Config holding a few dotted-path values"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, path, default=None):
+        return self.values.get(path, default)
+
+
+class TestDroneConnectionLazy(unittest.TestCase):
+    """Tests for lazy connection, background loading and reconnection"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.connection = DroneConnection()
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.connection.disconnect()
+
+    @patch('dronekit.connect')
+    def test_lazy_connect_returns_before_parameters(self, mock_connect):
+        """Test connect returns with telemetry live and parameters still loading"""
+        vehicle = SlowVehicle(parameter_delay=0.5)
+        mock_connect.return_value = vehicle
+        status_changes = []
+        self.connection.register_on_status_changed(lambda: status_changes.append(True))
+
+        start = time.monotonic()
+        self.assertTrue(self.connection.connect("tcp:127.0.0.1:5760", timeout=5, lazy=True))
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(vehicle.attitude.pitch, 0.01)
+        self.assertFalse(self.connection.parameters_ready.is_set())
+        _, kwargs = mock_connect.call_args
+        self.assertNotIn("wait_ready", kwargs)
+        self.assertEqual(kwargs["heartbeat_timeout"], 5)
+
+        metrics = self.connection.get_connect_metrics()
+        self.assertEqual(metrics["mode"], "lazy")
+        self.assertGreaterEqual(metrics["time_to_first_telemetry"], metrics["time_to_heartbeat"])
+        self.assertIsNone(metrics["time_to_parameters"])
+
+        # Parameters and the mission finish loading in the background
+        self.assertTrue(self.connection.parameters_ready.wait(2))
+        self.assertTrue(self.connection.mission_ready.wait(2))
+        self.connection.loader_thread.join(2)
+        metrics = self.connection.get_connect_metrics()
+        self.assertGreaterEqual(metrics["time_to_parameters"], 0.5)
+        self.assertGreaterEqual(metrics["time_to_mission"], metrics["time_to_parameters"])
+        self.assertEqual(vehicle.commands.downloads, 1)
+        self.assertEqual(vehicle.parameter_waits, [("parameters",)])
+        self.assertTrue(status_changes)
+
+    @patch('dronekit.connect')
+    def test_full_connect_metrics(self, mock_connect):
+        """Test a full connection waits for every attribute and reports one time"""
+        mock_connect.return_value = SlowVehicle()
+
+        self.assertTrue(self.connection.connect("tcp:127.0.0.1:5760", timeout=5))
+
+        _, kwargs = mock_connect.call_args
+        self.assertTrue(kwargs["wait_ready"])
+        self.assertTrue(self.connection.parameters_ready.is_set())
+        metrics = self.connection.get_connect_metrics()
+        self.assertEqual(metrics["mode"], "full")
+        self.assertEqual(metrics["time_to_first_telemetry"], metrics["time_to_parameters"])
+
+    @patch('dronekit.connect')
+    def test_reconnect_with_backoff(self, mock_connect):
+        """Test a lost link is reopened with exponential backoff"""
+        first, second = SlowVehicle(), SlowVehicle()
+        call_times = []
+
+        def connect(*args, **kwargs):
+            call_times.append(time.monotonic())
+            if len(call_times) == 1:
+                return first
+            if len(call_times) < 4:
+                raise ConnectionError("No heartbeat")
+            return second
+        mock_connect.side_effect = connect
+
+        events = []
+        self.connection.register_on_connection(lambda: events.append("connected"))
+        self.connection.register_on_disconnection(lambda: events.append("disconnected"))
+        self.connection.reconnect_initial_delay = 0.05
+        self.assertTrue(self.connection.connect("tcp:127.0.0.1:5760", timeout=5, lazy=True))
+
+        self.connection._on_link_event(LINK_LOST, [])
+        self.connection.reconnect_thread.join(5)
+
+        self.assertIs(self.connection.vehicle, second)
+        self.assertTrue(self.connection.is_connected)
+        self.assertTrue(first.closed)
+        self.assertEqual(events, ["connected", "disconnected", "connected"])
+        self.assertEqual(self.connection.get_connect_metrics()["reconnects"], 1)
+        # Waits of 0.05, 0.1 and 0.2 s between attempts
+        gaps = [b - a for a, b in zip(call_times[1:], call_times[2:])]
+        self.assertGreater(gaps[1], gaps[0] * 1.5)
+        # The reconnection keeps the lazy mode
+        _, kwargs = mock_connect.call_args
+        self.assertNotIn("wait_ready", kwargs)
+
+    @patch('dronekit.connect')
+    def test_disconnect_stops_reconnecting(self, mock_connect):
+        """Test disconnect() ends the reconnect loop"""
+        mock_connect.return_value = SlowVehicle()
+        self.assertTrue(self.connection.connect("tcp:127.0.0.1:5760", timeout=5))
+        mock_connect.side_effect = ConnectionError("No heartbeat")
+        self.connection.reconnect_initial_delay = 0.02
+
+        self.connection._on_link_event(LINK_LOST, [])
+        time.sleep(0.1)
+        self.connection.disconnect()
+        self.connection.reconnect_thread.join(2)
+
+        self.assertFalse(self.connection.reconnect_thread.is_alive())
+        self.assertFalse(self.connection.is_connected)
+
+    @patch('dronekit.connect')
+    def test_controller_disconnect_stops_reconnecting(self, mock_connect):
+        """Test DroneController.disconnect() stops a reconnect loop after the vehicle was dropped"""
+        controller = DroneController()
+        mock_connect.return_value = SlowVehicle()
+        self.assertTrue(controller.connect("tcp:127.0.0.1:5760", timeout=5, lazy=False))
+        connection = controller.connection
+        mock_connect.side_effect = ConnectionError("No heartbeat")
+        connection.reconnect_initial_delay = 0.02
+
+        connection._on_link_event(LINK_LOST, [])
+        deadline = time.monotonic() + 2
+        while mock_connect.call_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertIsNone(connection.vehicle)
+        self.assertFalse(controller.is_connected)
+
+        controller.disconnect()
+        connection.reconnect_thread.join(2)
+        attempts = mock_connect.call_count
+        time.sleep(0.2)
+
+        self.assertFalse(connection.reconnect_thread.is_alive())
+        self.assertTrue(connection.stop_reconnect.is_set())
+        self.assertEqual(mock_connect.call_count, attempts)
+        controller.executor.stop()
+
+    @patch('dronekit.connect')
+    def test_recording_resumes_after_failed_attempts(self, mock_connect):
+        """Test a recording carries over even when the first reconnect attempts fail"""
+        first, second = SlowVehicle(), SlowVehicle()
+        mock_connect.side_effect = [first, ConnectionError("No heartbeat"), second]
+        self.assertTrue(self.connection.connect("tcp:127.0.0.1:5760", timeout=5))
+        recorder = StubRecorder()
+        self.connection.recorder = recorder
+        self.connection.reconnect_initial_delay = 0.02
+
+        self.connection._on_link_event(LINK_LOST, [])
+        self.connection.reconnect_thread.join(5)
+
+        self.assertIs(self.connection.vehicle, second)
+        self.assertTrue(recorder.is_recording)
+        self.assertEqual(recorder.vehicles, [second])
+
+    @patch('dronekit.connect')
+    def test_disconnect_during_reconnect_attempt(self, mock_connect):
+        """Test a connection opened after disconnect() was called is closed again"""
+        first, second = SlowVehicle(), SlowVehicle()
+
+        def connect(*args, **kwargs):
+            if mock_connect.call_count == 1:
+                return first
+            # disconnect() arrives while this attempt is still connecting
+            self.connection.stop_reconnect.set()
+            return second
+        mock_connect.side_effect = connect
+        events = []
+        self.connection.register_on_disconnection(lambda: events.append("disconnected"))
+        self.assertTrue(self.connection.connect("tcp:127.0.0.1:5760", timeout=5))
+        self.connection.reconnect_initial_delay = 0.02
+
+        self.connection._on_link_event(LINK_LOST, [])
+        self.connection.reconnect_thread.join(5)
+
+        self.assertTrue(second.closed)
+        self.assertFalse(self.connection.is_connected)
+        self.assertEqual(self.connection.reconnects, 0)
+        self.assertEqual(events, ["disconnected", "disconnected"])
+
+    @patch('dronekit.connect')
+    def test_recording_from_config(self, mock_connect):
+        """Test drone.record_telemetry records every connection into paths.telemetry"""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        self.connection = DroneConnection(StubConfig({"drone.record_telemetry": True,
+                                                      "paths.telemetry": directory}))
+        vehicle = SlowVehicle()
+        mock_connect.return_value = vehicle
+
+        self.assertTrue(self.connection.connect("tcp:127.0.0.1:5760", timeout=5, lazy=True))
+
+        self.assertTrue(self.connection.recorder.is_recording)
+        self.assertEqual(self.connection.recorder.directory, directory)
+        self.assertIn(self.connection.recorder._on_message, vehicle.message_listeners["*"])
+        self.connection.disconnect()
+        self.assertFalse(self.connection.recorder.is_recording)
@@ -0,0 +1,131 @@
+# src/tests/test_drone_status_model.py
+import unittest
+import threading
+import time
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from PyQt6.QtCore import QCoreApplication, Qt
+
+# Import the modules to test
+from src.drone.drone_state import DroneState
+from src.drone.state_snapshot import STATE_FIELDS
+from src.views.drone_status_model import DroneStatusTableModel, VALUE_COLUMN
+
+app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+
+class TestDroneStatusTableModel(unittest.TestCase):
+    """Tests for the push-based drone status table"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.state = DroneState()
+        self.model = DroneStatusTableModel()
+        self.changes = []
+        self.resets = []
+        self.model.dataChanged.connect(
+            lambda top, bottom, roles: self.changes.append((top.row(), bottom.row(), top.column())))
+        self.model.modelReset.connect(lambda: self.resets.append(True))
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.model.detach()
+        self.state.clear_vehicle()
+
+    def text(self, key):
+        return self.model.data(self.model.index(STATE_FIELDS.index(key), VALUE_COLUMN))
+
+    def test_first_state_fills_table(self):
+        """Test the first state loads every row with the table's formatting"""
+        self.state.latitude = 40.1234567
+        self.state.battery_voltage = 12.456
+        self.model.apply_state(self.state.get_snapshot())
+
+        self.assertEqual(self.model.rowCount(), len(STATE_FIELDS))
+        self.assertEqual(self.model.columnCount(), 2)
+        self.assertEqual(self.model.headerData(1, Qt.Orientation.Horizontal), "Value")
+        self.assertEqual(self.model.data(self.model.index(0, 0)), "latitude")
+        self.assertEqual(self.text("latitude"), "40.123457")
+        self.assertEqual(self.text("battery_voltage"), "12.46")
+        self.assertEqual(self.text("armed"), "False")
+        self.assertEqual(len(self.resets), 1)
+
+    def test_only_changed_cells_are_signalled(self):
+        """Test dataChanged covers only value cells whose text changed"""
+        self.model.apply_state(self.state.get_snapshot())
+
+        self.state.roll = 1.0
+        self.state.pitch = 2.0
+        self.state.battery_level = 50.0
+        self.model.apply_state(self.state.get_snapshot())
+
+        # roll and pitch are adjacent rows, battery_level is separate
+        roll, pitch, battery = (STATE_FIELDS.index(k) for k in ("roll", "pitch", "battery_level"))
+        self.assertEqual(self.changes, [(roll, pitch, VALUE_COLUMN), (battery, battery, VALUE_COLUMN)])
+        self.assertEqual(self.text("pitch"), "2.00")
+
+        # A change below display precision repaints nothing
+        self.changes.clear()
+        self.state.roll = 1.001
+        self.model.apply_state(self.state.get_snapshot())
+        self.assertEqual(self.changes, [])
+        self.assertEqual(len(self.resets), 1)
+
+    def test_stale_snapshot_is_ignored(self):
+        """Test a snapshot older than the one shown doesn't roll the table back"""
+        self.state.roll = 1.0
+        old = self.state.get_snapshot()
+        self.state.roll = 2.0
+        self.model.apply_state(self.state.get_snapshot())
+        self.model.apply_state(old)
+
+        self.assertEqual(self.text("roll"), "2.00")
+
+    def test_attach_pushes_state_changes(self):
+        """Test state changes reach the model through queued signals"""
+        self.model.attach(self.state, max_rate_hz=None)
+        app.processEvents()
+        self.assertEqual(self.model.rowCount(), len(STATE_FIELDS))
+
+        self.state._write(latitude=41.5, longitude=-104.25)
+        deadline = time.time() + 1.0
+        while self.text("latitude") != "41.500000" and time.time() < deadline:
+            app.processEvents()
+
+        self.assertEqual(self.text("latitude"), "41.500000")
+        self.assertEqual(self.text("longitude"), "-104.250000")
+
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+
+    def test_snapshot_queued_before_detach_is_dropped(self):
+        """Test a snapshot still queued when the model detaches doesn't refill the table"""
+        self.model.attach(self.state, max_rate_hz=None)
+        app.processEvents()
+
+        # Delivered on a telemetry thread but not yet processed by the GUI thread
+        self.state.latitude = 41.5
+        callback = self.model._state_callback
+        delivery = threading.Thread(target=callback, args=(self.state.get_snapshot(),))
+        delivery.start()
+        delivery.join()
+        self.model.detach()
+        self.model.clear()
+        app.processEvents()
+
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertGreaterEqual(self.model.get_stats()["stale_dropped"], 1)
+
+        # Attaching again shows the current state
+        self.model.attach(self.state, max_rate_hz=None)
+        app.processEvents()
+        self.assertEqual(self.text("latitude"), "41.500000")
@@ -0,0 +1,211 @@
+# src/tests/test_link_monitor.py
+import unittest
+import threading
+import time
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+# Import the modules to test
+from src.drone.drone_connection import DroneConnection
+from src.drone.link_monitor import (
+    LinkMonitor, LINK_LOST, LINK_RESTORED, LINK_DEGRADED, LINK_RECOVERED,
+    REASON_LOSS, REASON_RSSI, REASON_LATENCY,
+)
+
+
+def stamp(message, seq, system=1, component=1):
+    """Give a message the header fields set when it is received"""
+    message._header = mavlink.MAVLink_header(message.id, seq=seq, srcSystem=system, srcComponent=component)
+    return message
+
+
+def heartbeat(seq, **kwargs):
+    return stamp(mavlink.MAVLink_heartbeat_message(
+        mavlink.MAV_TYPE_QUADROTOR, mavlink.MAV_AUTOPILOT_ARDUPILOTMEGA, 0, 0, 0, 3), seq, **kwargs)
+
+
+def attitude(seq, **kwargs):
+    return stamp(mavlink.MAVLink_attitude_message(0, 0, 0, 0, 0, 0, 0), seq, **kwargs)
+
+
+class FakeVehicle:
+    """Vehicle with a message listener API and a MAVLink encoder"""
+
+    def __init__(self):
+        self.message_factory = mavlink.MAVLink(None)
+        self.listeners = []
+        self.sent = []
+
+    def add_message_listener(self, name, fn):
+        self.listeners.append(fn)
+
+    def remove_message_listener(self, name, fn):
+        self.listeners.remove(fn)
+
+    def send_mavlink(self, message):
+        self.sent.append(message)
+
+    def receive(self, message):
+        for fn in list(self.listeners):
+            fn(self, message.get_type(), message)
+
+
+class TestLinkMonitor(unittest.TestCase):
+    """Tests for link-quality statistics and events"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.monitor = LinkMonitor(window=10.0, silence_timeout=None, timesync_interval=None)
+        self.events = []
+        self.monitor.register_on_link_event(lambda event, reasons: self.events.append((event, reasons)))
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.monitor.stop()
+
+    def test_sequence_gaps(self):
+        """Test loss is counted from sequence gaps per sending component"""
+        now = time.monotonic()
+        # Autopilot: 250..255 then 2 (wrap, 0 and 1 lost), plus 10 lost in the middle
+        for seq in [250, 251, 252, 253, 254, 255, 2, 13, 14]:
+            self.monitor.process(attitude(seq), now)
+        # A second component with its own sequence, no loss
+        for seq in range(5):
+            self.monitor.process(attitude(seq, component=191), now)
+
+        stats = self.monitor.get_stats()
+        self.assertEqual(stats["total_received"], 14)
+        self.assertEqual(stats["total_lost"], 12)
+        self.assertAlmostEqual(stats["loss_percent"], 100 * 12 / 26)
+
+    def test_loss_event_fires_on_message(self):
+        """Test degradation is reported by the message that crosses the threshold"""
+        now = time.monotonic()
+        for seq in range(20):
+            self.monitor.process(attitude(seq), now)
+        self.assertEqual(self.events, [])
+
+        self.monitor.process(attitude(25), now)
+
+        self.assertEqual(self.events, [(LINK_DEGRADED, [REASON_LOSS])])
+
+    def test_window_expiry_and_rates(self):
+        """Test counts leave the window and rates are per type"""
+        base = time.monotonic() - 20.0
+        self.monitor.started_at = base
+        # 5 packets lost early on, which age out of the 10 s window
+        self.monitor.process(attitude(0), base)
+        self.monitor.process(attitude(6), base)
+
+        # 8 s of ATTITUDE at 10 Hz and HEARTBEAT at 1 Hz, ending now
+        seq = 7
+        for i in range(80):
+            t = base + 12.0 + i * 0.1
+            self.monitor.process(attitude(seq), t)
+            seq += 1
+            if i % 10 == 0:
+                self.monitor.process(heartbeat(seq), t)
+                seq += 1
+
+        stats = self.monitor.get_stats()
+        self.assertEqual(stats["received"], 88)
+        self.assertEqual(stats["lost"], 0)
+        self.assertEqual(stats["total_lost"], 5)
+        self.assertAlmostEqual(stats["message_rates"]["ATTITUDE"], 8.0, places=1)
+        self.assertAlmostEqual(stats["message_rates"]["HEARTBEAT"], 0.8, places=1)
+
+    def test_timesync_latency(self):
+        """Test TIMESYNC replies to our requests give round-trip latency"""
+        vehicle = FakeVehicle()
+        self.monitor.vehicle = vehicle
+        self.monitor.max_latency_ms = 20.0
+        self.assertTrue(self.monitor.send_timesync())
+        request = vehicle.sent[0]
+        self.assertEqual(request.tc1, 0)
+
+        # Unknown requests and autopilot-originated requests are ignored
+        self.monitor.process(stamp(mavlink.MAVLink_timesync_message(5, 12345), 0))
+        self.monitor.process(stamp(mavlink.MAVLink_timesync_message(0, request.ts1), 1))
+        self.assertIsNone(self.monitor.get_stats()["latency_ms"]["last"])
+
+        time.sleep(0.03)
+        self.monitor.process(stamp(mavlink.MAVLink_timesync_message(99, request.ts1), 2))
+
+        latency = self.monitor.get_stats()["latency_ms"]
+        self.assertEqual(latency["samples"], 1)
+        self.assertGreaterEqual(latency["last"], 30)
+        self.assertEqual(self.events, [(LINK_DEGRADED, [REASON_LATENCY])])
+
+    def test_radio_status(self):
+        """Test RSSI is reported and low RSSI degrades the link until it recovers"""
+        self.monitor.min_rssi = 100
+
+        def radio(seq, rssi):
+            return stamp(mavlink.MAVLink_radio_status_message(rssi, 120, 80, 30, 25, 3, 0), seq,
+                         system=51, component=68)
+
+        self.monitor.process(radio(0, 150))
+        self.monitor.process(radio(1, 90))
+        self.monitor.process(radio(2, 140))
+
+        self.assertEqual(self.events, [(LINK_DEGRADED, [REASON_RSSI]), (LINK_RECOVERED, [])])
+        self.assertEqual(self.monitor.get_stats()["radio"]["rssi"], 140)
+        self.assertEqual(self.monitor.get_stats()["radio"]["rxerrors"], 3)
+
+    def test_watchdog_reports_lost_heartbeat_quickly(self):
+        """Test a missing heartbeat is reported within 100 ms of the timeout"""
+        vehicle = FakeVehicle()
+        monitor = LinkMonitor(heartbeat_timeout=0.2, silence_timeout=None, timesync_interval=0.05)
+        lost = threading.Event()
+        restored = threading.Event()
+
+        def on_event(event, reasons):
+            if event == LINK_LOST:
+                lost.set()
+            elif event == LINK_RESTORED:
+                restored.set()
+        monitor.register_on_link_event(on_event)
+        try:
+            monitor.start(vehicle)
+            vehicle.receive(heartbeat(0))
+            last_heartbeat = time.monotonic()
+
+            self.assertTrue(lost.wait(2))
+            delay = time.monotonic() - last_heartbeat - 0.2
+            self.assertLess(delay, 0.1)
+            self.assertFalse(monitor.get_stats()["link_up"])
+            # TIMESYNC requests went out from the watchdog
+            self.assertTrue(any(m.get_type() == "TIMESYNC" for m in vehicle.sent))
+
+            vehicle.receive(heartbeat(1))
+            self.assertTrue(restored.is_set())
+        finally:
+            monitor.stop()
+        self.assertEqual(vehicle.listeners, [])
+
+    def test_connection_follows_link_events(self):
+        """Test DroneConnection turns link events into its callbacks"""
+        connection = DroneConnection()
+        calls = []
+        connection.register_on_disconnection(lambda: calls.append("disconnected"))
+        connection.register_on_connection(lambda: calls.append("connected"))
+        connection.register_on_status_changed(lambda: calls.append("status"))
+        connection.is_connected = True
+
+        connection._on_link_event(LINK_LOST, [])
+        self.assertFalse(connection.is_connected)
+        connection._on_link_event(LINK_RESTORED, [])
+        self.assertTrue(connection.is_connected)
+        connection._on_link_event(LINK_DEGRADED, [REASON_LOSS])
+
+        self.assertEqual(calls, ["disconnected", "connected", "status"])
@@ -0,0 +1,104 @@
+# src/tests/test_map_assets.py
+import unittest
+from unittest.mock import MagicMock
+import tempfile
+import shutil
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Import the module to test
+from src.mapping.map_assets import (
+    ASSET_DIR, find_remote_assets, local_asset_path, rewrite_asset_urls, vendor_assets
+)
+from src.mapping.map_generator import render_folium_map
+
+SAMPLE_HTML = """
+<head>
+    <script src="https://cdn.example.com/npm/leaflet@1.9.3/dist/leaflet.js"></script>
+    <link rel="stylesheet" href="https://cdn.example.com/npm/leaflet@1.9.3/dist/leaflet.css"/>
+    <script src="https://code.example.com/jquery-3.7.1.min.js"></script>
+    <script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+</head>
+"""
+
+
+class TestMapAssets(unittest.TestCase):
+    """Tests for vendoring and rewriting map page assets"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.asset_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up after each test"""
+        shutil.rmtree(self.asset_dir, ignore_errors=True)
+
+    def _vendor(self, url, content=b""):
+        path = local_asset_path(url, self.asset_dir)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+    def test_find_remote_assets(self):
+        """Test only remote scripts and stylesheets are found"""
+        urls = find_remote_assets(SAMPLE_HTML)
+
+        self.assertEqual(len(urls), 3)
+        self.assertNotIn("qrc:///qtwebchannel/qwebchannel.js", urls)
+
+    def test_rewrite_vendored_assets(self):
+        """Test vendored assets are served locally and the rest stay on the CDN"""
+        self._vendor("https://cdn.example.com/npm/leaflet@1.9.3/dist/leaflet.js")
+        self._vendor("https://cdn.example.com/npm/leaflet@1.9.3/dist/leaflet.css")
+
+        html = rewrite_asset_urls(SAMPLE_HTML, self.asset_dir)
+
+        self.assertIn('src="mapview://assets/cdn.example.com/npm/leaflet@1.9.3/dist/leaflet.js"', html)
+        self.assertIn('href="mapview://assets/cdn.example.com/npm/leaflet@1.9.3/dist/leaflet.css"', html)
+        self.assertIn('src="https://code.example.com/jquery-3.7.1.min.js"', html)
+
+    def test_vendor_follows_stylesheet_references(self):
+        """Test fonts and images referenced by stylesheets are vendored too"""
+        css_url = "https://cdn.example.com/fa/css/all.min.css"
+        responses = {
+            css_url: b"@font-face{src:url(../webfonts/fa.woff2) format('woff2')}"
+                     b".x{background:url('data:image/png;base64,AAAA')}",
+            "https://cdn.example.com/fa/webfonts/fa.woff2": b"font",
+        }
+
+        def get(url, timeout=None):
+            response = MagicMock()
+            response.content = responses[url]
+            return response
+
+        session = MagicMock()
+        session.get.side_effect = get
+
+        stats = vendor_assets([css_url], self.asset_dir, session)
+
+        self.assertEqual(stats["downloaded"], 2)
+        self.assertEqual(stats["failed"], 0)
+        self.assertTrue(os.path.exists(
+            local_asset_path("https://cdn.example.com/fa/webfonts/fa.woff2", self.asset_dir)))
+
+        # A second run finds everything already vendored
+        session.get.reset_mock()
+        stats = vendor_assets([css_url], self.asset_dir, session)
+        self.assertEqual(stats["existing"], 2)
+        session.get.assert_not_called()
+
+    def test_map_page_assets_are_vendored(self):
+        """Test every asset of the planning map has a vendored copy, so the page loads nothing remote"""
+        sample_path = [(34.0734, -118.4449), (34.0740, -118.4440), (34.0746, -118.4449)]
+
+        urls = find_remote_assets(render_folium_map(sample_path, local_assets=False))
+        self.assertTrue(urls)
+        for url in urls:
+            self.assertTrue(os.path.isfile(local_asset_path(url, ASSET_DIR)), url)
+
+        html = render_folium_map(sample_path, local_assets=True)
+        self.assertEqual(find_remote_assets(html), [])
+        self.assertIn('mapview://assets/', html)
@@ -0,0 +1,61 @@
+# src/tests/test_map_documents.py
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Import the module to test
+from src.mapping.map_documents import MapDocumentStore, plan_hash, map_document_url
+
+WAYPOINTS = [(34.0734, -118.4449), (34.0740, -118.4449), (34.0740, -118.4440)]
+
+
+class TestMapDocuments(unittest.TestCase):
+    """Tests for the in-memory map document store"""
+
+    def test_plan_hash(self):
+        """Test equal plans share a hash and changed plans don't"""
+        self.assertEqual(plan_hash(WAYPOINTS, 5.0, 50), plan_hash(list(WAYPOINTS), 5, 50.0))
+        self.assertNotEqual(plan_hash(WAYPOINTS, 5.0, 50), plan_hash(WAYPOINTS, 6.0, 50))
+        self.assertNotEqual(plan_hash(WAYPOINTS, 5.0, 50), plan_hash(WAYPOINTS[:2], 5.0, 50))
+        self.assertEqual(map_document_url("abc"), "mapview://maps/abc.html")
+
+    @patch('src.mapping.map_documents.render_folium_map', return_value="<html></html>")
+    def test_unchanged_plan_skips_render(self, mock_render):
+        """Test rendering the same plan twice renders once"""
+        store = MapDocumentStore()
+
+        first = store.render(WAYPOINTS, speed_mps=5.0, altitude=50)
+        second = store.render(WAYPOINTS, speed_mps=5.0, altitude=50)
+
+        self.assertEqual(first, second)
+        mock_render.assert_called_once()
+        self.assertEqual(store.stats["hits"], 1)
+        self.assertEqual(store.resolve(f"{first}.html"), (b"<html></html>", "text/html"))
+
+    def test_least_recently_used_is_evicted(self):
+        """Test the store stays within max_documents, dropping the oldest unused page"""
+        store = MapDocumentStore(max_documents=2)
+        store.put("a", "A")
+        store.put("b", "B")
+        store.get("a")
+        store.put("c", "C")
+
+        self.assertIn("a", store)
+        self.assertNotIn("b", store)
+        self.assertEqual(len(store), 2)
+        self.assertIsNone(store.resolve("b.html"))
+
+    def test_overlay_without_plan(self):
+        """Test a map without a flight path still shows raster overlays, centred on them"""
+        store = MapDocumentStore()
+        overlays = [{"name": "Probability", "bounds": (40.0, -100.0, 40.2, -99.8), "version": 3}]
+
+        html = store.get(store.render(None, overlays=overlays)).decode()
+
+        self.assertIn("mapview://overlays/Probability/", html)
+        self.assertIn("40.1", html)
+        self.assertNotEqual(store.render(None, overlays=overlays), store.render(None))
@@ -0,0 +1,79 @@
+# src/tests/test_map_events.py
+import unittest
+import json
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Import the module to test
+from src.mapping.map_events import MapEventDispatcher, HOVER_EVENT, CLICK_EVENT, SHAPE_EVENT
+
+
+class TestMapEventDispatcher(unittest.TestCase):
+    """Tests for the batched map event dispatcher"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.dispatcher = MapEventDispatcher()
+        self.received = []
+        for event_type in (HOVER_EVENT, CLICK_EVENT, SHAPE_EVENT):
+            self.dispatcher.register_handler(event_type, self.received.append)
+
+    def test_mixed_batch(self):
+        """Test one message carries several event types in order"""
+        batch = {
+            "events": [
+                {"type": "click", "lat": 1.0, "lon": 2.0},
+                {"type": "shape", "coordinates": [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]},
+                {"type": "hover", "lat": 3.0, "lon": 4.0},
+            ],
+            "raw": {"mousemove": 12, "click": 1},
+        }
+
+        count = self.dispatcher.dispatch_batch(json.dumps(batch))
+
+        self.assertEqual(count, 3)
+        self.assertEqual([e["type"] for e in self.received], ["click", "shape", "hover"])
+        self.assertEqual(self.dispatcher.stats["messages"], 1)
+        self.assertEqual(self.dispatcher.stats["raw_events"], 13)
+
+    def test_hover_is_coalesced(self):
+        """Test only the newest hover in a batch is delivered"""
+        batch = {"events": [
+            {"type": "hover", "lat": 1.0, "lon": 1.0},
+            {"type": "click", "lat": 5.0, "lon": 5.0},
+            {"type": "hover", "lat": 2.0, "lon": 2.0},
+        ]}
+
+        self.dispatcher.dispatch_batch(json.dumps(batch))
+
+        hovers = [e for e in self.received if e["type"] == "hover"]
+        self.assertEqual(len(hovers), 1)
+        self.assertEqual(hovers[0]["lat"], 2.0)
+        self.assertEqual(self.dispatcher.stats["coalesced"], 1)
+
+    def test_malformed_batch(self):
+        """Test a malformed message is counted and ignored"""
+        count = self.dispatcher.dispatch_batch("{not json")
+
+        self.assertEqual(count, 0)
+        self.assertEqual(self.dispatcher.stats["errors"], 1)
+        self.assertEqual(self.received, [])
+
+    def test_handler_error_does_not_stop_batch(self):
+        """Test a failing handler doesn't prevent later events from being delivered"""
+        def failing(event):
+            raise RuntimeError("boom")
+
+        self.dispatcher.register_handler(CLICK_EVENT, failing)
+        batch = {"events": [
+            {"type": "click", "lat": 1.0, "lon": 1.0},
+            {"type": "hover", "lat": 2.0, "lon": 2.0},
+        ]}
+
+        self.dispatcher.dispatch_batch(json.dumps(batch))
+
+        self.assertEqual(self.dispatcher.stats["errors"], 1)
+        self.assertEqual(self.received[-1]["type"], "hover")
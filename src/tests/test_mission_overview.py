@@ -0,0 +1,139 @@
+# src/tests/test_mission_overview.py
+import unittest
+import json
+import math
+import time
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from PyQt6.QtCore import QCoreApplication
+
+# Import the modules to test
+from src.mapping.mission_overview import MissionOverviewIndex, OverviewGeometry, OverviewSession
+from src.mapping.overview_publisher import MissionOverviewPublisher
+
+
+def wiggly_polygon(lat, lon, size=0.01, points=400):
+    """A detailed polygon of about size degrees around a center"""
+    ring = []
+    for i in range(points):
+        angle = 2 * math.pi * i / points
+        radius = size / 2 * (1 + 0.02 * math.sin(angle * 40))
+        ring.append([lat + radius * math.sin(angle), lon + radius * math.cos(angle)])
+    return ring
+
+
+def build_index(rows=20, cols=20, spacing=0.1):
+    """A grid of missions around Los Angeles"""
+    index = MissionOverviewIndex()
+    for row in range(rows):
+        for col in range(cols):
+            index.add(OverviewGeometry(
+                f"boundary-{row}-{col}",
+                wiggly_polygon(34.0 + row * spacing, -118.0 + col * spacing),
+                properties={"mission": f"Mission {row}-{col}", "status": "ready"},
+            ))
+    return index
+
+
+class TestMissionOverview(unittest.TestCase):
+    """Tests for the viewport-driven mission overview"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.index = build_index()
+
+    def test_query_viewport(self):
+        """Test a viewport query only returns nearby geometries"""
+        found = self.index.query((34.0, -118.0, 34.15, -117.85))
+        self.assertEqual({g.feature_id for g in found},
+                         {"boundary-0-0", "boundary-0-1", "boundary-1-0", "boundary-1-1"})
+
+    def test_level_of_detail(self):
+        """Test geometries are simplified at low zoom and collapse to points when tiny"""
+        geometry = self.index.geometries["boundary-0-0"]
+        detailed = geometry.feature(18)
+        medium = geometry.feature(12)
+        tiny = geometry.feature(6)
+
+        self.assertEqual(len(detailed["coords"]), 400)
+        self.assertLess(len(medium["coords"]), 100)
+        self.assertEqual(tiny["kind"], "point")
+        self.assertEqual(detailed["mission"], "Mission 0-0")
+
+    def test_circle_boundary(self):
+        """Test circle boundaries become rings"""
+        circle = OverviewGeometry("circle", [[34.0, -118.0, 500.0]])
+        south, west, north, east = circle.bounds
+        self.assertAlmostEqual((north - south) * 111320.0, 1000.0, delta=1.0)
+
+    def test_session_sends_only_changes(self):
+        """Test panning sends new geometries, removes old ones and skips unchanged ones"""
+        session = OverviewSession(self.index, padding=0.0)
+        added, removed = session.update((34.0, -118.0, 34.05, -117.95), 14)
+        self.assertEqual([f["id"] for f in added], ["boundary-0-0"])
+        self.assertEqual(removed, [])
+
+        added, removed = session.update((34.0, -118.0, 34.05, -117.95), 14)
+        self.assertEqual((added, removed), ([], []))
+
+        added, removed = session.update((34.2, -118.0, 34.25, -117.95), 14)
+        self.assertEqual([f["id"] for f in added], ["boundary-2-0"])
+        self.assertEqual(removed, ["boundary-0-0"])
+
+
+class TestMissionOverviewPublisher(unittest.TestCase):
+    """Tests for paging overview geometries to the page"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application once"""
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def spin(self, publisher, timeout=5.0):
+        """Process events until the publisher has sent everything queued"""
+        deadline = time.time() + timeout
+        while publisher._pages and time.time() < deadline:
+            QCoreApplication.processEvents()
+        QCoreApplication.processEvents()
+
+    def test_features_are_paged(self):
+        """Test a large viewport is delivered in pages"""
+        publisher = MissionOverviewPublisher(build_index(), page_size=50)
+        pages = []
+        publisher.features_added.connect(lambda features: pages.append(json.loads(features)))
+
+        publisher.set_enabled(True)
+        publisher.on_viewport({"south": 33.9, "west": -118.1, "north": 36.0, "east": -116.0, "zoom": 9})
+        self.spin(publisher)
+
+        self.assertEqual([len(page) for page in pages], [50] * 8)
+        self.assertEqual(publisher.stats["features_sent"], 400)
+
+    def test_outdated_pages_are_dropped(self):
+        """Test pages queued for an old viewport are not sent"""
+        publisher = MissionOverviewPublisher(build_index(), page_size=10)
+        sent = []
+        publisher.features_added.connect(lambda features: sent.extend(json.loads(features)))
+
+        publisher.set_enabled(True)
+        publisher.on_viewport({"south": 33.9, "west": -118.1, "north": 36.0, "east": -116.0, "zoom": 9})
+        publisher.on_viewport({"south": 34.0, "west": -118.0, "north": 34.05, "east": -117.95, "zoom": 16})
+        self.spin(publisher)
+
+        self.assertLess(len(sent), 40)
+        self.assertEqual(publisher.stats["pages_dropped"], 40)
+
+    def test_disabled_sends_nothing(self):
+        """Test nothing is sent while the overview is off"""
+        publisher = MissionOverviewPublisher(build_index())
+        sent = []
+        publisher.features_added.connect(sent.append)
+
+        publisher.on_viewport({"south": 33.9, "west": -118.1, "north": 36.0, "east": -116.0, "zoom": 9})
+        self.spin(publisher)
+
+        self.assertEqual(sent, [])
@@ -0,0 +1,244 @@
+# src/tests/test_parameter_cache.py
+import unittest
+import functools
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+import dronekit
+from pymavlink import mavutil
+
+# Import the modules to test
+from src.drone.parameter_cache import (
+    ParameterCache, CachedParameterVehicle, SOURCE_CACHE, SOURCE_DOWNLOAD,
+)
+from src.drone.parameter_manager import ParameterManager
+
+mavlink = mavutil.mavlink
+
+
+def free_udp_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class FakeAutopilot:
+    """ArduCopter stand-in on a UDP port: heartbeats, AUTOPILOT_VERSION and the parameter protocol"""
+
+    def __init__(self, port, parameters, uid=0x0123456789ABCDEF, firmware=0x04050600):
+        self.conn = mavutil.mavlink_connection(f"udpout:127.0.0.1:{port}", source_system=1, source_component=1)
+        self.parameters = [list(p) for p in parameters]
+        self.uid = uid
+        self.firmware = firmware
+        self.requests = collections.Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(2)
+        self.conn.close()
+
+    def _send_param(self, index):
+        name, value = self.parameters[index]
+        self.conn.mav.param_value_send(name.encode(), value, mavlink.MAV_PARAM_TYPE_REAL32,
+                                       len(self.parameters), index)
+
+    def _run(self):
+        last_heartbeat = 0
+        while not self._stop.is_set():
+            if time.monotonic() - last_heartbeat > 0.1:
+                self.conn.mav.heartbeat_send(mavlink.MAV_TYPE_QUADROTOR, mavlink.MAV_AUTOPILOT_ARDUPILOTMEGA,
+                                             mavlink.MAV_MODE_FLAG_CUSTOM_MODE_ENABLED, 0,
+                                             mavlink.MAV_STATE_STANDBY)
+                last_heartbeat = time.monotonic()
+            message = self.conn.recv_match(blocking=True, timeout=0.02)
+            if message is None:
+                continue
+            kind = message.get_type()
+            if kind == "COMMAND_LONG" and message.command == mavlink.MAV_CMD_REQUEST_AUTOPILOT_CAPABILITIES:
+                self.conn.mav.autopilot_version_send(0xFFFF, self.firmware, 0, 0, 0, [1, 2, 3, 4, 5, 6, 7, 8],
+                                                     [0] * 8, [0] * 8, 0, 0, self.uid)
+            elif kind == "PARAM_REQUEST_LIST":
+                self.requests["list"] += 1
+                for index in range(len(self.parameters)):
+                    self._send_param(index)
+            elif kind == "PARAM_REQUEST_READ":
+                self.requests["read"] += 1
+                if 0 <= message.param_index < len(self.parameters):
+                    self._send_param(message.param_index)
+
+
+class RecordingVehicle(CachedParameterVehicle):
+    """Records the table size each time 'parameters' is announced"""
+
+    def __init__(self, handler, cache=None):
+        self.announced = []
+        super().__init__(handler, cache=cache)
+
+    def notify_attribute_listeners(self, attr_name, value, cache=False):
+        if attr_name == 'parameters':
+            self.announced.append(len(self._params_map))
+        super().notify_attribute_listeners(attr_name, value, cache=cache)
+
+    def _load_cached_parameters(self):
+        loaded = super()._load_cached_parameters()
+        # DroneKit's download state as the fallback download starts
+        self.after_probe = (self._params_start, self._params_loaded, self._params_count)
+        return loaded
+
+
+class TestParameterCache(unittest.TestCase):
+    """Tests for the persistent parameter cache"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.directory = tempfile.mkdtemp()
+        self.cache = ParameterCache(self.directory, spot_checks=6, probe_timeout=1.0)
+        self.parameters = [(f"PARAM_{i:03d}", float(i) + 0.5) for i in range(120)]
+        self.autopilot = None
+        self.vehicle = None
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.disconnect()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def connect(self, parameters, vehicle_class=CachedParameterVehicle, **kwargs):
+        port = free_udp_port()
+        self.autopilot = FakeAutopilot(port, parameters, **kwargs)
+        self.vehicle = dronekit.connect(f"udpin:127.0.0.1:{port}", heartbeat_timeout=5, rate=None,
+                                        vehicle_class=functools.partial(vehicle_class, cache=self.cache))
+        self.assertTrue(self.vehicle.wait_ready('parameters', timeout=10, raise_exception=False))
+        return self.vehicle
+
+    def disconnect(self):
+        if self.vehicle is not None:
+            self.vehicle.close()
+            self.vehicle = None
+        if self.autopilot is not None:
+            self.autopilot.stop()
+            self.autopilot = None
+
+    def wait_for_file(self):
+        deadline = time.monotonic() + 5
+        while not os.listdir(self.directory) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        return [name for name in os.listdir(self.directory) if name.endswith(".json")]
+
+    def test_second_connection_uses_cache(self):
+        """Test the table is downloaded once, saved, then validated by spot checks only"""
+        vehicle = self.connect(self.parameters)
+        self.assertEqual(vehicle.parameter_source, SOURCE_DOWNLOAD)
+        self.assertGreaterEqual(self.autopilot.requests["list"], 1)
+        files = self.wait_for_file()
+        self.assertEqual(files, ["0123456789abcdef_4.5.6.0-0102030405060708.json"])
+        self.disconnect()
+
+        vehicle = self.connect(self.parameters)
+        self.assertEqual(vehicle.parameter_source, SOURCE_CACHE)
+        self.assertEqual(self.autopilot.requests["list"], 0)
+        self.assertLessEqual(self.autopilot.requests["read"], 2 * 6)
+        self.assertEqual(len(vehicle.parameters), 120)
+        self.assertEqual(vehicle.parameters["PARAM_077"], 77.5)
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["last_probe"]["checked"], 6)
+
+    def test_changed_table_is_downloaded_again(self):
+        """Test a failed spot check falls back to the full download and refreshes the cache"""
+        self.connect(self.parameters)
+        self.wait_for_file()
+        self.disconnect()
+
+        # The last index is always checked
+        changed = list(self.parameters)
+        changed[-1] = ("PARAM_119", 42.0)
+        vehicle = self.connect(changed)
+
+        self.assertEqual(vehicle.parameter_source, SOURCE_DOWNLOAD)
+        self.assertGreaterEqual(self.autopilot.requests["list"], 1)
+        self.assertEqual(vehicle.parameters["PARAM_119"], 42.0)
+        self.assertEqual(self.cache.get_stats()["invalidated"], 1)
+        self.assertIn("PARAM_119 42.0 != 119.5", self.cache.get_stats()["last_probe"]["mismatches"])
+
+        self.disconnect()
+        uid, firmware = "0123456789abcdef", "4.5.6.0-0102030405060708"
+        self.assertEqual(self.cache.load(uid, firmware)[-1][1], 42.0)
+
+    def test_count_change_does_not_announce_empty_table(self):
+        """Test a probe reply with a new count doesn't let DroneKit report an empty table as loaded"""
+        self.connect(self.parameters)
+        self.wait_for_file()
+        self.disconnect()
+
+        grown = list(self.parameters) + [("PARAM_120", 120.5)]
+        vehicle = self.connect(grown, vehicle_class=RecordingVehicle)
+
+        self.assertEqual(vehicle.parameter_source, SOURCE_DOWNLOAD)
+        self.assertEqual(vehicle.after_probe, (False, False, -1))
+        self.assertEqual(len(vehicle.parameters), 121)
+        self.assertTrue(vehicle.announced)
+        self.assertNotIn(0, vehicle.announced)
+        self.assertEqual(vehicle.announced[0], 121)
+
+    def test_other_firmware_is_not_reused(self):
+        """Test a table is only offered for the same firmware build"""
+        self.connect(self.parameters)
+        self.wait_for_file()
+        self.disconnect()
+
+        vehicle = self.connect(self.parameters, firmware=0x04050700)
+        self.assertEqual(vehicle.parameter_source, SOURCE_DOWNLOAD)
+        self.assertEqual(self.cache.get_stats()["last_probe"]["reason"], "not cached")
+
+    def test_corrupt_file_is_ignored(self):
+        """Test a table whose hash doesn't match its contents is not loaded"""
+        entries = [(name, value, mavlink.MAV_PARAM_TYPE_REAL32) for name, value in self.parameters]
+        self.assertTrue(self.cache.save("abc", "1.0", entries))
+        self.assertEqual(self.cache.load("abc", "1.0"), entries)
+
+        path = self.cache.path_for("abc", "1.0")
+        with open(path) as f:
+            data = json.load(f)
+        data["parameters"][3][1] = 99.0
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+        self.assertIsNone(self.cache.load("abc", "1.0"))
+
+    def test_spot_checks_cover_both_ends(self):
+        """Test the first and last index are always among the spot checks"""
+        indices = self.cache.choose_spot_checks(500)
+        self.assertEqual(len(indices), 6)
+        self.assertIn(0, indices)
+        self.assertIn(499, indices)
+        self.assertEqual(self.cache.choose_spot_checks(1), [0])
+
+    def test_manager_reports_cache_stats(self):
+        """Test ParameterManager exposes the cache and the vehicle's parameter source"""
+        manager = ParameterManager(cache=self.cache)
+        manager.set_vehicle(self.connect(self.parameters))
+
+        stats = manager.get_cache_stats()
+        self.assertEqual(stats["source"], SOURCE_DOWNLOAD)
+        self.wait_for_file()
+        self.assertTrue(manager.save_cache())
+        self.assertIsNone(ParameterManager().get_cache_stats())
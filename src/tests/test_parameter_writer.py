@@ -0,0 +1,173 @@
+# src/tests/test_parameter_writer.py
+import unittest
+import heapq
+import itertools
+import os
+import tempfile
+import threading
+import time
+import sys
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+# Import the modules to test
+from src.drone.parameter_writer import (
+    BulkParameterWriter, as_float32, UNCHANGED, CONFIRMED, REJECTED, TIMEOUT, UNKNOWN,
+)
+from src.drone.parameter_manager import ParameterManager
+
+
+class EchoingVehicle:
+    """Autopilot that answers each PARAM_SET with a PARAM_VALUE after a delay
+
+    Names in `drop_first` lose their first PARAM_SET, names in `ignore` are
+    never answered and `limits` clamps values to a maximum.
+    """
+
+    def __init__(self, parameters, latency=0.02, drop_first=(), ignore=(), limits=None):
+        self.parameters = dict(parameters)
+        self.names = list(self.parameters)
+        self.message_factory = mavlink.MAVLink(None)
+        self.listeners = []
+        self.latency = latency
+        self.drop_first = set(drop_first)
+        self.ignore = set(ignore)
+        self.limits = limits or {}
+        self.sets = collections.Counter()
+        self.max_in_flight = 0
+
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add_message_listener(self, name, fn):
+        self.listeners.append(fn)
+
+    def remove_message_listener(self, name, fn):
+        self.listeners.remove(fn)
+
+    def send_mavlink(self, message):
+        name = message.param_id.decode() if isinstance(message.param_id, bytes) else message.param_id
+        self.sets[name] += 1
+        if name in self.ignore:
+            return
+        if name in self.drop_first:
+            self.drop_first.discard(name)
+            return
+        value = min(message.param_value, self.limits.get(name, float("inf")))
+        with self._condition:
+            heapq.heappush(self._queue, (time.monotonic() + self.latency, next(self._counter), name, value))
+            self.max_in_flight = max(self.max_in_flight, len(self._queue))
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stop = True
+            self._condition.notify()
+        self._thread.join(2)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stop and (not self._queue or self._queue[0][0] > time.monotonic()):
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._condition.wait(timeout)
+                if self._stop:
+                    return
+                _, _, name, value = heapq.heappop(self._queue)
+            self.parameters[name] = as_float32(value)
+            message = mavlink.MAVLink_param_value_message(
+                name.encode(), as_float32(value), mavlink.MAV_PARAM_TYPE_REAL32, len(self.names), self.names.index(name))
+            for fn in list(self.listeners):
+                fn(self, "PARAM_VALUE", message)
+
+
+class TestBulkParameterWriter(unittest.TestCase):
+    """Tests for pipelined parameter writes"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.initial = {f"PARAM_{i:03d}": float(i) for i in range(300)}
+        self.vehicle = None
+
+    def tearDown(self):
+        """Clean up after each test"""
+        if self.vehicle is not None:
+            self.vehicle.stop()
+
+    def test_pipelined_write(self):
+        """Test only changed parameters are sent, with a bounded window, much faster than one at a time"""
+        self.vehicle = EchoingVehicle(self.initial, latency=0.02)
+        requested = dict(self.initial)
+        for i in range(0, 300, 2):
+            requested[f"PARAM_{i:03d}"] = i + 0.25
+
+        writer = BulkParameterWriter(self.vehicle, window=10, timeout=0.5)
+        report = writer.write(requested)
+
+        self.assertEqual(report.counts, {CONFIRMED: 150, UNCHANGED: 150})
+        self.assertTrue(report.succeeded)
+        self.assertEqual(sum(self.vehicle.sets.values()), 150)
+        self.assertLessEqual(self.vehicle.max_in_flight, 10)
+        self.assertEqual(self.vehicle.parameters["PARAM_100"], 100.25)
+        # 150 round trips of 20 ms one at a time would take 3 s
+        self.assertLess(report.elapsed, 1.0)
+        self.assertIsNotNone(report.results[0].rtt)
+
+    def test_retries_rejections_and_unknown(self):
+        """Test lost sets are resent, clamped values are reported and unknown names are skipped"""
+        self.vehicle = EchoingVehicle(self.initial, latency=0.005, drop_first=["PARAM_001"],
+                                      ignore=["PARAM_002"], limits={"PARAM_003": 10.0})
+        writer = BulkParameterWriter(self.vehicle, window=4, timeout=0.1, retries=2)
+
+        report = writer.write({"param_001": 1.5, "PARAM_002": 2.5, "PARAM_003": 50, "NOT_A_PARAM": 1})
+        rows = {row["name"]: row for row in report.as_rows()}
+
+        self.assertEqual(rows["PARAM_001"]["status"], CONFIRMED)
+        self.assertEqual(rows["PARAM_001"]["attempts"], 2)
+        self.assertEqual(rows["PARAM_002"]["status"], TIMEOUT)
+        self.assertEqual(rows["PARAM_002"]["attempts"], 3)
+        self.assertEqual(rows["PARAM_003"]["status"], REJECTED)
+        self.assertEqual(rows["PARAM_003"]["final"], 10.0)
+        self.assertEqual(rows["NOT_A_PARAM"]["status"], UNKNOWN)
+        self.assertEqual(self.vehicle.sets["NOT_A_PARAM"], 0)
+        self.assertFalse(report.succeeded)
+        self.assertEqual([result.name for result in report.failed], ["PARAM_002", "PARAM_003", "NOT_A_PARAM"])
+
+        table = report.format_table()
+        self.assertIn("PARAM_003", table)
+        self.assertIn("rejected", table)
+        self.assertTrue(table.splitlines()[-1].startswith("4 parameters"))
+
+    def test_load_parameters_from_file_applies_in_bulk(self):
+        """Test ParameterManager applies a parameter file through the bulk writer"""
+        self.vehicle = EchoingVehicle(self.initial, latency=0.01)
+        manager = ParameterManager(self.vehicle)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".param", delete=False) as f:
+            f.write("# test file\n")
+            for i in range(300):
+                f.write(f"PARAM_{i:03d}={i + 1 if i < 100 else i}\n")
+            path = f.name
+        try:
+            start = time.monotonic()
+            parameters = manager.load_parameters_from_file(path, apply=True)
+            elapsed = time.monotonic() - start
+        finally:
+            os.unlink(path)
+
+        self.assertEqual(len(parameters), 300)
+        self.assertEqual(manager.last_write_report.counts, {CONFIRMED: 100, UNCHANGED: 200})
+        self.assertEqual(self.vehicle.parameters["PARAM_050"], 51.0)
+        self.assertLess(elapsed, 2.0)
@@ -0,0 +1,116 @@
+# src/tests/test_plan_scheduler.py
+import unittest
+import threading
+import time
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from PyQt6.QtCore import QCoreApplication
+
+# Import the module to test
+from src.planning.plan_scheduler import PlanScheduler
+
+
+def process_events_until(condition, timeout=5.0):
+    """Spin the Qt event loop until condition() holds or the timeout expires"""
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+class TestPlanScheduler(unittest.TestCase):
+    """Tests for the debounced off-thread plan scheduler"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application once"""
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        """Set up for each test"""
+        self.calls = []
+        self.results = []
+        self.main_thread = threading.get_ident()
+
+    def _make_scheduler(self, plan_function, **kwargs):
+        scheduler = PlanScheduler(plan_function, **kwargs)
+        scheduler.plan_ready.connect(lambda gen, result: self.results.append((gen, result)))
+        return scheduler
+
+    def test_burst_is_coalesced(self):
+        """Test a burst of requests results in one planning run with the latest payload"""
+        def plan(payload, is_cancelled):
+            self.calls.append((payload["value"], threading.get_ident()))
+            return payload["value"] * 2
+
+        scheduler = self._make_scheduler(plan, debounce_ms=50, max_wait_ms=10000)
+        for value in range(30):
+            last_generation = scheduler.request({"value": value})
+
+        self.assertTrue(process_events_until(lambda: self.results))
+        scheduler.wait_for_done()
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.calls[0][0], 29)
+        self.assertNotEqual(self.calls[0][1], self.main_thread)
+        self.assertEqual(self.results, [(last_generation, 58)])
+
+    def test_max_wait_during_long_burst(self):
+        """Test a never-ending burst still dispatches after max_wait_ms"""
+        scheduler = self._make_scheduler(lambda payload, _: payload["value"],
+                                         debounce_ms=100, max_wait_ms=150)
+        deadline = time.time() + 0.6
+        value = 0
+        while time.time() < deadline:
+            scheduler.request({"value": value})
+            value += 1
+            QCoreApplication.processEvents()
+            time.sleep(0.02)
+
+        process_events_until(lambda: scheduler.stats["dispatched"] >= 2, timeout=1.0)
+        self.assertGreaterEqual(scheduler.stats["dispatched"], 2)
+        scheduler.wait_for_done()
+
+    def test_stale_result_is_discarded(self):
+        """Test a result superseded while planning never reaches plan_ready"""
+        release = threading.Event()
+        cancelled_seen = []
+
+        def plan(payload, is_cancelled):
+            if payload["value"] == "slow":
+                release.wait(5)
+                cancelled_seen.append(is_cancelled())
+            return payload["value"]
+
+        scheduler = self._make_scheduler(plan, debounce_ms=10)
+        scheduler.request({"value": "slow"})
+        self.assertTrue(process_events_until(lambda: scheduler.stats["dispatched"] == 1))
+
+        latest = scheduler.request({"value": "fast"})
+        self.assertTrue(process_events_until(lambda: self.results))
+        release.set()
+        scheduler.wait_for_done()
+        process_events_until(lambda: scheduler.stats["discarded"] == 1)
+
+        self.assertEqual(self.results, [(latest, "fast")])
+        self.assertEqual(cancelled_seen, [True])
+        self.assertEqual(scheduler.stats["discarded"], 1)
+
+    def test_failure_is_reported(self):
+        """Test exceptions in the plan function surface through plan_failed"""
+        def plan(payload, is_cancelled):
+            raise ValueError("bad boundary")
+
+        errors = []
+        scheduler = self._make_scheduler(plan, debounce_ms=10)
+        scheduler.plan_failed.connect(lambda gen, error: errors.append(error))
+        scheduler.request({})
+
+        self.assertTrue(process_events_until(lambda: errors))
+        self.assertIn("bad boundary", errors[0])
+        self.assertEqual(self.results, [])
@@ -0,0 +1,98 @@
+# src/tests/test_raster_tiles.py
+import unittest
+import io
+from concurrent.futures import Future
+import sys
+import os
+
+import numpy as np
+from PIL import Image
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Import the module to test
+from src.mapping.raster_tiles import RasterTileRenderer, TRANSPARENT_TILE, build_lut, COLORMAPS
+from src.mapping.tiles import lat_lon_to_tile
+
+# About 1 km around UCLA
+BOUNDS = (34.068, -118.450, 34.078, -118.438)
+ZOOM = 16
+
+
+def decode(png):
+    return np.array(Image.open(io.BytesIO(png)).convert("RGBA"))
+
+
+class TestRasterTiles(unittest.TestCase):
+    """Tests for the raster overlay tile renderer"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.renderer = RasterTileRenderer(cache_size=4)
+        data = np.linspace(0.0, 1.0, 100 * 100, dtype=np.float32).reshape(100, 100)
+        self.renderer.set_layer("Probability", data, BOUNDS, "probability", (0.0, 1.0))
+        self.center_tile = lat_lon_to_tile(34.073, -118.444, ZOOM)
+
+    def test_lut(self):
+        """Test lookup tables span the ramp end to end"""
+        lut = build_lut(COLORMAPS["coverage"])
+        self.assertEqual(lut.shape, (256, 4))
+        self.assertEqual(tuple(lut[0]), COLORMAPS["coverage"][0][1])
+        self.assertEqual(tuple(lut[-1]), COLORMAPS["coverage"][-1][1])
+
+    def test_tile_inside_raster(self):
+        """Test a tile over the raster is colourised and fully opaque-ish"""
+        x, y = self.center_tile
+        rgba = decode(self.renderer.render_tile("Probability", ZOOM, x, y))
+        self.assertEqual(rgba.shape, (256, 256, 4))
+        self.assertTrue((rgba[..., 3] > 0).any())
+        # Values grow southwards, so the ramp changes between top and bottom rows
+        self.assertFalse(np.array_equal(rgba[0], rgba[-1]))
+
+    def test_tile_outside_raster(self):
+        """Test tiles away from the raster are the shared transparent tile"""
+        x, y = lat_lon_to_tile(40.0, -100.0, ZOOM)
+        self.assertIs(self.renderer.render_tile("Probability", ZOOM, x, y), TRANSPARENT_TILE)
+        self.assertEqual(self.renderer.stats["rendered"], 0)
+
+    def test_nan_is_transparent(self):
+        """Test NaN cells are not drawn"""
+        self.renderer.set_layer("Coverage", np.full((10, 10), np.nan), BOUNDS, "coverage", (0, 1))
+        x, y = self.center_tile
+        rgba = decode(self.renderer.render_tile("Coverage", ZOOM, x, y))
+        self.assertEqual(rgba[..., 3].max(), 0)
+
+    def test_list_data(self):
+        """Test nested lists are accepted and non-2D data is rejected"""
+        self.renderer.set_layer("Coverage", [[0.0, 0.5], [0.5, 1.0]], BOUNDS, "coverage", (0, 1))
+        x, y = self.center_tile
+        rgba = decode(self.renderer.render_tile("Coverage", ZOOM, x, y))
+        self.assertTrue((rgba[..., 3] > 0).any())
+
+        with self.assertRaises(ValueError):
+            self.renderer.set_layer("Flat", [0.0, 0.5, 1.0], BOUNDS)
+
+    def test_cache_and_invalidation(self):
+        """Test tiles are cached until the layer is replaced"""
+        x, y = self.center_tile
+        first = self.renderer.render_tile("Probability", ZOOM, x, y)
+        self.assertIs(self.renderer.render_tile("Probability", ZOOM, x, y), first)
+        self.assertEqual(self.renderer.stats["hits"], 1)
+
+        self.renderer.set_layer("Probability", np.zeros((10, 10)), BOUNDS, "probability", (0, 1))
+        self.assertNotEqual(self.renderer.render_tile("Probability", ZOOM, x, y), first)
+        self.assertEqual(self.renderer.overlay_layers()[0]["version"], 1)
+
+    def test_resolve(self):
+        """Test the mapview://overlays/ route"""
+        x, y = self.center_tile
+        # Rendered off the calling thread, then served from the cache
+        future = self.renderer.resolve(f"Probability/{ZOOM}/{x}/{y}.png")
+        self.assertIsInstance(future, Future)
+        data, mime_type = future.result(5)
+        self.assertEqual(mime_type, "image/png")
+        self.assertEqual(self.renderer.resolve(f"Probability/{ZOOM}/{x}/{y}.png"), (data, "image/png"))
+        self.assertEqual(self.renderer.stats["rendered"], 1)
+        self.assertIsNone(self.renderer.resolve(f"Missing/{ZOOM}/{x}/{y}.png"))
+        self.assertIsNone(self.renderer.resolve("Probability/bad"))
@@ -0,0 +1,202 @@
+# src/tests/test_snapshot_service.py
+import unittest
+import tempfile
+import shutil
+import time
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from PyQt6.QtCore import QCoreApplication, QObject, QTimer, QUrl, pyqtSignal
+
+try:
+    import PyQt6.QtWebEngineWidgets
+except ImportError as e:
+    raise unittest.SkipTest(f"QtWebEngine is not available: {e}")
+
+# Import the module to test
+from src.mapping.snapshot_service import MapSnapshotService, PENDING_TILES_JS
+
+
+def process_events_until(condition, timeout=5.0):
+    """Spin the Qt event loop until condition() holds or the timeout expires"""
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+    return condition()
+
+
+class StubPage:
+    """Page that answers the tile poll from a script of pending counts"""
+
+    def __init__(self):
+        self.pending = []
+        self.polls = 0
+        self.scripts = []
+
+    def runJavaScript(self, script, callback=None):
+        if script == PENDING_TILES_JS:
+            self.polls += 1
+            pending = self.pending.pop(0) if self.pending else 0
+            QTimer.singleShot(0, lambda: callback(pending))
+        else:
+            self.scripts.append(script)
+
+
+class StubImage:
+    """Grabbed view contents"""
+
+    def save(self, path, fmt):
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG")
+        return True
+
+
+class StubView(QObject):
+    """Stands in for the offscreen QWebEngineView"""
+
+    loadFinished = pyqtSignal(bool)
+
+    def __init__(self):
+        super().__init__()
+        self.stub_page = StubPage()
+        self.current_url = QUrl()
+        self.loads = []
+        self.fail_loads = 0
+        self.closed = False
+
+    def page(self):
+        return self.stub_page
+
+    def setUrl(self, url):
+        self.current_url = url
+        self.loads.append(url)
+        ok = self.fail_loads == 0
+        self.fail_loads = max(0, self.fail_loads - 1)
+        QTimer.singleShot(0, lambda: self.loadFinished.emit(ok))
+
+    def url(self):
+        return self.current_url
+
+    def resize(self, width, height):
+        self.size = (width, height)
+
+    def grab(self):
+        return StubImage()
+
+    def close(self):
+        self.closed = True
+
+
+class StubConfig:
+    """Config with only the snapshot directory set"""
+
+    def __init__(self, snapshot_dir):
+        self.values = {"paths.snapshots": snapshot_dir}
+
+    def get(self, path, default=None):
+        return self.values.get(path, default)
+
+
+class TestSnapshotService(unittest.TestCase):
+    """Tests for queueing and tile polling in MapSnapshotService"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application once"""
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        """Set up for each test"""
+        self.directory = tempfile.mkdtemp()
+        self.view = StubView()
+        self.service = MapSnapshotService(config=StubConfig(self.directory), view=self.view,
+                                          poll_interval_ms=5, settle_ms=0)
+        self.ready = []
+        self.failed = []
+        self.drained = []
+        self.service.snapshot_ready.connect(lambda job_id, path: self.ready.append((job_id, path)))
+        self.service.snapshot_failed.connect(lambda job_id, error: self.failed.append(job_id))
+        self.service.queue_drained.connect(lambda: self.drained.append(True))
+        self.waypoints = [(34.0734, -118.4449), (34.0740, -118.4440), (34.0746, -118.4449)]
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.service.shutdown()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_queued_jobs_run_in_order(self):
+        """Test jobs submitted during warm-up run one after another once the view is ready"""
+        job_ids = [self.service.submit(waypoints=self.waypoints, altitude=50 + i) for i in range(3)]
+        self.assertEqual(self.service.pending(), 3)
+
+        self.assertTrue(process_events_until(lambda: self.drained))
+
+        self.assertEqual([job_id for job_id, _ in self.ready], job_ids)
+        for job_id, path in self.ready:
+            self.assertEqual(path, os.path.join(self.directory, f"snapshot_{job_id}.png"))
+            self.assertTrue(os.path.exists(path))
+        # Warm-up page plus one page per job, each framed on the flight path
+        self.assertEqual(len(self.view.loads), 4)
+        self.assertEqual(len(self.view.stub_page.scripts), 3)
+
+        stats = self.service.get_stats()
+        self.assertEqual(stats["completed"], 3)
+        self.assertEqual(stats["pending"], 0)
+        self.assertGreater(stats["snapshots_per_second"], 0)
+
+    def test_capture_waits_for_tiles(self):
+        """Test the capture happens only once no tile layer is loading"""
+        self.view.stub_page.pending = [-1, 2, 1, 0]
+        self.service.submit(waypoints=self.waypoints)
+
+        self.assertTrue(process_events_until(lambda: self.ready))
+
+        self.assertEqual(self.view.stub_page.polls, 4)
+        self.assertEqual(self.service.get_stats()["tile_timeouts"], 0)
+
+    def test_tile_timeout_captures_anyway(self):
+        """Test a map whose tiles never finish loading is still captured after the timeout"""
+        self.service.tile_timeout_ms = 50
+        self.view.stub_page.pending = [1] * 1000
+        self.service.submit(waypoints=self.waypoints)
+
+        self.assertTrue(process_events_until(lambda: self.ready))
+
+        self.assertEqual(self.service.get_stats()["tile_timeouts"], 1)
+
+    def test_same_document_is_not_reloaded(self):
+        """Test a job showing the previous job's map skips the page load"""
+        self.service.submit(waypoints=self.waypoints)
+        self.service.submit(waypoints=self.waypoints, bounds=(34.07, -118.45, 34.08, -118.44))
+
+        self.assertTrue(process_events_until(lambda: self.drained))
+
+        self.assertEqual(len(self.ready), 2)
+        self.assertEqual(len(self.view.loads), 2)
+
+    def test_failed_load_moves_on(self):
+        """Test a page that fails to load reports the job and runs the next one"""
+        self.assertTrue(process_events_until(lambda: self.service._ready))
+        self.view.fail_loads = 1
+        first = self.service.submit(waypoints=self.waypoints)
+        second = self.service.submit(waypoints=self.waypoints, altitude=80)
+
+        self.assertTrue(process_events_until(lambda: self.drained))
+
+        self.assertEqual(self.failed, [first])
+        self.assertEqual([job_id for job_id, _ in self.ready], [second])
+        self.assertEqual(self.service.get_stats()["failed"], 1)
+
+    def test_explicit_output_path(self):
+        """Test an explicit output path overrides the configured directory"""
+        path = os.path.join(self.directory, "nested", "plan.png")
+        job_id = self.service.submit(path, waypoints=self.waypoints)
+
+        self.assertTrue(process_events_until(lambda: self.ready))
+
+        self.assertEqual(self.ready, [(job_id, path)])
+        self.assertTrue(os.path.exists(path))
@@ -0,0 +1,95 @@
+# src/tests/test_state_consistency.py
+import unittest
+import threading
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+# Import the modules to test
+from src.drone.drone_state import DroneState
+
+WRITERS = 4
+WRITES_PER_THREAD = 5000
+
+
+class TestStateConsistency(unittest.TestCase):
+    """Stress tests for consistent cross-thread state reads"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.state = DroneState()
+        self.errors = []
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.state.clear_vehicle()
+
+    def check_record(self, record, source):
+        # Every write sets all four position fields to the same value
+        values = (record["latitude"], record["longitude"], record["altitude"], record["relative_altitude"])
+        if len(set(values)) != 1:
+            self.errors.append((source, values))
+
+    def write(self, writer):
+        for i in range(WRITES_PER_THREAD):
+            value = float(writer * WRITES_PER_THREAD + i + 1)
+            self.state._write(latitude=value, longitude=value, altitude=value,
+                              relative_altitude=value, roll=float(writer))
+
+    def read(self, done):
+        last_version = -1
+        while not done.is_set():
+            snapshot = self.state.get_snapshot()
+            self.check_record(snapshot, "snapshot")
+            self.check_record(self.state.get_state(), "get_state")
+            if snapshot.version < last_version:
+                self.errors.append(("version", last_version, snapshot.version))
+            last_version = snapshot.version
+
+    def test_concurrent_writers_and_readers(self):
+        """Test readers and callbacks never see a record mixing two writes"""
+        versions = []
+
+        def on_change(snapshot):
+            self.check_record(snapshot, "callback")
+            versions.append(snapshot.version)
+
+        self.state.register_state_change_callback(on_change, max_rate_hz=None)
+
+        done = threading.Event()
+        readers = [threading.Thread(target=self.read, args=(done,)) for _ in range(2)]
+        writers = [threading.Thread(target=self.write, args=(n,)) for n in range(WRITERS)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(self.errors, [])
+        final = self.state.get_snapshot()
+        self.assertEqual(final.version, WRITERS * WRITES_PER_THREAD)
+        # Callbacks never go back to an older version and end on the latest
+        self.assertEqual(versions, sorted(set(versions)))
+        self.assertEqual(versions[-1], final.version)
+
+    def test_direct_assignment_is_published_on_read(self):
+        """Test attributes assigned directly are published together on the next read"""
+        first = self.state.get_snapshot()
+        self.state.latitude = 40.0
+        self.state.longitude = -105.0
+        # Not visible to readers until published
+        self.assertIs(self.state._snapshot, first)
+
+        snapshot = self.state.get_snapshot()
+        self.assertEqual(snapshot.version, first.version + 1)
+        self.assertEqual((snapshot.latitude, snapshot.longitude), (40.0, -105.0))
+        self.assertEqual(self.state.latitude, 40.0)
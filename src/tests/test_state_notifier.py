@@ -0,0 +1,115 @@
+# src/tests/test_state_notifier.py
+import unittest
+import time
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+# Import the modules to test
+from src.drone.drone_state import DroneState
+from src.drone.state_snapshot import StateField
+
+
+class TestStateNotifier(unittest.TestCase):
+    """Tests for rate-limited state change notifications"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.state = DroneState()
+        self.received = []
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.state.clear_vehicle()
+
+    def callback(self, snapshot):
+        self.received.append(snapshot)
+
+    def wait_for(self, count, timeout=2.0):
+        deadline = time.time() + timeout
+        while len(self.received) < count and time.time() < deadline:
+            time.sleep(0.005)
+        return len(self.received) >= count
+
+    def test_burst_is_coalesced(self):
+        """Test a burst is delivered as one immediate call plus one trailing call"""
+        self.state.register_state_change_callback(self.callback, max_rate_hz=10)
+
+        for i in range(50):
+            self.state.roll = float(i + 1)
+            if i == 25:
+                self.state.latitude = 40.0
+            self.state._notify_state_change()
+
+        self.assertEqual(len(self.received), 1)
+        self.assertTrue(self.wait_for(2))
+        time.sleep(0.15)
+
+        self.assertEqual(len(self.received), 2)
+        trailing = self.received[1]
+        self.assertEqual(trailing.roll, 50.0)
+        # The trailing call reports everything that changed since the first one
+        self.assertEqual(trailing.changed, StateField.ROLL | StateField.LATITUDE)
+        stats = self.state.get_notification_stats()
+        self.assertEqual(stats["delivered"], 2)
+        self.assertEqual(stats["coalesced"], 48)
+        self.assertGreater(stats["subscribers"][0]["latency_ms_max"], 0.0)
+
+    def test_safety_fields_bypass_rate_limit(self):
+        """Test arming and mode changes are delivered immediately"""
+        self.state.register_state_change_callback(self.callback, max_rate_hz=1)
+
+        self.state.roll = 1.0
+        self.state._notify_state_change()
+        self.state.roll = 2.0
+        self.state._notify_state_change()
+        self.state.armed = True
+        self.state._notify_state_change()
+        self.state.mode = "GUIDED"
+        self.state._notify_state_change()
+
+        self.assertEqual(len(self.received), 3)
+        self.assertEqual(self.received[1].changed, StateField.ROLL | StateField.ARMED)
+        self.assertEqual(self.received[2].mode, "GUIDED")
+        self.assertEqual(self.state.get_notification_stats()["bypassed"], 2)
+
+    def test_field_filter(self):
+        """Test a callback only hears about the fields it subscribed to"""
+        self.state.register_state_change_callback(self.callback, max_rate_hz=None,
+                                                  fields=StateField.BATTERY)
+
+        self.state.roll = 1.0
+        self.state._notify_state_change()
+        self.state.battery_level = 80.0
+        self.state._notify_state_change()
+
+        self.assertEqual(len(self.received), 1)
+        self.assertEqual(self.received[0].battery_level, 80.0)
+
+    def test_unlimited_rate(self):
+        """Test max_rate_hz=None delivers every change synchronously"""
+        self.state.register_state_change_callback(self.callback, max_rate_hz=None)
+
+        for i in range(20):
+            self.state.roll = float(i + 1)
+            self.state._notify_state_change()
+
+        self.assertEqual(len(self.received), 20)
+
+    def test_unregister(self):
+        """Test unregistered callbacks are no longer called"""
+        self.state.register_state_change_callback(self.callback)
+        self.state.unregister_state_change_callback(self.callback)
+
+        self.state.roll = 1.0
+        self.state._notify_state_change()
+
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.state.state_change_callbacks, [])
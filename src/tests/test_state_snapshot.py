@@ -0,0 +1,89 @@
+# src/tests/test_state_snapshot.py
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+# Import the modules to test
+from src.drone.drone_state import DroneState
+from src.drone.state_snapshot import DroneStateSnapshot, StateField, STATE_FIELDS
+
+
+class TestDroneStateSnapshot(unittest.TestCase):
+    """Tests for shared, diff-based state snapshots"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.state = DroneState()
+
+    def test_snapshot_behaves_like_state_dict(self):
+        """Test a snapshot can be used wherever the get_state() dict was"""
+        self.state.latitude = 40.0
+        self.state.mode = "GUIDED"
+        snapshot = self.state.get_snapshot()
+
+        self.assertEqual(snapshot["latitude"], 40.0)
+        self.assertEqual(snapshot.get("mode"), "GUIDED")
+        self.assertEqual(snapshot.latitude, 40.0)
+        self.assertEqual(list(snapshot.keys()), list(STATE_FIELDS))
+        self.assertEqual(snapshot, self.state.get_state())
+        self.assertEqual(snapshot.as_dict(), self.state.get_state())
+        self.assertIsNone(snapshot.get("missing"))
+
+    def test_snapshot_is_immutable(self):
+        """Test snapshots can't be modified by subscribers"""
+        snapshot = self.state.get_snapshot()
+        with self.assertRaises(AttributeError):
+            snapshot.latitude = 1.0
+        with self.assertRaises(TypeError):
+            snapshot["latitude"] = 1.0
+        self.assertFalse(hasattr(snapshot, "__dict__"))
+
+    def test_version_and_changed_mask(self):
+        """Test a new version records exactly the fields that changed"""
+        first = self.state.get_snapshot()
+        self.assertIs(self.state.get_snapshot(), first)
+
+        self.state.latitude = 40.0
+        self.state.armed = True
+        second = self.state.get_snapshot()
+
+        self.assertEqual(second.version, first.version + 1)
+        self.assertEqual(second.changed, StateField.LATITUDE | StateField.ARMED)
+        self.assertTrue(second.has_changed(StateField.POSITION))
+        self.assertFalse(second.has_changed(StateField.ATTITUDE))
+
+    def test_one_snapshot_shared_by_callbacks(self):
+        """Test every callback receives the same snapshot object"""
+        received = []
+        self.state.register_state_change_callback(received.append)
+        self.state.register_state_change_callback(lambda s: received.append(s))
+
+        attitude = MagicMock(roll=0.1, pitch=0.2, yaw=0.3)
+        self.state._update_attitude(None, 'attitude', attitude)
+
+        self.assertEqual(len(received), 2)
+        self.assertIs(received[0], received[1])
+        self.assertTrue(received[0].has_changed(StateField.ATTITUDE))
+        self.assertIsInstance(received[0], DroneStateSnapshot)
+
+    def test_unchanged_state_is_not_notified(self):
+        """Test a notification without any field change reaches no callback"""
+        received = []
+        self.state.register_state_change_callback(received.append)
+
+        self.state._notify_state_change()
+        self.state.heading = 90
+        self.state._notify_state_change()
+        self.state._notify_state_change()
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].changed, StateField.HEADING)
@@ -0,0 +1,134 @@
+# src/tests/test_telemetry_history.py
+import unittest
+import threading
+import sys
+import os
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+# Import the modules to test
+from src.drone.drone_state import DroneState
+from src.drone.telemetry_history import TelemetryHistory
+
+
+def sample(t, altitude=0.0, battery=100.0):
+    return {"relative_altitude": altitude, "battery_level": battery, "armed": True,
+            "mode": "GUIDED", "last_update_time": t}
+
+
+class TestTelemetryHistory(unittest.TestCase):
+    """Tests for the telemetry ring buffer"""
+
+    def test_window_is_zero_copy(self):
+        """Test windows are contiguous views of the underlying buffer"""
+        history = TelemetryHistory(capacity=100)
+        for i in range(250):
+            history.append(sample(float(i), altitude=float(i)))
+
+        window = history.window()
+        self.assertEqual(len(window), 100)
+        self.assertTrue(np.shares_memory(window, history._buffer))
+        self.assertEqual(window["relative_altitude"][0], 150.0)
+        self.assertEqual(window["relative_altitude"][-1], 249.0)
+        self.assertTrue(np.all(np.diff(window["time"]) > 0))
+
+    def test_time_window(self):
+        """Test reading the last N seconds of one field"""
+        history = TelemetryHistory(capacity=1000)
+        for i in range(600):
+            history.append(sample(i * 0.1, altitude=i * 0.1))
+
+        times, altitude = history.series("relative_altitude", seconds=10.0)
+        self.assertEqual(len(times), 101)
+        self.assertAlmostEqual(float(times[0]), 49.9, places=3)
+        self.assertAlmostEqual(history.rate_of_change("relative_altitude", 10.0), 1.0, places=3)
+        self.assertEqual(history.latest()["armed"], 1)
+
+        with self.assertRaises(KeyError):
+            history.series("mode")
+
+    def test_empty_and_partial(self):
+        """Test reads before the buffer has wrapped"""
+        history = TelemetryHistory(capacity=10)
+        self.assertEqual(len(history.window()), 0)
+        self.assertIsNone(history.latest())
+
+        for i in range(3):
+            history.append(sample(float(i + 1)))
+        self.assertEqual(list(history.window()["time"]), [1.0, 2.0, 3.0])
+
+    def test_concurrent_reader(self):
+        """Test a view copied before it is overwritten is consistent while the writer runs"""
+        history = TelemetryHistory(capacity=200)
+        errors = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                before = history.total_samples
+                times = history.window()[-50:]["time"].copy()
+                # Only copies made within the view's guaranteed lifetime count
+                if history.total_samples - before > history.capacity - 50:
+                    continue
+                if len(times) > 1 and not np.all(np.diff(times) == 1.0):
+                    errors.append(times)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        for i in range(20000):
+            history.append(sample(float(i + 1)))
+        done.set()
+        reader.join()
+
+        self.assertEqual(errors, [])
+
+    def test_attach_records_state_changes(self):
+        """Test the history records samples from DroneState"""
+        state = DroneState()
+        history = TelemetryHistory(capacity=10)
+        history.attach(state, max_rate_hz=None)
+
+        state.relative_altitude = 12.5
+        state.last_update_time = 100.0
+        state._notify_state_change()
+        # A timestamp-only change isn't a new sample
+        state.last_update_time = 101.0
+        state._notify_state_change()
+
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history.latest()["relative_altitude"], 12.5)
+        history.detach()
+        state.clear_vehicle()
+
+    def test_time_going_backwards_starts_new_segment(self):
+        """Test a replay seek back drops the older samples instead of breaking window queries"""
+        history = TelemetryHistory(capacity=50)
+        for i in range(80):
+            history.append(sample(100.0 + i, altitude=float(i)))
+
+        # Seek back to t=110 and replay from there
+        for i in range(5):
+            history.append(sample(110.0 + i, altitude=10.0 + i))
+
+        self.assertEqual(len(history), 5)
+        self.assertEqual(history.segments, 2)
+        self.assertEqual(list(history.window()["time"]), [110.0, 111.0, 112.0, 113.0, 114.0])
+        self.assertEqual(len(history.window(2.0)), 3)
+        self.assertEqual(history.latest()["relative_altitude"], 14.0)
+        self.assertAlmostEqual(history.rate_of_change("relative_altitude", 10.0), 1.0, places=3)
+
+        # A repeated timestamp is not a jump back
+        history.append(sample(114.0, altitude=14.0))
+        self.assertEqual(history.segments, 2)
+
+        history.clear()
+        self.assertEqual(len(history), 0)
+        self.assertIsNone(history.latest())
@@ -0,0 +1,135 @@
+# src/tests/test_telemetry_replay.py
+import unittest
+import tempfile
+import shutil
+import time
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+# Import the modules to test
+from src.drone.drone_state import DroneState
+from src.drone.telemetry_recorder import TLOG_TIMESTAMP
+from src.drone.telemetry_replay import ReplayVehicle, index_tlog
+
+START_TIME = 1700000000.0
+
+
+def write_flight_log(path, seconds=2.0, rate_hz=50):
+    """Write a synthetic climb: position, battery and GPS at rate_hz, armed in GUIDED"""
+    mav = mavlink.MAVLink(None, srcSystem=1, srcComponent=1)
+    records = []
+    count = int(seconds * rate_hz)
+    for i in range(count + 1):
+        t = START_TIME + i / rate_hz
+        messages = [
+            mavlink.MAVLink_global_position_int_message(
+                int(i * 10), int((40.0 + i * 1e-5) * 1e7), int(-105.0 * 1e7),
+                int((1600 + i) * 1000), int(i * 1000), 100, 0, -50, 9000),
+            mavlink.MAVLink_attitude_message(int(i * 10), 0.1, 0.2, 0.3, 0, 0, 0),
+            mavlink.MAVLink_sys_status_message(0, 0, 0, 0, 12600 - i, 150, max(0, 100 - i // 10), 0, 0, 0, 0, 0, 0),
+            mavlink.MAVLink_gps_raw_int_message(int(i * 10), 3, 0, 0, 0, 100, 150, 0, 0, 12),
+        ]
+        if i % rate_hz == 0:
+            # Armed, ArduCopter GUIDED (custom mode 4)
+            messages.append(mavlink.MAVLink_heartbeat_message(
+                mavlink.MAV_TYPE_QUADROTOR, mavlink.MAV_AUTOPILOT_ARDUPILOTMEGA,
+                mavlink.MAV_MODE_FLAG_SAFETY_ARMED | mavlink.MAV_MODE_FLAG_CUSTOM_MODE_ENABLED,
+                4, mavlink.MAV_STATE_ACTIVE, 3))
+        for message in messages:
+            records.append(TLOG_TIMESTAMP.pack(int(t * 1e6)) + bytes(message.pack(mav)))
+    with open(path, "wb") as f:
+        f.write(b"".join(records))
+    return count
+
+
+class TestTelemetryReplay(unittest.TestCase):
+    """Tests for replaying recorded telemetry"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "flight.tlog")
+        self.samples = write_flight_log(self.path)
+        self.vehicle = ReplayVehicle(self.path, speed=None)
+        self.state = DroneState()
+
+    def tearDown(self):
+        """Clean up after each test"""
+        self.vehicle.stop()
+        self.state.clear_vehicle()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_index(self):
+        """Test the log is indexed and corrupt bytes are skipped"""
+        self.assertAlmostEqual(self.vehicle.duration, 2.0)
+        self.assertEqual(self.vehicle.message_count, (self.samples + 1) * 4 + 3)
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+        times, offsets, lengths = index_tlog(b"\x00\x01\x02" + data)
+        self.assertEqual(len(times), self.vehicle.message_count)
+
+    def test_drives_drone_state(self):
+        """Test a full-speed replay leaves DroneState at the last recorded values"""
+        self.state.set_vehicle(self.vehicle)
+        self.vehicle.start()
+        self.assertTrue(self.vehicle.finished.wait(5.0))
+
+        state = self.state.get_state()
+        self.assertAlmostEqual(state["latitude"], 40.0 + self.samples * 1e-5)
+        self.assertAlmostEqual(state["relative_altitude"], float(self.samples))
+        self.assertAlmostEqual(state["roll"], 0.1, places=5)
+        self.assertAlmostEqual(state["battery_voltage"], (12600 - self.samples) / 1000.0)
+        self.assertEqual(state["gps_satellites"], 12)
+        self.assertTrue(state["armed"])
+        self.assertEqual(state["mode"], "GUIDED")
+        self.assertEqual(self.vehicle.get_stats()["messages"], self.vehicle.message_count)
+
+    def test_real_time_speed(self):
+        """Test playback follows the recorded timing at a speed multiple"""
+        self.vehicle.set_speed(10.0)
+        started = time.monotonic()
+        self.vehicle.start()
+        self.assertTrue(self.vehicle.finished.wait(5.0))
+        elapsed = time.monotonic() - started
+
+        # 2 s of telemetry at 10x
+        self.assertGreaterEqual(elapsed, 0.18)
+        self.assertLess(elapsed, 1.0)
+
+    def test_seek_primes_state(self):
+        """Test seeking applies the latest state before the new position"""
+        self.state.set_vehicle(self.vehicle)
+        self.vehicle.seek(1.0)
+
+        self.assertAlmostEqual(self.vehicle.position, 1.0)
+        self.assertAlmostEqual(self.state.relative_altitude, 49.0)
+        self.assertEqual(self.state.mode, "GUIDED")
+
+        self.vehicle.seek(0.0)
+        self.vehicle.run_to_end()
+        self.assertAlmostEqual(self.state.relative_altitude, float(self.samples))
+
+    def test_pause(self):
+        """Test a paused replay stops dispatching messages"""
+        self.vehicle.set_speed(1.0)
+        self.vehicle.start()
+        time.sleep(0.1)
+        self.vehicle.pause()
+        time.sleep(0.05)
+        replayed = self.vehicle.get_stats()["messages"]
+        time.sleep(0.1)
+
+        self.assertGreater(replayed, 0)
+        self.assertEqual(self.vehicle.get_stats()["messages"], replayed)
+        self.assertFalse(self.vehicle.is_playing)
@@ -0,0 +1,113 @@
+# src/tests/test_telemetry_streams.py
+import unittest
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Fix for DroneKit compatibility with Python 3.9+
+import collections
+import collections.abc
+collections.MutableMapping = collections.abc.MutableMapping
+
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+# Import the modules to test
+from src.drone.drone_connection import DroneConnection
+from src.drone.telemetry_streams import TelemetrySubscriptions
+
+
+class FakeHandler:
+    """Stand-in for DroneKit's MAVConnection"""
+
+    def __init__(self):
+        self.message_listeners = []
+
+    def forward_message(self, fn):
+        self.message_listeners.append(fn)
+
+    def receive(self, message, timestamp):
+        message._timestamp = timestamp
+        for fn in self.message_listeners:
+            fn(self, message)
+
+
+class FakeVehicle:
+    """Stand-in for a DroneKit Vehicle with a MAVLink link"""
+
+    def __init__(self):
+        self._handler = FakeHandler()
+        self.message_factory = mavlink.MAVLink(None)
+        self.sent = []
+
+    def send_mavlink(self, message):
+        self.sent.append(message)
+
+
+def attitude(boot_ms):
+    return mavlink.MAVLink_attitude_message(boot_ms, 0.1, 0.2, 0.3, 0, 0, 0)
+
+
+class TestTelemetrySubscriptions(unittest.TestCase):
+    """Tests for raw MAVLink subscriptions and stream rates"""
+
+    def setUp(self):
+        """Set up for each test"""
+        self.vehicle = FakeVehicle()
+        self.subscriptions = TelemetrySubscriptions()
+        self.subscriptions.attach(self.vehicle)
+
+    def test_per_type_callbacks_with_timestamps(self):
+        """Test callbacks only get their message type, with receive and boot times"""
+        received = []
+        self.subscriptions.subscribe("attitude", received.append)
+
+        self.vehicle._handler.receive(attitude(1234), 1700000000.5)
+        self.vehicle._handler.receive(mavlink.MAVLink_vfr_hud_message(1, 2, 90, 50, 10, 0), 1700000000.6)
+
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].type, "ATTITUDE")
+        self.assertEqual(received[0].received_at, 1700000000.5)
+        self.assertEqual(received[0].boot_time_ms, 1234)
+        self.assertAlmostEqual(received[0].roll, 0.1, places=5)
+        self.assertEqual(self.subscriptions.get_stats()["counts"], {"ATTITUDE": 1, "VFR_HUD": 1})
+
+        self.subscriptions.unsubscribe("ATTITUDE", received.append)
+        self.vehicle._handler.receive(attitude(1300), 1700000001.0)
+        self.assertEqual(len(received), 1)
+
+        self.subscriptions.detach()
+        self.assertEqual(self.vehicle._handler.message_listeners, [])
+
+    def test_unknown_message(self):
+        """Test subscribing to an unknown message type fails"""
+        with self.assertRaises(ValueError):
+            self.subscriptions.subscribe("NOT_A_MESSAGE", print)
+
+    def test_set_message_interval(self):
+        """Test stream rates are requested with SET_MESSAGE_INTERVAL"""
+        applied = self.subscriptions.apply_stream_rates(2.0, {"ATTITUDE": 50.0, "RC_CHANNELS": 0})
+
+        self.assertEqual(applied["ATTITUDE"], 50.0)
+        self.assertEqual(applied["VFR_HUD"], 2.0)
+        commands = {int(m.param1): m.param2 for m in self.vehicle.sent}
+        for m in self.vehicle.sent:
+            self.assertEqual(m.command, mavlink.MAV_CMD_SET_MESSAGE_INTERVAL)
+        self.assertEqual(commands[mavlink.MAVLINK_MSG_ID_ATTITUDE], 20000)
+        self.assertEqual(commands[mavlink.MAVLINK_MSG_ID_VFR_HUD], 500000)
+        # A rate of 0 stops the stream
+        self.assertEqual(commands[mavlink.MAVLINK_MSG_ID_RC_CHANNELS], -1)
+
+    def test_connection_uses_config_rates(self):
+        """Test DroneConnection requests rates from the drone config"""
+        connection = DroneConnection()
+        connection.vehicle = self.vehicle
+        connection.subscriptions.attach(self.vehicle)
+        self.vehicle.sent = []
+
+        applied = connection.apply_stream_rates()
+
+        self.assertEqual(applied["ATTITUDE"], 10.0)
+        self.assertEqual(applied["SYS_STATUS"], 2.0)
+
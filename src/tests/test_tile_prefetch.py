@@ -0,0 +1,194 @@
+# src/tests/test_tile_prefetch.py
+import unittest
+from unittest.mock import patch
+import threading
+import tempfile
+import shutil
+import sys
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Import the module to test
+from src.mapping.tiles import lat_lon_to_tile, tile_bounds, boundary_bounds
+from src.mapping.tile_prefetch import TileCache, TilePrefetcher
+
+
+class MockTileHandler(BaseHTTPRequestHandler):
+    """Serves a fake PNG for any /<layer>/<z>/<x>/<y>.png request"""
+
+    lock = threading.Lock()
+    requests_seen = []
+    active = 0
+    max_active = 0
+    fail_paths = set()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.requests_seen.append(self.path)
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        try:
+            threading.Event().wait(0.01)
+            if self.path in cls.fail_paths:
+                self.send_response(500)
+                self.end_headers()
+                return
+            body = b"\x89PNG" + self.path.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubConfig:
+    """Config holding a few dotted-path values"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, path, default=None):
+        return self.values.get(path, default)
+
+
+class TestTilePrefetch(unittest.TestCase):
+    """Tests for the tile prefetcher against a local mock tile server"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the mock tile server"""
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), MockTileHandler)
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        base = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.sources = {
+            "Satellite": {"url": base + "/sat/{z}/{x}/{y}.png", "attr": "", "subdomains": ""},
+            "Light": {"url": base + "/light/{z}/{x}/{y}.png", "attr": "", "subdomains": ""},
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the mock tile server"""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Set up for each test"""
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = TileCache(self.cache_dir)
+        self.boundary = [[34.0734, -118.4449], [34.0760, -118.4449], [34.0760, -118.4400]]
+        MockTileHandler.requests_seen = []
+        MockTileHandler.max_active = 0
+        MockTileHandler.fail_paths = set()
+
+    def tearDown(self):
+        """Clean up after each test"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_tile_math(self):
+        """Test tile index and bounds conversions agree"""
+        x, y = lat_lon_to_tile(34.0734, -118.4449, 16)
+        south, west, north, east = tile_bounds(x, y, 16)
+        self.assertTrue(south <= 34.0734 <= north)
+        self.assertTrue(west <= -118.4449 <= east)
+
+    def test_circle_boundary_bounds(self):
+        """Test the circle boundary format is expanded by its radius"""
+        south, west, north, east = boundary_bounds([[34.0, -118.0, 1000]])
+        self.assertAlmostEqual(north - south, 2000 / 111320.0, places=4)
+        self.assertLess(west, -118.0)
+        self.assertGreater(east, -118.0)
+
+    def test_prefetch_downloads_all_tiles(self):
+        """Test every planned tile is downloaded with progress reported"""
+        prefetcher = TilePrefetcher(self.cache, max_workers=8, per_host_limit=2, sources=self.sources)
+        planned = prefetcher.plan(self.boundary, [14, 15, 16])
+        updates = []
+
+        result = prefetcher.prefetch(self.boundary, [14, 15, 16], progress_callback=updates.append)
+
+        self.assertEqual(result["total"], len(planned))
+        self.assertEqual(result["downloaded"], len(planned))
+        self.assertEqual(result["failed"], 0)
+        self.assertGreater(result["bytes"], 0)
+        self.assertEqual(len(updates), len(planned))
+        self.assertEqual(updates[-1]["completed"], len(planned))
+        for tile in planned:
+            self.assertTrue(self.cache.contains(*tile))
+
+    def test_per_host_limit(self):
+        """Test concurrent requests to one host never exceed the limit"""
+        prefetcher = TilePrefetcher(self.cache, max_workers=8, per_host_limit=2, sources=self.sources)
+        prefetcher.prefetch(self.boundary, [15, 16, 17])
+
+        self.assertLessEqual(MockTileHandler.max_active, 2)
+
+    def test_prefetch_resumes(self):
+        """Test a second run skips tiles that are already cached"""
+        prefetcher = TilePrefetcher(self.cache, sources=self.sources)
+        first = prefetcher.prefetch(self.boundary, [15], layers=["Satellite"])
+        MockTileHandler.requests_seen = []
+
+        second = prefetcher.prefetch(self.boundary, [15, 16], layers=["Satellite"])
+
+        self.assertEqual(second["skipped"], first["total"])
+        self.assertEqual(len(MockTileHandler.requests_seen), second["total"] - first["total"])
+
+    def test_failed_tiles_are_retried_on_resume(self):
+        """Test failed tiles are counted and fetched by the next run"""
+        prefetcher = TilePrefetcher(self.cache, sources=self.sources)
+        layer, z, x, y = prefetcher.plan(self.boundary, [16], layers=["Light"])[0]
+        MockTileHandler.fail_paths = {f"/light/{z}/{x}/{y}.png"}
+
+        first = prefetcher.prefetch(self.boundary, [16], layers=["Light"])
+        self.assertEqual(first["failed"], 1)
+        self.assertFalse(self.cache.contains(layer, z, x, y))
+
+        MockTileHandler.fail_paths = set()
+        second = prefetcher.prefetch(self.boundary, [16], layers=["Light"])
+        self.assertEqual(second["downloaded"], 1)
+        self.assertTrue(self.cache.contains(layer, z, x, y))
+
+    def test_plan_rejects_oversized_jobs(self):
+        """Test jobs above the tile limit are refused"""
+        prefetcher = TilePrefetcher(self.cache, max_tiles=10, sources=self.sources)
+        with self.assertRaises(ValueError):
+            prefetcher.plan(self.boundary, [18, 19])
+
+    def test_cancel_before_thread_runs(self):
+        """Test a cancel() between start() and the worker thread running is kept"""
+        prefetcher = TilePrefetcher(self.cache, sources=self.sources)
+        results = []
+
+        # Hold the worker thread back until the prefetch has been cancelled
+        with patch.object(threading.Thread, "start"):
+            self.assertTrue(prefetcher.start(self.boundary, [15, 16], finished_callback=results.append))
+        prefetcher.cancel()
+        threading.Thread.start(prefetcher._thread)
+        prefetcher.wait(5)
+
+        self.assertTrue(results[0]["cancelled"])
+        self.assertEqual(results[0]["downloaded"], 0)
+        self.assertEqual(MockTileHandler.requests_seen, [])
+
+        # A new start() clears the earlier cancel
+        self.assertTrue(prefetcher.start(self.boundary, [15], finished_callback=results.append))
+        prefetcher.wait(5)
+        self.assertFalse(results[1]["cancelled"])
+        self.assertGreater(results[1]["downloaded"], 0)
+
+    def test_cache_directory_from_config(self):
+        """Test the default tile cache lives in the configured 'paths.tiles' directory"""
+        prefetcher = TilePrefetcher(sources=self.sources, config=StubConfig({"paths.tiles": self.cache_dir}))
+        self.assertEqual(prefetcher.cache.root, self.cache_dir)
+        self.assertEqual(TileCache().root, os.path.join("data", "tiles"))
@@ -0,0 +1,133 @@
+# src/tests/test_track_buffer.py
+import unittest
+import json
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from PyQt6.QtCore import QCoreApplication
+
+# Import the modules to test
+from src.mapping.track_buffer import TrackBuffer
+from src.mapping.live_track import LiveTrackPublisher
+
+# Roughly 1.1 m of latitude
+STEP = 0.00001
+
+
+class TestTrackBuffer(unittest.TestCase):
+    """Tests for the bounded track buffer"""
+
+    def test_points_since(self):
+        """Test only points newer than a sequence number are returned"""
+        track = TrackBuffer()
+        for i in range(5):
+            track.append(34.0 + i * STEP, -118.0, 10.0, float(i))
+
+        newest = track.points_since(3)
+        self.assertEqual([p[0] for p in newest], [4, 5])
+        self.assertEqual(track.points_since(5), [])
+
+    def test_evicted_points_are_reported(self):
+        """Test asking for points that already left the ring signals the gap"""
+        track = TrackBuffer(recent_capacity=10)
+        for i in range(25):
+            track.append(34.0 + i * STEP, -118.0, 10.0, float(i))
+
+        self.assertIsNone(track.points_since(3))
+        self.assertEqual([p[0] for p in track.points_since(15)], list(range(16, 26)))
+
+    def test_stationary_fixes_are_filtered(self):
+        """Test fixes closer than min_distance_m are not stored"""
+        track = TrackBuffer(min_distance_m=0.5)
+        self.assertTrue(track.append(34.0, -118.0, 10.0, 0.0))
+        self.assertFalse(track.append(34.0, -118.0, 10.0, 1.0))
+        self.assertEqual(len(track), 1)
+
+    def test_memory_is_bounded(self):
+        """Test a very long track stays within capacity and keeps its ends"""
+        track = TrackBuffer(recent_capacity=100, history_capacity=50)
+        for i in range(20000):
+            track.append(34.0 + i * STEP, -118.0, 10.0, float(i))
+
+        snapshot = track.snapshot()
+        self.assertLessEqual(len(snapshot), 150)
+        self.assertEqual(snapshot[0][0], 1)
+        self.assertEqual(snapshot[-1][0], 20000)
+        sequences = [p[0] for p in snapshot]
+        self.assertEqual(sequences, sorted(sequences))
+
+
+class TestLiveTrackPublisher(unittest.TestCase):
+    """Tests for pushing the track to the map page"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application once"""
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_only_new_points_are_pushed(self):
+        """Test each flush sends just the points added since the previous one"""
+        publisher = LiveTrackPublisher()
+        pushed = []
+        publisher.points_appended.connect(lambda points: pushed.append(json.loads(points)))
+
+        for i in range(3):
+            publisher._on_state_change({"latitude": 34.0 + i * STEP, "longitude": -118.0,
+                                        "relative_altitude": 20.0, "last_update_time": i})
+        publisher.flush()
+        publisher._on_state_change({"latitude": 34.1, "longitude": -118.0,
+                                    "relative_altitude": 20.0, "last_update_time": 4})
+        publisher.flush()
+        publisher.flush()
+
+        self.assertEqual([len(points) for points in pushed], [3, 1])
+        self.assertEqual(pushed[1][0][:2], [34.1, -118.0])
+
+    def test_no_fix_is_ignored(self):
+        """Test the 0, 0 position reported before a GPS fix is not recorded"""
+        publisher = LiveTrackPublisher()
+        publisher._on_state_change({"latitude": 0.0, "longitude": 0.0})
+        self.assertEqual(len(publisher.buffer), 0)
+
+    def test_snapshot_resets_page_track(self):
+        """Test a snapshot request sends the whole track and resets the push position"""
+        publisher = LiveTrackPublisher()
+        resets = []
+        pushed = []
+        publisher.track_reset.connect(lambda points: resets.append(json.loads(points)))
+        publisher.points_appended.connect(pushed.append)
+
+        for i in range(4):
+            publisher._on_state_change({"latitude": 34.0 + i * STEP, "longitude": -118.0})
+        publisher.request_snapshot()
+        publisher.flush()
+
+        self.assertEqual(len(resets[0]), 4)
+        self.assertEqual(pushed, [])
+
+    def test_overflow_resends_whole_track(self):
+        """Test points evicted between flushes trigger a full resync instead of a gap"""
+        publisher = LiveTrackPublisher(TrackBuffer(recent_capacity=10, history_capacity=100))
+        resets = []
+        pushed = []
+        publisher.track_reset.connect(lambda points: resets.append(json.loads(points)))
+        publisher.points_appended.connect(lambda points: pushed.append(json.loads(points)))
+
+        publisher._on_state_change({"latitude": 34.0, "longitude": -118.0})
+        publisher.flush()
+        for i in range(1, 30):
+            publisher._on_state_change({"latitude": 34.0 + i * STEP, "longitude": -118.0})
+        publisher.flush()
+
+        self.assertEqual(len(pushed), 1)
+        self.assertEqual(len(resets), 1)
+        self.assertEqual(len(resets[0]), 30)
+        self.assertEqual(publisher.stats["resyncs"], 1)
+
+        # Incremental pushes resume after the resync
+        publisher._on_state_change({"latitude": 34.1, "longitude": -118.0})
+        publisher.flush()
+        self.assertEqual(pushed[-1], [[34.1, -118.0, 0.0]])
@@ -24,7 +24,30 @@ DEFAULT_CONFIG = {
     "drone": {
         "connection_timeout": 10,
         "telemetry_frequency": 2.0,  # Hz
+        "message_rates": {           # Hz, per MAVLink message
+            "ATTITUDE": 10.0,
+            "GLOBAL_POSITION_INT": 5.0
+        },
         "command_timeout": 5.0,      # seconds
+        "link": {                    # Link-quality thresholds
+            "heartbeat_timeout": 3.0,    # seconds
+            "silence_timeout": 1.0,      # seconds
+            "max_loss_percent": 10.0,
+            "max_latency_ms": 500.0,
+            "min_rssi": None             # radio RSSI units, None to ignore
+        },
+        "record_telemetry": False,   # Record every connection's MAVLink traffic to paths.telemetry
+        "connect_lazily": False,     # Return once core telemetry is live, load parameters in the background
+        "reconnect": {               # Automatic reconnection after the heartbeat is lost
+            "enabled": True,
+            "initial_delay": 0.5,        # seconds, doubled after each failed attempt
+            "max_delay": 30.0            # seconds
+        },
+        "parameter_cache": {         # Parameter tables kept per autopilot UID and firmware
+            "enabled": True,
+            "directory": "data/parameters",
+            "spot_checks": 8             # parameters read back to validate a cached table
+        },
     },
     "mapping": {
         "default_zoom": 13,
@@ -35,10 +58,36 @@ DEFAULT_CONFIG = {
     "paths": {
         "missions": "data/missions",
         "logs": "data/logs",
-        "backup": "data/backup"
+        "backup": "data/backup",
+        "tiles": "data/tiles",
+        "snapshots": "data/snapshots",
+        "telemetry": "data/telemetry"
     }
 }
 
+
+def config_value(config, path, default=None):
+    """Get a configuration value by path, falling back to DEFAULT_CONFIG
+
+    Args:
+        config: Application Config, or None to read DEFAULT_CONFIG
+        path: Dotted path (e.g., 'paths.tiles')
+        default: Value when the path doesn't exist
+
+    Returns:
+        The configured value
+    """
+    if config is not None:
+        return config.get(path, default)
+
+    value = DEFAULT_CONFIG
+    for key in path.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+    return value
+
+
 class Config:
     """Application configuration handler"""
     
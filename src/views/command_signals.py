@@ -0,0 +1,72 @@
+# src/views/command_signals.py
+import logging
+from typing import Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from src.drone.command_executor import CommandExecutor, CommandTicket, QUEUED, RUNNING
+
+logger = logging.getLogger(__name__)
+
+
+class CommandExecutorSignals(QObject):
+    """Qt signals for a CommandExecutor's progress
+
+    The executor reports from its worker thread; each report is passed
+    through a queued signal so the slots connected here always run on the
+    GUI thread. Each signal carries the ticket and the state it was in when
+    the report was made.
+    """
+
+    # Internal: (ticket, state) from any thread
+    _ticket_changed = pyqtSignal(object, str)
+
+    # Emitted on the GUI thread
+    command_queued = pyqtSignal(object)
+    command_started = pyqtSignal(object)
+    command_finished = pyqtSignal(object)
+    command_progress = pyqtSignal(object, str)
+
+    def __init__(self, executor: Optional[CommandExecutor] = None, parent: Optional[QObject] = None):
+        """Initialize the signals
+
+        Args:
+            executor: Executor to follow
+            parent: Optional Qt parent
+        """
+        super().__init__(parent)
+        self.executor = None
+        self._ticket_changed.connect(self._dispatch)
+        if executor is not None:
+            self.attach(executor)
+
+    def attach(self, executor: CommandExecutor):
+        """Follow an executor
+
+        Args:
+            executor: CommandExecutor whose tickets to report
+        """
+        self.detach()
+        self.executor = executor
+        executor.add_listener(self._on_ticket)
+
+    def detach(self):
+        """Stop following the executor"""
+        if self.executor is not None:
+            self.executor.remove_listener(self._on_ticket)
+            self.executor = None
+
+    def _on_ticket(self, ticket: CommandTicket):
+        """Executor listener (worker or submitting thread)"""
+        self._ticket_changed.emit(ticket, ticket.state)
+
+    @pyqtSlot(object, str)
+    def _dispatch(self, ticket: CommandTicket, state: str):
+        """Re-emit a report as the matching signal (GUI thread)"""
+        self.command_progress.emit(ticket, state)
+        if state == QUEUED:
+            self.command_queued.emit(ticket)
+        elif state == RUNNING:
+            self.command_started.emit(ticket)
+        else:
+            self.command_finished.emit(ticket)
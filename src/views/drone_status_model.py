@@ -0,0 +1,226 @@
+# src/views/drone_status_model.py
+import logging
+import functools
+from typing import Any, Dict, List, Mapping, Optional
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, pyqtSignal, pyqtSlot
+
+from src.drone.state_snapshot import STATE_FIELDS, FIELD_FLAGS
+
+logger = logging.getLogger(__name__)
+
+PARAMETER_COLUMN = 0
+VALUE_COLUMN = 1
+HEADERS = ("Parameter", "Value")
+
+# Fields shown with six decimals; other floats get two
+COORDINATE_FIELDS = ("latitude", "longitude")
+
+# StateField flag of each snapshot field, for skipping unchanged rows
+FLAG_BY_FIELD = dict(zip(STATE_FIELDS, FIELD_FLAGS))
+
+
+def format_value(key: str, value: Any) -> str:
+    """Format a state value for the status table
+
+    Args:
+        key: State field name
+        value: Field value
+
+    Returns:
+        str: Display text
+    """
+    if isinstance(value, float):
+        if key in COORDINATE_FIELDS:
+            return f"{value:.6f}"
+        return f"{value:.2f}"
+    return str(value)
+
+
+class DroneStatusTableModel(QAbstractTableModel):
+    """Parameter/value table of the drone state
+
+    The model is pushed state snapshots instead of being polled. Each update
+    re-formats only the fields in the snapshot's changed mask and emits
+    dataChanged for the value cells whose text actually changed, so the view
+    repaints those cells and nothing else.
+
+    DroneState callbacks arrive on telemetry threads; attach() routes them
+    through a queued signal so the model is only touched on the GUI thread.
+    Each attach() and detach() starts a new generation, and snapshots queued
+    under an older one are dropped when they arrive.
+    """
+
+    # Carries (generation, DroneStateSnapshot) from the telemetry thread to the GUI thread
+    snapshot_received = pyqtSignal(int, object)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """Initialize an empty model
+
+        Args:
+            parent: Optional Qt parent
+        """
+        super().__init__(parent)
+        self._keys: List[str] = []
+        self._text: List[str] = []
+        self._version = -1
+        self._generation = 0
+        self._state_callback = None
+        self.drone_state = None
+
+        self.snapshot_received.connect(self._on_snapshot_received)
+
+        self.stats = {
+            "updates": 0,
+            "cells_changed": 0,
+            "data_changed_signals": 0,
+            "resets": 0,
+            "stale_dropped": 0,
+        }
+
+    # QAbstractTableModel interface
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._keys)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        if index.column() == PARAMETER_COLUMN:
+            return self._keys[index.row()]
+        return self._text[index.row()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return None
+
+    # Updates
+
+    @pyqtSlot(object)
+    def apply_state(self, state: Mapping[str, Any]):
+        """Show a new state (GUI thread)
+
+        Args:
+            state: DroneStateSnapshot, or any mapping of field values such as
+                DroneState.get_state(); without a changed mask every field is
+                compared
+        """
+        version = getattr(state, "version", None)
+        if version is not None:
+            # Snapshots queued before the one already shown carry nothing new
+            if version <= self._version:
+                return
+            self._version = version
+
+        if not self._keys:
+            self._reset(state)
+            return
+
+        self.stats["updates"] += 1
+        changed = getattr(state, "changed", None)
+        changed_rows = []
+        for row, key in enumerate(self._keys):
+            if changed is not None and not changed & FLAG_BY_FIELD.get(key, -1):
+                continue
+            text = format_value(key, state.get(key))
+            if text != self._text[row]:
+                self._text[row] = text
+                changed_rows.append(row)
+
+        self.stats["cells_changed"] += len(changed_rows)
+        self._emit_changed(changed_rows)
+
+    def _reset(self, state: Mapping[str, Any]):
+        """Load the full row set"""
+        self.beginResetModel()
+        self._keys = [key for key in STATE_FIELDS if key in state] + \
+                     [key for key in state.keys() if key not in STATE_FIELDS]
+        self._text = [format_value(key, state.get(key)) for key in self._keys]
+        self.endResetModel()
+        self.stats["resets"] += 1
+
+    def _emit_changed(self, rows: List[int]):
+        """Emit one dataChanged per run of adjacent changed rows"""
+        start = None
+        previous = None
+        for row in rows + [None]:
+            if start is not None and (row is None or row != previous + 1):
+                self.dataChanged.emit(self.index(start, VALUE_COLUMN), self.index(previous, VALUE_COLUMN),
+                                      [Qt.ItemDataRole.DisplayRole])
+                self.stats["data_changed_signals"] += 1
+                start = None
+            if row is not None and start is None:
+                start = row
+            previous = row
+
+    def clear(self):
+        """Remove all rows"""
+        self._version = -1
+        if not self._keys:
+            return
+        self.beginResetModel()
+        self._keys = []
+        self._text = []
+        self.endResetModel()
+
+    def value_text(self, key: str) -> Optional[str]:
+        """Get the displayed text of a field, if shown"""
+        try:
+            return self._text[self._keys.index(key)]
+        except ValueError:
+            return None
+
+    # DroneState wiring
+
+    def attach(self, drone_state, max_rate_hz: Optional[float] = 5.0):
+        """Follow a DroneState
+
+        Args:
+            drone_state: DroneState to display
+            max_rate_hz: Maximum table updates per second
+        """
+        self.detach()
+        self.clear()
+        self.drone_state = drone_state
+        self._generation += 1
+        # The callback carries its generation, so a call racing detach() is still dropped
+        self._state_callback = functools.partial(self._on_state_change, self._generation)
+        drone_state.register_state_change_callback(self._state_callback, max_rate_hz=max_rate_hz)
+        self.snapshot_received.emit(self._generation, drone_state.get_snapshot())
+
+    def detach(self):
+        """Stop following the DroneState
+
+        Snapshots already queued for the GUI thread are discarded.
+        """
+        self._generation += 1
+        if self.drone_state is not None:
+            self.drone_state.unregister_state_change_callback(self._state_callback)
+            self.drone_state = None
+            self._state_callback = None
+
+    def _on_state_change(self, generation: int, snapshot):
+        """DroneState callback (telemetry thread)"""
+        self.snapshot_received.emit(generation, snapshot)
+
+    @pyqtSlot(int, object)
+    def _on_snapshot_received(self, generation: int, snapshot):
+        """Apply a queued snapshot unless it predates the last attach() or detach() (GUI thread)"""
+        if generation != self._generation or self.drone_state is None:
+            self.stats["stale_dropped"] += 1
+            return
+        self.apply_state(snapshot)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get update counters
+
+        Returns:
+            dict: Updates applied, cells changed, dataChanged signals emitted
+            and queued snapshots dropped after a detach
+        """
+        return dict(self.stats)
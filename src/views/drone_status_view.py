@@ -2,12 +2,15 @@
 import logging
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QPushButton, QTableWidget, QTableWidgetItem, QFrame,
+    QPushButton, QTableView, QFrame, QAbstractItemView,
     QComboBox, QDoubleSpinBox, QMessageBox
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from src.drone.drone_controller import DroneController
 from src.drone.drone_simulator import DroneSimulator
+from src.views.drone_status_model import DroneStatusTableModel
+from src.views.command_signals import CommandExecutorSignals
+from src.drone.command_executor import SUCCEEDED, PREEMPTED, CANCELLED
 
 logger = logging.getLogger(__name__)
 
@@ -21,12 +24,17 @@ class DroneStatusWidget(QWidget):
         self.simulator_running = False
         self.main_window = main_window
         
-        self.setup_ui()
+        # Status table contents, pushed from DroneState changes
+        self.status_model = DroneStatusTableModel(self)
+        
+        # Commands run on the controller's executor; results come back as signals
+        self.command_signals = CommandExecutorSignals(self.drone_controller.executor, self)
+        self.command_signals.command_progress.connect(self.show_command_progress)
+        self.command_signals.command_finished.connect(self.handle_command_finished)
+        # Ticket id -> (title, success message, error title, error message)
+        self.command_messages = {}
         
-        # Update timer
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(500)  # Update every 500ms
+        self.setup_ui()
     
     def setup_ui(self):
         """Set up the user interface"""
@@ -87,10 +95,11 @@ class DroneStatusWidget(QWidget):
         status_layout.addWidget(status_title)
         
         # Status table
-        self.status_table = QTableWidget(0, 2)
-        self.status_table.setHorizontalHeaderLabels(["Parameter", "Value"])
+        self.status_table = QTableView()
+        self.status_table.setModel(self.status_model)
         self.status_table.horizontalHeader().setStretchLastSection(True)
-        self.status_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.status_table.verticalHeader().setVisible(False)
+        self.status_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         status_layout.addWidget(self.status_table)
         
         main_layout.addWidget(status_frame)
@@ -158,6 +167,10 @@ class DroneStatusWidget(QWidget):
         
         commands_layout.addLayout(flight_cmd_layout)
         
+        # Progress of the running command
+        self.command_status = QLabel("")
+        commands_layout.addWidget(self.command_status)
+        
         main_layout.addWidget(commands_frame)
         
         # Disable command buttons initially
@@ -190,12 +203,14 @@ class DroneStatusWidget(QWidget):
             self.disconnect_btn.setEnabled(True)
             self.enable_command_buttons(True)
             self.drone_controller.register_state_change_callback(self.handle_state_change)
+            self.status_model.attach(self.drone_controller.state)
             QMessageBox.information(self, "Connection", "Connected to drone successfully")
         else:
             QMessageBox.warning(self, "Connection Error", "Failed to connect to drone. Check that simulator is running.")
     
     def disconnect_from_drone(self):
         """Disconnect from the drone"""
+        self.status_model.detach()
         self.drone_controller.disconnect()
         self.connection_status.setText("Not Connected")
         self.connection_status.setStyleSheet("color: red;")
@@ -217,87 +232,77 @@ class DroneStatusWidget(QWidget):
     def handle_state_change(self, state):
         """Handle drone state changes"""
         # This will be called automatically when drone state changes
-        # Status will be updated by the update_timer
+        # The status table is updated by status_model
         pass
     
-    def update_status(self):
-        """Update status display"""
-        if not self.drone_controller.is_connected:
-            return
-        
-        # Get current state
-        state = self.drone_controller.get_state()
-        
-        # Update status table
-        self.update_status_table(state)
-    
     def update_status_table(self, state):
-        """Update the status table with current state"""
-        # Clear table
-        self.status_table.setRowCount(0)
-        
-        # Add state items
-        row = 0
-        for key, value in state.items():
-            self.status_table.insertRow(row)
-            self.status_table.setItem(row, 0, QTableWidgetItem(key))
-            
-            # Format value based on type
-            if isinstance(value, float):
-                if key in ["latitude", "longitude"]:
-                    value_str = f"{value:.6f}"
-                else:
-                    value_str = f"{value:.2f}"
-            else:
-                value_str = str(value)
-            
-            self.status_table.setItem(row, 1, QTableWidgetItem(value_str))
-            row += 1
+        """Update the status table with a state snapshot or dict"""
+        self.status_model.apply_state(state)
     
     def clear_status_table(self):
         """Clear the status table"""
-        self.status_table.setRowCount(0)
+        self.status_model.clear()
+    
+    def submit_command(self, operation, args, title, success_message, error_title, error_message):
+        """Queue a controller operation without blocking the window
+        
+        Args:
+            operation: DroneController method name
+            args: Arguments for the method
+            title: Title of the success message box
+            success_message: Text shown if the command succeeds
+            error_title: Title of the failure message box
+            error_message: Text shown if the command fails
+        """
+        ticket = self.drone_controller.submit(operation, *args)
+        self.command_messages[ticket.id] = (title, success_message, error_title, error_message)
+    
+    def show_command_progress(self, ticket, state):
+        """Show the latest command state"""
+        self.command_status.setText(f"{ticket.name}: {state}")
+    
+    def handle_command_finished(self, ticket):
+        """Report a command's outcome"""
+        messages = self.command_messages.pop(ticket.id, None)
+        if messages is None:
+            return
+        title, success_message, error_title, error_message = messages
+        if ticket.state == SUCCEEDED:
+            QMessageBox.information(self, title, success_message)
+        elif ticket.state in (PREEMPTED, CANCELLED):
+            # Replaced by RTL/LAND or dropped on disconnect; the status line says so
+            logger.info(f"{ticket.name} {ticket.state}")
+        else:
+            QMessageBox.warning(self, error_title, error_message)
     
     def set_mode(self):
         """Set flight mode"""
         mode = self.mode_combo.currentText()
-        if self.drone_controller.set_mode(mode):
-            QMessageBox.information(self, "Mode Change", f"Mode changed to {mode}")
-        else:
-            QMessageBox.warning(self, "Mode Change Error", f"Failed to change mode to {mode}")
+        self.submit_command("set_mode", (mode,), "Mode Change", f"Mode changed to {mode}",
+                            "Mode Change Error", f"Failed to change mode to {mode}")
     
     def arm(self):
         """Arm the drone"""
-        if self.drone_controller.arm():
-            QMessageBox.information(self, "Arm", "Drone armed successfully")
-        else:
-            QMessageBox.warning(self, "Arm Error", "Failed to arm drone")
+        self.submit_command("arm", (), "Arm", "Drone armed successfully",
+                            "Arm Error", "Failed to arm drone")
     
     def disarm(self):
         """Disarm the drone"""
-        if self.drone_controller.disarm():
-            QMessageBox.information(self, "Disarm", "Drone disarmed successfully")
-        else:
-            QMessageBox.warning(self, "Disarm Error", "Failed to disarm drone")
+        self.submit_command("disarm", (), "Disarm", "Drone disarmed successfully",
+                            "Disarm Error", "Failed to disarm drone")
     
     def takeoff(self):
         """Take off to specified altitude"""
         altitude = self.altitude_spin.value()
-        if self.drone_controller.takeoff(altitude):
-            QMessageBox.information(self, "Takeoff", f"Taking off to {altitude}m")
-        else:
-            QMessageBox.warning(self, "Takeoff Error", "Failed to take off")
+        self.submit_command("takeoff", (altitude,), "Takeoff", f"Taking off to {altitude}m",
+                            "Takeoff Error", "Failed to take off")
     
     def return_to_launch(self):
         """Return to launch"""
-        if self.drone_controller.return_to_launch():
-            QMessageBox.information(self, "RTL", "Returning to launch point")
-        else:
-            QMessageBox.warning(self, "RTL Error", "Failed to initiate return to launch")
+        self.submit_command("return_to_launch", (), "RTL", "Returning to launch point",
+                            "RTL Error", "Failed to initiate return to launch")
     
     def land(self):
         """Land the drone"""
-        if self.drone_controller.land():
-            QMessageBox.information(self, "Land", "Landing drone")
-        else:
-            QMessageBox.warning(self, "Land Error", "Failed to initiate landing")
\ No newline at end of file
+        self.submit_command("land", (), "Land", "Landing drone",
+                            "Land Error", "Failed to initiate landing")
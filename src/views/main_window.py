@@ -749,6 +749,10 @@ class MainWindow(QMainWindow):
         self.drone_status_widget = DroneStatusWidget(self)
         self.content_area.addWidget(self.drone_status_widget)
 
+        # Stream the connected vehicle's position to the map
+        if hasattr(self, "map_view"):
+            self.map_view.attach_drone_state(self.drone_status_widget.drone_controller.state)
+
     def show_drone_status(self):
         """Show the drone status screen"""
         self.content_area.setCurrentIndex(self.DRONE_STATUS_SCREEN)  # Define this index constant
@@ -1,7 +1,8 @@
 # src/views/map_view.py
 import os
+import json
+import time
 import logging
-import traceback
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QComboBox, QDoubleSpinBox,
@@ -9,14 +10,21 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QUrl
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from src.mapping.map_generator import generate_folium_map
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from PyQt6.QtWebChannel import QWebChannel
-from pathlib import Path
 from src.planning.flight_planner import FlightPlanner
+from src.planning.plan_scheduler import PlanScheduler
 from src.utils.shape_utils import extract_active_shape_bounds
 from PyQt5 import QtWebChannel
 from src.mapping.map_manager import MapManager
+from src.mapping.map_documents import MapDocumentStore, map_document_url
+from src.mapping.map_events import MapEventDispatcher, HOVER_EVENT, CLICK_EVENT, SHAPE_EVENT, VIEWPORT_EVENT
+from src.mapping.map_scheme_handler import install_map_scheme_handler
+from src.mapping.url_scheme import MAPS_ROUTE, OVERLAYS_ROUTE
+from src.mapping.raster_tiles import RasterTileRenderer
+from src.mapping.live_track import LiveTrackPublisher
+from src.mapping.mission_overview import MissionOverviewIndex
+from src.mapping.overview_publisher import MissionOverviewPublisher
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +37,18 @@ class CoordinateBridge(QObject):
         self.map_manager = map_manager
         self.update_callback = update_callback
 
+        self.event_dispatcher = MapEventDispatcher()
+        self.event_dispatcher.register_handler(
+            HOVER_EVENT, lambda e: self.hover_coordinates.emit(e["lat"], e["lon"]))
+        self.event_dispatcher.register_handler(
+            CLICK_EVENT, lambda e: self.coordinate_received.emit(e["lat"], e["lon"]))
+        self.event_dispatcher.register_handler(
+            SHAPE_EVENT, lambda e: self.receiveShape(json.dumps(e["coordinates"])))
+
+    @pyqtSlot(str)
+    def send_events(self, batch_json):
+        self.event_dispatcher.dispatch_batch(batch_json)
+
     @pyqtSlot(float, float)
     def send_coordinates(self, lat, lon):
         self.coordinate_received.emit(lat, lon)
@@ -47,6 +67,11 @@ class MapViewWidget(QWidget):
         super().__init__()
         self.main_window = main_window
         self.flight_planner = FlightPlanner()
+        self.map_documents = MapDocumentStore()
+        self.raster_tiles = RasterTileRenderer()
+        self.plan_scheduler = PlanScheduler(self._plan_and_render, parent=self)
+        self.plan_scheduler.plan_ready.connect(self._show_plan)
+        self.plan_scheduler.plan_failed.connect(self._on_plan_failed)
         self.setup_ui()
 
     def setup_ui(self):
@@ -76,13 +101,11 @@ class MapViewWidget(QWidget):
         
         # Add camera controls only for now
         left_layout.addWidget(self.create_camera_controls())
-        left_layout.addStretch()
 
-        # Generate map
-        map_path = generate_folium_map(None, speed_mps=self.speed_spin)
-        full_path = Path(map_path).resolve().as_uri()
-        QTimer.singleShot(500, lambda: self.webview.setUrl(QUrl(full_path)))
-        print("[DEBUG] Loading map into webview from:", full_path)
+        self.overview_checkbox = QCheckBox("Show all missions")
+        self.overview_checkbox.toggled.connect(self.toggle_mission_overview)
+        left_layout.addWidget(self.overview_checkbox)
+        left_layout.addStretch()
 
         # Map panel
         right_panel = QWidget()
@@ -90,6 +113,13 @@ class MapViewWidget(QWidget):
         right_layout.setContentsMargins(0, 0, 0, 0)
 
         self.webview = QWebEngineView()
+        self.scheme_handler = install_map_scheme_handler(self.webview.page().profile(),
+                                                         config=getattr(self.main_window, "config", None))
+        self.scheme_handler.add_route(MAPS_ROUTE, self.map_documents.resolve)
+        self.scheme_handler.add_route(OVERLAYS_ROUTE, self.raster_tiles.resolve)
+        self.load_started_at = None
+        self.webview.loadStarted.connect(self.on_map_load_started)
+        self.webview.loadFinished.connect(self.on_map_load_finished)
 
         self.map_manager = MapManager(self)
         self.bridge = CoordinateBridge(self.map_manager, self.update_map)
@@ -103,13 +133,21 @@ class MapViewWidget(QWidget):
         self.channel.registerObject("mapBridge", self.bridge)
         self.bridge.map_manager = self.map_manager
 
-        # ✅ Enable local content to access remote JS (fixes Leaflet 'L is not defined' error)
-        from PyQt6.QtWebEngineCore import QWebEngineSettings
-        self.webview.settings().setAttribute(
-            QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True
-        )
-
-        self.webview.load(QUrl.fromLocalFile(map_path))
+        # The page asks for the full track when its channel connects, so the
+        # track survives the page being regenerated for a new plan
+        self.track_publisher = LiveTrackPublisher(parent=self)
+        self.channel.registerObject("trackBridge", self.track_publisher)
+
+        # Mission overview geometries are paged in as the viewport changes
+        self.overview_publisher = MissionOverviewPublisher(parent=self)
+        self.channel.registerObject("overviewBridge", self.overview_publisher)
+        self.bridge.event_dispatcher.register_handler(VIEWPORT_EVENT, self.overview_publisher.on_viewport)
+
+        # Map pages are rendered into memory and served via mapview://maps/. Leaflet
+        # and its plugins come from the vendored copies and base map tiles from the
+        # tile cache (downloaded on a miss), so the page needs no remote access.
+        initial_key = self.map_documents.render(None, speed_mps=self.speed_spin.value())
+        self.webview.setUrl(QUrl(map_document_url(initial_key)))
         right_layout.addWidget(self.webview)
 
         # Split layout
@@ -218,46 +256,126 @@ class MapViewWidget(QWidget):
         self.coverage_label.setText(f"Coverage: {width:.1f} × {height:.1f} m")
 
     def update_map(self):
-        try:
-            logger.info("Updating map with current mission settings...")
-
-            params = {
-                "altitude": self.alt,
-                "w_fov": self.fov_w,
-                "h_fov": self.fov_h,
-                "angle": self.angle,
-                "f_overlap": self.overlap_s,
-                "s_overlap": self.overlap_s,
-                "speed": self.speed_spin,
+        """Queue a re-plan with the current settings
+
+        Runs on the GUI thread for every settings change, so it only snapshots
+        the inputs; the plan scheduler coalesces bursts and does the work.
+        """
+        drawn_shapes = self.map_manager.get_drawn_shapes()
+        payload = {
+            "params": {
+                "altitude": self.altitude_spin.value(),
+                "w_fov": self.camera_fov_w_spin.value(),
+                "h_fov": self.camera_fov_h_spin.value(),
+                "angle": self.camera_angle_spin.value(),
+                "f_overlap": self.front_overlap_input.value(),
+                "s_overlap": self.side_overlap_input.value(),
+                "speed": self.speed_spin.value(),
                 "contour": self.contouring_checkbox.isChecked()
-            }
-
-            # 2. Get drawn shapes from map and extract active boundary
-            logger.info("Updating map with current mission settings...")
-            drawn_shapes = self.map_manager.get_drawn_shapes()
-            logger.debug(f"Drawn shapes retrieved: {drawn_shapes}")
-            boundary = extract_active_shape_bounds(drawn_shapes)
-            if boundary is None:
-                logger.warning("No active shape found for flight planning.")
-                return 
-
-            # 3. Generate waypoints
-            if self.pattern_dropdown.currentText() == "Spiral":
-                waypoints = self.flight_planner.plan_spiral_search(boundary, params)
-            else:
-                waypoints = self.flight_planner.plan_grid_search(boundary, params)
-            print("[DEBUG] Generated waypoints:", waypoints)
-
-            # 4. Rebuild map and display
-            logger.info(f"WAYPOINTS GENERATED: {waypoints}")
-            logger.info(f"PARAMS: {params}")
-            map_path = generate_folium_map(waypoints, speed_mps=self.speed_spin.value(), altitude = self.altitude_spin.value())
-            full_path = Path(map_path).resolve().as_uri()
-            QTimer.singleShot(500, lambda: self.webview.setUrl(QUrl(full_path)))
-
+            },
+            "pattern": self.pattern_dropdown.currentText(),
+            "drawn_shapes": [dict(shape) for shape in drawn_shapes],
+            "overlays": self.raster_tiles.overlay_layers(),
+        }
+        self.plan_scheduler.request(payload)
+
+    def _plan_and_render(self, payload, is_cancelled):
+        """Plan the flight path and render the map (runs on a worker thread)"""
+        params = payload["params"]
+        logger.info("Updating map with current mission settings...")
+
+        # Extract active boundary from the drawn shapes
+        logger.debug(f"Drawn shapes retrieved: {payload['drawn_shapes']}")
+        boundary = extract_active_shape_bounds(payload["drawn_shapes"])
+        if not boundary:
+            logger.warning("No active shape found for flight planning.")
+            # Raster overlays don't depend on a plan; show them on an empty map
+            return self.map_documents.render(None, overlays=payload["overlays"])
+
+        # Generate waypoints
+        if payload["pattern"] == "Spiral":
+            waypoints = self.flight_planner.plan_spiral_search(boundary, params)
+        else:
+            waypoints = self.flight_planner.plan_grid_search(boundary, params)
+        logger.info(f"WAYPOINTS GENERATED: {len(waypoints)}")
+        logger.info(f"PARAMS: {params}")
+
+        # Skip the render if the settings changed again meanwhile
+        if is_cancelled():
+            return None
+
+        return self.map_documents.render(waypoints, speed_mps=params["speed"],
+                                         altitude=params["altitude"],
+                                         overlays=payload["overlays"])
+
+    def _show_plan(self, generation, map_key):
+        """Display a finished plan (GUI thread)"""
+        if map_key is None:
+            return
+        url = QUrl(map_document_url(map_key))
+        if self.webview.url() == url:
+            # Same plan as on screen; reloading would only lose the drawn shapes
+            return
+        self.webview.setUrl(url)
+        logger.debug(f"Displayed plan {generation} in "
+                     f"{self.plan_scheduler.stats['last_plan_ms']:.0f} ms")
+
+    def _on_plan_failed(self, generation, error):
+        logger.error(f"Error updating map: {error}")
+
+    def on_map_load_started(self):
+        self.load_started_at = time.perf_counter()
+
+    def on_map_load_finished(self, ok):
+        if self.load_started_at is None:
+            return
+        elapsed_ms = (time.perf_counter() - self.load_started_at) * 1000
+        self.load_started_at = None
+        logger.info(f"Map page loaded in {elapsed_ms:.0f} ms (ok={ok})")
+
+    def set_raster_overlay(self, name, data, bounds, colormap="probability", value_range=None):
+        """Show a raster (e.g. probability of area or achieved coverage) over the map
+
+        Args:
+            name: Layer name shown in the layer control
+            data: 2D array or nested lists, row 0 at the northern edge
+            bounds: (south, west, north, east) covered by the raster
+            colormap: "probability" or "coverage"
+            value_range: (min, max) mapped onto the colour ramp
+        """
+        self.raster_tiles.set_layer(name, data, bounds, colormap, value_range)
+        self.update_map()
+
+    def remove_raster_overlay(self, name):
+        """Remove a raster overlay from the map"""
+        self.raster_tiles.remove_layer(name)
+        self.update_map()
+
+    def toggle_mission_overview(self, enabled):
+        """Show or hide the boundaries of all missions"""
+        if enabled:
+            self.load_mission_overview()
+        self.overview_publisher.set_enabled(enabled)
+
+    def load_mission_overview(self):
+        """(Re)load mission boundaries for the overview from the database"""
+        repository = getattr(self.main_window, "mission_repository", None)
+        if repository is None:
+            logger.warning("No mission repository available for the overview")
+            return
+
+        index = MissionOverviewIndex()
+        try:
+            boundaries = repository.get_boundaries(getattr(self.main_window, "current_user_id", None))
+            count = index.add_mission_boundaries(boundaries)
+            logger.info(f"Loaded {count} mission boundaries for the overview")
         except Exception as e:
-            logger.error(f"Error updating map: {e}")
-            traceback.print_exc()
+            logger.error(f"Error loading mission overview: {str(e)}")
+        self.overview_publisher.set_index(index)
+
+    def attach_drone_state(self, drone_state):
+        """Show the live position and track of a vehicle on the map"""
+        self.track_publisher.attach(drone_state)
 
     def update_coordinate_display(self, lat, lon):
         self.coord_label.setText(f"Lat: {lat:.5f}, Lon: {lon:.5f}")